@@ -3566,7 +3566,7 @@ from akshare.stock_feature.stock_hist_tx import stock_zh_a_hist_tx
 """
 筹码分布
 """
-from akshare.stock_feature.stock_cyq_em import stock_cyq_em
+from akshare.stock_feature.stock_cyq_em import stock_cyq_em, stock_cyq_em_batch
 
 """
 东财财富-分时数据
@@ -3841,6 +3841,8 @@ from akshare.index.index_option_qvix import (
     index_option_cyb_qvix,
     index_option_kcb_min_qvix,
     index_option_kcb_qvix,
+    index_option_qvix_all,
+    set_qvix_cache_ttl,
 )
 
 """
@@ -4476,6 +4478,7 @@ from akshare.stock_feature.stock_hist_em import (
     stock_zh_b_spot_em,
     stock_zh_ab_comparison_em,
     stock_zh_a_hist,
+    stock_zh_a_hist_batch,
     stock_hk_spot_em,
     stock_hk_main_board_spot_em,
     stock_hk_hist,
@@ -4927,6 +4930,7 @@ from akshare.futures.futures_zh_sina import (
     futures_symbol_mark,
     match_main_contract,
     futures_zh_spot,
+    FuturesZhSpotPoller,
 )
 
 """
@@ -5237,6 +5241,15 @@ from akshare.option.option_finance_sina import (
     option_minute_em,
 )
 
+"""
+金融期权-希腊字母和隐含波动率
+"""
+from akshare.option.option_greeks import (
+    option_bsm_greeks,
+    option_implied_volatility,
+    option_chain_greeks,
+)
+
 """
 债券-沪深债券
 """
@@ -5264,6 +5277,10 @@ from akshare.bond.bond_convert import (
 from akshare.fund.fund_em import (
     fund_open_fund_daily_em,
     fund_open_fund_info_em,
+    fund_open_fund_info_bundle_em,
+    fund_open_fund_info_em_batch,
+    set_fund_open_fund_info_ttl,
+    set_fund_open_fund_info_cache_size,
     fund_etf_fund_daily_em,
     fund_etf_fund_info_em,
     fund_financial_fund_daily_em,
@@ -5820,6 +5837,7 @@ from akshare.futures.futures_basis import (
     futures_spot_price_daily,
     futures_spot_price,
     futures_spot_price_previous,
+    futures_basis_panel,
 )
 
 """
@@ -5833,14 +5851,16 @@ from akshare.futures.cot import (
     get_dce_rank_table,
     get_cffex_rank_table,
     futures_dce_position_rank,
+    futures_dce_position_rank_iter,
     futures_dce_position_rank_other,
     futures_gfex_position_rank,
+    set_rank_exchange_limit,
 )
 
 """
 大宗商品期货仓单数据
 """
-from akshare.futures.receipt import get_receipt
+from akshare.futures.receipt import get_receipt, get_receipt_panel
 
 """
 大宗商品期货展期收益率数据
@@ -5848,6 +5868,7 @@ from akshare.futures.receipt import get_receipt
 from akshare.futures.futures_roll_yield import (
     get_roll_yield_bar,
     get_roll_yield,
+    get_roll_yield_panel,
 )
 
 """
@@ -5859,6 +5880,7 @@ from akshare.futures.futures_daily_bar import (
     get_shfe_daily,
     get_dce_daily,
     get_futures_daily,
+    get_futures_daily_batch,
     get_ine_daily,
     get_gfex_daily,
 )
@@ -5887,6 +5909,11 @@ from .exceptions import (
     RateLimitError,
 )
 
+"""
+本地增量行情存储
+"""
+from akshare.utils.hist_store import HistStore, hist_incremental
+
 """
 Pro API 设置
 """
@@ -0,0 +1,48 @@
+"""
+AKShare 异步接口
+基于 curl_cffi 的 AsyncSession, 同一事件循环内的请求复用连接, 适合单个事件循环内的大规模并发请求
+
+import asyncio
+import akshare.aio as aka
+
+async def main():
+    async with aka.AsyncClient(max_clients=32, rate=50) as client:
+        tasks = [aka.stock_zh_a_hist(symbol=symbol, client=client) for symbol in ["000001", "600000"]]
+        return await asyncio.gather(*tasks)
+"""
+
+from akshare.aio.client import (
+    AsyncClient,
+    get_client,
+    close_client,
+    fetch_paginated_data,
+)
+
+# 东方财富网-沪深京 A 股, 港股, 美股
+from akshare.aio.stock_hist_em import (
+    stock_zh_a_spot_em,
+    stock_zh_a_hist,
+    stock_zh_a_hist_min_em,
+    stock_hk_spot_em,
+    stock_hk_hist,
+    stock_us_spot_em,
+    stock_us_hist,
+)
+
+# 东方财富-沪深板块-概念板块
+from akshare.aio.stock_board_concept_em import stock_board_concept_hist_em
+
+__all__ = [
+    "AsyncClient",
+    "get_client",
+    "close_client",
+    "fetch_paginated_data",
+    "stock_zh_a_spot_em",
+    "stock_zh_a_hist",
+    "stock_zh_a_hist_min_em",
+    "stock_hk_spot_em",
+    "stock_hk_hist",
+    "stock_us_spot_em",
+    "stock_us_hist",
+    "stock_board_concept_hist_em",
+]
@@ -0,0 +1,206 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/17 12:00
+Desc: 异步 HTTP 客户端, 基于 curl_cffi 的 AsyncSession 复用连接
+"""
+
+import asyncio
+import math
+import random
+import weakref
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+from curl_cffi.requests import AsyncSession
+from curl_cffi.requests.exceptions import RequestException
+
+from akshare.utils.func import _merge_paginated_data
+from akshare.utils.ratelimit import get_rate_limiter
+
+
+class AsyncClient:
+    """
+    异步 HTTP 客户端
+    同一客户端内的请求复用连接; max_clients 限制同时进行的请求数
+    """
+
+    def __init__(
+        self,
+        max_clients: int = 10,
+        timeout: float = 15,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        random_delay_range: Tuple[float, float] = (0.5, 1.5),
+        rate: Optional[float] = None,
+    ):
+        """
+        :param max_clients: 最大并发请求数, 即连接池大小
+        :type max_clients: int
+        :param timeout: 默认超时时间（秒）
+        :type timeout: float
+        :param max_retries: 最大重试次数
+        :type max_retries: int
+        :param base_delay: 基础延迟时间（秒），用于指数退避
+        :type base_delay: float
+        :param random_delay_range: 随机延迟范围（秒）
+        :type random_delay_range: tuple
+        :param rate: 每个主机每秒最多请求数; 默认 None, 不限速
+        :type rate: float
+        """
+        self.max_clients = max_clients
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.random_delay_range = random_delay_range
+        self.rate = rate
+        self._session = None
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = AsyncSession(max_clients=self.max_clients)
+        return self._session
+
+    async def get(self, url: str, params: Dict = None, timeout: Optional[float] = None):
+        """
+        带重试机制的异步 HTTP GET 请求
+        :param url: 请求 URL
+        :type url: str
+        :param params: 请求参数
+        :type params: dict
+        :param timeout: 超时时间（秒）; 默认使用客户端的设置
+        :type timeout: float
+        :return: Response 对象
+        :rtype: curl_cffi.requests.Response
+        :raises: 最后一次请求的异常
+        """
+        last_exception = None
+        for attempt in range(self.max_retries):
+            if self.rate is not None:
+                delay = get_rate_limiter(url, rate=self.rate).reserve()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            try:
+                response = await self.session.get(
+                    url, params=params, timeout=timeout or self.timeout
+                )
+                response.raise_for_status()
+                return response
+            except (RequestException, ValueError) as e:
+                last_exception = e
+                if attempt < self.max_retries - 1:
+                    # 指数退避 + 随机抖动
+                    delay = self.base_delay * (2**attempt) + random.uniform(
+                        *self.random_delay_range
+                    )
+                    await asyncio.sleep(delay)
+        raise last_exception
+
+    async def get_json(
+        self, url: str, params: Dict = None, timeout: Optional[float] = None
+    ) -> Dict:
+        """
+        异步 GET 请求并解析 JSON
+        :param url: 请求 URL
+        :type url: str
+        :param params: 请求参数
+        :type params: dict
+        :param timeout: 超时时间（秒）
+        :type timeout: float
+        :return: 解析后的 JSON 数据
+        :rtype: dict
+        """
+        response = await self.get(url, params=params, timeout=timeout)
+        return response.json()
+
+    async def close(self) -> None:
+        """
+        关闭会话并释放连接
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+        return False  # 不处理异常
+
+
+_default_clients = weakref.WeakKeyDictionary()
+
+
+def get_client() -> AsyncClient:
+    """
+    获取当前事件循环的默认客户端; 同一事件循环内的调用共享连接
+    :return: 默认客户端
+    :rtype: AsyncClient
+    """
+    loop = asyncio.get_running_loop()
+    client = _default_clients.get(loop)
+    if client is None:
+        client = AsyncClient()
+        _default_clients[loop] = client
+    return client
+
+
+async def close_client() -> None:
+    """
+    关闭当前事件循环的默认客户端
+    """
+    loop = asyncio.get_running_loop()
+    client = _default_clients.pop(loop, None)
+    if client is not None:
+        await client.close()
+
+
+async def fetch_paginated_data(
+    url: str,
+    base_params: Dict,
+    timeout: float = 15,
+    client: AsyncClient = None,
+    rate: float = None,
+) -> pd.DataFrame:
+    """
+    东方财富-异步分页获取数据并合并结果
+    https://quote.eastmoney.com/f1.html?newcode=0.000001
+    :param url: 请求地址
+    :type url: str
+    :param base_params: 基础请求参数
+    :type base_params: dict
+    :param timeout: 请求超时时间
+    :type timeout: float
+    :param client: 异步客户端; 默认使用当前事件循环的默认客户端
+    :type client: AsyncClient
+    :param rate: 该主机每秒最多请求数; 默认使用客户端的限速设置, 客户端未限速时为 5
+    :type rate: float
+    :return: 合并后的数据
+    :rtype: pandas.DataFrame
+    """
+    client = client or get_client()
+    params = base_params.copy()
+    data_json = await client.get_json(url, params=params, timeout=timeout)
+    per_page_num = len(data_json["data"]["diff"])
+    total_page = math.ceil(data_json["data"]["total"] / per_page_num)
+    # 客户端已限速时不再重复消耗令牌
+    limiter = None
+    if rate is not None or client.rate is None:
+        limiter = get_rate_limiter(url, rate=rate or 5)
+
+    async def _fetch_page(page: int) -> List[Dict]:
+        if limiter is not None:
+            delay = limiter.reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        page_json = await client.get_json(
+            url, params={**params, "pn": page}, timeout=timeout
+        )
+        return page_json["data"]["diff"]
+
+    pages = list(range(2, total_page + 1))
+    results = await asyncio.gather(*[_fetch_page(page) for page in pages])
+    page_data = {1: data_json["data"]["diff"]}
+    page_data.update(zip(pages, results))
+    return _merge_paginated_data(page_data)
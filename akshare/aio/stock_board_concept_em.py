@@ -0,0 +1,68 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/17 12:00
+Desc: 东方财富-沪深板块-概念板块-异步接口
+https://quote.eastmoney.com/center/boardlist.html#concept_board
+"""
+
+import asyncio
+
+import pandas as pd
+
+from akshare.aio.client import AsyncClient, get_client
+from akshare.stock.stock_board_concept_em import (
+    _stock_board_concept_code,
+    _stock_board_concept_hist_em_params,
+    _stock_board_concept_hist_em_parse,
+)
+
+
+async def stock_board_concept_hist_em(
+    symbol: str = "绿色电力",
+    period: str = "daily",
+    start_date: str = "20220101",
+    end_date: str = "20221128",
+    adjust: str = "",
+    client: AsyncClient = None,
+) -> pd.DataFrame:
+    """
+    东方财富网-沪深板块-概念板块-历史行情
+    https://quote.eastmoney.com/bk/90.BK0715.html
+    :param symbol: 板块名称或板块代码, 如 "绿色电力" 或 "BK0715"
+    :type symbol: str
+    :param period: choice of {"daily", "weekly", "monthly"}
+    :type period: str
+    :param start_date: 开始时间
+    :type start_date: str
+    :param end_date: 结束时间
+    :type end_date: str
+    :param adjust: choice of {'': 不复权, "qfq": 前复权, "hfq": 后复权}
+    :type adjust: str
+    :param client: 异步客户端; 默认使用当前事件循环的默认客户端
+    :type client: akshare.aio.AsyncClient
+    :return: 历史行情
+    :rtype: pandas.DataFrame
+    """
+    client = client or get_client()
+    # 板块名称表已缓存, 仅首次按名称调用时在线程中同步获取
+    stock_board_code = await asyncio.to_thread(_stock_board_concept_code, symbol)
+    url, params = _stock_board_concept_hist_em_params(
+        stock_board_code, period, start_date, end_date, adjust
+    )
+    data_json = await client.get_json(url, params=params)
+    return _stock_board_concept_hist_em_parse(data_json)
+
+
+if __name__ == "__main__":
+
+    async def main():
+        stock_board_concept_hist_em_df = await stock_board_concept_hist_em(
+            symbol="绿色电力",
+            period="daily",
+            start_date="20220101",
+            end_date="20250227",
+            adjust="",
+        )
+        print(stock_board_concept_hist_em_df)
+
+    asyncio.run(main())
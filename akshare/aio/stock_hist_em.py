@@ -0,0 +1,215 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/17 12:00
+Desc: 东方财富网-行情首页-沪深京 A 股, 港股, 美股-异步接口
+https://quote.eastmoney.com/
+"""
+
+import pandas as pd
+
+from akshare.aio.client import AsyncClient, fetch_paginated_data, get_client
+from akshare.stock_feature.stock_hist_em import (
+    _stock_hk_hist_params,
+    _stock_hk_hist_parse,
+    _stock_hk_spot_em_format,
+    _stock_hk_spot_em_params,
+    _stock_us_hist_params,
+    _stock_us_hist_parse,
+    _stock_us_spot_em_format,
+    _stock_us_spot_em_params,
+    _stock_zh_a_hist_min_em_params,
+    _stock_zh_a_hist_min_em_parse,
+    _stock_zh_a_hist_params,
+    _stock_zh_a_hist_parse,
+    _stock_zh_a_spot_em_format,
+    _stock_zh_a_spot_em_params,
+)
+
+
+async def stock_zh_a_spot_em(client: AsyncClient = None) -> pd.DataFrame:
+    """
+    东方财富网-沪深京 A 股-实时行情
+    https://quote.eastmoney.com/center/gridlist.html#hs_a_board
+    :param client: 异步客户端; 默认使用当前事件循环的默认客户端
+    :type client: akshare.aio.AsyncClient
+    :return: 实时行情
+    :rtype: pandas.DataFrame
+    """
+    url, params = _stock_zh_a_spot_em_params()
+    temp_df = await fetch_paginated_data(url, params, client=client)
+    return _stock_zh_a_spot_em_format(temp_df)
+
+
+async def stock_zh_a_hist(
+    symbol: str = "000001",
+    period: str = "daily",
+    start_date: str = "19700101",
+    end_date: str = "20500101",
+    adjust: str = "",
+    timeout: float = None,
+    client: AsyncClient = None,
+) -> pd.DataFrame:
+    """
+    东方财富网-行情首页-沪深京 A 股-每日行情
+    https://quote.eastmoney.com/concept/sh603777.html?from=classic
+    :param symbol: 股票代码
+    :type symbol: str
+    :param period: choice of {'daily', 'weekly', 'monthly'}
+    :type period: str
+    :param start_date: 开始日期
+    :type start_date: str
+    :param end_date: 结束日期
+    :type end_date: str
+    :param adjust: choice of {"qfq": "前复权", "hfq": "后复权", "": "不复权"}
+    :type adjust: str
+    :param timeout: choice of None or a positive float number
+    :type timeout: float
+    :param client: 异步客户端; 默认使用当前事件循环的默认客户端
+    :type client: akshare.aio.AsyncClient
+    :return: 每日行情
+    :rtype: pandas.DataFrame
+    """
+    client = client or get_client()
+    url, params = _stock_zh_a_hist_params(symbol, period, start_date, end_date, adjust)
+    data_json = await client.get_json(url, params=params, timeout=timeout)
+    return _stock_zh_a_hist_parse(data_json, symbol)
+
+
+async def stock_zh_a_hist_min_em(
+    symbol: str = "000001",
+    start_date: str = "1979-09-01 09:32:00",
+    end_date: str = "2222-01-01 09:32:00",
+    period: str = "5",
+    adjust: str = "",
+    client: AsyncClient = None,
+) -> pd.DataFrame:
+    """
+    东方财富网-行情首页-沪深京 A 股-每日分时行情
+    https://quote.eastmoney.com/concept/sh603777.html?from=classic
+    :param symbol: 股票代码
+    :type symbol: str
+    :param start_date: 开始日期
+    :type start_date: str
+    :param end_date: 结束日期
+    :type end_date: str
+    :param period: choice of {'1', '5', '15', '30', '60'}
+    :type period: str
+    :param adjust: choice of {'', 'qfq', 'hfq'}
+    :type adjust: str
+    :param client: 异步客户端; 默认使用当前事件循环的默认客户端
+    :type client: akshare.aio.AsyncClient
+    :return: 每日分时行情
+    :rtype: pandas.DataFrame
+    """
+    client = client or get_client()
+    url, params = _stock_zh_a_hist_min_em_params(symbol, period, adjust)
+    data_json = await client.get_json(url, params=params, timeout=15)
+    return _stock_zh_a_hist_min_em_parse(data_json, start_date, end_date, period)
+
+
+async def stock_hk_spot_em(client: AsyncClient = None) -> pd.DataFrame:
+    """
+    东方财富网-港股-实时行情
+    https://quote.eastmoney.com/center/gridlist.html#hk_stocks
+    :param client: 异步客户端; 默认使用当前事件循环的默认客户端
+    :type client: akshare.aio.AsyncClient
+    :return: 港股-实时行情
+    :rtype: pandas.DataFrame
+    """
+    url, params = _stock_hk_spot_em_params()
+    temp_df = await fetch_paginated_data(url, params, client=client)
+    return _stock_hk_spot_em_format(temp_df)
+
+
+async def stock_hk_hist(
+    symbol: str = "00593",
+    period: str = "daily",
+    start_date: str = "19700101",
+    end_date: str = "22220101",
+    adjust: str = "",
+    client: AsyncClient = None,
+) -> pd.DataFrame:
+    """
+    东方财富网-行情-港股-每日行情
+    https://quote.eastmoney.com/hk/08367.html
+    :param symbol: 港股-每日行情
+    :type symbol: str
+    :param period: choice of {'daily', 'weekly', 'monthly'}
+    :type period: str
+    :param start_date: 开始日期
+    :type start_date: str
+    :param end_date: 结束日期
+    :type end_date: str
+    :param adjust: choice of {"qfq": "1", "hfq": "2", "": "不复权"}
+    :type adjust: str
+    :param client: 异步客户端; 默认使用当前事件循环的默认客户端
+    :type client: akshare.aio.AsyncClient
+    :return: 每日行情
+    :rtype: pandas.DataFrame
+    """
+    client = client or get_client()
+    url, params = _stock_hk_hist_params(symbol, period, start_date, end_date, adjust)
+    data_json = await client.get_json(url, params=params, timeout=15)
+    return _stock_hk_hist_parse(data_json, start_date, end_date)
+
+
+async def stock_us_spot_em(client: AsyncClient = None) -> pd.DataFrame:
+    """
+    东方财富网-美股-实时行情
+    https://quote.eastmoney.com/center/gridlist.html#us_stocks
+    :param client: 异步客户端; 默认使用当前事件循环的默认客户端
+    :type client: akshare.aio.AsyncClient
+    :return: 美股-实时行情; 延迟 15 min
+    :rtype: pandas.DataFrame
+    """
+    url, params = _stock_us_spot_em_params()
+    temp_df = await fetch_paginated_data(url, params, client=client)
+    return _stock_us_spot_em_format(temp_df)
+
+
+async def stock_us_hist(
+    symbol: str = "105.MSFT",
+    period: str = "daily",
+    start_date: str = "19700101",
+    end_date: str = "22220101",
+    adjust: str = "",
+    client: AsyncClient = None,
+) -> pd.DataFrame:
+    """
+    东方财富网-行情-美股-每日行情
+    https://quote.eastmoney.com/us/ENTX.html#fullScreenChart
+    :param symbol: 股票代码; 此股票代码需要通过调用 ak.stock_us_spot_em() 的 `代码` 字段获取
+    :type symbol: str
+    :param period: choice of {'daily', 'weekly', 'monthly'}
+    :type period: str
+    :param start_date: 开始日期
+    :type start_date: str
+    :param end_date: 结束日期
+    :type end_date: str
+    :param adjust: choice of {"qfq": "1", "hfq": "2", "": "不复权"}
+    :type adjust: str
+    :param client: 异步客户端; 默认使用当前事件循环的默认客户端
+    :type client: akshare.aio.AsyncClient
+    :return: 每日行情
+    :rtype: pandas.DataFrame
+    """
+    client = client or get_client()
+    url, params = _stock_us_hist_params(symbol, period, start_date, end_date, adjust)
+    data_json = await client.get_json(url, params=params, timeout=15)
+    return _stock_us_hist_parse(data_json, start_date, end_date)
+
+
+if __name__ == "__main__":
+    import asyncio
+
+    async def main():
+        stock_zh_a_hist_df = await stock_zh_a_hist(
+            symbol="000001",
+            period="daily",
+            start_date="20170301",
+            end_date="20240528",
+            adjust="",
+        )
+        print(stock_zh_a_hist_df)
+
+    asyncio.run(main())
@@ -17,6 +17,7 @@ import requests
 from tqdm import tqdm
 
 from akshare.bank.cons import cbirc_headers_without_cookie_2020
+from akshare.utils.func import PageAccumulator
 
 
 def bank_fjcf_total_num(item: str = "分局本级") -> int:
@@ -94,7 +95,7 @@ def bank_fjcf_page_url(
     }
     cbirc_headers = cbirc_headers_without_cookie_2020.copy()
     main_url = "https://www.nfra.gov.cn/cbircweb/DocInfo/SelectDocByItemIdAndChild"
-    temp_df = pd.DataFrame()
+    pages = PageAccumulator()
     for i_page in tqdm(range(begin, page + begin), leave=False):
         params = {
             "itemId": item_id_list[item],
@@ -102,7 +103,8 @@ def bank_fjcf_page_url(
             "pageIndex": str(i_page),
         }
         res = requests.get(main_url, params=params, headers=cbirc_headers)
-        temp_df = pd.concat([temp_df, pd.DataFrame(res.json()["data"]["rows"])])
+        pages.append(pd.DataFrame(res.json()["data"]["rows"]))
+    temp_df = pages.to_frame()
     return temp_df[
         ["docId", "docSubtitle", "publishDate", "docFileUrl", "docTitle", "generaltype"]
     ]
@@ -123,7 +125,7 @@ def bank_fjcf_table_detail(
     :rtype: pandas.DataFrame
     """
     id_list = bank_fjcf_page_url(page=page, item=item, begin=begin)["docId"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     for item in id_list:
         url = f"https://www.nfra.gov.cn/cn/static/data/DocInfo/SelectByDocId/data_docId={item}.json"
         res = requests.get(url)
@@ -160,11 +162,12 @@ def bank_fjcf_table_detail(
             table_list.append(res.json()["data"]["publishDate"])
             table_df = pd.DataFrame(table_list)
             table_df.columns = ["内容"]
-            big_df = pd.concat(objs=[big_df, table_df.T], ignore_index=True)
+            pages.append(table_df.T)
             # 解决有些页面缺少字段的问题, 都放到 try 里面
         except:  # noqa: E722
             warnings.warn(f"{item} 不是表格型数据，将跳过采集")
             continue
+    big_df = pages.to_frame(ignore_index=True)
     if big_df.empty:
         return pd.DataFrame()
     big_df.columns = [
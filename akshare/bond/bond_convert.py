@@ -11,7 +11,7 @@ import pandas as pd
 import requests
 import time
 
-from akshare.utils import demjson
+from akshare.utils.js_literal import loads_js_literal
 
 
 def bond_cb_index_jsl() -> pd.DataFrame:
@@ -23,7 +23,7 @@ def bond_cb_index_jsl() -> pd.DataFrame:
     """
     url = "https://www.jisilu.cn/webapi/cb/index_history/"
     r = requests.get(url)
-    data_dict = demjson.decode(r.text)["data"]
+    data_dict = loads_js_literal(r.text)["data"]
     temp_df = pd.DataFrame(data_dict)
     return temp_df
 
@@ -10,6 +10,7 @@ import functools
 
 import pandas as pd
 import requests
+from akshare.utils.func import PageAccumulator
 from akshare.utils.tqdm import get_tqdm
 from akshare.bond.bond_china import bond_china_close_return_map
 
@@ -139,14 +140,15 @@ def bond_info_cm(
     r = requests.post(url, data=payload, headers=headers)
     data_json = r.json()
     total_page = data_json["data"]["pageTotal"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         payload.update({"pageNo": page})
         r = requests.post(url, data=payload, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["data"]["resultList"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.rename(
         columns={
             "bondDefinedCode": "查询代码",
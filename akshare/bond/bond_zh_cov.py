@@ -10,7 +10,6 @@ import datetime
 import re
 
 import pandas as pd
-import py_mini_racer
 import requests
 
 from akshare.bond.cons import (
@@ -19,10 +18,10 @@ from akshare.bond.cons import (
     zh_sina_bond_hs_cov_url,
     zh_sina_bond_hs_cov_hist_url,
 )
-from akshare.stock.cons import hk_js_decode
-from akshare.utils import demjson
-from akshare.utils.func import fetch_paginated_data
+from akshare.utils.js_literal import loads_js_literal
+from akshare.utils.func import fetch_paginated_data, PageAccumulator
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.sina_decode import sina_js_decode
 
 
 def _get_zh_bond_hs_cov_page_count() -> int:
@@ -50,15 +49,16 @@ def bond_zh_hs_cov_spot() -> pd.DataFrame:
     :return: 所有沪深可转债在当前时刻的实时行情数据
     :rtype: pandas.DataFrame
     """
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     page_count = _get_zh_bond_hs_cov_page_count()
     zh_sina_bond_hs_payload_copy = zh_sina_bond_hs_cov_payload.copy()
     tqdm = get_tqdm()
     for page in tqdm(range(1, page_count + 1), leave=False):
         zh_sina_bond_hs_payload_copy.update({"page": page})
         res = requests.get(zh_sina_bond_hs_cov_url, params=zh_sina_bond_hs_payload_copy)
-        data_json = demjson.decode(res.text)
-        big_df = pd.concat(objs=[big_df, pd.DataFrame(data_json)], ignore_index=True)
+        data_json = loads_js_literal(res.text)
+        pages.append(pd.DataFrame(data_json))
+    big_df = pages.to_frame(ignore_index=True)
     return big_df
 
 
@@ -76,10 +76,8 @@ def bond_zh_hs_cov_daily(symbol: str = "sh010107") -> pd.DataFrame:
             symbol, datetime.datetime.now().strftime("%Y_%m_%d")
         )
     )
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(hk_js_decode)
-    dict_list = js_code.call(
-        "d", r.text.split("=")[1].split(";")[0].replace('"', "")
+    dict_list = sina_js_decode(
+        r.text.split("=")[1].split(";")[0].replace('"', "")
     )  # 执行js解密代码
     data_df = pd.DataFrame(dict_list)
     data_df["date"] = pd.to_datetime(data_df["date"]).dt.date
@@ -332,14 +330,15 @@ def bond_zh_cov() -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
 
     big_df.columns = [
         "债券代码",
@@ -11,7 +11,6 @@ import re
 
 import pandas as pd
 import requests
-import py_mini_racer
 
 from akshare.bond.cons import (
     zh_sina_bond_hs_count_url,
@@ -19,9 +18,10 @@ from akshare.bond.cons import (
     zh_sina_bond_hs_url,
     zh_sina_bond_hs_hist_url,
 )
-from akshare.stock.cons import hk_js_decode
-from akshare.utils import demjson
+from akshare.utils.js_literal import loads_js_literal
+from akshare.utils.func import PageAccumulator
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.sina_decode import sina_js_decode
 
 
 def get_zh_bond_hs_page_count() -> int:
@@ -57,15 +57,16 @@ def bond_zh_hs_spot(start_page: str = "1", end_page: str = "10") -> pd.DataFrame
     page_count = int(page_count)
     zh_sina_bond_hs_payload_copy = zh_sina_bond_hs_payload.copy()
     tqdm = get_tqdm()
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     start_page = int(start_page)
     end_page = int(end_page) + 1 if int(end_page) + 1 <= page_count else page_count
     for page in tqdm(range(start_page, end_page), leave=False):
         zh_sina_bond_hs_payload_copy.update({"page": page})
         r = requests.get(zh_sina_bond_hs_url, params=zh_sina_bond_hs_payload_copy)
-        data_json = demjson.decode(r.text)
+        data_json = loads_js_literal(r.text)
         temp_df = pd.DataFrame(data_json)
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.columns = [
         "代码",
         "-",
@@ -129,10 +130,8 @@ def bond_zh_hs_daily(symbol: str = "sh010107") -> pd.DataFrame:
             symbol, datetime.datetime.now().strftime("%Y_%m_%d")
         )
     )
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(hk_js_decode)
-    dict_list = js_code.call(
-        "d", r.text.split("=")[1].split(";")[0].replace('"', "")
+    dict_list = sina_js_decode(
+        r.text.split("=")[1].split(";")[0].replace('"', "")
     )  # 执行 js 解密代码
     data_df = pd.DataFrame(dict_list)
     data_df["date"] = pd.to_datetime(data_df["date"], errors="coerce").dt.date
@@ -14,6 +14,8 @@ import requests
 from bs4 import BeautifulSoup
 from tqdm import tqdm
 
+from akshare.utils.func import PageAccumulator
+
 
 @lru_cache()
 def _currency_boc_sina_map(
@@ -84,12 +86,13 @@ def currency_boc_sina(
     soup.find(attrs={"id": "money_code"})
     page_element_list = soup.find_all("a", attrs={"class": "page"})
     page_num = int(page_element_list[-2].text) if len(page_element_list) != 0 else 1
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     for page in tqdm(range(1, page_num + 1), leave=False):
         params.update({"page": page})
         r = requests.get(url, params=params)
         temp_df = pd.read_html(StringIO(r.text), header=0)[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.columns = [
         "日期",
         "中行汇买价",
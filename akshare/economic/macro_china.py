@@ -19,7 +19,8 @@ from urllib3.poolmanager import PoolManager
 from akshare.economic.cons import (
     JS_CHINA_ENERGY_DAILY_URL,
 )
-from akshare.utils import demjson
+from akshare.utils.js_literal import loads_js_literal
+from akshare.utils.func import PageAccumulator
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -60,14 +61,14 @@ def __macro_china_base_func(symbol: str, params: dict) -> pd.DataFrame:
     }
     url = "https://datacenter-api.jin10.com/reports/list_v2"
     params = params
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     while True:
         r = requests.get(url, params=params, headers=headers)
         data_json = r.json()
         if not data_json["data"]["values"]:
             break
         temp_df = pd.DataFrame(data_json["data"]["values"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
         last_date_str = temp_df.iat[-1, 0]
         last_date_str = (
             (
@@ -78,6 +79,7 @@ def __macro_china_base_func(symbol: str, params: dict) -> pd.DataFrame:
             .isoformat()
         )
         params.update({"max_date": f"{last_date_str}"})
+    big_df = pages.to_frame(ignore_index=True)
     big_df.columns = [
         "日期",
         "今值",
@@ -953,7 +955,7 @@ def macro_china_au_report() -> pd.DataFrame:
         url="https://cdn.jin10.com/data_center/reports/sge.json", params=params
     )
     json_data = res.json()
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     for item in json_data["values"].keys():
         temp_df = pd.DataFrame(json_data["values"][item])
         temp_df["date"] = item
@@ -973,7 +975,8 @@ def macro_china_au_report() -> pd.DataFrame:
             "交收量",
             "日期",
         ]
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df = big_df[
         [
             "日期",
@@ -1027,14 +1030,15 @@ def macro_china_lpr() -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
 
     big_df["TRADE_DATE"] = pd.to_datetime(big_df["TRADE_DATE"], errors="coerce").dt.date
     big_df["LPR1Y"] = pd.to_numeric(big_df["LPR1Y"], errors="coerce")
@@ -1391,14 +1395,15 @@ def macro_china_vegetable_basket() -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.drop_duplicates(inplace=True)
     big_df.columns = [
         "日期",
@@ -1446,14 +1451,15 @@ def macro_china_agricultural_product() -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.drop_duplicates(inplace=True)
     big_df.columns = [
         "日期",
@@ -1501,14 +1507,15 @@ def macro_china_agricultural_index() -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.drop_duplicates(inplace=True)
     big_df.columns = [
         "日期",
@@ -1556,14 +1563,15 @@ def macro_china_energy_index() -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.drop_duplicates(inplace=True)
     big_df.columns = [
         "日期",
@@ -1611,14 +1619,15 @@ def macro_china_commodity_price_index() -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.drop_duplicates(inplace=True)
     big_df.columns = [
         "日期",
@@ -1666,14 +1675,15 @@ def macro_global_sox_index() -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.drop_duplicates(inplace=True)
     big_df.columns = [
         "日期",
@@ -1721,14 +1731,15 @@ def macro_china_yw_electronic_index() -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.drop_duplicates(inplace=True)
     big_df.columns = [
         "日期",
@@ -1779,14 +1790,15 @@ def macro_china_construction_index() -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.drop_duplicates(inplace=True)
     big_df.columns = [
         "日期",
@@ -1834,14 +1846,15 @@ def macro_china_construction_price_index() -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.drop_duplicates(inplace=True)
     big_df.columns = [
         "日期",
@@ -1889,14 +1902,15 @@ def macro_china_lpi_index() -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.drop_duplicates(inplace=True)
     big_df.columns = [
         "日期",
@@ -1944,14 +1958,15 @@ def macro_china_bdti_index() -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.drop_duplicates(inplace=True)
     big_df.columns = [
         "日期",
@@ -1999,14 +2014,15 @@ def macro_china_bsi_index() -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.drop_duplicates(inplace=True)
     big_df.columns = [
         "日期",
@@ -2054,14 +2070,15 @@ def _em_macro_1(em_id) -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.drop_duplicates(inplace=True)
     big_df.columns = [
         "日期",
@@ -3241,16 +3258,18 @@ def macro_china_society_electricity() -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("{") : -3])
+    data_json = loads_js_literal(data_text[data_text.find("{") : -3])
     page_num = math.ceil(int(data_json["count"]) / 31)
-    big_df = pd.DataFrame(data_json["data"])
+    pages = PageAccumulator()
+    pages.append(pd.DataFrame(data_json["data"]))
     for i in range(1, page_num):
         params.update({"from": i * 31})
         r = requests.get(url, params=params)
         data_text = r.text
-        data_json = demjson.decode(data_text[data_text.find("{") : -3])
+        data_json = loads_js_literal(data_text[data_text.find("{") : -3])
         temp_df = pd.DataFrame(data_json["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
 
     big_df.columns = [
         "统计时间",
@@ -3294,17 +3313,19 @@ def macro_china_society_traffic_volume() -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("{") : -3])
+    data_json = loads_js_literal(data_text[data_text.find("{") : -3])
     page_num = math.ceil(int(data_json["count"]) / 31)
-    big_df = pd.DataFrame(data_json["data"]["非累计"])
+    pages = PageAccumulator()
+    pages.append(pd.DataFrame(data_json["data"]["非累计"]))
     tqdm = get_tqdm()
     for i in tqdm(range(1, page_num), leave=False):
         params.update({"from": i * 31})
         r = requests.get(url, params=params)
         data_text = r.text
-        data_json = demjson.decode(data_text[data_text.find("{") : -3])
+        data_json = loads_js_literal(data_text[data_text.find("{") : -3])
         temp_df = pd.DataFrame(data_json["data"]["非累计"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.columns = [item[1] for item in data_json["config"]["all"]]
     big_df["货运量"] = pd.to_numeric(big_df["货运量"], errors="coerce")
     big_df["货运量同比增长"] = pd.to_numeric(big_df["货运量同比增长"], errors="coerce")
@@ -3352,17 +3373,19 @@ def macro_china_postal_telecommunicational() -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("{") : -3])
+    data_json = loads_js_literal(data_text[data_text.find("{") : -3])
     page_num = math.ceil(int(data_json["count"]) / 31)
-    big_df = pd.DataFrame(data_json["data"]["非累计"])
+    pages = PageAccumulator()
+    pages.append(pd.DataFrame(data_json["data"]["非累计"]))
     tqdm = get_tqdm()
     for i in tqdm(range(1, page_num), leave=False):
         params.update({"from": i * 31})
         r = requests.get(url, params=params)
         data_text = r.text
-        data_json = demjson.decode(data_text[data_text.find("{") : -3])
+        data_json = loads_js_literal(data_text[data_text.find("{") : -3])
         temp_df = pd.DataFrame(data_json["data"]["非累计"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.columns = [item[1] for item in data_json["config"]["all"]]
     for item in big_df.columns[1:]:
         big_df[item] = pd.to_numeric(big_df[item], errors="coerce")
@@ -3386,17 +3409,19 @@ def macro_china_international_tourism_fx() -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("{") : -3])
+    data_json = loads_js_literal(data_text[data_text.find("{") : -3])
     page_num = math.ceil(int(data_json["count"]) / 31)
-    big_df = pd.DataFrame(data_json["data"])
+    pages = PageAccumulator()
+    pages.append(pd.DataFrame(data_json["data"]))
     tqdm = get_tqdm()
     for i in tqdm(range(1, page_num)):
         params.update({"from": i * 31})
         r = requests.get(url, params=params)
         data_text = r.text
-        data_json = demjson.decode(data_text[data_text.find("{") : -3])
+        data_json = loads_js_literal(data_text[data_text.find("{") : -3])
         temp_df = pd.DataFrame(data_json["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.columns = [item[1] for item in data_json["config"]["all"]]
     big_df["数量"] = pd.to_numeric(big_df["数量"], errors="coerce")
     big_df["比重"] = pd.to_numeric(big_df["比重"], errors="coerce")
@@ -3420,17 +3445,19 @@ def macro_china_passenger_load_factor() -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("{") : -3])
+    data_json = loads_js_literal(data_text[data_text.find("{") : -3])
     page_num = math.ceil(int(data_json["count"]) / 31)
-    big_df = pd.DataFrame(data_json["data"])
+    pages = PageAccumulator()
+    pages.append(pd.DataFrame(data_json["data"]))
     tqdm = get_tqdm()
     for i in tqdm(range(1, page_num)):
         params.update({"from": i * 31})
         r = requests.get(url, params=params)
         data_text = r.text
-        data_json = demjson.decode(data_text[data_text.find("{") : -3])
+        data_json = loads_js_literal(data_text[data_text.find("{") : -3])
         temp_df = pd.DataFrame(data_json["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.columns = [item[1] for item in data_json["config"]["all"]]
     big_df["客座率"] = pd.to_numeric(big_df["客座率"], errors="coerce")
     big_df["载运率"] = pd.to_numeric(big_df["载运率"], errors="coerce")
@@ -3454,7 +3481,7 @@ def _macro_china_freight_index() -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("{") : -3])
+    data_json = loads_js_literal(data_text[data_text.find("{") : -3])
     page_num = math.ceil(int(data_json["count"]) / 31)
     big_df = pd.DataFrame(data_json["data"])
     tqdm = get_tqdm()
@@ -3462,7 +3489,7 @@ def _macro_china_freight_index() -> pd.DataFrame:
         params.update({"from": i * 31})
         r = requests.get(url, params=params)
         data_text = r.text
-        data_json = demjson.decode(data_text[data_text.find("{") : -3])
+        data_json = loads_js_literal(data_text[data_text.find("{") : -3])
         temp_df = pd.DataFrame(data_json["data"])
         big_df = big_df.append(temp_df, ignore_index=True)
     big_df.columns = [item[1] for item in data_json["config"]["all"]]
@@ -3531,17 +3558,19 @@ def macro_china_central_bank_balance() -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("{") : -3])
+    data_json = loads_js_literal(data_text[data_text.find("{") : -3])
     page_num = math.ceil(int(data_json["count"]) / 31)
-    big_df = pd.DataFrame(data_json["data"])
+    pages = PageAccumulator()
+    pages.append(pd.DataFrame(data_json["data"]))
     tqdm = get_tqdm()
     for i in tqdm(range(1, page_num)):
         params.update({"from": i * 31})
         r = requests.get(url, params=params)
         data_text = r.text
-        data_json = demjson.decode(data_text[data_text.find("{") : -3])
+        data_json = loads_js_literal(data_text[data_text.find("{") : -3])
         temp_df = pd.DataFrame(data_json["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.columns = [item[1] for item in data_json["config"]["all"]]
     for item in big_df.columns[1:]:
         big_df[item] = pd.to_numeric(big_df[item], errors="coerce")
@@ -3565,17 +3594,19 @@ def macro_china_insurance() -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("{") : -3])
+    data_json = loads_js_literal(data_text[data_text.find("{") : -3])
     page_num = math.ceil(int(data_json["count"]) / 31)
-    big_df = pd.DataFrame(data_json["data"])
+    pages = PageAccumulator()
+    pages.append(pd.DataFrame(data_json["data"]))
     tqdm = get_tqdm()
     for i in tqdm(range(1, page_num)):
         params.update({"from": i * 31})
         r = requests.get(url, params=params)
         data_text = r.text
-        data_json = demjson.decode(data_text[data_text.find("{") : -3])
+        data_json = loads_js_literal(data_text[data_text.find("{") : -3])
         temp_df = pd.DataFrame(data_json["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.columns = [item[1] for item in data_json["config"]["all"]]
     for item in big_df.columns[2:]:
         big_df[item] = pd.to_numeric(big_df[item], errors="coerce")
@@ -3599,17 +3630,19 @@ def macro_china_supply_of_money() -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("{") : -3])
+    data_json = loads_js_literal(data_text[data_text.find("{") : -3])
     page_num = math.ceil(int(data_json["count"]) / 31)
-    big_df = pd.DataFrame(data_json["data"])
+    pages = PageAccumulator()
+    pages.append(pd.DataFrame(data_json["data"]))
     tqdm = get_tqdm()
     for i in tqdm(range(1, page_num)):
         params.update({"from": i * 31})
         r = requests.get(url, params=params)
         data_text = r.text
-        data_json = demjson.decode(data_text[data_text.find("{") : -3])
+        data_json = loads_js_literal(data_text[data_text.find("{") : -3])
         temp_df = pd.DataFrame(data_json["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.columns = [item[1] for item in data_json["config"]["all"]]
     for item in big_df.columns[1:]:
         big_df[item] = pd.to_numeric(big_df[item], errors="coerce")
@@ -3633,17 +3666,19 @@ def macro_china_foreign_exchange_gold() -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("{") : -3])
+    data_json = loads_js_literal(data_text[data_text.find("{") : -3])
     page_num = math.ceil(int(data_json["count"]) / 31)
-    big_df = pd.DataFrame(data_json["data"])
+    pages = PageAccumulator()
+    pages.append(pd.DataFrame(data_json["data"]))
     tqdm = get_tqdm()
     for i in tqdm(range(1, page_num), leave=False):
         params.update({"from": i * 31})
         r = requests.get(url, params=params)
         data_text = r.text
-        data_json = demjson.decode(data_text[data_text.find("{") : -3])
+        data_json = loads_js_literal(data_text[data_text.find("{") : -3])
         temp_df = pd.DataFrame(data_json["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.columns = [item[1] for item in data_json["config"]["all"]]
     big_df.sort_values(by=["统计时间"], ignore_index=True, inplace=True)
     big_df["黄金储备"] = pd.to_numeric(big_df["黄金储备"], errors="coerce")
@@ -3668,17 +3703,19 @@ def macro_china_retail_price_index() -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("{") : -3])
+    data_json = loads_js_literal(data_text[data_text.find("{") : -3])
     page_num = math.ceil(int(data_json["count"]) / 31)
-    big_df = pd.DataFrame(data_json["data"])
+    pages = PageAccumulator()
+    pages.append(pd.DataFrame(data_json["data"]))
     tqdm = get_tqdm()
     for i in tqdm(range(1, page_num), leave=False):
         params.update({"from": i * 31})
         r = requests.get(url, params=params)
         data_text = r.text
-        data_json = demjson.decode(data_text[data_text.find("{") : -3])
+        data_json = loads_js_literal(data_text[data_text.find("{") : -3])
         temp_df = pd.DataFrame(data_json["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.columns = [item[1] for item in data_json["config"]["all"]]
     big_df.sort_values(by=["统计月份"], ignore_index=True, inplace=True)
     big_df["零售商品价格指数"] = pd.to_numeric(
@@ -3714,14 +3751,15 @@ def macro_china_real_estate() -> pd.DataFrame:
     r = requests.get(url, params=params, headers=headers)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
         r = requests.get(url, params=params, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.columns = [
         "日期",
         "最新值",
@@ -17,6 +17,8 @@ import pandas as pd
 import requests
 from tqdm import tqdm
 
+from akshare.utils.func import PageAccumulator
+
 
 # 金十数据中心-经济指标-欧元区-国民经济运行状况
 # 金十数据中心-经济指标-欧元区-国民经济运行状况-经济状况
@@ -43,7 +45,7 @@ def macro_euro_gdp_yoy() -> pd.DataFrame:
     data_json = r.json()
     date_list = data_json["data"]
     date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     for date in tqdm(date_point_list, leave=False):
         url = "https://datacenter-api.jin10.com/reports/list_v2"
         params = {
@@ -64,7 +66,8 @@ def macro_euro_gdp_yoy() -> pd.DataFrame:
             data_json["data"]["values"],
             columns=[item["name"] for item in data_json["data"]["keys"]],
         )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
 
     big_df["商品"] = "欧元区季度GDP年率"
 
@@ -101,7 +104,7 @@ def macro_euro_cpi_mom() -> pd.DataFrame:
     data_json = r.json()
     date_list = data_json["data"]
     date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     for date in tqdm(date_point_list, leave=False):
         url = "https://datacenter-api.jin10.com/reports/list_v2"
         params = {
@@ -122,7 +125,8 @@ def macro_euro_cpi_mom() -> pd.DataFrame:
             data_json["data"]["values"],
             columns=[item["name"] for item in data_json["data"]["keys"]],
         )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df["商品"] = "欧元区CPI月率"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
@@ -160,7 +164,7 @@ def macro_euro_cpi_yoy() -> pd.DataFrame:
     data_json = r.json()
     date_list = data_json["data"]
     date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     for date in tqdm(date_point_list, leave=False):
         url = "https://datacenter-api.jin10.com/reports/list_v2"
         params = {
@@ -181,7 +185,8 @@ def macro_euro_cpi_yoy() -> pd.DataFrame:
             data_json["data"]["values"],
             columns=[item["name"] for item in data_json["data"]["keys"]],
         )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df["商品"] = "欧元区CPI年率"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
@@ -218,7 +223,7 @@ def macro_euro_ppi_mom() -> pd.DataFrame:
     data_json = r.json()
     date_list = data_json["data"]
     date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     for date in tqdm(date_point_list, leave=False):
         url = "https://datacenter-api.jin10.com/reports/list_v2"
         params = {
@@ -239,7 +244,8 @@ def macro_euro_ppi_mom() -> pd.DataFrame:
             data_json["data"]["values"],
             columns=[item["name"] for item in data_json["data"]["keys"]],
         )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df["商品"] = "欧元区PPI月率"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
@@ -277,7 +283,7 @@ def macro_euro_retail_sales_mom() -> pd.DataFrame:
     data_json = r.json()
     date_list = data_json["data"]
     date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     for date in tqdm(date_point_list, leave=False):
         url = "https://datacenter-api.jin10.com/reports/list_v2"
         params = {
@@ -298,7 +304,8 @@ def macro_euro_retail_sales_mom() -> pd.DataFrame:
             data_json["data"]["values"],
             columns=[item["name"] for item in data_json["data"]["keys"]],
         )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df["商品"] = "欧元区零售销售月率"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
@@ -333,7 +340,7 @@ def macro_euro_employment_change_qoq() -> pd.DataFrame:
     data_json = r.json()
     date_list = data_json["data"]
     date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     for date in tqdm(date_point_list, leave=False):
         url = "https://datacenter-api.jin10.com/reports/list_v2"
         params = {
@@ -354,7 +361,8 @@ def macro_euro_employment_change_qoq() -> pd.DataFrame:
             data_json["data"]["values"],
             columns=[item["name"] for item in data_json["data"]["keys"]],
         )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df["商品"] = "欧元区季调后就业人数季率"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
@@ -392,7 +400,7 @@ def macro_euro_unemployment_rate_mom() -> pd.DataFrame:
     data_json = r.json()
     date_list = data_json["data"]
     date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     for date in tqdm(date_point_list, leave=False):
         url = "https://datacenter-api.jin10.com/reports/list_v2"
         params = {
@@ -413,7 +421,8 @@ def macro_euro_unemployment_rate_mom() -> pd.DataFrame:
             data_json["data"]["values"],
             columns=[item["name"] for item in data_json["data"]["keys"]],
         )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df["商品"] = "欧元区失业率"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
@@ -451,7 +460,7 @@ def macro_euro_trade_balance() -> pd.DataFrame:
     data_json = r.json()
     date_list = data_json["data"]
     date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     for date in tqdm(date_point_list, leave=False):
         url = "https://datacenter-api.jin10.com/reports/list_v2"
         params = {
@@ -472,7 +481,8 @@ def macro_euro_trade_balance() -> pd.DataFrame:
             data_json["data"]["values"],
             columns=[item["name"] for item in data_json["data"]["keys"]],
         )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df["商品"] = "欧元区未季调贸易帐"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
@@ -510,7 +520,7 @@ def macro_euro_current_account_mom() -> pd.DataFrame:
     data_json = r.json()
     date_list = data_json["data"]
     date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     for date in tqdm(date_point_list, leave=False):
         url = "https://datacenter-api.jin10.com/reports/list_v2"
         params = {
@@ -531,7 +541,8 @@ def macro_euro_current_account_mom() -> pd.DataFrame:
             data_json["data"]["values"],
             columns=[item["name"] for item in data_json["data"]["keys"]],
         )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df["商品"] = "欧元区经常帐"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
@@ -569,7 +580,7 @@ def macro_euro_industrial_production_mom() -> pd.DataFrame:
     data_json = r.json()
     date_list = data_json["data"]
     date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     for date in tqdm(date_point_list, leave=False):
         url = "https://datacenter-api.jin10.com/reports/list_v2"
         params = {
@@ -590,7 +601,8 @@ def macro_euro_industrial_production_mom() -> pd.DataFrame:
             data_json["data"]["values"],
             columns=[item["name"] for item in data_json["data"]["keys"]],
         )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df["商品"] = "欧元区工业产出月率"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
@@ -628,7 +640,7 @@ def macro_euro_manufacturing_pmi() -> pd.DataFrame:
     data_json = r.json()
     date_list = data_json["data"]
     date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     for date in tqdm(date_point_list, leave=False):
         url = "https://datacenter-api.jin10.com/reports/list_v2"
         params = {
@@ -649,7 +661,8 @@ def macro_euro_manufacturing_pmi() -> pd.DataFrame:
             data_json["data"]["values"],
             columns=[item["name"] for item in data_json["data"]["keys"]],
         )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df["商品"] = "欧元区制造业PMI初值"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
@@ -687,7 +700,7 @@ def macro_euro_services_pmi() -> pd.DataFrame:
     data_json = r.json()
     date_list = data_json["data"]
     date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     for date in tqdm(date_point_list, leave=False):
         url = "https://datacenter-api.jin10.com/reports/list_v2"
         params = {
@@ -708,7 +721,8 @@ def macro_euro_services_pmi() -> pd.DataFrame:
             data_json["data"]["values"],
             columns=[item["name"] for item in data_json["data"]["keys"]],
         )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df["商品"] = "欧元区服务业PMI终值"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
@@ -745,7 +759,7 @@ def macro_euro_zew_economic_sentiment() -> pd.DataFrame:
     data_json = r.json()
     date_list = data_json["data"]
     date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     for date in tqdm(date_point_list, leave=False):
         url = "https://datacenter-api.jin10.com/reports/list_v2"
         params = {
@@ -766,7 +780,8 @@ def macro_euro_zew_economic_sentiment() -> pd.DataFrame:
             data_json["data"]["values"],
             columns=[item["name"] for item in data_json["data"]["keys"]],
         )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df["商品"] = "欧元区ZEW经济景气指数"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
@@ -803,7 +818,7 @@ def macro_euro_sentix_investor_confidence() -> pd.DataFrame:
     data_json = r.json()
     date_list = data_json["data"]
     date_point_list = [item for num, item in enumerate(date_list) if num % 20 == 0]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     for date in tqdm(date_point_list, leave=False):
         url = "https://datacenter-api.jin10.com/reports/list_v2"
         params = {
@@ -824,7 +839,8 @@ def macro_euro_sentix_investor_confidence() -> pd.DataFrame:
             data_json["data"]["values"],
             columns=[item["name"] for item in data_json["data"]["keys"]],
         )
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df["商品"] = "欧元区Sentix投资者信心指数"
     big_df = big_df[["商品", "日期", "今值", "预测值", "前值"]]
     big_df["今值"] = pd.to_numeric(big_df["今值"])
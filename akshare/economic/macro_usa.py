@@ -12,6 +12,8 @@ import time
 import pandas as pd
 import requests
 
+from akshare.utils.func import PageAccumulator
+
 
 def __macro_usa_base_func(symbol: str, params: dict) -> pd.DataFrame:
     """
@@ -32,14 +34,14 @@ def __macro_usa_base_func(symbol: str, params: dict) -> pd.DataFrame:
     }
     url = "https://datacenter-api.jin10.com/reports/list_v2"
     params = params
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     while True:
         r = requests.get(url, params=params, headers=headers)
         data_json = r.json()
         if not data_json["data"]["values"]:
             break
         temp_df = pd.DataFrame(data_json["data"]["values"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
         last_date_str = temp_df.iat[-1, 0]
         last_date_str = (
             (
@@ -50,6 +52,7 @@ def __macro_usa_base_func(symbol: str, params: dict) -> pd.DataFrame:
             .isoformat()
         )
         params.update({"max_date": f"{last_date_str}"})
+    big_df = pages.to_frame(ignore_index=True)
     big_df.columns = [
         "日期",
         "今值",
@@ -1123,11 +1126,12 @@ def macro_usa_cme_merchant_goods_holding():
         url="https://cdn.jin10.com/data_center/reports/cme_3.json", params=params
     )
     json_data = r.json()
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     for item in json_data["values"].keys():
         temp_df = pd.DataFrame(json_data["values"][item])
         temp_df["日期"] = item
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
 
     big_df.columns = ["pz", "tc", "-", "-", "-", "成交量", "-", "-", "日期"]
     big_df["品种"] = big_df["pz"] + "-" + big_df["tc"]
@@ -26,8 +26,9 @@ import requests
 from bs4 import BeautifulSoup
 from tqdm import tqdm
 
-from akshare.utils import demjson
+from akshare.utils.js_literal import loads_js_literal
 from akshare.utils.cons import headers
+from akshare.utils.func import PageAccumulator
 
 
 def energy_carbon_domestic(symbol: str = "湖北") -> pd.DataFrame:
@@ -46,7 +47,7 @@ def energy_carbon_domestic(symbol: str = "湖北") -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("(") + 1 : -1])
+    data_json = loads_js_literal(data_text[data_text.find("(") + 1 : -1])
     temp_df = pd.DataFrame(data_json[symbol])
     temp_df.columns = [
         "成交价",
@@ -91,7 +92,7 @@ def energy_carbon_bj() -> pd.DataFrame:
         .strip(";")
         .strip('"')
     )
-    temp_df = pd.DataFrame()
+    pages = PageAccumulator()
     for i in tqdm(
         range(1, int(total_page) + 1),
         desc="Please wait for a moment",
@@ -103,7 +104,8 @@ def energy_carbon_bj() -> pd.DataFrame:
         r = requests.get(url, verify=False, headers=headers)
         r.encoding = "utf-8"
         df = pd.read_html(StringIO(r.text))[0]
-        temp_df = pd.concat(objs=[temp_df, df], ignore_index=True)
+        pages.append(df)
+    temp_df = pages.to_frame(ignore_index=True)
     temp_df.columns = ["日期", "成交量", "成交均价", "成交额"]
     temp_df["成交单位"] = (
         temp_df["成交额"]
@@ -142,14 +144,16 @@ def energy_carbon_sz() -> pd.DataFrame:
     r = requests.get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     page_num = int(soup.find(attrs={"class": "pagebar"}).find_all("option")[-1].text)
-    big_df = pd.read_html(StringIO(r.text), header=0)[0]
+    pages = PageAccumulator()
+    pages.append(pd.read_html(StringIO(r.text), header=0)[0])
     for page in tqdm(
         range(2, page_num + 1), desc="Please wait for a moment", leave=False
     ):
         url = f"http://www.cerx.cn/dailynewsCN/index_{page}.htm"
         r = requests.get(url, headers=headers)
         temp_df = pd.read_html(StringIO(r.text), header=0)[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df["交易日期"] = pd.to_datetime(big_df["交易日期"], errors="coerce").dt.date
     big_df["开盘价"] = pd.to_numeric(big_df["开盘价"], errors="coerce")
     big_df["最高价"] = pd.to_numeric(big_df["最高价"], errors="coerce")
@@ -174,14 +178,16 @@ def energy_carbon_eu() -> pd.DataFrame:
     r = requests.get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     page_num = int(soup.find(attrs={"class": "pagebar"}).find_all("option")[-1].text)
-    big_df = pd.read_html(StringIO(r.text), header=0)[0]
+    pages = PageAccumulator()
+    pages.append(pd.read_html(StringIO(r.text), header=0)[0])
     for page in tqdm(
         range(2, page_num + 1), desc="Please wait for a moment", leave=False
     ):
         url = f"http://www.cerx.cn/dailynewsOuter/index_{page}.htm"
         r = requests.get(url)
         temp_df = pd.read_html(StringIO(r.text), header=0)[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df["交易日期"] = pd.to_datetime(big_df["交易日期"], errors="coerce").dt.date
     big_df["开盘价"] = pd.to_numeric(big_df["开盘价"], errors="coerce")
     big_df["最高价"] = pd.to_numeric(big_df["最高价"], errors="coerce")
@@ -210,7 +216,7 @@ def energy_carbon_hb() -> pd.DataFrame:
     )
     start_pos = data_text.find("cjj = '[") + 7  # 找到 JSON 数组开始的位置
     end_pos = data_text.rfind("cjj =") - 31  # 找到 JSON 数组结束的位置
-    data_json = demjson.decode(data_text[start_pos:end_pos])
+    data_json = loads_js_literal(data_text[start_pos:end_pos])
     temp_df = pd.DataFrame.from_dict(data_json)
     temp_df.rename(
         columns={
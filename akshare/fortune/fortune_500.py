@@ -16,6 +16,8 @@ import requests
 from bs4 import BeautifulSoup
 from tqdm import tqdm
 
+from akshare.utils.func import PageAccumulator
+
 
 @lru_cache()
 def _fortune_rank_year_url_map() -> dict:
@@ -55,13 +57,16 @@ def fortune_rank(year: str = "2015") -> pd.DataFrame:
     elif 2006 < int(year) < 2010:
         df = pd.read_html(StringIO(r.text))[0].iloc[1:,]
         df.columns = pd.read_html(StringIO(r.text))[0].iloc[0, :].tolist()
+        pages = PageAccumulator()
+        pages.append(df)
         for page in tqdm(range(2, 11), leave=False):
             # page =2
             r = requests.get(url.rsplit(".", maxsplit=1)[0] + "_" + str(page) + ".htm")
             r.encoding = "utf-8"
             temp_df = pd.read_html(StringIO(r.text))[0].iloc[1:,]
             temp_df.columns = pd.read_html(StringIO(r.text))[0].iloc[0, :].tolist()
-            df = pd.concat(objs=[df, temp_df], ignore_index=True)
+            pages.append(temp_df)
+        df = pages.to_frame(ignore_index=True)
         return df
     else:
         df = pd.read_html(StringIO(r.text))[0]
@@ -12,6 +12,8 @@ import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 
+from akshare.utils.func import PageAccumulator
+
 
 def hurun_rank(indicator: str = "胡润百富榜", year: str = "2023") -> pd.DataFrame:
     """
@@ -62,7 +64,7 @@ def hurun_rank(indicator: str = "胡润百富榜", year: str = "2023") -> pd.Dat
         warnings.warn("正在下载中")
         offset = 0
         limit = 20
-        big_df = pd.DataFrame()
+        pages = PageAccumulator()
         while offset < 2200:
             try:
                 params.update(
@@ -76,10 +78,11 @@ def hurun_rank(indicator: str = "胡润百富榜", year: str = "2023") -> pd.Dat
                 data_json = r.json()
                 temp_df = pd.DataFrame(data_json["rows"])
                 offset = offset + 20
-                big_df = pd.concat([big_df, temp_df], ignore_index=True)
+                pages.append(temp_df)
             except requests.exceptions.JSONDecodeError:
                 offset = offset + 40
                 continue
+        big_df = pages.to_frame(ignore_index=True)
         big_df.rename(
             columns={
                 "hs_Rank_Rich_Ranking": "排名",
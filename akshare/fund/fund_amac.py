@@ -9,6 +9,7 @@ Desc: 中国证券投资基金业协会-信息公示数据
 import pandas as pd
 import requests
 
+from akshare.utils.func import PageAccumulator
 from akshare.utils.tqdm import get_tqdm
 
 headers = {
@@ -57,14 +58,15 @@ def amac_member_info() -> pd.DataFrame:
     r = requests.post(url, params=params, json={}, headers=headers)
     data_json = r.json()
     total_page = data_json["totalPages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(0, int(total_page)), leave=False):
         params.update({"page": page})
         r = requests.post(url, params=params, json={}, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     keys_list = [
         "managerName",
         "memberBehalf",
@@ -147,7 +149,7 @@ def amac_person_fund_org_list(symbol: str = "公募基金管理公司") -> pd.Da
     )
     data_json = r.json()
     total_page = data_json["totalPages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(0, int(total_page)), leave=False):
         params.update({"page": page})
@@ -160,7 +162,8 @@ def amac_person_fund_org_list(symbol: str = "公募基金管理公司") -> pd.Da
         )
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     keys_list = [
         "orgName",
         "orgType",
@@ -253,14 +256,15 @@ def amac_manager_info() -> pd.DataFrame:
     r = requests.post(url, params=params, json={}, verify=False, headers=headers)
     data_json = r.json()
     total_page = data_json["totalPages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(0, int(total_page)), leave=False):
         params.update({"page": page})
         r = requests.post(url, params=params, json={}, verify=False, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     keys_list = [
         "managerName",
         "artificialPersonName",
@@ -307,14 +311,15 @@ def amac_manager_classify_info() -> pd.DataFrame:
     r = requests.post(url, params=params, json={}, verify=False, headers=headers)
     data_json = r.json()
     total_page = data_json["totalPages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(0, int(total_page)), leave=False):
         params.update({"page": page})
         r = requests.post(url, params=params, json={}, verify=False, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     keys_list = [
         "managerName",
         "artificialPersonName",
@@ -378,14 +383,15 @@ def amac_member_sub_info() -> pd.DataFrame:
     r = requests.post(url, params=params, json={}, verify=False, headers=headers)
     data_json = r.json()
     total_page = data_json["totalPages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(0, int(total_page)), leave=False):
         params.update({"page": page})
         r = requests.post(url, params=params, json={}, verify=False, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     keys_list = [
         "managerName",
         "memberBehalf",
@@ -436,14 +442,15 @@ def amac_fund_info(start_page: str = "1", end_page: str = "2000") -> pd.DataFram
         real_end_page = int(end_page)
     else:
         real_end_page = total_page
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(int(start_page) - 1, real_end_page), leave=False):
         params.update({"page": page})
         r = requests.post(url, params=params, json={}, verify=False, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     keys_list = [
         "fundName",
         "managerName",
@@ -489,14 +496,15 @@ def amac_securities_info() -> pd.DataFrame:
     r = requests.post(url, params=params, json={}, verify=False, headers=headers)
     data_json = r.json()
     total_page = data_json["totalPages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(0, int(total_page)), leave=False):
         params.update({"page": page})
         r = requests.post(url, params=params, json={}, verify=False, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     keys_list = [
         "cpmc",
         "cpbm",
@@ -543,14 +551,15 @@ def amac_aoin_info() -> pd.DataFrame:
     r = requests.post(url, params=params, json={}, verify=False, headers=headers)
     data_json = r.json()
     total_page = data_json["totalPages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(0, int(total_page)), leave=False):
         params.update({"page": page})
         r = requests.post(url, params=params, json={}, verify=False, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     keys_list = [
         "code",
         "name",
@@ -590,14 +599,15 @@ def amac_fund_sub_info() -> pd.DataFrame:
     r = requests.post(url, params=params, json={}, verify=False, headers=headers)
     data_json = r.json()
     total_page = data_json["totalPages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(0, int(total_page)), leave=False):
         params.update({"page": page})
         r = requests.post(url, params=params, json={}, verify=False, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     keys_list = [
         "productCode",
         "productName",
@@ -646,14 +656,15 @@ def amac_fund_account_info() -> pd.DataFrame:
     r = requests.post(url, params=params, json={}, verify=False, headers=headers)
     data_json = r.json()
     total_page = data_json["totalPages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(0, int(total_page)), leave=False):
         params.update({"page": page})
         r = requests.post(url, params=params, json={}, verify=False, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     keys_list = [
         "registerDate",
         "registerCode",
@@ -691,14 +702,15 @@ def amac_fund_abs() -> pd.DataFrame:
     r = requests.post(url, params=params, json={}, verify=False, headers=headers)
     data_json = r.json()
     total_page = data_json["totalPages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(0, int(total_page)), leave=False):
         params.update({"page": page})
         r = requests.post(url, params=params, json={}, verify=False, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.reset_index(inplace=True)
     big_df["index"] = range(1, len(big_df) + 1)
     big_df.columns = [
@@ -750,14 +762,15 @@ def amac_futures_info() -> pd.DataFrame:
     r = requests.post(url, params=params, json={}, verify=False, headers=headers)
     data_json = r.json()
     total_page = data_json["totalPages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(0, int(total_page)), leave=False):
         params.update({"page": page})
         r = requests.post(url, params=params, json={}, verify=False, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     keys_list = [
         "mpiName",
         "mpiProductCode",
@@ -808,14 +821,15 @@ def amac_manager_cancelled_info() -> pd.DataFrame:
     r = requests.post(url, params=params, json={}, verify=False, headers=headers)
     data_json = r.json()
     total_page = data_json["totalPages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(0, int(total_page)), leave=False):
         params.update({"page": page})
         r = requests.post(url, params=params, json={}, verify=False, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     keys_list = [
         "orgName",
         "orgCode",
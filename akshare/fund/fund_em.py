@@ -17,15 +17,19 @@ https://fundf10.eastmoney.com/jjjl_001810.html
 
 import json
 import math
+import threading
 import time
+from collections import OrderedDict
 from io import StringIO
+from typing import Any, Callable, List
 
 import pandas as pd
-import py_mini_racer
 import requests
 
-from akshare.utils import demjson
 from akshare.utils.cons import headers
+from akshare.utils.func import run_batch
+from akshare.utils.js_literal import extract_js_vars, loads_js_literal
+from akshare.utils.ratelimit import get_rate_limiter
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -45,7 +49,7 @@ def fund_purchase_em() -> pd.DataFrame:
     }
     r = requests.get(url, params=params, headers=headers)
     data_text = r.text
-    data_json = demjson.decode(data_text.strip("var reData="))
+    data_json = extract_js_vars(data_text, names=["reData"])["reData"]
     temp_df = pd.DataFrame(data_json["datas"])
     temp_df.reset_index(inplace=True)
     temp_df["index"] = temp_df.index + 1
@@ -106,7 +110,7 @@ def fund_name_em() -> pd.DataFrame:
     url = "https://fund.eastmoney.com/js/fundcode_search.js"
     r = requests.get(url, headers=headers)
     text_data = r.text
-    data_json = demjson.decode(text_data.strip("var r = ")[:-1])
+    data_json = extract_js_vars(text_data, names=["r"])["r"]
     temp_df = pd.DataFrame(data_json)
     temp_df.columns = ["基金代码", "拼音缩写", "基金简称", "基金类型", "拼音全称"]
     return temp_df
@@ -286,7 +290,7 @@ def fund_open_fund_daily_em() -> pd.DataFrame:
     }
     res = requests.get(url, params=params, headers=headers)
     text_data = res.text
-    data_json = demjson.decode(text_data.strip("var db="))
+    data_json = extract_js_vars(text_data, names=["db"])["db"]
     temp_df = pd.DataFrame(data_json["datas"])
     show_day = data_json["showday"]
     temp_df.columns = [
@@ -330,33 +334,174 @@ def fund_open_fund_daily_em() -> pd.DataFrame:
     return data_df
 
 
-def fund_open_fund_info_em(
-    symbol: str = "710001", indicator: str = "单位净值走势", period: str = "成立来"
-) -> pd.DataFrame:
+# 天天基金 pingzhongdata/{symbol}.js 中各指标对应的变量
+_PINGZHONG_INDICATOR_VAR = {
+    "单位净值走势": "Data_netWorthTrend",
+    "累计净值走势": "Data_ACWorthTrend",
+    "每万份收益": "Data_millionCopiesIncome",
+    "7日年化收益率": "Data_sevenDaysYearIncome",
+    "同类排名走势": "Data_rateInSimilarType",
+    "同类排名百分比": "Data_rateInSimilarPersent",
+}
+
+# 分红送配详情和拆分详情在同一个页面中
+_FHSP_INDICATOR = ("分红送配详情", "拆分详情")
+
+_fund_info_ttl = 60
+_fund_info_maxsize = 64
+_fund_info_cache = OrderedDict()
+# 正在使用的 key 到 [锁, 使用者数量] 的映射; 没有线程使用时删除, 避免随基金数量增长
+_fund_info_locks = {}
+_fund_info_lock = threading.Lock()
+
+
+def set_fund_open_fund_info_ttl(ttl: float = 60) -> None:
     """
-    东方财富网-天天基金网-基金数据-开放式基金净值
-    https://fund.eastmoney.com/fund.html
-    :param symbol: 基金代码; 可以通过调用 ak.fund_open_fund_daily_em() 获取所有开放式基金代码
+    设置开放式基金净值原始数据的缓存时间
+    :param ttl: 缓存时间（秒）; 0 表示每次都重新下载
+    :type ttl: float
+    """
+    global _fund_info_ttl
+    with _fund_info_lock:
+        _fund_info_ttl = ttl
+        _fund_info_cache.clear()
+
+
+def set_fund_open_fund_info_cache_size(maxsize: int = 64) -> None:
+    """
+    设置开放式基金净值原始数据最多缓存的条数, 超过时淘汰最久未使用的数据
+    :param maxsize: 最多缓存的条数; 每只基金的走势数据和分红送配数据各占一条; 0 表示不缓存
+    :type maxsize: int
+    """
+    global _fund_info_maxsize
+    with _fund_info_lock:
+        _fund_info_maxsize = maxsize
+        _fund_info_evict()
+
+
+def _fund_info_evict() -> None:
+    """
+    删除已过期的缓存, 并按最近使用顺序把缓存条数限制在 maxsize 以内; 调用方需持有 _fund_info_lock
+    """
+    now = time.monotonic()
+    expired = [
+        key for key, (deadline, _) in _fund_info_cache.items() if deadline <= now
+    ]
+    for key in expired:
+        del _fund_info_cache[key]
+    while len(_fund_info_cache) > max(_fund_info_maxsize, 0):
+        _fund_info_cache.popitem(last=False)
+
+
+def _fund_info_cached(key: tuple, func: Callable, use_cache: bool = True) -> Any:
+    """
+    在 ttl 秒内复用同一个 key 的结果; 并发请求同一个 key 时只下载一次
+    :param key: 缓存键
+    :type key: tuple
+    :param func: 无参数的获取函数
+    :type func: function
+    :param use_cache: 是否读写缓存; 批量获取时每个 key 只请求一次, 不需要缓存
+    :type use_cache: bool
+    :return: 获取函数的结果
+    :rtype: object
+    """
+    if not use_cache:
+        return func()
+    with _fund_info_lock:
+        key_lock = _fund_info_locks.setdefault(key, [threading.Lock(), 0])
+        key_lock[1] += 1
+    try:
+        # 并发请求同一个 key 时只有一个线程下载, 其余线程等待后直接读取缓存
+        with key_lock[0]:
+            with _fund_info_lock:
+                cached = _fund_info_cache.get(key)
+                if cached is not None and time.monotonic() < cached[0]:
+                    _fund_info_cache.move_to_end(key)
+                    return cached[1]
+            value = func()
+            with _fund_info_lock:
+                if _fund_info_ttl > 0 and _fund_info_maxsize > 0:
+                    _fund_info_cache[key] = (time.monotonic() + _fund_info_ttl, value)
+                    _fund_info_cache.move_to_end(key)
+                    _fund_info_evict()
+        return value
+    finally:
+        with _fund_info_lock:
+            key_lock[1] -= 1
+            if key_lock[1] == 0:
+                del _fund_info_locks[key]
+
+
+def _fund_pingzhong_data(symbol: str, use_cache: bool = True) -> dict:
+    """
+    天天基金网-基金数据-pingzhongdata 中的全部走势变量
+    整个文件只下载一次, 变量的字面量直接按 JSON 解析, 不是严格 JSON 时才交给 V8 执行
+    https://fund.eastmoney.com/pingzhongdata/710001.js
+    :param symbol: 基金代码
     :type symbol: str
-    :param indicator: 需要获取的指标
-    :type indicator: str
-    :param period: "成立来"; choice of {"1月", "3月", "6月", "1年", "3年", "5年", "今年来", "成立来"}
-    :type period: str
-    :return: 指定基金指定指标的数据
-    :rtype: pandas.DataFrame
+    :param use_cache: 是否读写缓存
+    :type use_cache: bool
+    :return: 变量名到数据的映射; 文件中没有的变量为空列表
+    :rtype: dict
     """
-    from akshare.utils.cons import headers
 
-    url = f"https://fund.eastmoney.com/pingzhongdata/{symbol}.js"  # 各类数据都在里面
-    r = requests.get(url, headers=headers)
-    data_text = r.text
+    def _fetch() -> dict:
+        url = (
+            f"https://fund.eastmoney.com/pingzhongdata/{symbol}.js"  # 各类数据都在里面
+        )
+        r = requests.get(url, headers=headers)
+        data = extract_js_vars(
+            r.text, names=_PINGZHONG_INDICATOR_VAR.values(), fallback="v8"
+        )
+        return {item: data.get(item, []) for item in _PINGZHONG_INDICATOR_VAR.values()}
+
+    return _fund_info_cached(("pingzhongdata", symbol), _fetch, use_cache)
+
+
+def _fund_fhsp_tables(symbol: str, use_cache: bool = True) -> dict:
+    """
+    天天基金网-基金档案-分红送配, 一次下载同时解析分红送配详情和拆分详情
+    https://fundf10.eastmoney.com/fhsp_710001.html
+    :param symbol: 基金代码
+    :type symbol: str
+    :param use_cache: 是否读写缓存
+    :type use_cache: bool
+    :return: 指标到数据的映射
+    :rtype: dict
+    """
 
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(data_text)
+    def _fetch() -> dict:
+        url = f"https://fundf10.eastmoney.com/fhsp_{symbol}.html"
+        r = requests.get(url, headers=headers)
+        tables = pd.read_html(StringIO(r.text))
+        if len(tables) == 3:
+            fhsp_df, cf_df = tables[1], tables[2]
+        else:
+            fhsp_df, cf_df = tables[0], tables[1]
+        return {
+            "分红送配详情": pd.DataFrame()
+            if fhsp_df.iloc[0, 1] == "暂无分红信息!"
+            else fhsp_df,
+            "拆分详情": pd.DataFrame()
+            if cf_df.iloc[0, 1] == "暂无拆分信息!"
+            else cf_df,
+        }
 
+    return _fund_info_cached(("fhsp", symbol), _fetch, use_cache)
+
+
+def _fund_pingzhong_frame(indicator: str, data_json: list) -> pd.DataFrame:
+    """
+    整理 pingzhongdata 中的单个指标
+    :param indicator: _PINGZHONG_INDICATOR_VAR 中的指标
+    :type indicator: str
+    :param data_json: 指标对应的变量
+    :type data_json: list
+    :return: 指定指标的数据
+    :rtype: pandas.DataFrame
+    """
     # 单位净值走势
     if indicator == "单位净值走势":
-        data_json = js_code.execute("Data_netWorthTrend")
         temp_df = pd.DataFrame(data_json)
         if temp_df.empty:
             return pd.DataFrame()
@@ -384,93 +529,86 @@ def fund_open_fund_info_em(
         temp_df["日增长率"] = pd.to_numeric(temp_df["日增长率"], errors="coerce")
         return temp_df
 
-    # 累计净值走势
-    if indicator == "累计净值走势":
-        data_json = js_code.execute("Data_ACWorthTrend")
+    # 同类排名走势
+    if indicator == "同类排名走势":
         temp_df = pd.DataFrame(data_json)
         if temp_df.empty:
             return pd.DataFrame()
-        temp_df.columns = ["x", "y"]
         temp_df["x"] = pd.to_datetime(temp_df["x"], unit="ms", utc=True).dt.tz_convert(
             "Asia/Shanghai"
         )
         temp_df["x"] = temp_df["x"].dt.date
         temp_df.columns = [
-            "净值日期",
-            "累计净值",
+            "报告日期",
+            "同类型排名-每日近三月排名",
+            "总排名-每日近三月排名",
         ]
         temp_df = temp_df[
             [
-                "净值日期",
-                "累计净值",
+                "报告日期",
+                "同类型排名-每日近三月排名",
+                "总排名-每日近三月排名",
             ]
         ]
-        temp_df["净值日期"] = pd.to_datetime(
-            temp_df["净值日期"], errors="coerce"
+        temp_df["报告日期"] = pd.to_datetime(
+            temp_df["报告日期"], errors="coerce"
         ).dt.date
-        temp_df["累计净值"] = pd.to_numeric(temp_df["累计净值"], errors="coerce")
-        return temp_df
-
-    # 每万份收益
-    if indicator == "每万份收益":
-        data_json = js_code.execute("Data_millionCopiesIncome")
-        temp_df = pd.DataFrame(data_json)
-        if temp_df.empty:
-            return pd.DataFrame()
-        temp_df.columns = ["x", "y"]
-        temp_df["x"] = pd.to_datetime(temp_df["x"], unit="ms", utc=True).dt.tz_convert(
-            "Asia/Shanghai"
+        temp_df["同类型排名-每日近三月排名"] = pd.to_numeric(
+            temp_df["同类型排名-每日近三月排名"], errors="coerce"
+        )
+        temp_df["总排名-每日近三月排名"] = pd.to_numeric(
+            temp_df["总排名-每日近三月排名"], errors="coerce"
         )
-        temp_df["x"] = temp_df["x"].dt.date
-        temp_df.columns = [
-            "净值日期",
-            "每万份收益",
-        ]
-        temp_df = temp_df[
-            [
-                "净值日期",
-                "每万份收益",
-            ]
-        ]
-        temp_df["净值日期"] = pd.to_datetime(
-            temp_df["净值日期"], errors="coerce"
-        ).dt.date
-        temp_df["每万份收益"] = pd.to_numeric(temp_df["每万份收益"], errors="coerce")
         return temp_df
 
-    # 7日年化收益率
-    if indicator == "7日年化收益率":
-        data_json = js_code.execute("Data_sevenDaysYearIncome")
-        temp_df = pd.DataFrame(data_json)
-        if temp_df.empty:
-            return pd.DataFrame()
-        temp_df.columns = ["x", "y"]
-        temp_df["x"] = pd.to_datetime(temp_df["x"], unit="ms", utc=True).dt.tz_convert(
-            "Asia/Shanghai"
-        )
-        temp_df["x"] = temp_df["x"].dt.date
-        temp_df.columns = [
-            "净值日期",
-            "7日年化收益率",
-        ]
-        temp_df = temp_df[
-            [
-                "净值日期",
-                "7日年化收益率",
-            ]
-        ]
-        temp_df["净值日期"] = pd.to_datetime(
-            temp_df["净值日期"], errors="coerce"
-        ).dt.date
-        temp_df["7日年化收益率"] = pd.to_numeric(
-            temp_df["7日年化收益率"], errors="coerce"
+    # 累计净值走势, 每万份收益, 7日年化收益率, 同类排名百分比: 均为 [时间戳, 数值] 两列
+    date_column, value_column = {
+        "累计净值走势": ("净值日期", "累计净值"),
+        "每万份收益": ("净值日期", "每万份收益"),
+        "7日年化收益率": ("净值日期", "7日年化收益率"),
+        "同类排名百分比": ("报告日期", "同类型排名-每日近3月收益排名百分比"),
+    }[indicator]
+    temp_df = pd.DataFrame(data_json)
+    if temp_df.empty:
+        return pd.DataFrame()
+    temp_df.columns = ["x", "y"]
+    temp_df["x"] = pd.to_datetime(temp_df["x"], unit="ms", utc=True).dt.tz_convert(
+        "Asia/Shanghai"
+    )
+    temp_df["x"] = temp_df["x"].dt.date
+    temp_df.columns = [
+        date_column,
+        value_column,
+    ]
+    temp_df[date_column] = pd.to_datetime(temp_df[date_column], errors="coerce").dt.date
+    temp_df[value_column] = pd.to_numeric(temp_df[value_column], errors="coerce")
+    return temp_df
+
+
+def fund_open_fund_info_em(
+    symbol: str = "710001", indicator: str = "单位净值走势", period: str = "成立来"
+) -> pd.DataFrame:
+    """
+    东方财富网-天天基金网-基金数据-开放式基金净值
+    https://fund.eastmoney.com/fund.html
+    :param symbol: 基金代码; 可以通过调用 ak.fund_open_fund_daily_em() 获取所有开放式基金代码
+    :type symbol: str
+    :param indicator: 需要获取的指标
+    :type indicator: str
+    :param period: "成立来"; choice of {"1月", "3月", "6月", "1年", "3年", "5年", "今年来", "成立来"}
+    :type period: str
+    :return: 指定基金指定指标的数据
+    :rtype: pandas.DataFrame
+    """
+    if indicator in _PINGZHONG_INDICATOR_VAR:
+        data = _fund_pingzhong_data(symbol)
+        return _fund_pingzhong_frame(
+            indicator, data[_PINGZHONG_INDICATOR_VAR[indicator]]
         )
-        return temp_df
 
     # 累计收益率走势
     if indicator == "累计收益率走势":
         url = "https://api.fund.eastmoney.com/pinzhong/LJSYLZS"
-        headers = {"Referer": "https://fund.eastmoney.com/"}
         period_map = {
             "1月": "m",
             "3月": "q",
@@ -486,7 +624,9 @@ def fund_open_fund_info_em(
             "indexcode": "000300",
             "type": period_map[period],
         }
-        r = requests.get(url, params=params, headers=headers)
+        r = requests.get(
+            url, params=params, headers={"Referer": "https://fund.eastmoney.com/"}
+        )
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["Data"][0]["data"])
         temp_df.columns = ["日期", "累计收益率"]
@@ -497,92 +637,114 @@ def fund_open_fund_info_em(
         temp_df["累计收益率"] = pd.to_numeric(temp_df["累计收益率"], errors="coerce")
         return temp_df
 
-    # 同类排名走势
-    if indicator == "同类排名走势":
-        data_json = js_code.execute("Data_rateInSimilarType")
-        temp_df = pd.DataFrame(data_json)
-        temp_df["x"] = pd.to_datetime(temp_df["x"], unit="ms", utc=True).dt.tz_convert(
-            "Asia/Shanghai"
-        )
-        temp_df["x"] = temp_df["x"].dt.date
-        temp_df.columns = [
-            "报告日期",
-            "同类型排名-每日近三月排名",
-            "总排名-每日近三月排名",
-        ]
-        temp_df = temp_df[
-            [
-                "报告日期",
-                "同类型排名-每日近三月排名",
-                "总排名-每日近三月排名",
-            ]
-        ]
-        temp_df["报告日期"] = pd.to_datetime(
-            temp_df["报告日期"], errors="coerce"
-        ).dt.date
-        temp_df["同类型排名-每日近三月排名"] = pd.to_numeric(
-            temp_df["同类型排名-每日近三月排名"], errors="coerce"
-        )
-        temp_df["总排名-每日近三月排名"] = pd.to_numeric(
-            temp_df["总排名-每日近三月排名"], errors="coerce"
-        )
-        return temp_df
+    # 分红送配详情, 拆分详情
+    if indicator in _FHSP_INDICATOR:
+        return _fund_fhsp_tables(symbol)[indicator].copy()
+    return pd.DataFrame()
 
-    # 同类排名百分比
-    if indicator == "同类排名百分比":
-        data_json = js_code.execute("Data_rateInSimilarPersent")
-        temp_df = pd.DataFrame(data_json)
-        temp_df.columns = ["x", "y"]
-        temp_df["x"] = pd.to_datetime(temp_df["x"], unit="ms", utc=True).dt.tz_convert(
-            "Asia/Shanghai"
-        )
-        temp_df["x"] = temp_df["x"].dt.date
-        temp_df.columns = [
-            "报告日期",
-            "同类型排名-每日近3月收益排名百分比",
-        ]
-        temp_df = temp_df[
-            [
-                "报告日期",
-                "同类型排名-每日近3月收益排名百分比",
-            ]
-        ]
-        temp_df["报告日期"] = pd.to_datetime(
-            temp_df["报告日期"], errors="coerce"
-        ).dt.date
-        temp_df["同类型排名-每日近3月收益排名百分比"] = pd.to_numeric(
-            temp_df["同类型排名-每日近3月收益排名百分比"], errors="coerce"
-        )
-        return temp_df
 
-    # 分红送配详情
-    if indicator == "分红送配详情":
-        url = f"https://fundf10.eastmoney.com/fhsp_{symbol}.html"
-        r = requests.get(url, headers=headers)
-        table_num = len(pd.read_html(StringIO(r.text)))
-        if table_num == 3:
-            temp_df = pd.read_html(StringIO(r.text))[1]
-        else:
-            temp_df = pd.read_html(StringIO(r.text))[0]
-        if temp_df.iloc[0, 1] == "暂无分红信息!":
-            return pd.DataFrame()
-        else:
-            return temp_df
+def fund_open_fund_info_bundle_em(
+    symbol: str = "710001", indicator_list: List[str] = None
+) -> dict:
+    """
+    东方财富网-天天基金网-基金数据-开放式基金净值-多个指标
+    pingzhongdata 中的走势指标只下载和执行一次, 分红送配详情和拆分详情只下载一次; 原始数据会缓存一段时间
+    https://fund.eastmoney.com/fund.html
+    :param symbol: 基金代码
+    :type symbol: str
+    :param indicator_list: 需要获取的指标; 默认为 "单位净值走势", "累计净值走势", "每万份收益", "7日年化收益率", "同类排名走势", "同类排名百分比", "分红送配详情", "拆分详情"; 累计收益率走势需要单独调用 fund_open_fund_info_em
+    :type indicator_list: list
+    :return: 指标到数据的映射
+    :rtype: dict
+    """
+    return _fund_open_fund_info_bundle(symbol, indicator_list)
 
-    # 拆分详情
-    if indicator == "拆分详情":
-        url = f"https://fundf10.eastmoney.com/fhsp_{symbol}.html"
-        r = requests.get(url, headers=headers)
-        table_num = len(pd.read_html(StringIO(r.text)))
-        if table_num == 3:
-            temp_df = pd.read_html(StringIO(r.text))[2]
-        else:
-            temp_df = pd.read_html(StringIO(r.text))[1]
-        if temp_df.iloc[0, 1] == "暂无拆分信息!":
-            return pd.DataFrame()
+
+def _fund_open_fund_info_bundle(
+    symbol: str, indicator_list: List[str] = None, use_cache: bool = True
+) -> dict:
+    """
+    东方财富网-天天基金网-基金数据-开放式基金净值-多个指标
+    :param symbol: 基金代码
+    :type symbol: str
+    :param indicator_list: 需要获取的指标; 默认同 fund_open_fund_info_bundle_em
+    :type indicator_list: list
+    :param use_cache: 是否读写原始数据的缓存
+    :type use_cache: bool
+    :return: 指标到数据的映射
+    :rtype: dict
+    """
+    if indicator_list is None:
+        indicator_list = list(_PINGZHONG_INDICATOR_VAR) + list(_FHSP_INDICATOR)
+    for indicator in indicator_list:
+        if (
+            indicator not in _PINGZHONG_INDICATOR_VAR
+            and indicator not in _FHSP_INDICATOR
+        ):
+            raise ValueError(
+                f"indicator must be in {list(_PINGZHONG_INDICATOR_VAR) + list(_FHSP_INDICATOR)}"
+            )
+    bundle = {}
+    if any(item in _PINGZHONG_INDICATOR_VAR for item in indicator_list):
+        data = _fund_pingzhong_data(symbol, use_cache)
+    if any(item in _FHSP_INDICATOR for item in indicator_list):
+        fhsp_dict = _fund_fhsp_tables(symbol, use_cache)
+    for indicator in indicator_list:
+        if indicator in _PINGZHONG_INDICATOR_VAR:
+            bundle[indicator] = _fund_pingzhong_frame(
+                indicator, data[_PINGZHONG_INDICATOR_VAR[indicator]]
+            )
         else:
-            return temp_df
-    return pd.DataFrame()
+            bundle[indicator] = fhsp_dict[indicator].copy()
+    return bundle
+
+
+def fund_open_fund_info_em_batch(
+    symbol: List[str],
+    indicator_list: List[str] = None,
+    max_workers: int = 8,
+    rate: float = 10,
+) -> dict:
+    """
+    东方财富网-天天基金网-基金数据-开放式基金净值-批量获取
+    多只基金并发请求, 每只基金的各个指标来自同一次下载
+    https://fund.eastmoney.com/fund.html
+    :param symbol: 基金代码列表
+    :type symbol: list
+    :param indicator_list: 需要获取的指标; 默认同 fund_open_fund_info_bundle_em
+    :type indicator_list: list
+    :param max_workers: 并发线程数
+    :type max_workers: int
+    :param rate: 每秒最多请求的基金数
+    :type rate: float
+    :return: 指标到长格式数据的映射, 数据中增加基金代码列, 各基金按输入顺序排列; 获取失败的基金及原因记录在每个数据的 attrs["failed"] 中
+    :rtype: dict
+    """
+    symbol_list = [symbol] if isinstance(symbol, str) else list(symbol)
+    if indicator_list is None:
+        indicator_list = list(_PINGZHONG_INDICATOR_VAR) + list(_FHSP_INDICATOR)
+    limiter = get_rate_limiter("https://fund.eastmoney.com/pingzhongdata/", rate=rate)
+    result_dict, failed_dict = run_batch(
+        symbol_list,
+        # 批量获取时每只基金只下载一次, 不写入缓存, 避免大量基金的数据常驻内存
+        lambda item: _fund_open_fund_info_bundle(
+            symbol=item, indicator_list=indicator_list, use_cache=False
+        ),
+        limiter=limiter,
+        max_workers=max_workers,
+    )
+    big_dict = {}
+    for indicator in indicator_list:
+        frames = []
+        for item in symbol_list:
+            if item in result_dict and not result_dict[item][indicator].empty:
+                temp_df = result_dict[item][indicator].copy()
+                temp_df.insert(0, "基金代码", item)
+                frames.append(temp_df)
+        big_df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+        big_df.attrs["failed"] = failed_dict
+        big_dict[indicator] = big_df
+    return big_dict
 
 
 def fund_money_fund_daily_em() -> pd.DataFrame:
@@ -777,7 +939,7 @@ def fund_financial_fund_info_em(symbol: str = "000134") -> pd.DataFrame:
     }
     r = requests.get(url, params=params, headers=headers)
     text_data = r.text
-    data_json = demjson.decode(text_data[text_data.find("{") : -1])
+    data_json = loads_js_literal(text_data[text_data.find("{") : -1])
     temp_df = pd.DataFrame(data_json["Data"]["LSJZList"])
     temp_df.columns = [
         "净值日期",
@@ -839,7 +1001,7 @@ def fund_graded_fund_daily_em() -> pd.DataFrame:
     }
     res = requests.get(url, params=params, headers=headers)
     text_data = res.text
-    data_json = demjson.decode(text_data.strip("var db="))
+    data_json = extract_js_vars(text_data, names=["db"])["db"]
     temp_df = pd.DataFrame(data_json["datas"])
     show_day = data_json["showday"]
     temp_df.columns = [
@@ -7,11 +7,10 @@ https://vip.stock.finance.sina.com.cn/fund_center/index.html#jjhqetf
 """
 
 import pandas as pd
-import py_mini_racer
 import requests
 
-from akshare.stock.cons import hk_js_decode
-from akshare.utils import demjson
+from akshare.utils.js_literal import extract_js_vars, loads_js_literal
+from akshare.utils.sina_decode import sina_js_decode
 
 
 def fund_etf_category_sina(symbol: str = "LOF基金") -> pd.DataFrame:
@@ -42,7 +41,7 @@ def fund_etf_category_sina(symbol: str = "LOF基金") -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("([") + 1 : -2])
+    data_json = loads_js_literal(data_text[data_text.find("([") + 1 : -2])
     temp_df = pd.DataFrame(data_json)
     if symbol == "封闭式基金":
         temp_df.columns = [
@@ -126,10 +125,8 @@ def fund_etf_hist_sina(symbol: str = "sh510050") -> pd.DataFrame:
         f"https://finance.sina.com.cn/realstock/company/{symbol}/hisdata_klc2/klc_kl.js"
     )
     r = requests.get(url)
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(hk_js_decode)
-    dict_list = js_code.call(
-        "d", r.text.split("=")[1].split(";")[0].replace('"', "")
+    dict_list = sina_js_decode(
+        r.text.split("=")[1].split(";")[0].replace('"', "")
     )  # 执行js解密代码
     temp_df = pd.DataFrame(dict_list)
     if temp_df.empty:  # 处理获取数据为空的问题
@@ -163,8 +160,8 @@ def fund_etf_dividend_sina(symbol: str = "sh510050") -> pd.DataFrame:
     r = requests.get(factor_url)
     text = r.text
     if text.startswith("var"):
-        json_str = text.split("=")[1].strip().rsplit("}", maxsplit=1)[0].strip()
-        data = eval(json_str + "}")  # 这里使用eval而不是json.loads因为数据格式特殊
+        data_dict = extract_js_vars(text)
+        data = next(iter(data_dict.values()), None)
 
         if isinstance(data, dict) and "data" in data:
             df = pd.DataFrame(data["data"])
@@ -9,7 +9,7 @@ https://fund.eastmoney.com/data/xinfound.html
 import pandas as pd
 import requests
 
-from akshare.utils import demjson
+from akshare.utils.js_literal import loads_js_literal
 
 
 def fund_new_found_em() -> pd.DataFrame:
@@ -30,7 +30,7 @@ def fund_new_found_em() -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text.strip("var newfunddata="))
+    data_json = loads_js_literal(data_text.strip("var newfunddata="))
     temp_df = pd.DataFrame(data_json["datas"])
     temp_df.columns = [
         "基金代码",
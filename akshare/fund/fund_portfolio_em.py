@@ -12,7 +12,8 @@ import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 
-from akshare.utils import demjson
+from akshare.utils.js_literal import loads_js_literal
+from akshare.utils.func import PageAccumulator
 
 
 def fund_portfolio_hold_em(symbol: str = "000001", date: str = "2024") -> pd.DataFrame:
@@ -37,7 +38,7 @@ def fund_portfolio_hold_em(symbol: str = "000001", date: str = "2024") -> pd.Dat
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("{") : -1])
+    data_json = loads_js_literal(data_text[data_text.find("{") : -1])
     soup = BeautifulSoup(data_json["content"], features="lxml")
     item_label = [
         item.text.split("\xa0\xa0")[1]
@@ -125,13 +126,13 @@ def fund_portfolio_bond_hold_em(
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("{") : -1])
+    data_json = loads_js_literal(data_text[data_text.find("{") : -1])
     soup = BeautifulSoup(data_json["content"], features="lxml")
     item_label = [
         item.text.split("\xa0\xa0")[1]
         for item in soup.find_all(name="h4", attrs={"class": "t"})
     ]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     for item in range(len(item_label)):
         temp_df = pd.read_html(
             StringIO(data_json["content"]), converters={"债券代码": str}
@@ -151,7 +152,8 @@ def fund_portfolio_bond_hold_em(
                 "季度",
             ]
         ]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df["占净值比例"] = pd.to_numeric(big_df["占净值比例"], errors="coerce")
     big_df["持仓市值"] = pd.to_numeric(big_df["持仓市值"], errors="coerce")
     big_df["序号"] = range(1, len(big_df) + 1)
@@ -191,7 +193,7 @@ def fund_portfolio_industry_allocation_em(
     }
     r = requests.get(url, params=params, headers=headers)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("{") : -1])
+    data_json = loads_js_literal(data_text[data_text.find("{") : -1])
     temp_list = []
     for item in data_json["Data"]["QuarterInfos"]:
         temp_list.extend(item["HYPZInfo"])
@@ -260,13 +262,13 @@ def fund_portfolio_change_em(
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("{") : -1])
+    data_json = loads_js_literal(data_text[data_text.find("{") : -1])
     soup = BeautifulSoup(data_json["content"], features="lxml")
     item_label = [
         item.text.split("\xa0\xa0")[1]
         for item in soup.find_all(name="h4", attrs={"class": "t"})
     ]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     for item in range(len(item_label)):
         temp_df = pd.read_html(
             StringIO(data_json["content"]), converters={"股票代码": str}
@@ -296,7 +298,8 @@ def fund_portfolio_change_em(
                 "季度",
             ]
         ]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     del big_df["序号"]
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df.index + 1
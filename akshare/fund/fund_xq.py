@@ -9,6 +9,8 @@ https://danjuanfunds.com/funding/003545
 import pandas as pd
 import requests
 
+from akshare.utils.func import PageAccumulator
+
 
 def fund_individual_basic_info_xq(
     symbol: str = "000001", timeout: float = None
@@ -95,7 +97,7 @@ def fund_individual_achievement_xq(
     }
     r = requests.get(url, headers=headers, timeout=timeout)
     json_data = r.json()["data"]
-    combined_df = None
+    pages = PageAccumulator()
     type_dict = {
         "annual_performance_list": "年度业绩",
         "stage_performance_list": "阶段业绩",
@@ -119,7 +121,8 @@ def fund_individual_achievement_xq(
             "本产品最大回撒",
             "周期收益同类排名",
         ]
-        combined_df = pd.concat([combined_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    combined_df = pages.to_frame(ignore_index=True)
     combined_df = combined_df.map(
         lambda x: x if "%" not in str(x) else x.replace("%", "")
     )
@@ -241,7 +244,7 @@ def fund_individual_detail_info_xq(
     }
     r = requests.get(url, headers=headers, timeout=timeout)
     json_data = r.json()["data"]
-    combined_df = None
+    pages = PageAccumulator()
     rate_type_dict = {
         "declare_rate_table": "买入规则",
         "withdraw_rate_table": "卖出规则",
@@ -262,8 +265,9 @@ def fund_individual_detail_info_xq(
             "条件或名称",
             "费用",
         ]
-        combined_df = pd.concat(objs=[combined_df, temp_df], ignore_index=True)
-        combined_df["费用"] = pd.to_numeric(combined_df["费用"], errors="coerce")
+        pages.append(temp_df)
+    combined_df = pages.to_frame(ignore_index=True)
+    combined_df["费用"] = pd.to_numeric(combined_df["费用"], errors="coerce")
     return combined_df
 
 
@@ -16,22 +16,32 @@ http://www.czce.com.cn/cn/exchange/2014/datatradeholding/20140515.txt
 
 import datetime
 import json
+import os
 import re
+import threading
 import time
 import warnings
 import zipfile
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from io import StringIO
+from typing import Iterator, Tuple
 
 import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 
+from akshare.exceptions import NetworkError
 from akshare.futures import cons
 from akshare.futures.requests_fun import requests_link
-from akshare.futures.symbol_var import symbol_varieties
+from akshare.futures.symbol_var import symbol_varieties, symbol_varieties_series
+from akshare.utils.archive import download_spooled, iter_zip_members
+from akshare.utils.day_cache import day_cached
+from akshare.utils.func import PageAccumulator, run_batch
+from akshare.utils.hist_store import read_frame, write_frame
 
-calendar = cons.get_calendar()
+calendar = cons.get_trade_calendar()
 rank_columns = [
     "vol_party_name",
     "vol",
@@ -53,10 +63,44 @@ intColumns = [
 ]
 
 
+_rank_exchange_semaphore = {}
+
+
+def set_rank_exchange_limit(limit: int = 2) -> None:
+    """
+    设置采集持仓排名时每个交易所同时进行的 HTTP 请求数上限, 对并发的交易日和合约同时生效
+    :param limit: 每个交易所同时进行的请求数
+    :type limit: int
+    """
+    if limit < 1:
+        raise ValueError("limit must be >= 1")
+    global _rank_exchange_semaphore
+    _rank_exchange_semaphore = {
+        market: threading.BoundedSemaphore(limit)
+        for market in ["dce", "shfe", "czce", "cffex", "gfex"]
+    }
+
+
+set_rank_exchange_limit()
+
+
+@contextmanager
+def _rank_request(market: str):
+    """
+    占用一个交易所的请求名额, 包在每一次 HTTP 请求外
+    :param market: 交易所
+    :type market: str
+    """
+    with _rank_exchange_semaphore[market]:
+        yield
+
+
 def get_rank_sum_daily(
     start_day: str = "20210510",
     end_day: str = "20210510",
     vars_list: list = cons.contract_symbols,
+    max_workers: int = 4,
+    checkpoint_dir: str = None,
 ):
     """
     采集四个期货交易所前 5、前 10、前 15、前 20 会员持仓排名数据
@@ -69,7 +113,11 @@ def get_rank_sum_daily(
     :type end_day: str
     :param vars_list: 合约品种如 ['RB'、'AL'] 等列表为空时为所有商品
     :type vars_list: list
-    :return:  会员持仓排名数据
+    :param max_workers: 同时采集的交易日数
+    :type max_workers: int
+    :param checkpoint_dir: 断点目录; 每个交易日完成后立即保存到该目录, 再次运行时跳过已保存的交易日
+    :type checkpoint_dir: str
+    :return:  会员持仓排名数据; 采集失败的交易日及原因记录在 attrs["failed"] 中
     :rtype: pandas.DataFrame
     symbol                           标的合约                     string
     var                              商品品种                     string
@@ -89,22 +137,45 @@ def get_rank_sum_daily(
         if end_day is not None
         else cons.convert_date(cons.get_latest_data_date(datetime.datetime.now()))
     )
-    records = pd.DataFrame()
-    while start_day <= end_day:
-        print(start_day)
-        if start_day.strftime("%Y%m%d") in calendar:
-            data = get_rank_sum(start_day, vars_list)
-            if data is False:
-                print(
-                    f"{start_day.strftime('%Y-%m-%d')}日交易所数据连接失败，已超过20次，您的地址被网站墙了，请保存好返回数据，稍后从该日期起重试"
-                )
-                return records.reset_index(drop=True)
-            records = pd.concat(objs=[records, data], ignore_index=True)
-        else:
-            warnings.warn(f"{start_day.strftime('%Y%m%d')}非交易日")
-        start_day += datetime.timedelta(days=1)
+    day_list = calendar.between(start_day, end_day)
 
-    return records.reset_index(drop=True)
+    def _checkpoint_path(day: str) -> str:
+        return os.path.join(checkpoint_dir, f"rank_sum_{day}.pkl")
+
+    stored_dict = {}
+    if checkpoint_dir:
+        for day in day_list:
+            stored_df = read_frame(_checkpoint_path(day))
+            if stored_df is not None:
+                stored_dict[day] = stored_df
+
+    def _fetch(day: str) -> pd.DataFrame:
+        data = get_rank_sum(datetime.datetime.strptime(day, "%Y%m%d").date(), vars_list)
+        if data is False:
+            raise NetworkError("交易所数据连接失败")
+        if data is not None and checkpoint_dir:
+            write_frame(data, _checkpoint_path(day))
+        return data
+
+    result_dict, failed_dict = run_batch(
+        [day for day in day_list if day not in stored_dict],
+        _fetch,
+        max_workers=max_workers,
+    )
+    result_dict.update(stored_dict)
+    if failed_dict:
+        print(
+            f"{', '.join(sorted(failed_dict))} 日交易所数据连接失败，请稍后重试"
+            + ("; 已完成的交易日已保存至断点目录" if checkpoint_dir else "")
+        )
+    pages = PageAccumulator()
+    for day in day_list:
+        if day in result_dict:
+            pages.append(result_dict[day])
+    records = pages.to_frame(ignore_index=True)
+    records = records.reset_index(drop=True)
+    records.attrs["failed"] = failed_dict
+    return records
 
 
 def get_rank_sum(date: str = "20210525", vars_list: list = cons.contract_symbols):
@@ -138,33 +209,26 @@ def get_rank_sum(date: str = "20210525", vars_list: list = cons.contract_symbols
     czce_var = [i for i in vars_list if i in cons.market_exchange_symbols["czce"]]
     cffex_var = [i for i in vars_list if i in cons.market_exchange_symbols["cffex"]]
     gfex_var = [i for i in vars_list if i in cons.market_exchange_symbols["gfex"]]
-    big_dict = {}
+    tasks = []
     if len(dce_var) > 0:
-        data = futures_dce_position_rank(date, dce_var)
-        if data is False:
-            return False
-        big_dict.update(data)
+        tasks.append((futures_dce_position_rank, (date, dce_var)))
     if len(shfe_var) > 0:
-        data = get_shfe_rank_table(date, shfe_var)
-        if data is False:
-            return False
-        big_dict.update(data)
+        tasks.append((get_shfe_rank_table, (date, shfe_var)))
     if len(czce_var) > 0:
-        data = get_rank_table_czce(date)
-        if data is False:
-            return False
-        big_dict.update(data)
+        tasks.append((get_rank_table_czce, (date,)))
     if len(cffex_var) > 0:
-        data = get_cffex_rank_table(date, cffex_var)
-        if data is False:
-            return False
-        big_dict.update(data)
+        tasks.append((get_cffex_rank_table, (date, cffex_var)))
     if len(gfex_var) > 0:
-        data = futures_gfex_position_rank(date, gfex_var)
+        tasks.append((futures_gfex_position_rank, (date, gfex_var)))
+    # 各交易所并发请求, 按原顺序合并
+    with ThreadPoolExecutor(max_workers=max(len(tasks), 1)) as executor:
+        results = list(executor.map(lambda task: task[0](*task[1]), tasks))
+    big_dict = {}
+    for data in results:
         if data is False:
             return False
         big_dict.update(data)
-    records = pd.DataFrame()
+    pages = PageAccumulator()
 
     for symbol, table in big_dict.items():
         table = table.map(lambda x: 0 if x == "" else x)
@@ -250,9 +314,8 @@ def get_rank_sum(date: str = "20210525", vars_list: list = cons.contract_symbols
                     ].sum(),
                     "date": date.strftime("%Y%m%d"),
                 }
-                records = pd.concat(
-                    [records, pd.DataFrame(big_dict, index=[0])], ignore_index=True
-                )
+                pages.append(pd.DataFrame(big_dict, index=[0]))
+    records = pages.to_frame(ignore_index=True)
 
     if len(big_dict.items()) > 0:
         add_vars = [
@@ -262,16 +325,20 @@ def get_rank_sum(date: str = "20210525", vars_list: list = cons.contract_symbols
             + cons.market_exchange_symbols["cffex"]
             if i in records["variety"].tolist()
         ]
+        var_pages = PageAccumulator()
+        var_pages.append(records)
         for var in add_vars:
             records_cut = records[records["variety"] == var]
             var_record = pd.DataFrame(records_cut.sum()).T
             var_record["date"] = date.strftime("%Y%m%d")
             var_record.loc[:, ["variety", "symbol"]] = var
-            records = pd.concat([records, var_record], ignore_index=True)
+            var_pages.append(var_record)
+        records = var_pages.to_frame(ignore_index=True)
 
     return records.reset_index(drop=True)
 
 
+@day_cached("SHFE")
 def get_shfe_rank_table(
     date: str = None, vars_list: list = cons.contract_symbols
 ) -> dict:
@@ -309,7 +376,8 @@ def get_shfe_rank_table(
         warnings.warn("%s非交易日" % date.strftime("%Y%m%d"))
         return {}
     url = cons.SHFE_VOL_RANK_URL_20250701 % (date.strftime("%Y%m%d"))
-    r = requests_link(url, encoding="utf-8", headers=cons.shfe_headers)
+    with _rank_request("shfe"):
+        r = requests_link(url, encoding="utf-8", headers=cons.shfe_headers)
     try:
         context = json.loads(r.text)
     except:  # noqa: E722
@@ -338,7 +406,7 @@ def get_shfe_rank_table(
         return {}
     df = df.map(lambda x: x.strip() if isinstance(x, str) else x)
     df = df.map(lambda x: None if x == "" else x)
-    df["variety"] = df["symbol"].apply(lambda x: symbol_varieties(x))
+    df["variety"] = symbol_varieties_series(df["symbol"])
     df = df[df["rank"] > 0]
     for col in [
         "PARTICIPANTID1",
@@ -384,7 +452,8 @@ def _czce_df_read(url, skip_rows, encoding="utf-8", header=0):
         "JlAxy_z0C15_KdO8kOI18i4K0rFERNPxjXq5qG1Gs.QiOm976wODY.pe8XCQtAsuLYJ."
         "N4DpTgNfHJp04jhMl0SntHhr.jhh3dFjMXBx.JEHngXBzY6gQAhER7uSKAeSktruxFeuKlebse.vrPghHqWvJm4WPTEvDQ8q",
     }
-    r = requests_link(url, encoding, headers=headers)
+    with _rank_request("czce"):
+        r = requests_link(url, encoding, headers=headers)
 
     data = pd.read_html(
         StringIO(r.text),
@@ -405,6 +474,7 @@ def _czce_df_read(url, skip_rows, encoding="utf-8", header=0):
     return data
 
 
+@day_cached("CZCE")
 def get_rank_table_czce(date: str = "20251103") -> dict:
     """
     郑州商品交易所前 20 会员持仓排名数据明细
@@ -450,7 +520,8 @@ def get_rank_table_czce(date: str = "20251103") -> dict:
             f"http://www.czce.com.cn/cn/DFSStaticFiles/Future/{date.year}/"
             f"{date.isoformat().replace('-', '')}/FutureDataHolding.xls"
         )
-    r = requests.get(url, headers=headers)
+    with _rank_request("czce"):
+        r = requests.get(url, headers=headers)
     temp_df = pd.read_excel(BytesIO(r.content))
 
     temp_pinzhong_index = [
@@ -512,6 +583,10 @@ def get_rank_table_czce(date: str = "20251103") -> dict:
     return new_big_dict
 
 
+_DCE_CONTRACT_WORKERS = 4
+_DCE_CONTRACT_RETRIES = 6
+
+
 def _get_dce_contract_list(date, var):
     """
     大连商品交易所取消了品种排名，只提供标的合约排名，需要获取标的合约列表
@@ -545,9 +620,10 @@ def _get_dce_contract_list(date, var):
         "contract": "",
     }
 
-    while 1:
+    for attempt in range(_DCE_CONTRACT_RETRIES):
         try:
-            r = requests.post(url, params=params, headers=headers)
+            with _rank_request("dce"):
+                r = requests.post(url, params=params, headers=headers, timeout=20)
             soup = BeautifulSoup(r.text, "lxml")
             contract_list = [
                 re.findall(
@@ -559,17 +635,139 @@ def _get_dce_contract_list(date, var):
             contract_list = [var.lower() + item for item in contract_list]
             return contract_list  # noqa: E722
         except:  # noqa: E722
-            time.sleep(5)
-            continue
+            # 指数退避, 不再无限重试
+            time.sleep(min(2**attempt, 30))
+    # 缺少品种的排名表不完整, 不能当作当天的结果返回
+    raise NetworkError(f"{date.strftime('%Y%m%d')} {var} 合约列表获取失败")
 
 
+def _dce_rank_contract(date, date_string, var: str, symbol: str):
+    """
+    大连商品交易所单个合约的前 20 会员持仓排名
+    :param date: 日期
+    :type date: datetime.date
+    :param date_string: 输出的 date 列
+    :type date_string: str
+    :param var: 合约品种
+    :type var: str
+    :param symbol: 合约
+    :type symbol: str
+    :return: 持仓排名; 请求失败时抛出 NetworkError
+    :rtype: pandas.DataFrame
+    """
+    url = cons.DCE_VOL_RANK_URL_1 % (
+        var.lower(),
+        symbol,
+        var.lower(),
+        date.year,
+        date.month - 1,
+        date.day,
+    )
+    try:
+        with _rank_request("dce"):
+            temp_df = pd.read_excel(url[:-3] + "excel", header=0, skiprows=3)
+        temp_df.dropna(how="any", axis=0, inplace=True)
+        temp_df = temp_df.map(lambda x: str(x).replace(",", ""))
+        del temp_df["名次.1"]
+        del temp_df["名次.2"]
+        temp_df.rename(
+            columns={
+                "名次": "rank",
+                "会员简称": "vol_party_name",
+                "成交量": "vol",
+                "增减": "vol_chg",
+                "会员简称.1": "long_party_name",
+                "持买单量": "long_open_interest",
+                "增减.1": "long_open_interest_chg",
+                "会员简称.2": "short_party_name",
+                "持卖单量": "short_open_interest",
+                "增减.2": "short_open_interest_chg",
+            },
+            inplace=True,
+        )
+        temp_df["symbol"] = symbol.upper()
+        temp_df["var"] = var
+        temp_df["date"] = date_string
+        temp_df = temp_df.map(lambda x: str(x).replace("-", "0") if x == "-" else x)
+        temp_df["rank"] = range(1, len(temp_df) + 1)
+        temp_df["vol"] = temp_df["vol"].astype(float)
+        temp_df["vol_chg"] = temp_df["vol_chg"].astype(float)
+        temp_df["long_open_interest"] = temp_df["long_open_interest"].astype(float)
+        temp_df["long_open_interest_chg"] = temp_df["long_open_interest_chg"].astype(
+            float
+        )
+        temp_df["short_open_interest"] = temp_df["short_open_interest"].astype(float)
+        temp_df["short_open_interest_chg"] = temp_df["short_open_interest_chg"].astype(
+            float
+        )
+        return temp_df
+    except:  # noqa: E722
+        temp_url = (
+            "http://portal.dce.com.cn/publicweb/quotesdata/memberDealPosiQuotes.html"
+        )
+        payload = {
+            "memberDealPosiQuotes.variety": var.lower(),
+            "memberDealPosiQuotes.trade_type": "0",
+            "year": date.year,
+            "month": date.month - 1,
+            "day": str(date.day).zfill(2),
+            "contract.contract_id": symbol,
+            "contract.variety_id": var.lower(),
+            "contract": "",
+        }
+        with _rank_request("dce"):
+            r = requests.post(temp_url, data=payload)
+        if r.status_code != 200:
+            raise NetworkError(
+                f"{date.strftime('%Y%m%d')} {symbol} 持仓排名获取失败: {r.status_code}"
+            )
+        else:
+            temp_df = pd.read_html(StringIO(r.text))[1].iloc[:-1, :]
+            del temp_df["名次.1"]
+            del temp_df["名次.2"]
+            temp_df.rename(
+                columns={
+                    "名次": "rank",
+                    "会员简称": "vol_party_name",
+                    "成交量": "vol",
+                    "增减": "vol_chg",
+                    "会员简称.1": "long_party_name",
+                    "持买单量": "long_open_interest",
+                    "增减.1": "long_open_interest_chg",
+                    "会员简称.2": "short_party_name",
+                    "持卖单量": "short_open_interest",
+                    "增减.2": "short_open_interest_chg",
+                },
+                inplace=True,
+            )
+            temp_df["symbol"] = symbol.upper()
+            temp_df["var"] = var
+            temp_df["date"] = date_string
+            temp_df = temp_df.map(lambda x: str(x).replace("-", "0") if x == "-" else x)
+            temp_df["rank"] = range(1, len(temp_df) + 1)
+            temp_df["vol"] = temp_df["vol"].astype(float)
+            temp_df["vol_chg"] = temp_df["vol_chg"].astype(float)
+            temp_df["long_open_interest"] = temp_df["long_open_interest"].astype(float)
+            temp_df["long_open_interest_chg"] = temp_df[
+                "long_open_interest_chg"
+            ].astype(float)
+            temp_df["short_open_interest"] = temp_df["short_open_interest"].astype(
+                float
+            )
+            temp_df["short_open_interest_chg"] = temp_df[
+                "short_open_interest_chg"
+            ].astype(float)
+            return temp_df
+
+
+@day_cached("DCE")
 def get_dce_rank_table(date: str = "20230706", vars_list=cons.contract_symbols) -> dict:
     """
     大连商品交易所前 20 会员持仓排名数据明细, 由于交易所网站问题, 需要 20200720 之后才有数据
     注: 该交易所只公布标的合约排名
     :param date: 日期 format：YYYY-MM-DD 或 YYYYMMDD 或 datetime.date 对象, 为空时为当天
     :param vars_list: 合约品种如 RB、AL 等列表为空时为所有商品, 数据从 20060104 开始，每交易日 16:30 左右更新数据
-    :return: 持仓排名
+    :return: 持仓排名; 任一品种的合约列表或合约排名获取失败时抛出 NetworkError, 不返回不完整的结果
     :rtype: pandas.DataFrame
 
     返回值格式
@@ -597,122 +795,26 @@ def get_dce_rank_table(date: str = "20230706", vars_list=cons.contract_symbols)
         warnings.warn("%s非交易日" % date.strftime("%Y%m%d"))
         return {}
     vars_list = [i for i in vars_list if i in cons.market_exchange_symbols["dce"]]
-    big_dict = {}
-    for var in vars_list:
-        # var = 'V'
-        symbol_list = _get_dce_contract_list(date, var)
-        for symbol in symbol_list:
-            # print(symbol)
-            url = cons.DCE_VOL_RANK_URL_1 % (
-                var.lower(),
-                symbol,
-                var.lower(),
-                date.year,
-                date.month - 1,
-                date.day,
+    # 先并发获取各品种的合约列表, 再并发获取各合约的排名
+    with ThreadPoolExecutor(max_workers=_DCE_CONTRACT_WORKERS) as executor:
+        symbol_lists = list(
+            executor.map(lambda var: _get_dce_contract_list(date, var), vars_list)
+        )
+        pairs = [
+            (var, symbol)
+            for var, symbol_list in zip(vars_list, symbol_lists)
+            for symbol in symbol_list
+        ]
+        tables = list(
+            executor.map(
+                lambda pair: _dce_rank_contract(date, date_string, *pair), pairs
             )
-            try:
-                temp_df = pd.read_excel(url[:-3] + "excel", header=0, skiprows=3)
-                temp_df.dropna(how="any", axis=0, inplace=True)
-                temp_df = temp_df.map(lambda x: str(x).replace(",", ""))
-                del temp_df["名次.1"]
-                del temp_df["名次.2"]
-                temp_df.rename(
-                    columns={
-                        "名次": "rank",
-                        "会员简称": "vol_party_name",
-                        "成交量": "vol",
-                        "增减": "vol_chg",
-                        "会员简称.1": "long_party_name",
-                        "持买单量": "long_open_interest",
-                        "增减.1": "long_open_interest_chg",
-                        "会员简称.2": "short_party_name",
-                        "持卖单量": "short_open_interest",
-                        "增减.2": "short_open_interest_chg",
-                    },
-                    inplace=True,
-                )
-                temp_df["symbol"] = symbol.upper()
-                temp_df["var"] = var
-                temp_df["date"] = date_string
-                temp_df = temp_df.map(
-                    lambda x: str(x).replace("-", "0") if x == "-" else x
-                )
-                temp_df["rank"] = range(1, len(temp_df) + 1)
-                temp_df["vol"] = temp_df["vol"].astype(float)
-                temp_df["vol_chg"] = temp_df["vol_chg"].astype(float)
-                temp_df["long_open_interest"] = temp_df["long_open_interest"].astype(
-                    float
-                )
-                temp_df["long_open_interest_chg"] = temp_df[
-                    "long_open_interest_chg"
-                ].astype(float)
-                temp_df["short_open_interest"] = temp_df["short_open_interest"].astype(
-                    float
-                )
-                temp_df["short_open_interest_chg"] = temp_df[
-                    "short_open_interest_chg"
-                ].astype(float)
-                big_dict[symbol] = temp_df
-            except:  # noqa: E722
-                temp_url = "http://portal.dce.com.cn/publicweb/quotesdata/memberDealPosiQuotes.html"
-                payload = {
-                    "memberDealPosiQuotes.variety": var.lower(),
-                    "memberDealPosiQuotes.trade_type": "0",
-                    "year": date.year,
-                    "month": date.month - 1,
-                    "day": str(date.day).zfill(2),
-                    "contract.contract_id": symbol,
-                    "contract.variety_id": var.lower(),
-                    "contract": "",
-                }
-                r = requests.post(temp_url, data=payload)
-                if r.status_code != 200:
-                    big_dict[symbol] = {}
-                else:
-                    temp_df = pd.read_html(StringIO(r.text))[1].iloc[:-1, :]
-                    del temp_df["名次.1"]
-                    del temp_df["名次.2"]
-                    temp_df.rename(
-                        columns={
-                            "名次": "rank",
-                            "会员简称": "vol_party_name",
-                            "成交量": "vol",
-                            "增减": "vol_chg",
-                            "会员简称.1": "long_party_name",
-                            "持买单量": "long_open_interest",
-                            "增减.1": "long_open_interest_chg",
-                            "会员简称.2": "short_party_name",
-                            "持卖单量": "short_open_interest",
-                            "增减.2": "short_open_interest_chg",
-                        },
-                        inplace=True,
-                    )
-                    temp_df["symbol"] = symbol.upper()
-                    temp_df["var"] = var
-                    temp_df["date"] = date_string
-                    temp_df = temp_df.map(
-                        lambda x: str(x).replace("-", "0") if x == "-" else x
-                    )
-                    temp_df["rank"] = range(1, len(temp_df) + 1)
-                    temp_df["vol"] = temp_df["vol"].astype(float)
-                    temp_df["vol_chg"] = temp_df["vol_chg"].astype(float)
-                    temp_df["long_open_interest"] = temp_df[
-                        "long_open_interest"
-                    ].astype(float)
-                    temp_df["long_open_interest_chg"] = temp_df[
-                        "long_open_interest_chg"
-                    ].astype(float)
-                    temp_df["short_open_interest"] = temp_df[
-                        "short_open_interest"
-                    ].astype(float)
-                    temp_df["short_open_interest_chg"] = temp_df[
-                        "short_open_interest_chg"
-                    ].astype(float)
-                    big_dict[symbol] = temp_df
+        )
+    big_dict = {symbol: table for (_, symbol), table in zip(pairs, tables)}
     return big_dict
 
 
+@day_cached("CFFEX")
 def get_cffex_rank_table(date: str = "20190805", vars_list=cons.contract_symbols):
     """
     中国金融期货交易所前 20 会员持仓排名数据明细
@@ -761,7 +863,8 @@ def get_cffex_rank_table(date: str = "20190805", vars_list=cons.contract_symbols
         )
         # url = 'http://www.cffex.com.cn/sj/ccpm/201908/05/IF_1.csv'
         # url = 'http://www.cffex.com.cn/sj/ccpm/202308/08/IF_1.csv'
-        r = requests.get(url, headers=headers)
+        with _rank_request("cffex"):
+            r = requests.get(url, headers=headers)
         # 20200316 开始数据结构变化，统一格式
         if r.status_code == 200:
             try:
@@ -815,23 +918,226 @@ def _table_cut_cal(table_cut, symbol):
     return table_cut
 
 
-def futures_dce_position_rank(
+def _dce_position_rank_member(z: zipfile.ZipFile, file_name: str) -> pd.DataFrame:
+    """
+    大连商品交易所-每日持仓排名-解析压缩包中的单个合约文件
+    :param z: 持仓排名压缩包
+    :type z: zipfile.ZipFile
+    :param file_name: 合约文件名, 如 20201105_c2011_成交量_买持仓_卖持仓排名.txt
+    :type file_name: str
+    :return: 该合约的持仓排名; 没有活跃合约时返回空表
+    :rtype: pandas.DataFrame
+    """
+    try:
+        data = pd.read_table(z.open(file_name), header=None, sep="\t")
+        if sum(data.iloc[:, 0].str.find("会员类别") == 0) > 0:
+            data = data.iloc[:-6]
+        if len(data) < 12:  # 处理没有活跃合约的情况
+            return pd.DataFrame()
+        temp_filter = data[data.iloc[:, 0].str.find("名次") == 0].index.tolist()
+        if (
+            temp_filter[1] - temp_filter[0] < 5
+        ):  # 过滤有无成交量但是有买卖持仓的数据, 如 20201105_c2011_成交量_买持仓_卖持仓排名.txt
+            return pd.DataFrame()
+        start_list = data[data.iloc[:, 0].str.find("名次") == 0].index.tolist()
+        data = data.iloc[
+            start_list[0] :,
+            data.columns[data.iloc[start_list[0], :].notnull()],
+        ]
+        data.reset_index(inplace=True, drop=True)
+        start_list = data[data.iloc[:, 0].str.find("名次") == 0].index.tolist()
+        end_list = data[
+            data.iloc[:, 0].str.contains(r"(?:总计|合计)", na=False)
+        ].index.tolist()
+        part_one = data[start_list[0] : end_list[0]].iloc[1:, :]
+        part_two = data[start_list[1] : end_list[1]].iloc[1:, :]
+        part_three = data[start_list[2] : end_list[2]].iloc[1:, :]
+        temp_df = pd.concat(
+            objs=[
+                part_one.reset_index(drop=True),
+                part_two.reset_index(drop=True),
+                part_three.reset_index(drop=True),
+            ],
+            axis=1,
+            ignore_index=True,
+        )
+        temp_df.columns = [
+            "名次",
+            "会员简称",
+            "成交量",
+            "增减",
+            "名次",
+            "会员简称",
+            "持买单量",
+            "增减",
+            "名次",
+            "会员简称",
+            "持卖单量",
+            "增减",
+        ]
+        temp_df["rank"] = range(1, len(temp_df) + 1)
+        del temp_df["名次"]
+        temp_df.columns = [
+            "vol_party_name",
+            "vol",
+            "vol_chg",
+            "long_party_name",
+            "long_open_interest",
+            "long_open_interest_chg",
+            "short_party_name",
+            "short_open_interest",
+            "short_open_interest_chg",
+            "rank",
+        ]
+        temp_df["symbol"] = file_name.split("_")[1].upper()
+        temp_df["variety"] = file_name.split("_")[1][:-4].upper()
+        temp_df = temp_df[
+            [
+                "long_open_interest",
+                "long_open_interest_chg",
+                "long_party_name",
+                "rank",
+                "short_open_interest",
+                "short_open_interest_chg",
+                "short_party_name",
+                "vol",
+                "vol_chg",
+                "vol_party_name",
+                "symbol",
+                "variety",
+            ]
+        ]
+        temp_df = temp_df.map(lambda x: str(x).replace(",", ""))
+        temp_df["long_open_interest"] = pd.to_numeric(
+            temp_df["long_open_interest"], errors="coerce"
+        )
+        temp_df["long_open_interest_chg"] = pd.to_numeric(
+            temp_df["long_open_interest_chg"], errors="coerce"
+        )
+        temp_df["rank"] = pd.to_numeric(temp_df["rank"], errors="coerce")
+        temp_df["short_open_interest"] = pd.to_numeric(
+            temp_df["short_open_interest"], errors="coerce"
+        )
+        temp_df["short_open_interest_chg"] = pd.to_numeric(
+            temp_df["short_open_interest_chg"], errors="coerce"
+        )
+        temp_df["vol"] = pd.to_numeric(temp_df["vol"], errors="coerce")
+        temp_df["vol_chg"] = pd.to_numeric(temp_df["vol_chg"], errors="coerce")
+        return temp_df
+    except UnicodeDecodeError:
+        try:
+            data = pd.read_table(
+                z.open(file_name),
+                header=None,
+                sep="\\s+",
+                encoding="gb2312",
+                skiprows=3,
+            )
+        except:  # noqa: E722
+            data = pd.read_table(
+                z.open(file_name),
+                header=None,
+                sep="\\s+",
+                encoding="gb2312",
+                skiprows=4,
+            )
+        start_list = data[data.iloc[:, 0].str.find("名次") == 0].index.tolist()
+        end_list = data[data.iloc[:, 0].str.find("总计") == 0].index.tolist()
+        part_one = data[start_list[0] : end_list[0]].iloc[1:, :]
+        part_two = data[start_list[1] : end_list[1]].iloc[1:, :]
+        part_three = data[start_list[2] : end_list[2]].iloc[1:, :]
+        temp_df = pd.concat(
+            objs=[
+                part_one.reset_index(drop=True),
+                part_two.reset_index(drop=True),
+                part_three.reset_index(drop=True),
+            ],
+            axis=1,
+            ignore_index=True,
+        )
+        temp_df.columns = [
+            "名次",
+            "会员简称",
+            "成交量",
+            "增减",
+            "名次",
+            "会员简称",
+            "持买单量",
+            "增减",
+            "名次",
+            "会员简称",
+            "持卖单量",
+            "增减",
+        ]
+        temp_df["rank"] = range(1, len(temp_df) + 1)
+        del temp_df["名次"]
+        temp_df.columns = [
+            "vol_party_name",
+            "vol",
+            "vol_chg",
+            "long_party_name",
+            "long_open_interest",
+            "long_open_interest_chg",
+            "short_party_name",
+            "short_open_interest",
+            "short_open_interest_chg",
+            "rank",
+        ]
+        temp_df["symbol"] = file_name.split("_")[1].upper()
+        temp_df["variety"] = file_name.split("_")[1][:-4].upper()
+        temp_df = temp_df[
+            [
+                "long_open_interest",
+                "long_open_interest_chg",
+                "long_party_name",
+                "rank",
+                "short_open_interest",
+                "short_open_interest_chg",
+                "short_party_name",
+                "vol",
+                "vol_chg",
+                "vol_party_name",
+                "symbol",
+                "variety",
+            ]
+        ]
+        temp_df = temp_df.map(lambda x: str(x).replace(",", ""))
+        temp_df["long_open_interest"] = pd.to_numeric(
+            temp_df["long_open_interest"], errors="coerce"
+        )
+        temp_df["long_open_interest_chg"] = pd.to_numeric(
+            temp_df["long_open_interest_chg"], errors="coerce"
+        )
+        temp_df["rank"] = pd.to_numeric(temp_df["rank"], errors="coerce")
+        temp_df["short_open_interest"] = pd.to_numeric(
+            temp_df["short_open_interest"], errors="coerce"
+        )
+        temp_df["short_open_interest_chg"] = pd.to_numeric(
+            temp_df["short_open_interest_chg"], errors="coerce"
+        )
+        temp_df["vol"] = pd.to_numeric(temp_df["vol"], errors="coerce")
+        temp_df["vol_chg"] = pd.to_numeric(temp_df["vol_chg"], errors="coerce")
+        return temp_df
+
+
+def futures_dce_position_rank_iter(
     date: str = "20160919", vars_list=cons.contract_symbols
-) -> dict:
+) -> Iterator[Tuple[str, pd.DataFrame]]:
     """
-    大连商品交易所-每日持仓排名-具体合约
+    大连商品交易所-每日持仓排名-具体合约-逐个合约返回
+    压缩包分块下载到临时文件, 只解析 vars_list 中品种的合约文件, 每解析完一个合约即返回
     http://www.dce.com.cn/dalianshangpin/xqsj/tjsj26/rtj/rcjccpm/index.html
     :param date: 指定交易日; e.g., "20200511"
     :type date: str
     :param vars_list: 品种列表
     :type vars_list: list
-    :return: 指定日期的持仓排名数据
-    :rtype: pandas.DataFrame
+    :return: (合约, 持仓排名) 的迭代器
+    :rtype: iterator
     """
     date = cons.convert_date(date) if date is not None else datetime.date.today()
     if date.strftime("%Y%m%d") not in calendar:
         warnings.warn("%s非交易日" % date.strftime("%Y%m%d"))
-        return {}
+        return
     date_str = date.strftime("%Y%m%d")
     url = "http://www.dce.com.cn/dcereport/publicweb/dailystat/memberDealPosi/batchDownload"
     payload = {
@@ -841,210 +1147,34 @@ def futures_dce_position_rank(
         "tradeType": "1",
         "lang": "zh",
     }
-    r = requests.post(url, json=payload)
-    big_dict = dict()
-    with zipfile.ZipFile(BytesIO(r.content), mode="r") as z:
-        for i in z.namelist():
-            file_name = i
-            if not file_name.startswith(date_str):
-                continue
-            try:
-                data = pd.read_table(z.open(i), header=None, sep="\t")
-                if sum(data.iloc[:, 0].str.find("会员类别") == 0) > 0:
-                    data = data.iloc[:-6]
-                if len(data) < 12:  # 处理没有活跃合约的情况
-                    big_dict[file_name.split("_")[1]] = pd.DataFrame()
-                    continue
-                temp_filter = data[data.iloc[:, 0].str.find("名次") == 0].index.tolist()
-                if (
-                    temp_filter[1] - temp_filter[0] < 5
-                ):  # 过滤有无成交量但是有买卖持仓的数据, 如 20201105_c2011_成交量_买持仓_卖持仓排名.txt
-                    big_dict[file_name.split("_")[1]] = pd.DataFrame()
-                    continue
-                start_list = data[data.iloc[:, 0].str.find("名次") == 0].index.tolist()
-                data = data.iloc[
-                    start_list[0] :,
-                    data.columns[data.iloc[start_list[0], :].notnull()],
-                ]
-                data.reset_index(inplace=True, drop=True)
-                start_list = data[data.iloc[:, 0].str.find("名次") == 0].index.tolist()
-                end_list = data[
-                    data.iloc[:, 0].str.contains(r"(?:总计|合计)", na=False)
-                ].index.tolist()
-                part_one = data[start_list[0] : end_list[0]].iloc[1:, :]
-                part_two = data[start_list[1] : end_list[1]].iloc[1:, :]
-                part_three = data[start_list[2] : end_list[2]].iloc[1:, :]
-                temp_df = pd.concat(
-                    objs=[
-                        part_one.reset_index(drop=True),
-                        part_two.reset_index(drop=True),
-                        part_three.reset_index(drop=True),
-                    ],
-                    axis=1,
-                    ignore_index=True,
-                )
-                temp_df.columns = [
-                    "名次",
-                    "会员简称",
-                    "成交量",
-                    "增减",
-                    "名次",
-                    "会员简称",
-                    "持买单量",
-                    "增减",
-                    "名次",
-                    "会员简称",
-                    "持卖单量",
-                    "增减",
-                ]
-                temp_df["rank"] = range(1, len(temp_df) + 1)
-                del temp_df["名次"]
-                temp_df.columns = [
-                    "vol_party_name",
-                    "vol",
-                    "vol_chg",
-                    "long_party_name",
-                    "long_open_interest",
-                    "long_open_interest_chg",
-                    "short_party_name",
-                    "short_open_interest",
-                    "short_open_interest_chg",
-                    "rank",
-                ]
-                temp_df["symbol"] = file_name.split("_")[1].upper()
-                temp_df["variety"] = file_name.split("_")[1][:-4].upper()
-                temp_df = temp_df[
-                    [
-                        "long_open_interest",
-                        "long_open_interest_chg",
-                        "long_party_name",
-                        "rank",
-                        "short_open_interest",
-                        "short_open_interest_chg",
-                        "short_party_name",
-                        "vol",
-                        "vol_chg",
-                        "vol_party_name",
-                        "symbol",
-                        "variety",
-                    ]
-                ]
-                temp_df = temp_df.map(lambda x: str(x).replace(",", ""))
-                temp_df["long_open_interest"] = pd.to_numeric(
-                    temp_df["long_open_interest"], errors="coerce"
-                )
-                temp_df["long_open_interest_chg"] = pd.to_numeric(
-                    temp_df["long_open_interest_chg"], errors="coerce"
-                )
-                temp_df["rank"] = pd.to_numeric(temp_df["rank"], errors="coerce")
-                temp_df["short_open_interest"] = pd.to_numeric(
-                    temp_df["short_open_interest"], errors="coerce"
-                )
-                temp_df["short_open_interest_chg"] = pd.to_numeric(
-                    temp_df["short_open_interest_chg"], errors="coerce"
-                )
-                temp_df["vol"] = pd.to_numeric(temp_df["vol"], errors="coerce")
-                temp_df["vol_chg"] = pd.to_numeric(temp_df["vol_chg"], errors="coerce")
-                big_dict[file_name.split("_")[1]] = temp_df
-            except UnicodeDecodeError:
-                try:
-                    data = pd.read_table(
-                        z.open(i),
-                        header=None,
-                        sep="\\s+",
-                        encoding="gb2312",
-                        skiprows=3,
-                    )
-                except:  # noqa: E722
-                    data = pd.read_table(
-                        z.open(i),
-                        header=None,
-                        sep="\\s+",
-                        encoding="gb2312",
-                        skiprows=4,
-                    )
-                start_list = data[data.iloc[:, 0].str.find("名次") == 0].index.tolist()
-                end_list = data[data.iloc[:, 0].str.find("总计") == 0].index.tolist()
-                part_one = data[start_list[0] : end_list[0]].iloc[1:, :]
-                part_two = data[start_list[1] : end_list[1]].iloc[1:, :]
-                part_three = data[start_list[2] : end_list[2]].iloc[1:, :]
-                temp_df = pd.concat(
-                    objs=[
-                        part_one.reset_index(drop=True),
-                        part_two.reset_index(drop=True),
-                        part_three.reset_index(drop=True),
-                    ],
-                    axis=1,
-                    ignore_index=True,
-                )
-                temp_df.columns = [
-                    "名次",
-                    "会员简称",
-                    "成交量",
-                    "增减",
-                    "名次",
-                    "会员简称",
-                    "持买单量",
-                    "增减",
-                    "名次",
-                    "会员简称",
-                    "持卖单量",
-                    "增减",
-                ]
-                temp_df["rank"] = range(1, len(temp_df) + 1)
-                del temp_df["名次"]
-                temp_df.columns = [
-                    "vol_party_name",
-                    "vol",
-                    "vol_chg",
-                    "long_party_name",
-                    "long_open_interest",
-                    "long_open_interest_chg",
-                    "short_party_name",
-                    "short_open_interest",
-                    "short_open_interest_chg",
-                    "rank",
-                ]
-                temp_df["symbol"] = file_name.split("_")[1].upper()
-                temp_df["variety"] = file_name.split("_")[1][:-4].upper()
-                temp_df = temp_df[
-                    [
-                        "long_open_interest",
-                        "long_open_interest_chg",
-                        "long_party_name",
-                        "rank",
-                        "short_open_interest",
-                        "short_open_interest_chg",
-                        "short_party_name",
-                        "vol",
-                        "vol_chg",
-                        "vol_party_name",
-                        "symbol",
-                        "variety",
-                    ]
-                ]
-                temp_df = temp_df.map(lambda x: str(x).replace(",", ""))
-                temp_df["long_open_interest"] = pd.to_numeric(
-                    temp_df["long_open_interest"], errors="coerce"
-                )
-                temp_df["long_open_interest_chg"] = pd.to_numeric(
-                    temp_df["long_open_interest_chg"], errors="coerce"
-                )
-                temp_df["rank"] = pd.to_numeric(temp_df["rank"], errors="coerce")
-                temp_df["short_open_interest"] = pd.to_numeric(
-                    temp_df["short_open_interest"], errors="coerce"
-                )
-                temp_df["short_open_interest_chg"] = pd.to_numeric(
-                    temp_df["short_open_interest_chg"], errors="coerce"
-                )
-                temp_df["vol"] = pd.to_numeric(temp_df["vol"], errors="coerce")
-                temp_df["vol_chg"] = pd.to_numeric(temp_df["vol_chg"], errors="coerce")
-                big_dict[file_name.split("_")[1]] = temp_df
-    dict_keys = list(big_dict.keys())
-    for item in dict_keys:
-        result = re.sub(r"\d", "", item)
-        if result.upper() not in vars_list:
-            del big_dict[item]
+
+    def _match(file_name: str) -> bool:
+        if not file_name.startswith(date_str):
+            return False
+        return re.sub(r"\d", "", file_name.split("_")[1]).upper() in vars_list
+
+    with _rank_request("dce"):
+        file = download_spooled(url, method="post", json=payload)
+    with file:
+        for file_name, z in iter_zip_members(file, match=_match):
+            yield file_name.split("_")[1], _dce_position_rank_member(z, file_name)
+
+
+@day_cached("DCE")
+def futures_dce_position_rank(
+    date: str = "20160919", vars_list=cons.contract_symbols
+) -> dict:
+    """
+    大连商品交易所-每日持仓排名-具体合约
+    http://www.dce.com.cn/dalianshangpin/xqsj/tjsj26/rtj/rcjccpm/index.html
+    :param date: 指定交易日; e.g., "20200511"
+    :type date: str
+    :param vars_list: 品种列表
+    :type vars_list: list
+    :return: 指定日期的持仓排名数据
+    :rtype: pandas.DataFrame
+    """
+    big_dict = dict(futures_dce_position_rank_iter(date, vars_list))
     filtered_dict = {k: v for k, v in big_dict.items() if len(v) > 1}
     return filtered_dict
 
@@ -1073,7 +1203,8 @@ def futures_dce_position_rank_other(date: str = "20160104"):
         "contract.variety_id": "c",
         "contract": "",
     }
-    r = requests.post(url, data=payload)
+    with _rank_request("dce"):
+        r = requests.post(url, data=payload)
     soup = BeautifulSoup(r.text, features="lxml")
     symbol_list = [
         item["onclick"].strip("javascript:setVariety(").strip("');")
@@ -1091,7 +1222,8 @@ def futures_dce_position_rank_other(date: str = "20160104"):
             "contract.variety_id": symbol,
             "contract": "",
         }
-        r = requests.post(url, data=payload)
+        with _rank_request("dce"):
+            r = requests.post(url, data=payload)
         soup = BeautifulSoup(r.text, features="lxml")
         contract_list = [
             item["onclick"].strip("javascript:setContract_id('").strip("');")
@@ -1111,7 +1243,8 @@ def futures_dce_position_rank_other(date: str = "20160104"):
                         "contract.variety_id": symbol,
                         "contract": "",
                     }
-                    r = requests.post(url, data=payload)
+                    with _rank_request("dce"):
+                        r = requests.post(url, data=payload)
                     temp_df = pd.read_html(StringIO(r.text))[1].iloc[:-1, :]
                     temp_df.columns = [
                         "rank",
@@ -1161,7 +1294,8 @@ def __futures_gfex_vars_list() -> list:
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/119.0.0.0 Safari/537.36"
     }
-    r = requests.post(url=url, headers=headers)
+    with _rank_request("gfex"):
+        r = requests.post(url=url, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     var_list = temp_df["varietyId"].tolist()
@@ -1188,7 +1322,8 @@ def __futures_gfex_contract_list(symbol: str = "si", date: str = "20240729") ->
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/119.0.0.0 Safari/537.36"
     }
-    r = requests.post(url=url, data=payload, headers=headers)
+    with _rank_request("gfex"):
+        r = requests.post(url=url, data=payload, headers=headers)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"])
     if temp_df.empty:
@@ -1231,7 +1366,8 @@ def __futures_gfex_contract_data(
                 "data_type": page,
             }
         )
-        r = requests.post(url=url, data=payload, headers=headers)
+        with _rank_request("gfex"):
+            r = requests.post(url=url, data=payload, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["data"])
         if "qtySub" in temp_df.columns:
@@ -1289,6 +1425,7 @@ def __futures_gfex_contract_data(
     return big_df
 
 
+@day_cached("GFEX")
 def futures_gfex_position_rank(date: str = "20231113", vars_list: list = None):
     """
     广州期货交易所-日成交持仓排名
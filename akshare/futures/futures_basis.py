@@ -17,21 +17,27 @@ import datetime
 import re
 import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
 import pandas as pd
 
 from akshare.futures import cons
+from akshare.futures.futures_daily_bar import get_futures_daily_batch
 from akshare.futures.requests_fun import pandas_read_html_link
 from akshare.futures.symbol_var import chinese_to_english
+from akshare.utils.day_cache import day_cached
+from akshare.utils.func import PageAccumulator
+from akshare.utils.ratelimit import get_rate_limiter
 
-calendar = cons.get_calendar()
+calendar = cons.get_trade_calendar()
 
 
 def futures_spot_price_daily(
     start_day: str = "20210201",
     end_day: str = "20210208",
     vars_list: list = cons.contract_symbols,
+    max_workers: int = 4,
 ):
     """
     指定时间段内大宗商品现货价格及相应基差
@@ -39,6 +45,7 @@ def futures_spot_price_daily(
     :param start_day: str 开始日期 format：YYYY-MM-DD 或 YYYYMMDD 或 datetime.date对象; 默认为当天
     :param end_day: str 结束数据 format：YYYY-MM-DD 或 YYYYMMDD 或 datetime.date对象; 默认为当天
     :param vars_list: list 合约品种如 [RB, AL]; 默认参数为所有商品
+    :param max_workers: int 并发请求的交易日数
     :return: 基差
     :rtype: pandas.DataFrame
     展期收益率数据:
@@ -62,20 +69,46 @@ def futures_spot_price_daily(
         if end_day is not None
         else cons.convert_date(cons.get_latest_data_date(datetime.datetime.now()))
     )
-    df_list = []
-    while start_day <= end_day:
-        temp_df = futures_spot_price(start_day, vars_list)
-        if temp_df is False:
-            return pd.concat(df_list).reset_index(drop=True)
-        elif temp_df is not None:
-            df_list.append(temp_df)
-        start_day += datetime.timedelta(days=1)
+    if start_day < datetime.date(2011, 1, 4):
+        raise Exception(
+            "数据源开始日期为 20110104, 请将获取数据时间点设置在 20110104 后"
+        )
+    df_list = _futures_spot_price_days(
+        calendar.between(start_day, end_day), vars_list, max_workers=max_workers
+    )
     if len(df_list) > 0:
         temp_df = pd.concat(df_list)
         temp_df.reset_index(drop=True, inplace=True)
         return temp_df
 
 
+def _futures_spot_price_days(
+    day_list: list, vars_list: list, max_workers: int = 4, rate: float = 2
+) -> list:
+    """
+    并发获取多个交易日的现货价格及相应基差
+    :param day_list: 交易日列表, 格式为 YYYYMMDD
+    :type day_list: list
+    :param vars_list: 合约品种列表
+    :type vars_list: list
+    :param max_workers: 并发线程数
+    :type max_workers: int
+    :param rate: 每秒最多请求数
+    :type rate: float
+    :return: 按日期排列的每日数据, 没有数据的交易日不包含在内
+    :rtype: list
+    """
+    limiter = get_rate_limiter("https://www.100ppi.com/sf/", rate=rate)
+
+    def _fetch(day: str) -> pd.DataFrame:
+        limiter.acquire()
+        return futures_spot_price(day, vars_list)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        frames = list(executor.map(_fetch, day_list))
+    return [frame for frame in frames if frame is not None and not frame.empty]
+
+
 def futures_spot_price(
     date: str = "20240430", vars_list: list = cons.contract_symbols
 ) -> pd.DataFrame:
@@ -106,41 +139,141 @@ def futures_spot_price(
     if date.strftime("%Y%m%d") not in calendar:
         warnings.warn(f"{date.strftime('%Y%m%d')}非交易日")
         return pd.DataFrame()
+    records = _futures_spot_price_day(date)
+    if len(records.columns) == 0:
+        return pd.DataFrame()
+    records.index = records["symbol"]
+    var_list_in_market = [i for i in vars_list if i in records.index]
+    temp_df = records.loc[var_list_in_market, :]
+    temp_df.reset_index(drop=True, inplace=True)
+    return temp_df
+
+
+@day_cached("100PPI")
+def _futures_spot_price_day(date: datetime.date) -> pd.DataFrame:
+    """
+    生意社指定交易日全部品种的现货价格及相应基差, 请求失败时返回空表
+    :param date: 交易日
+    :type date: datetime.date
+    :return: 全部品种的现货价格及相应基差
+    :rtype: pandas.DataFrame
+    """
     u1 = "https://www.100ppi.com/sf/"
     u2 = f"https://www.100ppi.com/sf/day-{date.strftime('%Y-%m-%d')}.html"
-    i = 1
-    while True:
+    headers = {
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,"
+        "image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7"
+    }
+    for i in range(1, 6):
         for url in [u2, u1]:
             try:
-                # url = u2
-                headers = {
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,"
-                    "image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7"
-                }
                 r = pandas_read_html_link(url, headers=headers)
                 string = r[0].loc[1, 1]
                 news = "".join(re.findall(r"[0-9]", string))
                 if news[3:11] == date.strftime("%Y%m%d"):
-                    records = _check_information(r[1], date)
-                    records.index = records["symbol"]
-                    var_list_in_market = [i for i in vars_list if i in records.index]
-                    temp_df = records.loc[var_list_in_market, :]
-                    temp_df.reset_index(drop=True, inplace=True)
-                    return temp_df
-                else:
-                    time.sleep(3)
+                    return _check_information(r[1], date)
             except Exception as e:  # noqa: E722
                 print(
                     f"{date.strftime('%Y-%m-%d')}日生意社数据连接失败[错误信息:{e}]，第{str(i)}次尝试，最多5次"
                 )
-                i += 1
-                if i > 5:
-                    print(
-                        f"{date.strftime('%Y-%m-%d')}日生意社数据连接失败, 如果当前交易日是 2018-09-12, "
-                        f"由于生意社源数据缺失, 无法访问, 否则为重复访问已超过5次，您的地址被网站墙了，"
-                        f"请保存好返回数据，稍后从该日期起重试"
-                    )
-                    return pd.DataFrame()
+        if i < 5:
+            time.sleep(3)
+    print(
+        f"{date.strftime('%Y-%m-%d')}日生意社数据连接失败, 如果当前交易日是 2018-09-12, "
+        f"由于生意社源数据缺失, 无法访问, 否则为重复访问已超过5次，您的地址被网站墙了，"
+        f"请保存好返回数据，稍后从该日期起重试"
+    )
+    return pd.DataFrame()
+
+
+def futures_basis_panel(
+    start_day: str = "20240401",
+    end_day: str = "20240430",
+    vars_list: list = cons.contract_symbols,
+    price: str = "settle",
+    max_workers: int = 4,
+) -> pd.DataFrame:
+    """
+    指定时间段内大宗商品的基差面板
+    生意社现货价格按交易日并发获取, 与交易所日线的结算价按 (日期, 合约) 合并, 计算临近交割合约和主力合约的基差及基差率;
+    开启 akshare.utils.day_cache.enable_day_cache 后, 已获取的交易日从本地读取
+    https://www.100ppi.com/sf/
+    :param start_day: 开始日期 format：YYYY-MM-DD 或 YYYYMMDD 或 datetime.date对象
+    :type start_day: str
+    :param end_day: 结束日期 format：YYYY-MM-DD 或 YYYYMMDD 或 datetime.date对象
+    :type end_day: str
+    :param vars_list: 合约品种如 [RB, AL]; 默认参数为所有商品
+    :type vars_list: list
+    :param price: choice of {"settle", "100ppi"}; settle: 使用交易所结算价, 缺失时使用生意社的期货价格; 100ppi: 只使用生意社的期货价格
+    :type price: str
+    :param max_workers: 并发线程数
+    :type max_workers: int
+    :return: 基差面板, 列与 futures_spot_price_daily 相同
+    :rtype: pandas.DataFrame
+    """
+    if price not in {"settle", "100ppi"}:
+        raise ValueError("price must be one of {'settle', '100ppi'}")
+    start_day = cons.convert_date(start_day)
+    end_day = cons.convert_date(end_day)
+    if start_day < datetime.date(2011, 1, 4):
+        raise Exception(
+            "数据源开始日期为 20110104, 请将获取数据时间点设置在 20110104 后"
+        )
+    df_list = _futures_spot_price_days(
+        calendar.between(start_day, end_day), vars_list, max_workers=max_workers
+    )
+    if len(df_list) == 0:
+        return pd.DataFrame()
+    big_df = pd.concat(df_list, ignore_index=True)
+    if price == "settle":
+        market_list = sorted(
+            {
+                market.upper()
+                for market, symbols in cons.market_exchange_symbols.items()
+                if set(symbols) & set(big_df["symbol"])
+            }
+        )
+        bar_df = get_futures_daily_batch(
+            start_date=start_day,
+            end_date=end_day,
+            market=market_list,
+            max_workers=max_workers * 2,
+        )
+        if not bar_df.empty:
+            settle_series = pd.Series(
+                pd.to_numeric(bar_df["settle"], errors="coerce").to_numpy(),
+                index=pd.MultiIndex.from_arrays(
+                    [
+                        bar_df["date"].astype(str).str.replace("-", "").str[:8],
+                        bar_df["symbol"].astype(str).str.upper(),
+                    ]
+                ),
+            )
+            settle_series = settle_series[
+                ~settle_series.index.duplicated(keep="first")
+            ]
+            for contract_col, price_col in [
+                ("near_contract", "near_contract_price"),
+                ("dominant_contract", "dominant_contract_price"),
+            ]:
+                key = pd.MultiIndex.from_arrays(
+                    [big_df["date"], big_df[contract_col].str.upper()]
+                )
+                settle = settle_series.reindex(key).to_numpy()
+                big_df[price_col] = big_df[price_col].where(
+                    pd.isna(settle), settle
+                )
+            big_df["near_basis"] = big_df["near_contract_price"] - big_df["spot_price"]
+            big_df["dom_basis"] = (
+                big_df["dominant_contract_price"] - big_df["spot_price"]
+            )
+            big_df["near_basis_rate"] = (
+                big_df["near_contract_price"] / big_df["spot_price"] - 1
+            )
+            big_df["dom_basis_rate"] = (
+                big_df["dominant_contract_price"] / big_df["spot_price"] - 1
+            )
+    return big_df
 
 
 def _check_information(df_data, date):
@@ -172,7 +305,7 @@ def _check_information(df_data, date):
         "dominant_contract",
         "dominant_contract_price",
     ]
-    records = pd.DataFrame()
+    pages = PageAccumulator()
     for string in df_data["symbol"].tolist():
         news = "".join(re.findall(r"[\u4e00-\u9fa5]", string))
         if news == "":
@@ -211,7 +344,8 @@ def _check_information(df_data, date):
                 symbol == "LH"
             ):  # 上表中现货单位为元/公斤, 期货单位为元/吨. 换算公式：元/公斤*1000=元/吨(http://www.100ppi.com/sf/959.html)
                 record.loc[:, "spot_price"] = float(record["spot_price"].iloc[0]) * 1000
-            records = pd.concat([records, record])
+            pages.append(record)
+    records = pages.to_frame()
 
     # 20241129:如果某日没有数据，直接返回返回空表
     if records.empty:
@@ -379,6 +513,11 @@ if __name__ == "__main__":
     )
     print(futures_spot_price_daily_df)
 
+    futures_basis_panel_df = futures_basis_panel(
+        start_day="20260302", end_day="20260306", vars_list=["RB", "CU"]
+    )
+    print(futures_basis_panel_df)
+
     futures_spot_price_df = futures_spot_price(date="20260303")
     print(futures_spot_price_df)
 
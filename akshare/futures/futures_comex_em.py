@@ -9,6 +9,7 @@ https://data.eastmoney.com/pmetal/comex/by.html
 import pandas as pd
 import requests
 
+from akshare.utils.func import PageAccumulator
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -41,7 +42,7 @@ def futures_comex_inventory(symbol: str = "黄金") -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update(
@@ -52,7 +53,8 @@ def futures_comex_inventory(symbol: str = "黄金") -> pd.DataFrame:
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], axis=0, ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(axis=0, ignore_index=True)
 
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df["index"] + 1
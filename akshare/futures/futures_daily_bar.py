@@ -7,9 +7,12 @@ Desc: 期货日线行情
 
 import datetime
 import json
+import random
 import re
+import time
 import zipfile
-from io import BytesIO, StringIO
+from io import StringIO, TextIOWrapper
+from typing import List, Union
 
 import numpy as np
 import pandas as pd
@@ -17,8 +20,39 @@ import requests
 
 from akshare.futures import cons
 from akshare.futures.requests_fun import requests_link
+from akshare.utils.archive import download_spooled
+from akshare.utils.day_cache import day_cached
+from akshare.utils.func import run_batch
+from akshare.utils.ratelimit import get_rate_limiter
 
-calendar = cons.get_calendar()
+calendar = cons.get_trade_calendar()
+
+
+def _czce_history_rows(lines, date: str) -> str:
+    """
+    郑州商品交易所-历史行情文件-逐行筛选指定交易日的数据
+    全年数据文件只保留表头和指定交易日的行, 避免解析整个文件
+    :param lines: 按行读取的文本文件; 第一行为标题, 第二行为表头
+    :type lines: file-like object
+    :param date: 需要的日期
+    :type date: str
+    :return: 表头和指定交易日的行
+    :rtype: str
+    """
+    target = pd.Timestamp(date)
+    parsed = {}
+    next(lines, None)
+    rows = [next(lines, "")]
+    for line in lines:
+        value = line.split("|", 1)[0].strip()
+        if value not in parsed:
+            try:
+                parsed[value] = pd.Timestamp(value) == target
+            except ValueError:
+                parsed[value] = False
+        if parsed[value]:
+            rows.append(line)
+    return "".join(rows)
 
 
 def _futures_daily_czce(
@@ -35,11 +69,15 @@ def _futures_daily_czce(
     :rtype: pandas.DataFrame
     """
     url = f"http://www.czce.com.cn/cn/exchange/{dataset}.zip"
-    r = requests.get(url)
-    with zipfile.ZipFile(BytesIO(r.content)) as file:
-        with file.open(f"{dataset}.txt") as my_file:
-            data = my_file.read().decode("gb2312")
-            data_df = pd.read_table(StringIO(data), sep=r"|", header=1)
+    with download_spooled(url) as file:
+        with zipfile.ZipFile(file) as zip_file:
+            with zip_file.open(f"{dataset}.txt") as my_file:
+                data = _czce_history_rows(
+                    TextIOWrapper(my_file, encoding="gb2312"), date
+                )
+            data_df = pd.read_table(StringIO(data), sep=r"|", header=0)
+            if data_df.empty:
+                return pd.DataFrame()
             data_df.columns = [item.strip() for item in data_df.columns]
             data_df.dropna(axis=1, inplace=True)
             for column in data_df.columns:
@@ -105,6 +143,7 @@ def _futures_daily_czce(
     return temp_df
 
 
+@day_cached("CFFEX")
 def get_cffex_daily(date: str = "20100416") -> pd.DataFrame:
     """
     中国金融期货交易所-日频率交易数据
@@ -123,12 +162,11 @@ def get_cffex_daily(date: str = "20100416") -> pd.DataFrame:
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/108.0.0.0 Safari/537.36",
     }
-    r = requests.get(url, headers=headers)
     try:
-        with zipfile.ZipFile(BytesIO(r.content)) as file:
-            with file.open(f"{date}_1.csv") as my_file:
-                data = my_file.read().decode("gb2312")
-                data_df = pd.read_csv(StringIO(data))
+        with download_spooled(url, headers=headers) as file:
+            with zipfile.ZipFile(file) as zip_file:
+                with zip_file.open(f"{date}_1.csv") as my_file:
+                    data_df = pd.read_csv(my_file, encoding="gb2312")
     except:  # noqa: E722
         return pd.DataFrame()
     data_df = data_df[data_df["合约代码"] != "小计"]
@@ -196,6 +234,7 @@ def get_cffex_daily(date: str = "20100416") -> pd.DataFrame:
     return data_df
 
 
+@day_cached("GFEX")
 def get_gfex_daily(date: str = "20221223") -> pd.DataFrame:
     """
     广州期货交易所-日频率-量价数据
@@ -272,6 +311,7 @@ def get_gfex_daily(date: str = "20221223") -> pd.DataFrame:
     return result_df
 
 
+@day_cached("INE")
 def get_ine_daily(date: str = "20241129") -> pd.DataFrame:
     """
     上海国际能源交易中心-日频率-量价数据
@@ -338,6 +378,7 @@ def get_ine_daily(date: str = "20241129") -> pd.DataFrame:
     return result_df
 
 
+@day_cached("CZCE")
 def get_czce_daily(date: str = "20050525") -> pd.DataFrame:
     """
     郑州商品交易所-日频率-量价数据
@@ -450,6 +491,7 @@ def get_czce_daily(date: str = "20050525") -> pd.DataFrame:
         return _futures_daily_czce_df
 
 
+@day_cached("SHFE")
 def get_shfe_daily(date: str = "20220415") -> pd.DataFrame:
     """
     上海期货交易所-日频率-量价数据
@@ -524,6 +566,7 @@ def get_shfe_daily(date: str = "20220415") -> pd.DataFrame:
     return df
 
 
+@day_cached("DCE")
 def get_dce_daily(date: str = "20251027") -> pd.DataFrame:
     """
     大连商品交易所日交易数据
@@ -634,6 +677,39 @@ def get_dce_daily(date: str = "20251027") -> pd.DataFrame:
     return temp_df
 
 
+_FUTURES_DAILY_MARKET = {
+    "CFFEX": (get_cffex_daily, "www.cffex.com.cn"),
+    "CZCE": (get_czce_daily, "www.czce.com.cn"),
+    "SHFE": (get_shfe_daily, "www.shfe.com.cn"),
+    "DCE": (get_dce_daily, "www.dce.com.cn"),
+    "INE": (get_ine_daily, "www.ine.cn"),
+    "GFEX": (get_gfex_daily, "www.gfex.com.cn"),
+}
+
+
+def _futures_daily_range(start_date, end_date) -> list:
+    """
+    日期区间内的交易日
+    :param start_date: 开始日期 format：YYYY-MM-DD 或 YYYYMMDD 或 datetime.date对象 为空时为当天
+    :type start_date: str
+    :param end_date: 结束日期 format：YYYY-MM-DD 或 YYYYMMDD 或 datetime.date对象 为空时为最新的有数据的交易日
+    :type end_date: str
+    :return: 交易日列表, 格式为 YYYYMMDD
+    :rtype: list
+    """
+    start_date = (
+        cons.convert_date(start_date)
+        if start_date is not None
+        else datetime.date.today()
+    )
+    end_date = (
+        cons.convert_date(end_date)
+        if end_date is not None
+        else cons.convert_date(cons.get_latest_data_date(datetime.datetime.now()))
+    )
+    return calendar.between(start_date, end_date)
+
+
 def get_futures_daily(
     start_date: str = "20220208",
     end_date: str = "20220208",
@@ -650,48 +726,102 @@ def get_futures_daily(
     :return: 交易所日交易数据
     :rtype: pandas.DataFrame
     """
-    if market.upper() == "CFFEX":
-        f = get_cffex_daily
-    elif market.upper() == "CZCE":
-        f = get_czce_daily
-    elif market.upper() == "SHFE":
-        f = get_shfe_daily
-    elif market.upper() == "DCE":
-        f = get_dce_daily
-    elif market.upper() == "INE":
-        f = get_ine_daily
-    elif market.upper() == "GFEX":
-        f = get_gfex_daily
-    else:
+    if market.upper() not in _FUTURES_DAILY_MARKET:
         print("Invalid Market Symbol")
         return pd.DataFrame()
-
-    start_date = (
-        cons.convert_date(start_date)
-        if start_date is not None
-        else datetime.date.today()
-    )
-    end_date = (
-        cons.convert_date(end_date)
-        if end_date is not None
-        else cons.convert_date(cons.get_latest_data_date(datetime.datetime.now()))
-    )
+    f = _FUTURES_DAILY_MARKET[market.upper()][0]
 
     df_list = list()
-    while start_date <= end_date:
-        df = f(date=str(start_date).replace("-", ""))
+    for day in _futures_daily_range(start_date, end_date):
+        df = f(date=day)
         if not df.empty:
             df_list.append(df)
-        start_date += datetime.timedelta(days=1)
 
     if len(df_list) == 0:
         return pd.DataFrame()
-    elif len(df_list) > 0:
-        temp_df = pd.concat(df_list).reset_index(drop=True)
-        temp_df = temp_df[~temp_df["symbol"].str.contains("efp")]
-        return temp_df
+    temp_df = pd.concat(df_list).reset_index(drop=True)
+    temp_df = temp_df[~temp_df["symbol"].str.contains("efp")]
+    return temp_df
+
+
+def get_futures_daily_batch(
+    start_date: str = "20220208",
+    end_date: str = "20220208",
+    market: Union[str, List[str]] = "all",
+    max_workers: int = 12,
+    rate: float = 4,
+    max_retries: int = 3,
+) -> pd.DataFrame:
+    """
+    交易所日交易数据-批量获取
+    只请求区间内的交易日, 多个交易所和多个交易日并发请求, 每个交易所单独限速
+    :param start_date: 开始日期 format：YYYY-MM-DD 或 YYYYMMDD 或 datetime.date对象 为空时为当天
+    :type start_date: str
+    :param end_date: 结束日期 format：YYYY-MM-DD 或 YYYYMMDD 或 datetime.date对象 为空时为最新的有数据的交易日
+    :type end_date: str
+    :param market: "all" 表示全部六个交易所, 或 {'CFFEX', 'CZCE', 'SHFE', 'DCE', 'INE', 'GFEX'} 中的一个或多个
+    :type market: str or list
+    :param max_workers: 并发线程数
+    :type max_workers: int
+    :param rate: 每个交易所每秒最多请求数
+    :type rate: float
+    :param max_retries: 单个交易日的最大重试次数
+    :type max_retries: int
+    :return: 各交易所的日交易数据, exchange 列为交易所代码, 按交易所和日期排列; 获取失败的交易所和日期及原因记录在 attrs["failed"] 中
+    :rtype: pandas.DataFrame
+    """
+    if isinstance(market, str):
+        market_list = (
+            list(_FUTURES_DAILY_MARKET) if market.lower() == "all" else [market]
+        )
     else:
-        return pd.DataFrame()
+        market_list = list(market)
+    market_list = [item.upper() for item in market_list]
+    for item in market_list:
+        if item not in _FUTURES_DAILY_MARKET:
+            raise ValueError(
+                f"market must be 'all' or in {list(_FUTURES_DAILY_MARKET)}"
+            )
+    day_list = _futures_daily_range(start_date, end_date)
+    limiter_dict = {
+        item: get_rate_limiter(_FUTURES_DAILY_MARKET[item][1], rate=rate)
+        for item in market_list
+    }
+
+    def _fetch(key: tuple) -> pd.DataFrame:
+        item, day = key
+        f = _FUTURES_DAILY_MARKET[item][0]
+        for attempt in range(max_retries):
+            limiter_dict[item].acquire()
+            try:
+                return f(date=day)
+            except Exception:
+                if attempt == max_retries - 1:
+                    raise
+                time.sleep(2**attempt + random.uniform(0.5, 1.5))
+
+    # 按日期交错提交, 使各交易所同时推进
+    result_dict, failed_dict = run_batch(
+        [(item, day) for day in day_list for item in market_list],
+        _fetch,
+        max_workers=max_workers,
+    )
+    failed_dict = {f"{key[0]} {key[1]}": value for key, value in failed_dict.items()}
+    frames = []
+    for item in market_list:
+        for day in day_list:
+            if (item, day) in result_dict:
+                temp_df = result_dict[(item, day)]
+                temp_df.insert(0, "exchange", item)
+                frames.append(temp_df)
+    if frames:
+        big_df = pd.concat(frames, ignore_index=True)
+        big_df = big_df[~big_df["symbol"].astype(str).str.contains("efp")]
+        big_df.reset_index(drop=True, inplace=True)
+    else:
+        big_df = pd.DataFrame()
+    big_df.attrs["failed"] = failed_dict
+    return big_df
 
 
 if __name__ == "__main__":
@@ -700,6 +830,11 @@ if __name__ == "__main__":
     )
     print(get_futures_daily_df)
 
+    get_futures_daily_batch_df = get_futures_daily_batch(
+        start_date="20250701", end_date="20250708", market="all"
+    )
+    print(get_futures_daily_batch_df)
+
     get_dce_daily_df = get_dce_daily(date="20251029")
     print(get_dce_daily_df)
 
@@ -12,6 +12,7 @@ from typing import Optional
 import pandas as pd
 import requests
 
+from akshare.utils.func import PageAccumulator
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -106,13 +107,14 @@ def futures_global_spot_em() -> pd.DataFrame:
     total_num = data_json["total"]
     total_page = math.ceil(total_num / 20) - 1
     tqdm = get_tqdm()
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     for page in tqdm(range(total_page), leave=False):
         params.update({"pageIndex": page})
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["list"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df["index"] + 1
     big_df.rename(
@@ -11,13 +11,18 @@ import re
 import warnings
 
 import math
+import numpy as np
 import pandas as pd
 
 from akshare.futures import cons
-from akshare.futures.futures_daily_bar import get_futures_daily
+from akshare.futures.futures_daily_bar import (
+    get_futures_daily,
+    get_futures_daily_batch,
+)
 from akshare.futures.symbol_var import symbol_market, symbol_varieties
+from akshare.utils.func import PageAccumulator
 
-calendar = cons.get_calendar()
+calendar = cons.get_trade_calendar()
 
 
 def get_roll_yield(date=None, var="BB", symbol1=None, symbol2=None, df=None):
@@ -71,6 +76,111 @@ def get_roll_yield(date=None, var="BB", symbol1=None, symbol2=None, df=None):
         return math.log(close2 / close1) / c * 12, symbol1, symbol2
 
 
+def get_roll_yield_panel(
+    df: pd.DataFrame = None,
+    start_day: str = None,
+    end_day: str = None,
+    vars_list: list = None,
+) -> pd.DataFrame:
+    """
+    展期收益率面板
+    对多日、多品种的日线数据一次性分组计算, 得到每个 (日期, 品种) 的主力、次主力合约和展期收益率;
+    与逐日逐品种调用 get_roll_yield 的结果一致
+    :param df: get_futures_daily 或 get_futures_daily_batch 返回的日线数据; 为空时按 start_day 和 end_day 获取全部交易所的数据
+    :type df: pandas.DataFrame
+    :param start_day: 开始日期 format：YYYYMMDD; 只在 df 为空时使用
+    :type start_day: str
+    :param end_day: 结束日期 format：YYYYMMDD; 只在 df 为空时使用
+    :type end_day: str
+    :param vars_list: 品种列表如 ["RB", "AL"]; 为空时为全部品种
+    :type vars_list: list
+    :return: 展期收益率面板
+    :rtype: pandas.DataFrame
+    date            日期                      string YYYYMMDD
+    variety         品种                      string
+    dominant        主力合约(持仓量最大)        string
+    sub_dominant    次主力合约(持仓量第二)      string
+    near_by         近月合约                  string
+    deferred        远月合约                  string
+    near_close      近月合约收盘价             float
+    deferred_close  远月合约收盘价             float
+    spread          远月与近月的价差           float
+    months          远月与近月相隔的月数        int
+    roll_yield      年化展期收益率             float
+    """
+    if df is None:
+        df = get_futures_daily_batch(start_date=start_day, end_date=end_day)
+    columns = [
+        "date",
+        "variety",
+        "dominant",
+        "sub_dominant",
+        "near_by",
+        "deferred",
+        "near_close",
+        "deferred_close",
+        "spread",
+        "months",
+        "roll_yield",
+    ]
+    if df.empty:
+        return pd.DataFrame(columns=columns)
+    temp_df = df[~df["symbol"].astype(str).str.contains("efp")]
+    if vars_list is not None:
+        temp_df = temp_df[temp_df["variety"].isin(vars_list)]
+    temp_df = pd.DataFrame(
+        {
+            "date": temp_df["date"].astype(str).str.replace("-", "").str[:8],
+            "variety": temp_df["variety"],
+            "symbol": temp_df["symbol"].astype(str),
+            "close": pd.to_numeric(temp_df["close"], errors="coerce"),
+            "open_interest": pd.to_numeric(temp_df["open_interest"], errors="coerce"),
+        }
+    )
+    # 同一 (日期, 品种) 内按持仓量降序, 取前两个合约
+    temp_df.sort_values(
+        by=["date", "variety", "open_interest"],
+        ascending=[True, True, False],
+        kind="mergesort",
+        inplace=True,
+    )
+    rank = temp_df.groupby(["date", "variety"], sort=False).cumcount()
+    first_df = temp_df[rank == 0].set_index(["date", "variety"])
+    second_df = temp_df[rank == 1].set_index(["date", "variety"])
+    big_df = first_df.join(second_df, how="inner", lsuffix="_1", rsuffix="_2")
+    # 合约月份: 去掉字母后, 末两位为月份, 其余为年份
+    month_list = []
+    for col in ["symbol_1", "symbol_2"]:
+        digits = big_df[col].str.replace(r"\D", "", regex=True)
+        year = pd.to_numeric(digits.str[:-2], errors="coerce")
+        month = pd.to_numeric(digits.str[-2:], errors="coerce")
+        month_list.append(year * 12 + month)
+    c = month_list[0] - month_list[1]
+    close_1 = big_df["close_1"]
+    close_2 = big_df["close_2"]
+    valid = c.notna() & (c != 0) & (close_1 != 0) & (close_2 != 0)
+    big_df = big_df[valid]
+    c = c[valid]
+    close_1 = close_1[valid]
+    close_2 = close_2[valid]
+    later = c > 0
+    result_df = pd.DataFrame(
+        {
+            "dominant": big_df["symbol_1"],
+            "sub_dominant": big_df["symbol_2"],
+            "near_by": big_df["symbol_2"].where(later, big_df["symbol_1"]),
+            "deferred": big_df["symbol_1"].where(later, big_df["symbol_2"]),
+            "near_close": close_2.where(later, close_1),
+            "deferred_close": close_1.where(later, close_2),
+            "months": c.abs().astype(int),
+            "roll_yield": np.log(close_2 / close_1) / c * 12,
+        }
+    )
+    result_df["spread"] = result_df["deferred_close"] - result_df["near_close"]
+    result_df.reset_index(inplace=True)
+    return result_df[columns]
+
+
 def get_roll_yield_bar(
     type_method: str = "var",
     var: str = "RB",
@@ -108,55 +218,41 @@ def get_roll_yield_bar(
         return df
 
     if type_method == "var":
-        df = pd.DataFrame()
+        df_pages = PageAccumulator()
         for market in ["dce", "cffex", "shfe", "czce", "gfex"]:
-            df = pd.concat(
-                [
-                    df,
-                    get_futures_daily(start_date=date, end_date=date, market=market),
-                ]
+            df_pages.append(
+                get_futures_daily(start_date=date, end_date=date, market=market)
             )
-        var_list = list(set(df["variety"]))
-        for i_remove in ["IO", "MO", "HO"]:
-            if i_remove in var_list:
-                var_list.remove(i_remove)
-        df_l = pd.DataFrame()
-        for var in var_list:
-            ry = get_roll_yield(date, var, df=df)
-            if ry:
-                df_l = pd.concat(
-                    [
-                        df_l,
-                        pd.DataFrame(
-                            [ry],
-                            index=[var],
-                            columns=["roll_yield", "near_by", "deferred"],
-                        ),
-                    ]
-                )
+        df = df_pages.to_frame()
+        panel_df = get_roll_yield_panel(df)
+        panel_df = panel_df[~panel_df["variety"].isin(["IO", "MO", "HO"])]
+        df_l = pd.DataFrame(
+            panel_df[["roll_yield", "near_by", "deferred"]].to_numpy(),
+            index=panel_df["variety"].tolist(),
+            columns=["roll_yield", "near_by", "deferred"],
+        )
+        df_l["roll_yield"] = df_l["roll_yield"].astype(float)
         df_l["date"] = date
         df_l = df_l.sort_values("roll_yield")
         return df_l
 
     if type_method == "date":
-        df_l = pd.DataFrame()
-        while start_day <= end_day:
-            try:
-                ry = get_roll_yield(start_day, var)
-                if ry:
-                    df_l = pd.concat(
-                        [
-                            df_l,
-                            pd.DataFrame(
-                                [ry],
-                                index=[start_day],
-                                columns=["roll_yield", "near_by", "deferred"],
-                            ),
-                        ]
-                    )
-            except:  # noqa: E722
-                pass
-            start_day += datetime.timedelta(days=1)
+        # 一次获取区间内该交易所的全部日线, 再整体计算
+        df = get_futures_daily(
+            start_date=start_day, end_date=end_day, market=symbol_market(var)
+        )
+        if df.empty:
+            return pd.DataFrame()
+        panel_df = get_roll_yield_panel(df, vars_list=[var])
+        df_l = pd.DataFrame(
+            panel_df[["roll_yield", "near_by", "deferred"]].to_numpy(),
+            index=[
+                datetime.datetime.strptime(item, "%Y%m%d").date()
+                for item in panel_df["date"]
+            ],
+            columns=["roll_yield", "near_by", "deferred"],
+        )
+        df_l["roll_yield"] = df_l["roll_yield"].astype(float)
         return df_l
 
 
@@ -8,12 +8,12 @@ https://links.sgx.com/1.0.0/derivatives-daily/5888/FUTURE.zip
 """
 
 import zipfile
-from io import BytesIO
-from io import StringIO
 
 import pandas as pd
 import requests
 
+from akshare.utils.archive import download_spooled
+
 
 def __fetch_ftse_index_futu(date: str = "20231108") -> int:
     """
@@ -71,14 +71,14 @@ def futures_settlement_price_sgx(date: str = "20231107") -> pd.DataFrame:
     """
     num = __fetch_ftse_index_futu(date)
     url = f"https://links.sgx.com/1.0.0/derivatives-daily/{num}/FUTURE.zip"
-    r = requests.get(url)
-    with zipfile.ZipFile(BytesIO(r.content)) as file:
-        with file.open(file.namelist()[0]) as my_file:
-            data = my_file.read().decode()
-            if file.namelist()[0].endswith("txt"):
-                data_df = pd.read_table(StringIO(data))
-            else:
-                data_df = pd.read_csv(StringIO(data))
+    with download_spooled(url) as file:
+        with zipfile.ZipFile(file) as zip_file:
+            name = zip_file.namelist()[0]
+            with zip_file.open(name) as my_file:
+                if name.endswith("txt"):
+                    data_df = pd.read_table(my_file)
+                else:
+                    data_df = pd.read_csv(my_file)
     return data_df
 
 
@@ -9,7 +9,7 @@ https://data.eastmoney.com/ifdata/xhgp.html
 import pandas as pd
 import requests
 
-from akshare.utils import demjson
+from akshare.utils.js_literal import loads_js_literal
 
 
 def futures_spot_stock(symbol: str = "能源") -> pd.DataFrame:
@@ -47,7 +47,7 @@ def futures_spot_stock(symbol: str = "能源") -> pd.DataFrame:
     }
     r = requests.get(url, headers=headers)
     data_text = r.text
-    temp_json = demjson.decode(
+    temp_json = loads_js_literal(
         data_text[
             data_text.find("pagedata") : data_text.find(
                 "/newstatic/js/common/emdataview.js"
@@ -10,6 +10,8 @@ from io import StringIO, BytesIO
 import pandas as pd
 import requests
 
+from akshare.utils.func import PageAccumulator
+
 
 def futures_to_spot_shfe(date: str = "202312") -> pd.DataFrame:
     """
@@ -209,7 +211,7 @@ def futures_delivery_match_czce(date: str = "20210106") -> pd.DataFrame:
     r.encoding = "utf-8"
     temp_df = pd.read_excel(BytesIO(r.content), skiprows=0)
     index_flag = temp_df[temp_df.iloc[:, 0].str.contains("配对日期")].index.values
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     for i, item in enumerate(index_flag):
         try:
             temp_inner_df = temp_df[index_flag[i] + 1 : index_flag[i + 1]]
@@ -225,7 +227,8 @@ def futures_delivery_match_czce(date: str = "20210106") -> pd.DataFrame:
         symbol = date_contract_str.split("：")[-1]
         temp_inner_df["配对日期"] = inner_date
         temp_inner_df["合约代码"] = symbol
-        big_df = pd.concat([big_df, temp_inner_df], ignore_index=True)
+        pages.append(temp_inner_df)
+    big_df = pages.to_frame(ignore_index=True)
 
     big_df.columns = [
         "卖方会员",
@@ -8,12 +8,14 @@ P.S. 注意采集速度, 容易封禁 IP, 如果不能访问请稍后再试
 """
 
 import json
+import random
 import time
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
+from typing import Iterable, Iterator, Optional, Tuple, Union
 
 import pandas as pd
 import requests
-import py_mini_racer
 
 from akshare.futures.cons import (
     zh_subscribe_exchange_symbol_url,
@@ -21,7 +23,7 @@ from akshare.futures.cons import (
     zh_match_main_contract_payload,
 )
 from akshare.futures.futures_contract_detail import futures_contract_detail
-from akshare.utils import demjson
+from akshare.utils.js_literal import loads_js_literal
 
 
 @lru_cache()
@@ -39,7 +41,7 @@ def futures_symbol_mark() -> pd.DataFrame:
     r.encoding = "gb2312"
     data_text = r.text
     raw_json = data_text[data_text.find("{") : data_text.find("}") + 1]
-    data_json = demjson.decode(raw_json)
+    data_json = loads_js_literal(raw_json)
     czce_mark_list = [item[1] for item in data_json["czce"][1:]]
     dce_mark_list = [item[1] for item in data_json["dce"][1:]]
     shfe_mark_list = [item[1] for item in data_json["shfe"][1:]]
@@ -148,7 +150,7 @@ def zh_subscribe_exchange_symbol(symbol: str = "cffex") -> pd.DataFrame:
     r = requests.get(zh_subscribe_exchange_symbol_url)
     r.encoding = "gbk"
     data_text = r.text
-    data_json = demjson.decode(
+    data_json = loads_js_literal(
         data_text[data_text.find("{") : data_text.find("};") + 1]
     )
     if symbol == "czce":
@@ -185,7 +187,7 @@ def match_main_contract(symbol: str = "cffex") -> str:
         res = requests.get(
             zh_match_main_contract_url, params=zh_match_main_contract_payload
         )
-        data_json = demjson.decode(res.text)
+        data_json = loads_js_literal(res.text)
         data_df = pd.DataFrame(data_json)
         try:
             main_contract = data_df[data_df.iloc[:, 3:].duplicated()]
@@ -202,414 +204,371 @@ def match_main_contract(symbol: str = "cffex") -> str:
     return ",".join([item for item in subscribe_exchange_list])
 
 
-def futures_zh_spot(
-    symbol: str = "V2309",
-    market: str = "CF",
-    adjust: str = "0",
-) -> pd.DataFrame:
+_SPOT_HEADERS = {
+    "Accept": "*/*",
+    "Accept-Encoding": "gzip, deflate",
+    "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
+    "Cache-Control": "no-cache",
+    "Host": "hq.sinajs.cn",
+    "Pragma": "no-cache",
+    "Proxy-Connection": "keep-alive",
+    "Referer": "https://vip.stock.finance.sina.com.cn/",
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/97.0.4692.71 Safari/537.36",
+}
+
+_CF_COLUMNS = [
+    "symbol",
+    "time",
+    "open",
+    "high",
+    "low",
+    "last_close",
+    "bid_price",
+    "ask_price",
+    "current_price",
+    "avg_price",
+    "last_settle_price",
+    "buy_vol",
+    "sell_vol",
+    "hold",
+    "volume",
+]
+
+_FF_COLUMNS = (
+    [
+        "open",
+        "high",
+        "low",
+        "current_price",
+        "volume",
+        "amount",
+        "hold",
+    ]
+    + ["_"] * 29
+    + ["__", "time"]
+    + ["_"] * 11
+    + ["symbol"]
+)
+
+
+def _futures_zh_spot_url(contract_list: list) -> str:
     """
-    期货的实时行情数据
-    https://vip.stock.finance.sina.com.cn/quotes_service/view/qihuohangqing.html#titlePos_1
-    :param symbol: 合约名称的字符串组合
-    :type symbol: str
+    新浪财经-期货实时行情的请求地址
+    rn 为 31 位随机数的十六进制字符串, 与网页中的 Math.round(Math.random() * 2147483648).toString(16) 一致
+    :param contract_list: 合约列表
+    :type contract_list: list
+    :return: 请求地址
+    :rtype: str
+    """
+    rn_code = format(random.randint(0, 2147483648), "x")
+    subscribe_list = ",".join(["nf_" + item for item in contract_list])
+    return f"https://hq.sinajs.cn/rn={rn_code}&list={subscribe_list}"
+
+
+def _futures_zh_spot_rows(text: str, market: str = "CF") -> Tuple[list, list]:
+    """
+    新浪财经-期货实时行情-拆分返回的文本
+    :param text: 形如 var hq_str_nf_V2309="...,..."; 的文本
+    :type text: str
     :param market: CF 为商品期货
     :type market: str
-    :param adjust: '1' or '0'；字符串的 0 或 1；返回合约、交易所和最小变动单位的实时数据, 返回数据会变慢
-    :type adjust: str
-    :return: 期货的实时行情数据
+    :return: 合约列表和每个合约的原始字段; 字段不全的合约(如已到期或无效合约返回的空字符串)被剔除
+    :rtype: tuple
+    """
+    min_fields = len(_CF_COLUMNS) if market == "CF" else len(_FF_COLUMNS)
+    contract_list = []
+    row_list = []
+    for item in text.split(";"):
+        item = item.strip()
+        if item == "":
+            continue
+        name, value = item.split("=", 1)
+        row = value.split(",")
+        if len(row) < min_fields:
+            continue
+        contract_list.append(name.rsplit("nf_", 1)[-1])
+        row_list.append(row)
+    return contract_list, row_list
+
+
+def _futures_zh_spot_frame(row_list: list, market: str = "CF") -> pd.DataFrame:
+    """
+    新浪财经-期货实时行情-整理字段
+    :param row_list: 每个合约的原始字段
+    :type row_list: list
+    :param market: CF 为商品期货
+    :type market: str
+    :return: 期货的实时行情数据, 未剔除没有最新价的合约
     :rtype: pandas.DataFrame
     """
-    file_data = "Math.round(Math.random() * 2147483648).toString(16)"
-    ctx = py_mini_racer.MiniRacer()
-    rn_code = ctx.eval(file_data)
-    subscribe_list = ",".join(["nf_" + item.strip() for item in symbol.split(",")])
-    url = f"https://hq.sinajs.cn/rn={rn_code}&list={subscribe_list}"
-    headers = {
-        "Accept": "*/*",
-        "Accept-Encoding": "gzip, deflate",
-        "Accept-Language": "zh-CN,zh;q=0.9,en;q=0.8",
-        "Cache-Control": "no-cache",
-        "Host": "hq.sinajs.cn",
-        "Pragma": "no-cache",
-        "Proxy-Connection": "keep-alive",
-        "Referer": "https://vip.stock.finance.sina.com.cn/",
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/97.0.4692.71 Safari/537.36",
-    }
-    r = requests.get(url, headers=headers)
-    data_df = pd.DataFrame(
-        [
-            item.strip().split("=")[1].split(",")
-            for item in r.text.split(";")
-            if item.strip() != ""
-        ]
-    )
+    data_df = pd.DataFrame(row_list)
     data_df.iloc[:, 0] = data_df.iloc[:, 0].str.replace('"', "")
     data_df.iloc[:, -1] = data_df.iloc[:, -1].str.replace('"', "")
-    if adjust == "1":
-        contract_name_list = [item.split("_")[1] for item in subscribe_list.split(",")]
-        contract_min_list = []
-        contract_exchange_list = []
-        for contract_name in contract_name_list:
-            temp_df = futures_contract_detail(symbol=contract_name)
-            exchange_name = temp_df[temp_df["item"] == "上市交易所"]["value"].values[0]
-            contract_exchange_list.append(exchange_name)
-            contract_min = temp_df[temp_df["item"] == "最小变动价位"]["value"].values[0]
-            contract_min_list.append(contract_min)
-        if market == "CF":
-            data_df.columns = [
+    if market == "CF":
+        # 此处由于 20220601 接口变动，增加了字段，多出的字段都不需要
+        data_df.columns = _CF_COLUMNS + ["_"] * (data_df.shape[1] - len(_CF_COLUMNS))
+        data_df = data_df[
+            [
                 "symbol",
                 "time",
                 "open",
                 "high",
                 "low",
-                "last_close",
+                "current_price",
                 "bid_price",
                 "ask_price",
-                "current_price",
-                "avg_price",
-                "last_settle_price",
                 "buy_vol",
                 "sell_vol",
                 "hold",
                 "volume",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-            ]
-            data_df = data_df[
-                [
-                    "symbol",
-                    "time",
-                    "open",
-                    "high",
-                    "low",
-                    "current_price",
-                    "bid_price",
-                    "ask_price",
-                    "buy_vol",
-                    "sell_vol",
-                    "hold",
-                    "volume",
-                    "avg_price",
-                    "last_close",
-                    "last_settle_price",
-                ]
-            ]
-            data_df["exchange"] = contract_exchange_list
-            data_df["contract"] = contract_name_list
-            data_df["contract_min_change"] = contract_min_list
-
-            data_df["open"] = pd.to_numeric(data_df["open"], errors="coerce")
-            data_df["high"] = pd.to_numeric(data_df["high"], errors="coerce")
-            data_df["low"] = pd.to_numeric(data_df["low"], errors="coerce")
-            data_df["current_price"] = pd.to_numeric(
-                data_df["current_price"], errors="coerce"
-            )
-            data_df["bid_price"] = pd.to_numeric(data_df["bid_price"], errors="coerce")
-            data_df["ask_price"] = pd.to_numeric(data_df["ask_price"], errors="coerce")
-            data_df["buy_vol"] = pd.to_numeric(data_df["buy_vol"], errors="coerce")
-            data_df["sell_vol"] = pd.to_numeric(data_df["sell_vol"], errors="coerce")
-            data_df["hold"] = pd.to_numeric(data_df["hold"], errors="coerce")
-            data_df["volume"] = pd.to_numeric(data_df["volume"], errors="coerce")
-            data_df["avg_price"] = pd.to_numeric(data_df["avg_price"], errors="coerce")
-            data_df["last_close"] = pd.to_numeric(
-                data_df["last_close"], errors="coerce"
-            )
-            data_df["last_settle_price"] = pd.to_numeric(
-                data_df["last_settle_price"], errors="coerce"
-            )
-            data_df.dropna(subset=["current_price"], ignore_index=True, inplace=True)
-            return data_df
-        else:
-            data_df.columns = [
-                "open",
-                "high",
-                "low",
-                "current_price",
-                "volume",
-                "amount",
-                "hold",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "__",
-                "time",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "symbol",
-            ]
-            data_df = data_df[
-                [
-                    "symbol",
-                    "time",
-                    "open",
-                    "high",
-                    "low",
-                    "current_price",
-                    "hold",
-                    "volume",
-                    "amount",
-                ]
+                "avg_price",
+                "last_close",
+                "last_settle_price",
             ]
-            data_df["exchange"] = contract_exchange_list
-            data_df["contract"] = contract_name_list
-            data_df["contract_min_change"] = contract_min_list
-            data_df["open"] = pd.to_numeric(data_df["open"], errors="coerce")
-            data_df["high"] = pd.to_numeric(data_df["high"], errors="coerce")
-            data_df["low"] = pd.to_numeric(data_df["low"], errors="coerce")
-            data_df["current_price"] = pd.to_numeric(
-                data_df["current_price"], errors="coerce"
-            )
-            data_df["hold"] = pd.to_numeric(data_df["hold"], errors="coerce")
-            data_df["volume"] = pd.to_numeric(data_df["volume"], errors="coerce")
-            data_df["amount"] = pd.to_numeric(data_df["amount"], errors="coerce")
-            data_df.dropna(subset=["current_price"], ignore_index=True, inplace=True)
-            return data_df
+        ]
     else:
-        if market == "CF":
-            # 此处由于 20220601 接口变动，增加了字段，此处增加异常判断，except 后为新代码
-            try:
-                data_df.columns = [
-                    "symbol",
-                    "time",
-                    "open",
-                    "high",
-                    "low",
-                    "last_close",
-                    "bid_price",
-                    "ask_price",
-                    "current_price",
-                    "avg_price",
-                    "last_settle_price",
-                    "buy_vol",
-                    "sell_vol",
-                    "hold",
-                    "volume",
-                    "_",
-                    "_",
-                    "_",
-                    "_",
-                    "_",
-                    "_",
-                    "_",
-                    "_",
-                    "_",
-                    "_",
-                    "_",
-                    "_",
-                    "_",
-                ]
-            except:  # noqa: E722
-                data_df.columns = [
-                    "symbol",
-                    "time",
-                    "open",
-                    "high",
-                    "low",
-                    "last_close",
-                    "bid_price",
-                    "ask_price",
-                    "current_price",
-                    "avg_price",
-                    "last_settle_price",
-                    "buy_vol",
-                    "sell_vol",
-                    "hold",
-                    "volume",
-                    "_",
-                    "_",
-                    "_",
-                    "_",
-                    "_",
-                    "_",
-                    "_",
-                    "_",
-                    "_",
-                    "_",
-                    "_",
-                    "_",
-                    "_",
-                    "_",
-                    "_",
-                    "_",
-                    "_",
-                    "_",
-                    "_",
-                    "_",
-                    "_",
-                    "_",
-                    "_",
-                    "_",
-                    "_",
-                    "_",
-                    "_",
-                    "_",
-                    "_",
-                ]
-            data_df = data_df[
-                [
-                    "symbol",
-                    "time",
-                    "open",
-                    "high",
-                    "low",
-                    "current_price",
-                    "bid_price",
-                    "ask_price",
-                    "buy_vol",
-                    "sell_vol",
-                    "hold",
-                    "volume",
-                    "avg_price",
-                    "last_close",
-                    "last_settle_price",
-                ]
-            ]
-
-            data_df["open"] = pd.to_numeric(data_df["open"], errors="coerce")
-            data_df["high"] = pd.to_numeric(data_df["high"], errors="coerce")
-            data_df["low"] = pd.to_numeric(data_df["low"], errors="coerce")
-            data_df["current_price"] = pd.to_numeric(
-                data_df["current_price"], errors="coerce"
-            )
-            data_df["bid_price"] = pd.to_numeric(data_df["bid_price"], errors="coerce")
-            data_df["ask_price"] = pd.to_numeric(data_df["ask_price"], errors="coerce")
-            data_df["buy_vol"] = pd.to_numeric(data_df["buy_vol"], errors="coerce")
-            data_df["sell_vol"] = pd.to_numeric(data_df["sell_vol"], errors="coerce")
-            data_df["hold"] = pd.to_numeric(data_df["hold"], errors="coerce")
-            data_df["volume"] = pd.to_numeric(data_df["volume"], errors="coerce")
-            data_df["avg_price"] = pd.to_numeric(data_df["avg_price"], errors="coerce")
-            data_df["last_close"] = pd.to_numeric(
-                data_df["last_close"], errors="coerce"
-            )
-            data_df["last_settle_price"] = pd.to_numeric(
-                data_df["last_settle_price"], errors="coerce"
-            )
-            data_df.dropna(subset=["current_price"], ignore_index=True, inplace=True)
-            return data_df
-        else:
-            data_df.columns = [
+        data_df.columns = _FF_COLUMNS
+        data_df = data_df[
+            [
+                "symbol",
+                "time",
                 "open",
                 "high",
                 "low",
                 "current_price",
+                "hold",
                 "volume",
                 "amount",
-                "hold",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "__",
-                "time",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "_",
-                "symbol",
             ]
-            data_df = data_df[
-                [
-                    "symbol",
-                    "time",
-                    "open",
-                    "high",
-                    "low",
-                    "current_price",
-                    "hold",
-                    "volume",
-                    "amount",
-                ]
+        ]
+    for column in data_df.columns[2:]:
+        data_df[column] = pd.to_numeric(data_df[column], errors="coerce")
+    return data_df
+
+
+@lru_cache(maxsize=None)
+def _futures_contract_meta(contract: str) -> Tuple[str, str]:
+    """
+    期货合约的上市交易所和最小变动价位; 合约属性不会变化, 进程内缓存
+    :param contract: 合约
+    :type contract: str
+    :return: 上市交易所和最小变动价位
+    :rtype: tuple
+    """
+    temp_df = futures_contract_detail(symbol=contract)
+    exchange_name = temp_df[temp_df["item"] == "上市交易所"]["value"].values[0]
+    contract_min = temp_df[temp_df["item"] == "最小变动价位"]["value"].values[0]
+    return exchange_name, contract_min
+
+
+def _futures_contract_meta_list(contract_list: list, max_workers: int = 8) -> list:
+    """
+    并发查询多个合约的上市交易所和最小变动价位, 已查询过的合约直接使用缓存
+    :param contract_list: 合约列表
+    :type contract_list: list
+    :param max_workers: 并发数
+    :type max_workers: int
+    :return: 与 contract_list 对应的 (上市交易所, 最小变动价位) 列表
+    :rtype: list
+    """
+    if not contract_list:
+        return []
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(contract_list))
+    ) as executor:
+        return list(executor.map(_futures_contract_meta, contract_list))
+
+
+def futures_zh_spot(
+    symbol: str = "V2309",
+    market: str = "CF",
+    adjust: str = "0",
+) -> pd.DataFrame:
+    """
+    期货的实时行情数据
+    https://vip.stock.finance.sina.com.cn/quotes_service/view/qihuohangqing.html#titlePos_1
+    :param symbol: 合约名称的字符串组合
+    :type symbol: str
+    :param market: CF 为商品期货
+    :type market: str
+    :param adjust: '1' or '0'；字符串的 0 或 1；返回合约、交易所和最小变动单位的实时数据, 返回数据会变慢
+    :type adjust: str
+    :return: 期货的实时行情数据
+    :rtype: pandas.DataFrame
+    """
+    url = _futures_zh_spot_url([item.strip() for item in symbol.split(",")])
+    r = requests.get(url, headers=_SPOT_HEADERS)
+    contract_name_list, row_list = _futures_zh_spot_rows(r.text, market=market)
+    if not row_list:
+        return pd.DataFrame()
+    data_df = _futures_zh_spot_frame(row_list, market=market)
+    if adjust == "1":
+        meta_list = _futures_contract_meta_list(contract_name_list)
+        data_df["exchange"] = [item[0] for item in meta_list]
+        data_df["contract"] = contract_name_list
+        data_df["contract_min_change"] = [item[1] for item in meta_list]
+    data_df.dropna(subset=["current_price"], ignore_index=True, inplace=True)
+    return data_df
+
+
+class FuturesZhSpotPoller:
+    """
+    新浪财经-期货实时行情-轮询器
+    订阅一组合约后反复调用 poll, 复用同一个连接, 合约属性只在订阅时查询一次,
+    每次只返回与上一次相比发生变化的合约, 并附带收到数据的时间 receive_time
+    """
+
+    def __init__(
+        self,
+        symbol: Union[str, Iterable[str]] = "V2309",
+        market: str = "CF",
+        adjust: str = "0",
+        session: Optional[requests.Session] = None,
+        timeout: float = 10,
+    ):
+        """
+        :param symbol: 合约, 逗号分隔的字符串或合约列表
+        :type symbol: str or list
+        :param market: CF 为商品期货
+        :type market: str
+        :param adjust: '1' or '0'；为 '1' 时返回上市交易所和最小变动价位
+        :type adjust: str
+        :param session: 使用的会话; 默认新建一个
+        :type session: requests.Session
+        :param timeout: 请求超时时间（秒）
+        :type timeout: float
+        """
+        self.market = market
+        self.adjust = adjust
+        self.session = session or requests.Session()
+        self.timeout = timeout
+        self.contract_list = []
+        self.meta = {}
+        self.last_rows = {}
+        self.snapshot = pd.DataFrame()
+        self.subscribe(symbol)
+
+    @staticmethod
+    def _split(symbol: Union[str, Iterable[str]]) -> list:
+        if isinstance(symbol, str):
+            symbol = symbol.split(",")
+        return [item.strip() for item in symbol if item.strip() != ""]
+
+    def subscribe(self, symbol: Union[str, Iterable[str]]) -> None:
+        """
+        增加订阅的合约; 需要合约属性时只查询新增的合约
+        :param symbol: 合约, 逗号分隔的字符串或合约列表
+        :type symbol: str or list
+        """
+        new_list = [
+            item for item in self._split(symbol) if item not in self.contract_list
+        ]
+        new_list = list(dict.fromkeys(new_list))
+        if self.adjust == "1":
+            meta_list = _futures_contract_meta_list(new_list)
+            self.meta.update(zip(new_list, meta_list))
+        self.contract_list.extend(new_list)
+
+    def unsubscribe(self, symbol: Union[str, Iterable[str]]) -> None:
+        """
+        取消订阅的合约
+        :param symbol: 合约, 逗号分隔的字符串或合约列表
+        :type symbol: str or list
+        """
+        remove_set = set(self._split(symbol))
+        self.contract_list = [
+            item for item in self.contract_list if item not in remove_set
+        ]
+        for item in remove_set:
+            self.last_rows.pop(item, None)
+        if not self.snapshot.empty:
+            self.snapshot = self.snapshot[
+                ~self.snapshot["contract"].isin(remove_set)
+            ].reset_index(drop=True)
+
+    def poll(self) -> pd.DataFrame:
+        """
+        请求一次行情, 返回有变化的合约
+        :return: 与上一次相比发生变化的合约的实时行情数据
+        :rtype: pandas.DataFrame
+        """
+        if not self.contract_list:
+            return pd.DataFrame()
+        r = self.session.get(
+            _futures_zh_spot_url(self.contract_list),
+            headers=_SPOT_HEADERS,
+            timeout=self.timeout,
+        )
+        receive_time = pd.Timestamp.now()
+        contract_name_list, row_list = _futures_zh_spot_rows(r.text, market=self.market)
+        changed_contract_list = []
+        changed_row_list = []
+        for contract, row in zip(contract_name_list, row_list):
+            row = tuple(row)
+            if self.last_rows.get(contract) != row:
+                self.last_rows[contract] = row
+                changed_contract_list.append(contract)
+                changed_row_list.append(row)
+        if not changed_row_list:
+            return pd.DataFrame()
+        data_df = _futures_zh_spot_frame(changed_row_list, market=self.market)
+        data_df.insert(0, "contract", changed_contract_list)
+        if self.adjust == "1":
+            data_df["exchange"] = [self.meta[item][0] for item in changed_contract_list]
+            data_df["contract_min_change"] = [
+                self.meta[item][1] for item in changed_contract_list
             ]
-            data_df["open"] = pd.to_numeric(data_df["open"], errors="coerce")
-            data_df["high"] = pd.to_numeric(data_df["high"], errors="coerce")
-            data_df["low"] = pd.to_numeric(data_df["low"], errors="coerce")
-            data_df["current_price"] = pd.to_numeric(
-                data_df["current_price"], errors="coerce"
-            )
-            data_df["hold"] = pd.to_numeric(data_df["hold"], errors="coerce")
-            data_df["volume"] = pd.to_numeric(data_df["volume"], errors="coerce")
-            data_df["amount"] = pd.to_numeric(data_df["amount"], errors="coerce")
-            data_df.dropna(subset=["current_price"], inplace=True, ignore_index=True)
-            return data_df
+        data_df["receive_time"] = receive_time
+        data_df.dropna(subset=["current_price"], ignore_index=True, inplace=True)
+        self._update_snapshot(data_df)
+        return data_df
+
+    def _update_snapshot(self, data_df: pd.DataFrame) -> None:
+        if self.snapshot.empty:
+            self.snapshot = data_df.copy()
+            return
+        snapshot = self.snapshot[~self.snapshot["contract"].isin(data_df["contract"])]
+        snapshot = pd.concat([snapshot, data_df], ignore_index=True)
+        order = {item: index for index, item in enumerate(self.contract_list)}
+        self.snapshot = snapshot.sort_values(
+            by="contract", key=lambda x: x.map(order), ignore_index=True
+        )
+
+    def stream(
+        self, interval: float = 3, max_polls: Optional[int] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        按固定间隔轮询, 只返回有变化的数据
+        :param interval: 轮询间隔（秒）
+        :type interval: float
+        :param max_polls: 最多轮询次数; 为空时一直轮询
+        :type max_polls: int
+        :return: 每次有变化时的实时行情数据
+        :rtype: iterator
+        """
+        count = 0
+        while max_polls is None or count < max_polls:
+            start = time.monotonic()
+            data_df = self.poll()
+            count += 1
+            if not data_df.empty:
+                yield data_df
+            if max_polls is None or count < max_polls:
+                time.sleep(max(0.0, interval - (time.monotonic() - start)))
+
+    def close(self) -> None:
+        """
+        关闭会话
+        """
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False  # 不处理异常
 
 
 def futures_zh_minute_sina(symbol: str = "IF2008", period: str = "1") -> pd.DataFrame:
@@ -9,7 +9,7 @@ Desc: 每日注册仓单数据
 import datetime
 import re
 import warnings
-from io import BytesIO
+from io import BytesIO, StringIO
 from typing import List
 
 import pandas as pd
@@ -18,8 +18,11 @@ import requests
 from akshare.futures import cons
 from akshare.futures.requests_fun import requests_link, pandas_read_html_link
 from akshare.futures.symbol_var import chinese_to_english
+from akshare.utils.day_cache import day_cached
+from akshare.utils.func import PageAccumulator, run_batch
+from akshare.utils.ratelimit import get_rate_limiter
 
-calendar = cons.get_calendar()
+calendar = cons.get_trade_calendar()
 shfe_20100126 = pd.DataFrame(
     {
         "var": ["CU", "AL", "ZN", "RU", "FU", "AU", "RB", "WR"],
@@ -34,6 +37,7 @@ shfe_20101029 = pd.DataFrame(
 )
 
 
+@day_cached("DCE")
 def get_dce_receipt(date: str = None, vars_list: List = cons.contract_symbols):
     """
     大连商品交易所-注册仓单数据
@@ -59,7 +63,7 @@ def get_dce_receipt(date: str = None, vars_list: List = cons.contract_symbols):
     r = requests.post(url, json=payload)
     data_json = r.json()
     temp_df = pd.DataFrame(data_json["data"]["entityList"])
-    records = pd.DataFrame()
+    pages = PageAccumulator()
     for x in temp_df.to_dict(orient="records"):
         if isinstance(x["variety"], str):
             if x["variety"][-2:] == "小计":
@@ -70,7 +74,8 @@ def get_dce_receipt(date: str = None, vars_list: List = cons.contract_symbols):
                     "receipt_chg": int(x["diff"]),
                     "date": date.strftime("%Y%m%d"),
                 }
-                records = pd.concat([records, pd.DataFrame(temp_data, index=[0])])
+                pages.extend([temp_data])
+    records = pages.to_frame()
 
     if len(records.index) != 0:
         records.index = records["var"]
@@ -79,6 +84,7 @@ def get_dce_receipt(date: str = None, vars_list: List = cons.contract_symbols):
     return records.reset_index(drop=True)
 
 
+@day_cached("SHFE")
 def get_shfe_receipt_1(
     date: str = None, vars_list: List = cons.contract_symbols
 ) -> pd.DataFrame:
@@ -133,7 +139,7 @@ def get_shfe_receipt_1(
         data = pandas_read_html_link(url)[0]
         indexes = [x for x in data.index if (data[0].tolist()[x] in var_list)]
         last_index = [x for x in data.index if "注" in str(data[0].tolist()[x])][0] - 1
-        records = pd.DataFrame()
+        pages = PageAccumulator()
         for i in list(range(len(indexes))):
             if i != len(indexes) - 1:
                 data_cut = data.loc[indexes[i] : indexes[i + 1] - 1, :]
@@ -145,7 +151,8 @@ def get_shfe_receipt_1(
             data_dict["receipt"] = int(data_cut[2].tolist()[-1])
             data_dict["receipt_chg"] = int(data_cut[3].tolist()[-1])
             data_dict["date"] = date
-            records = pd.concat([records, pd.DataFrame(data_dict, index=[0])])
+            pages.extend([data_dict])
+        records = pages.to_frame()
     if len(records.index) != 0:
         records.index = records["var"]
         vars_in_market = [i for i in vars_list if i in records.index]
@@ -153,6 +160,7 @@ def get_shfe_receipt_1(
     return records.reset_index(drop=True)
 
 
+@day_cached("SHFE")
 def get_shfe_receipt_2(
     date: str = None, vars_list: List = cons.contract_symbols
 ) -> pd.DataFrame:
@@ -185,7 +193,7 @@ def get_shfe_receipt_2(
     data = pd.DataFrame(context["o_cursor"])
     if len(data.columns) < 1:
         return pd.DataFrame()
-    records = pd.DataFrame()
+    pages = PageAccumulator()
     for var in set(data["VARNAME"].tolist()):
         data_cut = data[data["VARNAME"] == var]
         if "BC" in var:
@@ -202,12 +210,11 @@ def get_shfe_receipt_2(
                 "receipt_chg": int(data_cut["WRTCHANGE"].tolist()[-1]),
                 "date": date,
             }
-        records = pd.concat([records, pd.DataFrame(data_dict, index=[0])])
-        temp_records = (
-            records.groupby("var")[["receipt", "receipt_chg"]].sum().reset_index()
-        )
-        temp_records["date"] = date
-        records = temp_records
+        pages.extend([data_dict])
+    records = pages.to_frame()
+    if len(records.index) != 0:
+        records = records.groupby("var")[["receipt", "receipt_chg"]].sum().reset_index()
+        records["date"] = date
     if len(records.index) != 0:
         records.index = records["var"]
         vars_in_market = [i for i in vars_list if i in records.index]
@@ -215,6 +222,7 @@ def get_shfe_receipt_2(
     return records.reset_index(drop=True)
 
 
+@day_cached("SHFE")
 def get_shfe_receipt_3(
     date: str = None, vars_list: List = cons.contract_symbols
 ) -> pd.DataFrame:
@@ -240,25 +248,20 @@ def get_shfe_receipt_3(
         return pd.DataFrame()
     url = f"https://www.shfe.com.cn/data/tradedata/future/stockdata/dailystock_{date}/ZH/all.html"
     r = requests.get(url, headers=cons.shfe_headers)
-    from io import StringIO
-
     temp_tables = pd.read_html(StringIO(r.text))
-    len(temp_tables)
-    records = pd.DataFrame()
-    for table_num in range(1, len(temp_tables)):
-        temp_df = pd.read_html(StringIO(r.text))[table_num]
+    pages = PageAccumulator()
+    for temp_df in temp_tables[1:]:
         data_dict = {
             "var": chinese_to_english(temp_df.iloc[0, 1]),
             "receipt": int(temp_df.iloc[-1, 2]),
             "receipt_chg": int(temp_df.iloc[-1, 3]),
             "date": date,
         }
-        records = pd.concat([records, pd.DataFrame(data_dict, index=[0])])
-        temp_records = (
-            records.groupby("var")[["receipt", "receipt_chg"]].sum().reset_index()
-        )
-        temp_records["date"] = date
-        records = temp_records
+        pages.extend([data_dict])
+    records = pages.to_frame()
+    if len(records.index) != 0:
+        records = records.groupby("var")[["receipt", "receipt_chg"]].sum().reset_index()
+        records["date"] = date
     if len(records.index) != 0:
         records.index = records["var"]
         vars_in_market = [i for i in vars_list if i in records.index]
@@ -266,6 +269,7 @@ def get_shfe_receipt_3(
     return records.reset_index(drop=True)
 
 
+@day_cached("CZCE")
 def get_czce_receipt_1(date: str = None, vars_list: List = cons.contract_symbols):
     """
     郑州商品交易所-注册仓单数据
@@ -291,7 +295,7 @@ def get_czce_receipt_1(date: str = None, vars_list: List = cons.contract_symbols
     r = requests_link(url, encoding="utf-8", headers=cons.shfe_headers)
     context = r.text
     data = pd.read_html(context)[1]
-    records = pd.DataFrame()
+    pages = PageAccumulator()
     indexes = [x for x in data.index if "品种：" in str(data[0].tolist()[x])]
     ends = [x for x in data.index if "总计" in str(data[0].tolist()[x])]
     for i in list(range(len(indexes))):
@@ -317,7 +321,8 @@ def get_czce_receipt_1(date: str = None, vars_list: List = cons.contract_symbols
             "receipt_chg": int(receipt_chg),
             "date": date,
         }
-        records = pd.concat([records, pd.DataFrame(data_dict, index=[0])])
+        pages.extend([data_dict])
+    records = pages.to_frame()
     if len(records.index) != 0:
         records.index = records["var"]
         vars_in_market = [i for i in vars_list if i in records.index]
@@ -325,6 +330,7 @@ def get_czce_receipt_1(date: str = None, vars_list: List = cons.contract_symbols
     return records.reset_index(drop=True)
 
 
+@day_cached("CZCE")
 def get_czce_receipt_2(date: str = None, vars_list: List = cons.contract_symbols):
     """
     郑州商品交易所-注册仓单数据
@@ -351,7 +357,7 @@ def get_czce_receipt_2(date: str = None, vars_list: List = cons.contract_symbols
     r = requests.get(url)
     r.encoding = "utf-8"
     data = pd.read_html(r.text)[3:]
-    records = pd.DataFrame()
+    pages = PageAccumulator()
     for data_cut in data:
         if len(data_cut.columns) > 3:
             last_indexes = [
@@ -375,7 +381,8 @@ def get_czce_receipt_2(date: str = None, vars_list: List = cons.contract_symbols
                 "receipt_chg": int(receipt_chg),
                 "date": date,
             }
-            records = pd.concat([records, pd.DataFrame(data_dict, index=[0])])
+            pages.extend([data_dict])
+    records = pages.to_frame()
     if len(records.index) != 0:
         records.index = records["var"]
         vars_in_market = [i for i in vars_list if i in records.index]
@@ -383,6 +390,7 @@ def get_czce_receipt_2(date: str = None, vars_list: List = cons.contract_symbols
     return records.reset_index(drop=True)
 
 
+@day_cached("CZCE")
 def get_czce_receipt_3(
     date: str = None, vars_list: List = cons.contract_symbols
 ) -> pd.DataFrame:
@@ -499,6 +507,7 @@ def get_czce_receipt_3(
     return records.reset_index(drop=True)
 
 
+@day_cached("GFEX")
 def get_gfex_receipt(
     date: str = None, vars_list: List = cons.contract_symbols
 ) -> pd.DataFrame:
@@ -568,6 +577,51 @@ def get_gfex_receipt(
     return result_df
 
 
+_RECEIPT_MARKET_HOST = {
+    "dce": "www.dce.com.cn",
+    "shfe": "www.shfe.com.cn",
+    "gfex": "www.gfex.com.cn",
+    "czce": "www.czce.com.cn",
+}
+
+
+def _receipt_func(market: str, day: datetime.date):
+    """
+    指定交易所和交易日适用的注册仓单接口
+    :param market: choice of {"dce", "shfe", "gfex", "czce"}
+    :type market: str
+    :param day: 交易日
+    :type day: datetime.date
+    :return: 适用的接口和无数据时的提示; 没有适用的接口时接口为 None
+    :rtype: tuple
+    """
+    if market == "dce":
+        if day >= datetime.date(2009, 4, 7):
+            return get_dce_receipt, None
+        return None, "20090407 起，大连商品交易所每个交易日更新仓单数据"
+    elif market == "shfe":
+        if datetime.date(2008, 10, 6) <= day <= datetime.date(2014, 5, 16):
+            return get_shfe_receipt_1, None
+        elif datetime.date(2014, 5, 16) <= day <= datetime.date(2025, 11, 17):
+            return get_shfe_receipt_2, None
+        elif day > datetime.date(2025, 11, 17):
+            return get_shfe_receipt_3, None
+        return None, "20081006 起，上海期货交易所每个交易日更新仓单数据"
+    elif market == "gfex":
+        if day > datetime.date(2022, 12, 22):
+            return get_gfex_receipt, None
+        return None, "20081006 起，上海期货交易所每个交易日更新仓单数据"
+    elif market == "czce":
+        if datetime.date(2008, 3, 3) <= day <= datetime.date(2010, 8, 24):
+            return get_czce_receipt_1, None
+        elif datetime.date(2010, 8, 24) < day <= datetime.date(2015, 11, 11):
+            return get_czce_receipt_2, None
+        elif day > datetime.date(2015, 11, 11):
+            return get_czce_receipt_3, None
+        return None, "20080303 起，郑州商品交易所每个交易日更新仓单数据"
+    return None, None
+
+
 def get_receipt(
     start_date: str = None,
     end_date: str = None,
@@ -596,75 +650,123 @@ def get_receipt(
         if end_date is not None
         else cons.convert_date(cons.get_latest_data_date(datetime.datetime.now()))
     )
-    records = pd.DataFrame()
+    pages = PageAccumulator()
     while start_date <= end_date:
         if start_date.strftime("%Y%m%d") not in calendar:
             warnings.warn(f"{start_date.strftime('%Y%m%d')} 非交易日")
         else:
             print(start_date)
             for market, market_vars in cons.market_exchange_symbols.items():
-                f = None
-                if market == "dce":
-                    if start_date >= datetime.date(2009, 4, 7):
-                        f = get_dce_receipt
-                    else:
-                        print("20090407 起，大连商品交易所每个交易日更新仓单数据")
-                        f = None
-                elif market == "shfe":
-                    if (
-                        datetime.date(2008, 10, 6)
-                        <= start_date
-                        <= datetime.date(2014, 5, 16)
-                    ):
-                        f = get_shfe_receipt_1
-                    elif (
-                        datetime.date(2014, 5, 16)
-                        <= start_date
-                        <= datetime.date(2025, 11, 17)
-                    ):
-                        f = get_shfe_receipt_2
-                    elif start_date > datetime.date(2025, 11, 17):
-                        f = get_shfe_receipt_3
-                    else:
-                        f = None
-                        print("20081006 起，上海期货交易所每个交易日更新仓单数据")
-                elif market == "gfex":
-                    if start_date > datetime.date(2022, 12, 22):
-                        f = get_gfex_receipt
-                    else:
-                        f = None
-                        print("20081006 起，上海期货交易所每个交易日更新仓单数据")
-                elif market == "czce":
-                    if (
-                        datetime.date(2008, 3, 3)
-                        <= start_date
-                        <= datetime.date(2010, 8, 24)
-                    ):
-                        f = get_czce_receipt_1
-                    elif (
-                        datetime.date(2010, 8, 24)
-                        < start_date
-                        <= datetime.date(2015, 11, 11)
-                    ):
-                        f = get_czce_receipt_2
-                    elif start_date > datetime.date(2015, 11, 11):
-                        f = get_czce_receipt_3
-                    else:
-                        f = None
-                        print("20080303 起，郑州商品交易所每个交易日更新仓单数据")
+                f, message = _receipt_func(market, start_date)
+                if message is not None:
+                    print(message)
                 get_vars = [var for var in vars_list if var in market_vars]
                 if market != "cffex" and get_vars != []:
                     if f is not None:
-                        records = pd.concat([records, f(start_date, get_vars)])
+                        pages.append(f(start_date, get_vars))
         start_date += datetime.timedelta(days=1)
+    records = pages.to_frame()
     records.reset_index(drop=True, inplace=True)
     if records.empty:
         return records
     return records
 
 
+def get_receipt_panel(
+    start_date: str = None,
+    end_date: str = None,
+    vars_list: List = cons.contract_symbols,
+    max_workers: int = 8,
+    rate: float = 4,
+) -> pd.DataFrame:
+    """
+    大宗商品-注册仓单数据-区间面板
+    只请求区间内的交易日, 多个交易所和多个交易日并发请求, 每个交易所单独限速;
+    开启 akshare.utils.day_cache 后每个交易日的结果会缓存在本地
+    :param start_date: 开始日期 format：YYYY-MM-DD 或 YYYYMMDD 或 datetime.date 对象 为空时为当天
+    :type start_date: str
+    :param end_date: 结束数据 format：YYYY-MM-DD 或 YYYYMMDD 或 datetime.date 对象 为空时为最新的有数据的交易日
+    :type end_date: str
+    :param vars_list: 合约品种如 RB、AL 等列表为空时为所有商品
+    :type vars_list: list
+    :param max_workers: 并发线程数
+    :type max_workers: int
+    :param rate: 每个交易所每秒最多请求数
+    :type rate: float
+    :return: 注册仓单数据, 列为 date, exchange, variety, receipt, receipt_chg, 按日期和交易所排列;
+    获取失败的交易所和日期及原因记录在 attrs["failed"] 中
+    :rtype: pandas.DataFrame
+    """
+    if not isinstance(vars_list, list):
+        raise ValueError("vars_list: 必须是列表")
+    start_date = (
+        cons.convert_date(start_date)
+        if start_date is not None
+        else datetime.date.today()
+    )
+    end_date = (
+        cons.convert_date(end_date)
+        if end_date is not None
+        else cons.convert_date(cons.get_latest_data_date(datetime.datetime.now()))
+    )
+    task_dict = {}
+    for day in calendar.between(start_date, end_date):
+        day = cons.convert_date(day)
+        for market, market_vars in cons.market_exchange_symbols.items():
+            get_vars = [var for var in vars_list if var in market_vars]
+            f, _ = _receipt_func(market, day)
+            if f is not None and get_vars:
+                task_dict[(day.strftime("%Y%m%d"), market)] = (f, get_vars)
+    limiter_dict = {
+        market: get_rate_limiter(host, rate=rate)
+        for market, host in _RECEIPT_MARKET_HOST.items()
+    }
+
+    def _fetch(key: tuple) -> pd.DataFrame:
+        f, get_vars = task_dict[key]
+        # 部分接口会修改传入的品种列表
+        temp_df = f(key[0], list(get_vars))
+        return temp_df if isinstance(temp_df, pd.DataFrame) else None
+
+    columns = ["date", "exchange", "variety", "receipt", "receipt_chg"]
+    result_dict, failed_dict = run_batch(
+        task_dict,
+        _fetch,
+        limiter=lambda key: limiter_dict[key[1]],
+        max_workers=max_workers,
+    )
+    failed_dict = {
+        f"{key[1].upper()} {key[0]}": value for key, value in failed_dict.items()
+    }
+    pages = PageAccumulator()
+    for (day, market), temp_df in result_dict.items():
+        pages.extend(
+            zip(
+                [day] * len(temp_df),
+                [market.upper()] * len(temp_df),
+                temp_df["var"].tolist(),
+                temp_df["receipt"].tolist(),
+                temp_df["receipt_chg"].tolist(),
+            )
+        )
+    big_df = pages.to_frame()
+    if big_df.empty:
+        big_df = pd.DataFrame(columns=columns)
+    else:
+        big_df.columns = columns
+        big_df["receipt"] = pd.to_numeric(big_df["receipt"], errors="coerce")
+        big_df["receipt_chg"] = pd.to_numeric(big_df["receipt_chg"], errors="coerce")
+    big_df.attrs["failed"] = failed_dict
+    return big_df
+
+
 if __name__ == "__main__":
     get_receipt_df = get_receipt(
         start_date="20260130", end_date="20260130", vars_list=["RB"]
     )
     print(get_receipt_df)
+
+    get_receipt_panel_df = get_receipt_panel(
+        start_date="20260105", end_date="20260130", vars_list=["RB", "CU", "M", "SR"]
+    )
+    print(get_receipt_panel_df)
@@ -1,37 +1,231 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/7/21 15:00
+Date: 2026/10/18 01:30
 Desc: 期货品种映射表
+品种、交易所和中文名称的映射在导入时一次性建好, 单个查询为字典查找;
+整列合约代码可使用 *_series 函数一次性转换
 """
 
 import re
+from functools import lru_cache
+from types import MappingProxyType
+
+import pandas as pd
 
 from akshare.futures import cons
 
+_CHINESE_ENGLISH_PAIRS = (
+    ("橡胶", "RU"),
+    ("天然橡胶", "RU"),
+    ("石油沥青", "BU"),
+    ("石油沥青(仓库)", "BU"),
+    ("石油沥青(厂库)", "BU"),
+    ("沥青", "BU"),
+    ("沥青仓库", "BU"),
+    ("沥青(仓库)", "BU"),
+    ("沥青厂库", "BU2"),
+    ("沥青(厂库)", "BU2"),
+    ("热轧卷板", "HC"),
+    ("热轧卷板厂库", "HC"),
+    ("热轧卷板仓库", "HC"),
+    ("热轧卷板(厂库)", "HC"),
+    ("热轧卷板(仓库)", "HC"),
+    ("热轧板卷", "HC"),
+    ("燃料油", "FU"),
+    ("白银", "AG"),
+    ("线材", "WR"),
+    ("螺纹钢", "RB"),
+    ("螺纹钢(仓库)", "RB"),
+    ("螺纹钢(厂库)", "RB"),
+    ("铅", "PB"),
+    ("铜", "CU"),
+    ("铝", "AL"),
+    ("锌", "ZN"),
+    ("黄金", "AU"),
+    ("钯金", "AU"),
+    ("锡", "SN"),
+    ("镍", "NI"),
+    ("纸浆", "SP"),
+    ("纸浆(仓库)", "SP"),
+    ("纸浆(厂库)", "SP"),
+    ("豆一", "A"),
+    ("大豆", "A"),
+    ("豆二", "B"),
+    ("胶合板", "BB"),
+    ("玉米", "C"),
+    ("玉米淀粉", "CS"),
+    ("聚乙烯", "L"),
+    ("LLDPE", "L"),
+    ("LDPE", "L"),
+    ("豆粕", "M"),
+    ("豆油", "Y"),
+    ("大豆油", "Y"),
+    ("棕榈油", "P"),
+    ("纤维板", "FB"),
+    ("鸡蛋", "JD"),
+    ("聚氯乙烯", "V"),
+    ("PVC", "V"),
+    ("聚丙烯", "PP"),
+    ("PP", "PP"),
+    ("焦炭", "J"),
+    ("焦煤", "JM"),
+    ("铁矿石", "I"),
+    ("乙二醇", "EG"),
+    ("强麦", "WH"),
+    ("强筋小麦", "WH"),
+    (" 强筋小麦", "WH"),
+    ("硬冬白麦", "PM"),
+    ("普麦", "PM"),
+    ("硬白小麦", "PM"),
+    ("硬白小麦（）", "PM"),
+    ("皮棉", "CF"),
+    ("棉花", "CF"),
+    ("一号棉", "CF"),
+    ("白糖", "SR"),
+    ("PTA", "TA"),
+    ("菜籽油", "OI"),
+    ("菜油", "OI"),
+    ("早籼稻", "RI"),
+    ("早籼", "ER"),
+    ("甲醇", "MA"),
+    ("柴油", "MA"),
+    ("玻璃", "FG"),
+    ("油菜籽", "RS"),
+    ("菜籽", "RS"),
+    ("菜籽粕", "RM"),
+    ("菜粕", "RM"),
+    ("动力煤", "ZC"),
+    ("粳稻", "JR"),
+    ("晚籼稻", "LR"),
+    ("晚籼", "LR"),
+    ("硅铁", "SF"),
+    ("锰硅", "SM"),
+    ("硬麦", "WT"),
+    ("棉纱", "CY"),
+    ("苹果", "AP"),
+    ("原油", "SC"),
+    ("中质含硫原油", "SC"),
+    ("尿素", "UR"),
+    ("20号胶", "NR"),
+    ("苯乙烯", "EB"),
+    ("不锈钢", "SS"),
+    ("粳米", "RR"),
+    ("20号胶20", "NR"),
+    ("红枣", "CJ"),
+    ("不锈钢仓库", "SS"),
+    ("不锈钢厂库", "SS"),
+    ("不锈钢(厂库)", "SS"),
+    ("不锈钢(仓库)", "SS"),
+    ("纯碱", "SA"),
+    ("液化石油气", "PG"),
+    ("低硫燃料油", "LU"),
+    ("纸浆仓库", "SP"),
+    ("石油沥青厂库", "BU"),
+    ("石油沥青仓库", "BU"),
+    ("螺纹钢仓库", "RB"),
+    ("螺纹钢厂库", "RB"),
+    ("纸浆厂库", "SP"),
+    ("低硫燃料油仓库", "LU"),
+    ("低硫燃料油厂库", "LU"),
+    ("低硫燃料油(仓库)", "LU"),
+    ("低硫燃料油(厂库)", "LU"),
+    ("短纤", "PF"),
+    ("涤纶短纤", "PF"),
+    ("生猪", "LH"),
+    ("花生", "PK"),
+    ("工业硅", "SI"),
+    ("氧化铝", "AO"),
+    ("丁二烯橡胶", "BR"),
+    ("碳酸锂", "LC"),
+    ("氧化铝仓库", "AO"),
+    ("氧化铝厂库", "AO"),
+    ("氧化铝(仓库)", "AO"),
+    ("氧化铝(厂库)", "AO"),
+    ("烧碱", "SH"),
+    ("丁二烯橡胶仓库", "BR"),
+    ("丁二烯橡胶厂库", "BR"),
+    ("丁二烯橡胶(仓库)", "BR"),
+    ("丁二烯橡胶(厂库)", "BR"),
+    ("PX", "PX"),
+    ("原木", "LG"),
+    ("瓶片期货", "PR"),
+    ("瓶片", "PR"),
+    ("纯苯", "BZ"),
+    ("多晶硅", "PS"),
+    ("铸造铝合金", "AD"),
+    ("铜(BC)", "BC"),
+    ("胶版印刷纸(仓库)", "OP"),
+    ("胶版印刷纸(厂库)", "OP"),
+    ("丙烯期货", "PL"),
+    ("丙烯", "PL"),
+)
+
+# 中文名称 -> 品种代码; 同一名称以第一次出现的为准
+CHINESE_ENGLISH_MAP = MappingProxyType(
+    {chinese: english for chinese, english in reversed(_CHINESE_ENGLISH_PAIRS)}
+)
+
+# 品种代码 -> 交易所; 同一品种以第一个交易所为准
+VARIETY_MARKET_MAP = MappingProxyType(
+    {
+        var_item: market_item
+        for market_item, contract_items in reversed(
+            list(cons.market_exchange_symbols.items())
+        )
+        for var_item in contract_items
+    }
+)
+
+_CHINESE_PATTERN = re.compile(r"[\u4e00-\u9fa5]")
+_DIGIT_PATTERN = re.compile(r"\d")
+
 
+@lru_cache(maxsize=4096)
 def symbol_varieties(contract_code: str):
     """
     查找到具体合约代码, 返回大写字母的品种名称
     :param contract_code: ru1801
     :return: RU
     """
-    symbol_detail = "".join(re.findall(r"\D", contract_code)).upper().strip()
+    symbol_detail = _DIGIT_PATTERN.sub("", contract_code).upper().strip()
     if symbol_detail == "PTA":
         symbol_detail = "TA"
     return symbol_detail
 
 
+def symbol_varieties_series(contract_code: pd.Series) -> pd.Series:
+    """
+    整列合约代码的品种名称
+    :param contract_code: 合约代码, 如 ["ru1801", "TA801"]
+    :type contract_code: pandas.Series
+    :return: 大写字母的品种名称, 如 ["RU", "TA"]
+    :rtype: pandas.Series
+    """
+    symbol_detail = (
+        contract_code.str.replace(r"\d", "", regex=True).str.upper().str.strip()
+    )
+    return symbol_detail.mask(symbol_detail == "PTA", "TA")
+
+
 def symbol_market(symbol_detail: str = "SC"):
     """
     映射出市场代码
     :param symbol_detail:
     :return:
     """
-    var_item = symbol_varieties(symbol_detail)
-    for market_item, contract_items in cons.market_exchange_symbols.items():
-        if var_item in contract_items:
-            return market_item
+    return VARIETY_MARKET_MAP.get(symbol_varieties(symbol_detail))
+
+
+def symbol_market_series(contract_code: pd.Series) -> pd.Series:
+    """
+    整列合约代码或品种的市场代码
+    :param contract_code: 合约代码或品种, 如 ["rb1801", "IF"]
+    :type contract_code: pandas.Series
+    :return: 市场代码, 如 ["shfe", "cffex"]; 未知品种为 NaN
+    :rtype: pandas.Series
+    """
+    return symbol_varieties_series(contract_code).map(VARIETY_MARKET_MAP)
 
 
 def find_chinese(chinese_string: str):
@@ -40,9 +234,7 @@ def find_chinese(chinese_string: str):
     :param chinese_string: 中文字符串
     :return:
     """
-    p = re.compile(r"[\u4e00-\u9fa5]")
-    res = re.findall(p, chinese_string)
-    return "".join(res)
+    return "".join(_CHINESE_PATTERN.findall(chinese_string))
 
 
 def chinese_to_english(chinese_var: str):
@@ -51,298 +243,21 @@ def chinese_to_english(chinese_var: str):
     :param chinese_var: 期货品种中文名称
     :return: 对应的英文缩写
     """
-    chinese_list = [
-        "橡胶",
-        "天然橡胶",
-        "石油沥青",
-        "石油沥青(仓库)",
-        "石油沥青(厂库)",
-        "沥青",
-        "沥青仓库",
-        "沥青(仓库)",
-        "沥青厂库",
-        "沥青(厂库)",
-        "热轧卷板",
-        "热轧卷板厂库",
-        "热轧卷板仓库",
-        "热轧卷板(厂库)",
-        "热轧卷板(仓库)",
-        "热轧板卷",
-        "燃料油",
-        "白银",
-        "线材",
-        "螺纹钢",
-        "螺纹钢(仓库)",
-        "螺纹钢(厂库)",
-        "铅",
-        "铜",
-        "铝",
-        "锌",
-        "黄金",
-        "钯金",
-        "锡",
-        "镍",
-        "纸浆",
-        "纸浆(仓库)",
-        "纸浆(厂库)",
-        "豆一",
-        "大豆",
-        "豆二",
-        "胶合板",
-        "玉米",
-        "玉米淀粉",
-        "聚乙烯",
-        "LLDPE",
-        "LDPE",
-        "豆粕",
-        "豆油",
-        "大豆油",
-        "棕榈油",
-        "纤维板",
-        "鸡蛋",
-        "聚氯乙烯",
-        "PVC",
-        "聚丙烯",
-        "PP",
-        "焦炭",
-        "焦煤",
-        "铁矿石",
-        "乙二醇",
-        "强麦",
-        "强筋小麦",
-        " 强筋小麦",
-        "硬冬白麦",
-        "普麦",
-        "硬白小麦",
-        "硬白小麦（）",
-        "皮棉",
-        "棉花",
-        "一号棉",
-        "白糖",
-        "PTA",
-        "菜籽油",
-        "菜油",
-        "早籼稻",
-        "早籼",
-        "甲醇",
-        "柴油",
-        "玻璃",
-        "油菜籽",
-        "菜籽",
-        "菜籽粕",
-        "菜粕",
-        "动力煤",
-        "粳稻",
-        "晚籼稻",
-        "晚籼",
-        "硅铁",
-        "锰硅",
-        "硬麦",
-        "棉纱",
-        "苹果",
-        "原油",
-        "中质含硫原油",
-        "尿素",
-        "20号胶",
-        "苯乙烯",
-        "不锈钢",
-        "粳米",
-        "20号胶20",
-        "红枣",
-        "不锈钢仓库",
-        "不锈钢厂库",
-        "不锈钢(厂库)",
-        "不锈钢(仓库)",
-        "纯碱",
-        "液化石油气",
-        "低硫燃料油",
-        "纸浆仓库",
-        "石油沥青厂库",
-        "石油沥青仓库",
-        "螺纹钢仓库",
-        "螺纹钢厂库",
-        "纸浆厂库",
-        "低硫燃料油仓库",
-        "低硫燃料油厂库",
-        "低硫燃料油(仓库)",
-        "低硫燃料油(厂库)",
-        "短纤",
-        "涤纶短纤",
-        "生猪",
-        "花生",
-        "工业硅",
-        "氧化铝",
-        "丁二烯橡胶",
-        "碳酸锂",
-        "氧化铝仓库",
-        "氧化铝厂库",
-        "氧化铝(仓库)",
-        "氧化铝(厂库)",
-        "烧碱",
-        "丁二烯橡胶仓库",
-        "丁二烯橡胶厂库",
-        "丁二烯橡胶(仓库)",
-        "丁二烯橡胶(厂库)",
-        "PX",
-        "原木",
-        "瓶片期货",
-        "瓶片",
-        "纯苯",
-        "多晶硅",
-        "铸造铝合金",
-        "铜(BC)",
-        "胶版印刷纸(仓库)",
-        "胶版印刷纸(厂库)",
-        "丙烯期货",
-        "丙烯",
-    ]
-    english_list = [
-        "RU",
-        "RU",
-        "BU",
-        "BU",
-        "BU",
-        "BU",
-        "BU",
-        "BU",
-        "BU2",
-        "BU2",
-        "HC",
-        "HC",
-        "HC",
-        "HC",
-        "HC",
-        "HC",
-        "FU",
-        "AG",
-        "WR",
-        "RB",
-        "RB",
-        "RB",
-        "PB",
-        "CU",
-        "AL",
-        "ZN",
-        "AU",
-        "AU",
-        "SN",
-        "NI",
-        "SP",
-        "SP",
-        "SP",
-        "A",
-        "A",
-        "B",
-        "BB",
-        "C",
-        "CS",
-        "L",
-        "L",
-        "L",
-        "M",
-        "Y",
-        "Y",
-        "P",
-        "FB",
-        "JD",
-        "V",
-        "V",
-        "PP",
-        "PP",
-        "J",
-        "JM",
-        "I",
-        "EG",
-        "WH",
-        "WH",
-        "WH",
-        "PM",
-        "PM",
-        "PM",
-        "PM",
-        "CF",
-        "CF",
-        "CF",
-        "SR",
-        "TA",
-        "OI",
-        "OI",
-        "RI",
-        "ER",
-        "MA",
-        "MA",
-        "FG",
-        "RS",
-        "RS",
-        "RM",
-        "RM",
-        "ZC",
-        "JR",
-        "LR",
-        "LR",
-        "SF",
-        "SM",
-        "WT",
-        "CY",
-        "AP",
-        "SC",
-        "SC",
-        "UR",
-        "NR",
-        "EB",
-        "SS",
-        "RR",
-        "NR",
-        "CJ",
-        "SS",
-        "SS",
-        "SS",
-        "SS",
-        "SA",
-        "PG",
-        "LU",
-        "SP",
-        "BU",
-        "BU",
-        "RB",
-        "RB",
-        "SP",
-        "LU",
-        "LU",
-        "LU",
-        "LU",
-        "PF",
-        "PF",
-        "LH",
-        "PK",
-        "SI",
-        "AO",
-        "BR",
-        "LC",
-        "AO",
-        "AO",
-        "AO",
-        "AO",
-        "SH",
-        "BR",
-        "BR",
-        "BR",
-        "BR",
-        "PX",
-        "LG",
-        "PR",
-        "PR",
-        "BZ",
-        "PS",
-        "AD",
-        "BC",
-        "OP",
-        "OP",
-        "PL",
-        "PL",
-    ]
-    pos = chinese_list.index(chinese_var)
-    return english_list[pos]
+    try:
+        return CHINESE_ENGLISH_MAP[chinese_var]
+    except KeyError:
+        raise ValueError(f"{chinese_var!r} is not in list") from None
+
+
+def chinese_to_english_series(chinese_var: pd.Series) -> pd.Series:
+    """
+    整列期货品种中文名称的英文缩写
+    :param chinese_var: 期货品种中文名称
+    :type chinese_var: pandas.Series
+    :return: 对应的英文缩写; 未知名称为 NaN
+    :rtype: pandas.Series
+    """
+    return chinese_var.map(CHINESE_ENGLISH_MAP)
 
 
 if __name__ == "__main__":
@@ -16,7 +16,8 @@ from akshare.futures.cons import (
     zh_match_main_contract_url,
     zh_match_main_contract_payload,
 )
-from akshare.utils import demjson
+from akshare.utils.js_literal import loads_js_literal
+from akshare.utils.func import PageAccumulator
 
 
 def zh_subscribe_exchange_symbol(symbol: str = "dce") -> pd.DataFrame:
@@ -31,7 +32,7 @@ def zh_subscribe_exchange_symbol(symbol: str = "dce") -> pd.DataFrame:
     r = requests.get(zh_subscribe_exchange_symbol_url)
     r.encoding = "gb2312"
     data_text = r.text
-    data_json = demjson.decode(
+    data_json = loads_js_literal(
         data_text[data_text.find("{") : data_text.find("};") + 1]
     )
     if symbol == "czce":
@@ -67,7 +68,7 @@ def match_main_contract(symbol: str = "shfe") -> pd.DataFrame:
         res = requests.get(
             zh_match_main_contract_url, params=zh_match_main_contract_payload
         )
-        data_json = demjson.decode(res.text)
+        data_json = loads_js_literal(res.text)
         data_df = pd.DataFrame(data_json)
         try:
             main_contract = data_df[
@@ -93,9 +94,10 @@ def futures_display_main_sina() -> pd.DataFrame:
     :return: 新浪主力连续合约品种一览表
     :rtype: pandas.DataFrame
     """
-    temp_df = pd.DataFrame()
+    pages = PageAccumulator()
     for item in ["dce", "czce", "shfe", "cffex", "gfex"]:
-        temp_df = pd.concat([temp_df, match_main_contract(symbol=item)])
+        pages.append(match_main_contract(symbol=item))
+    temp_df = pages.to_frame()
     temp_df.reset_index(inplace=True, drop=True)
     return temp_df
 
@@ -9,6 +9,8 @@ https://gushitong.baidu.com/top/foreign-common-%E5%B8%B8%E7%94%A8
 import pandas as pd
 from curl_cffi import requests
 
+from akshare.utils.func import PageAccumulator
+
 
 def fx_quote_baidu(symbol: str = "人民币") -> pd.DataFrame:
     """
@@ -24,7 +26,7 @@ def fx_quote_baidu(symbol: str = "人民币") -> pd.DataFrame:
         "美元": "dollar",
     }
     num = 0
-    out_df = pd.DataFrame()
+    pages = PageAccumulator()
     while True:
         try:
             url = "https://finance.pae.baidu.com/api/getforeignrank"
@@ -54,10 +56,11 @@ def fx_quote_baidu(symbol: str = "人民币") -> pd.DataFrame:
             big_df["最新价"] = pd.to_numeric(big_df["最新价"])
             big_df["涨跌额"] = pd.to_numeric(big_df["涨跌额"])
             big_df["涨跌幅"] = pd.to_numeric(big_df["涨跌幅"].str.strip("%")) / 100
-            out_df = pd.concat(objs=[out_df, big_df], ignore_index=True)
+            pages.append(big_df)
             num = num + 20
         except:  # noqa: E722
             break
+    out_df = pages.to_frame(ignore_index=True)
     return out_df
 
 
@@ -14,7 +14,8 @@ import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 
-from akshare.utils import demjson
+from akshare.utils.js_literal import loads_js_literal
+from akshare.utils.func import PageAccumulator
 
 
 def index_stock_cons_sina(symbol: str = "000300") -> pd.DataFrame:
@@ -35,7 +36,7 @@ def index_stock_cons_sina(symbol: str = "000300") -> pd.DataFrame:
         params = {"node": f"{symbol}"}
         r = requests.get(url, params=params)
         page_num = math.ceil(int(r.json()) / 80) + 1
-        temp_df = pd.DataFrame()
+        pages = PageAccumulator()
         for page in range(1, page_num):
             url = "https://vip.stock.finance.sina.com.cn/quotes_service/api/json_v2.php/Market_Center.getHQNodeData"
             params = {
@@ -48,9 +49,8 @@ def index_stock_cons_sina(symbol: str = "000300") -> pd.DataFrame:
                 "_s_r_a": "init",
             }
             r = requests.get(url, params=params)
-            temp_df = pd.concat(
-                objs=[temp_df, pd.DataFrame(demjson.decode(r.text))], ignore_index=True
-            )
+            pages.append(pd.DataFrame(loads_js_literal(r.text)))
+        temp_df = pages.to_frame(ignore_index=True)
         return temp_df
 
     url = "https://vip.stock.finance.sina.com.cn/quotes_service/api/json_v2.php/Market_Center.getHQNodeDataSimple"
@@ -63,7 +63,7 @@ def index_stock_cons_sina(symbol: str = "000300") -> pd.DataFrame:
         "_s_r_a": "setlen",
     }
     r = requests.get(url, params=params)
-    temp = pd.DataFrame(demjson.decode(r.text))
+    temp = pd.DataFrame(loads_js_literal(r.text))
     return temp
 
 
@@ -109,15 +109,13 @@ def index_stock_cons(symbol: str = "399639") -> pd.DataFrame:
         temp_df["品种代码"] = temp_df["品种代码"].astype(str).str.zfill(6)
         return temp_df
 
-    temp_df = pd.DataFrame()
+    pages = PageAccumulator()
     for page in range(1, int(page_num) + 1):
         url = f"https://vip.stock.finance.sina.com.cn/corp/view/vII_NewestComponent.php?page={page}&indexid={symbol}"
         r = requests.get(url)
         r.encoding = "gb2312"
-        temp_df = pd.concat(
-            objs=[temp_df, pd.read_html(StringIO(r.text), header=1)[3]],
-            ignore_index=True,
-        )
+        pages.append(pd.read_html(StringIO(r.text), header=1)[3])
+    temp_df = pages.to_frame(ignore_index=True)
     temp_df = temp_df.iloc[:, :3]
     temp_df["品种代码"] = temp_df["品种代码"].astype(str).str.zfill(6)
     return temp_df
@@ -11,7 +11,7 @@ import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 
-from akshare.utils import demjson
+from akshare.utils.js_literal import loads_js_literal
 
 
 def drewry_wci_index(symbol: str = "composite") -> pd.DataFrame:
@@ -38,7 +38,7 @@ def drewry_wci_index(symbol: str = "composite") -> pd.DataFrame:
     r = requests.get(url)
     soup = BeautifulSoup(r.text, features="lxml")
     data_text = soup.find_all("script")[-4].string.strip("window.infographicData=")[:-1]
-    data_json = demjson.decode(data_text)
+    data_json = loads_js_literal(data_text)
     data_json_need = data_json["elements"]["content"]["content"]["entities"][
         "7a55585f-3fb3-44e6-9b54-beea1cd20b4d"
     ]["data"][symbol_map[symbol]]
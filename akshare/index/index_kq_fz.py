@@ -10,6 +10,8 @@ import pandas as pd
 import requests
 from tqdm import tqdm
 
+from akshare.utils.func import PageAccumulator
+
 
 def index_kq_fz(symbol: str = "价格指数") -> pd.DataFrame:
     """
@@ -36,7 +38,7 @@ def index_kq_fz(symbol: str = "价格指数") -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     page_num = data_json["page"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     for page in tqdm(range(1, page_num + 1), leave=False):
         params = {
             "category": "0",
@@ -48,7 +50,8 @@ def index_kq_fz(symbol: str = "价格指数") -> pd.DataFrame:
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     if symbol == "价格指数":
         big_df.columns = [
             "期次",
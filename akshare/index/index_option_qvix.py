@@ -1,18 +1,82 @@
 # -*- coding:utf-8 -*-
 # !/usr/bin/env python
 """
-Date: 2026/3/22 21:00
+Date: 2026/10/18 02:30
 Desc: 50 ETF 期权波动率指数 QVIX
 300 ETF 期权波动率指数 QVIX
 http://1.optbbs.com/s/vix.shtml?50ETF
 http://1.optbbs.com/s/vix.shtml?300ETF
+所有日频 QVIX 都来自同一个 k.csv 文件, 原始数据按地址缓存 ttl 秒, 同时刷新多个指数时只下载一次
 """
 
+import threading
+import time
+
 import pandas as pd
-from functools import lru_cache
+
+# 日频 QVIX 在 k.csv 中的列位置: 日期, 开盘, 最高, 最低, 收盘
+_QVIX_DAILY_COLUMNS = {
+    "50etf": [0, 1, 2, 3, 4],
+    "300etf": [0, 9, 10, 11, 12],
+    "500etf": [0, 67, 68, 69, 70],
+    "cyb": [0, 71, 72, 73, 74],
+    "kcb": [0, 83, 84, 85, 86],
+    "100etf": [0, 75, 76, 77, 78],
+    "300index": [0, 17, 18, 19, 20],
+    "1000index": [0, 25, 26, 27, 28],
+    "50index": [0, 79, 80, 81, 82],
+}
+
+_QVIX_MIN_URL = {
+    "50etf": "http://1.optbbs.com/d/csv/d/vix50.csv",
+    "300etf": "http://1.optbbs.com/d/csv/d/vix300.csv",
+    "500etf": "http://1.optbbs.com/d/csv/d/vix500.csv",
+    "cyb": "http://1.optbbs.com/d/csv/d/vixcyb.csv",
+    "kcb": "http://1.optbbs.com/d/csv/d/vixkcb.csv",
+    "100etf": "http://1.optbbs.com/d/csv/d/vix100.csv",
+    "300index": "http://1.optbbs.com/d/csv/d/vixindex.csv",
+    "1000index": "http://1.optbbs.com/d/csv/d/vixindex1000.csv",
+    "50index": "http://1.optbbs.com/d/csv/d/vix50index.csv",
+}
+
+_optbbs_ttl = 60
+_optbbs_cache = {}
+_optbbs_locks = {}
+_optbbs_lock = threading.Lock()
+
+
+def set_qvix_cache_ttl(ttl: float = 60) -> None:
+    """
+    设置 QVIX 原始数据的缓存时间
+    :param ttl: 缓存时间（秒）; 0 表示每次都重新下载
+    :type ttl: float
+    """
+    global _optbbs_ttl
+    with _optbbs_lock:
+        _optbbs_ttl = ttl
+        _optbbs_cache.clear()
+
+
+def _read_optbbs_csv(url: str, **kwargs) -> pd.DataFrame:
+    """
+    读取原始数据, 同一地址在 ttl 秒内只下载一次; 并发请求同一地址时只有一个线程下载
+    :param url: 数据地址
+    :type url: str
+    :return: 原始数据的副本
+    :rtype: pandas.DataFrame
+    """
+    with _optbbs_lock:
+        url_lock = _optbbs_locks.setdefault(url, threading.Lock())
+    with url_lock:
+        cached = _optbbs_cache.get(url)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1].copy()
+        temp_df = pd.read_csv(url, **kwargs)
+        if _optbbs_ttl > 0:
+            _optbbs_cache[url] = (time.monotonic() + _optbbs_ttl, temp_df)
+    return temp_df.copy()
 
 
-@lru_cache
 def __get_optbbs_daily() -> pd.DataFrame:
     """
     读取原始数据
@@ -21,18 +85,21 @@ def __get_optbbs_daily() -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     url = "http://1.optbbs.com/d/csv/d/k.csv"
-    temp_df = pd.read_csv(url, encoding="gbk")
+    temp_df = _read_optbbs_csv(url, encoding="gbk")
     return temp_df
 
 
-def index_option_50etf_qvix() -> pd.DataFrame:
+def _format_qvix_daily(raw_df: pd.DataFrame, symbol: str) -> pd.DataFrame:
     """
-    50ETF 期权波动率指数 QVIX
-    http://1.optbbs.com/s/vix.shtml?50ETF
-    :return: 50ETF 期权波动率指数 QVIX
+    从原始数据中取出指定指数的日频 QVIX
+    :param raw_df: k.csv 原始数据
+    :type raw_df: pandas.DataFrame
+    :param symbol: 指数, _QVIX_DAILY_COLUMNS 中的键
+    :type symbol: str
+    :return: 日频 QVIX
     :rtype: pandas.DataFrame
     """
-    temp_df = __get_optbbs_daily().iloc[:, :5]
+    temp_df = raw_df.iloc[:, _QVIX_DAILY_COLUMNS[symbol]].copy()
     temp_df.columns = [
         "date",
         "open",
@@ -48,23 +115,71 @@ def index_option_50etf_qvix() -> pd.DataFrame:
     return temp_df
 
 
-def index_option_50etf_min_qvix() -> pd.DataFrame:
+def _qvix_daily(symbol: str) -> pd.DataFrame:
     """
-    50 ETF 期权波动率指数 QVIX
-    http://1.optbbs.com/s/vix.shtml?50ETF
-    :return: 50 ETF 期权波动率指数 QVIX
+    指定指数的日频 QVIX
+    :param symbol: 指数, _QVIX_DAILY_COLUMNS 中的键
+    :type symbol: str
+    :return: 日频 QVIX
     :rtype: pandas.DataFrame
     """
-    url = "http://1.optbbs.com/d/csv/d/vix50.csv"
-    temp_df = pd.read_csv(url).iloc[:, :2]
+    return _format_qvix_daily(__get_optbbs_daily(), symbol)
+
+
+def _qvix_min(symbol: str) -> pd.DataFrame:
+    """
+    指定指数的分时 QVIX
+    :param symbol: 指数, _QVIX_MIN_URL 中的键
+    :type symbol: str
+    :return: 分时 QVIX
+    :rtype: pandas.DataFrame
+    """
+    temp_df = _read_optbbs_csv(_QVIX_MIN_URL[symbol]).iloc[:, :2]
     temp_df.columns = [
         "time",
         "qvix",
     ]
-    temp_df.loc[:, "qvix"] = pd.to_numeric(temp_df["qvix"], errors="coerce")
+    temp_df["qvix"] = pd.to_numeric(temp_df["qvix"], errors="coerce")
     return temp_df
 
 
+def index_option_qvix_all() -> pd.DataFrame:
+    """
+    全部期权波动率指数 QVIX-日频
+    http://1.optbbs.com/s/vix.shtml?50ETF
+    :return: 全部日频 QVIX, 列为 symbol, date, open, high, low, close; symbol 为 {"50etf", "300etf", "500etf", "cyb", "kcb", "100etf", "300index", "1000index", "50index"}
+    :rtype: pandas.DataFrame
+    """
+    raw_df = __get_optbbs_daily()
+    frames = []
+    for symbol in _QVIX_DAILY_COLUMNS:
+        temp_df = _format_qvix_daily(raw_df, symbol)
+        temp_df.insert(0, "symbol", symbol)
+        frames.append(temp_df)
+    big_df = pd.concat(frames, ignore_index=True)
+    return big_df
+
+
+def index_option_50etf_qvix() -> pd.DataFrame:
+    """
+    50ETF 期权波动率指数 QVIX
+    http://1.optbbs.com/s/vix.shtml?50ETF
+    :return: 50ETF 期权波动率指数 QVIX
+    :rtype: pandas.DataFrame
+    """
+    return _qvix_daily("50etf")
+
+
+def index_option_50etf_min_qvix() -> pd.DataFrame:
+    """
+    50 ETF 期权波动率指数 QVIX
+    http://1.optbbs.com/s/vix.shtml?50ETF
+    :return: 50 ETF 期权波动率指数 QVIX
+    :rtype: pandas.DataFrame
+    """
+    return _qvix_min("50etf")
+
+
 def index_option_300etf_qvix() -> pd.DataFrame:
     """
     300 ETF 期权波动率指数 QVIX
@@ -72,20 +187,7 @@ def index_option_300etf_qvix() -> pd.DataFrame:
     :return: 300 ETF 期权波动率指数 QVIX
     :rtype: pandas.DataFrame
     """
-    temp_df = __get_optbbs_daily().iloc[:, [0, 9, 10, 11, 12]]
-    temp_df.columns = [
-        "date",
-        "open",
-        "high",
-        "low",
-        "close",
-    ]
-    temp_df["date"] = pd.to_datetime(temp_df["date"], errors="coerce").dt.date
-    temp_df["open"] = pd.to_numeric(temp_df["open"], errors="coerce")
-    temp_df["high"] = pd.to_numeric(temp_df["high"], errors="coerce")
-    temp_df["low"] = pd.to_numeric(temp_df["low"], errors="coerce")
-    temp_df["close"] = pd.to_numeric(temp_df["close"], errors="coerce")
-    return temp_df
+    return _qvix_daily("300etf")
 
 
 def index_option_300etf_min_qvix() -> pd.DataFrame:
@@ -95,14 +197,7 @@ def index_option_300etf_min_qvix() -> pd.DataFrame:
     :return: 300 ETF 期权波动率指数 QVIX-分时
     :rtype: pandas.DataFrame
     """
-    url = "http://1.optbbs.com/d/csv/d/vix300.csv"
-    temp_df = pd.read_csv(url).iloc[:, :2]
-    temp_df.columns = [
-        "time",
-        "qvix",
-    ]
-    temp_df.loc[:, "qvix"] = pd.to_numeric(temp_df["qvix"], errors="coerce")
-    return temp_df
+    return _qvix_min("300etf")
 
 
 def index_option_500etf_qvix() -> pd.DataFrame:
@@ -112,20 +207,7 @@ def index_option_500etf_qvix() -> pd.DataFrame:
     :return: 500 ETF 期权波动率指数 QVIX
     :rtype: pandas.DataFrame
     """
-    temp_df = __get_optbbs_daily().iloc[:, [0, 67, 68, 69, 70]]
-    temp_df.columns = [
-        "date",
-        "open",
-        "high",
-        "low",
-        "close",
-    ]
-    temp_df["date"] = pd.to_datetime(temp_df["date"], errors="coerce").dt.date
-    temp_df["open"] = pd.to_numeric(temp_df["open"], errors="coerce")
-    temp_df["high"] = pd.to_numeric(temp_df["high"], errors="coerce")
-    temp_df["low"] = pd.to_numeric(temp_df["low"], errors="coerce")
-    temp_df["close"] = pd.to_numeric(temp_df["close"], errors="coerce")
-    return temp_df
+    return _qvix_daily("500etf")
 
 
 def index_option_500etf_min_qvix() -> pd.DataFrame:
@@ -135,14 +217,7 @@ def index_option_500etf_min_qvix() -> pd.DataFrame:
     :return: 500 ETF 期权波动率指数 QVIX-分时
     :rtype: pandas.DataFrame
     """
-    url = "http://1.optbbs.com/d/csv/d/vix500.csv"
-    temp_df = pd.read_csv(url).iloc[:, :2]
-    temp_df.columns = [
-        "time",
-        "qvix",
-    ]
-    temp_df.loc[:, "qvix"] = pd.to_numeric(temp_df["qvix"], errors="coerce")
-    return temp_df
+    return _qvix_min("500etf")
 
 
 def index_option_cyb_qvix() -> pd.DataFrame:
@@ -152,20 +227,7 @@ def index_option_cyb_qvix() -> pd.DataFrame:
     :return: 创业板 期权波动率指数 QVIX
     :rtype: pandas.DataFrame
     """
-    temp_df = __get_optbbs_daily().iloc[:, [0, 71, 72, 73, 74]]
-    temp_df.columns = [
-        "date",
-        "open",
-        "high",
-        "low",
-        "close",
-    ]
-    temp_df["date"] = pd.to_datetime(temp_df["date"], errors="coerce").dt.date
-    temp_df["open"] = pd.to_numeric(temp_df["open"], errors="coerce")
-    temp_df["high"] = pd.to_numeric(temp_df["high"], errors="coerce")
-    temp_df["low"] = pd.to_numeric(temp_df["low"], errors="coerce")
-    temp_df["close"] = pd.to_numeric(temp_df["close"], errors="coerce")
-    return temp_df
+    return _qvix_daily("cyb")
 
 
 def index_option_cyb_min_qvix() -> pd.DataFrame:
@@ -175,14 +237,7 @@ def index_option_cyb_min_qvix() -> pd.DataFrame:
     :return: 创业板 期权波动率指数 QVIX-分时
     :rtype: pandas.DataFrame
     """
-    url = "http://1.optbbs.com/d/csv/d/vixcyb.csv"
-    temp_df = pd.read_csv(url).iloc[:, :2]
-    temp_df.columns = [
-        "time",
-        "qvix",
-    ]
-    temp_df.loc[:, "qvix"] = pd.to_numeric(temp_df["qvix"], errors="coerce")
-    return temp_df
+    return _qvix_min("cyb")
 
 
 def index_option_kcb_qvix() -> pd.DataFrame:
@@ -192,20 +247,7 @@ def index_option_kcb_qvix() -> pd.DataFrame:
     :return: 科创板 期权波动率指数 QVIX
     :rtype: pandas.DataFrame
     """
-    temp_df = __get_optbbs_daily().iloc[:, [0, 83, 84, 85, 86]]
-    temp_df.columns = [
-        "date",
-        "open",
-        "high",
-        "low",
-        "close",
-    ]
-    temp_df["date"] = pd.to_datetime(temp_df["date"], errors="coerce").dt.date
-    temp_df["open"] = pd.to_numeric(temp_df["open"], errors="coerce")
-    temp_df["high"] = pd.to_numeric(temp_df["high"], errors="coerce")
-    temp_df["low"] = pd.to_numeric(temp_df["low"], errors="coerce")
-    temp_df["close"] = pd.to_numeric(temp_df["close"], errors="coerce")
-    return temp_df
+    return _qvix_daily("kcb")
 
 
 def index_option_kcb_min_qvix() -> pd.DataFrame:
@@ -215,14 +257,7 @@ def index_option_kcb_min_qvix() -> pd.DataFrame:
     :return: 科创板 期权波动率指数 QVIX-分时
     :rtype: pandas.DataFrame
     """
-    url = "http://1.optbbs.com/d/csv/d/vixkcb.csv"
-    temp_df = pd.read_csv(url).iloc[:, :2]
-    temp_df.columns = [
-        "time",
-        "qvix",
-    ]
-    temp_df.loc[:, "qvix"] = pd.to_numeric(temp_df["qvix"], errors="coerce")
-    return temp_df
+    return _qvix_min("kcb")
 
 
 def index_option_100etf_qvix() -> pd.DataFrame:
@@ -232,20 +267,7 @@ def index_option_100etf_qvix() -> pd.DataFrame:
     :return: 深证100ETF 期权波动率指数 QVIX
     :rtype: pandas.DataFrame
     """
-    temp_df = __get_optbbs_daily().iloc[:, [0, 75, 76, 77, 78]]
-    temp_df.columns = [
-        "date",
-        "open",
-        "high",
-        "low",
-        "close",
-    ]
-    temp_df["date"] = pd.to_datetime(temp_df["date"], errors="coerce").dt.date
-    temp_df["open"] = pd.to_numeric(temp_df["open"], errors="coerce")
-    temp_df["high"] = pd.to_numeric(temp_df["high"], errors="coerce")
-    temp_df["low"] = pd.to_numeric(temp_df["low"], errors="coerce")
-    temp_df["close"] = pd.to_numeric(temp_df["close"], errors="coerce")
-    return temp_df
+    return _qvix_daily("100etf")
 
 
 def index_option_100etf_min_qvix() -> pd.DataFrame:
@@ -255,14 +277,7 @@ def index_option_100etf_min_qvix() -> pd.DataFrame:
     :return: 深证100ETF 期权波动率指数 QVIX-分时
     :rtype: pandas.DataFrame
     """
-    url = "http://1.optbbs.com/d/csv/d/vix100.csv"
-    temp_df = pd.read_csv(url).iloc[:, :2]
-    temp_df.columns = [
-        "time",
-        "qvix",
-    ]
-    temp_df.loc[:, "qvix"] = pd.to_numeric(temp_df["qvix"], errors="coerce")
-    return temp_df
+    return _qvix_min("100etf")
 
 
 def index_option_300index_qvix() -> pd.DataFrame:
@@ -272,20 +287,7 @@ def index_option_300index_qvix() -> pd.DataFrame:
     :return: 中证300股指 期权波动率指数 QVIX
     :rtype: pandas.DataFrame
     """
-    temp_df = __get_optbbs_daily().iloc[:, [0, 17, 18, 19, 20]]
-    temp_df.columns = [
-        "date",
-        "open",
-        "high",
-        "low",
-        "close",
-    ]
-    temp_df["date"] = pd.to_datetime(temp_df["date"], errors="coerce").dt.date
-    temp_df["open"] = pd.to_numeric(temp_df["open"], errors="coerce")
-    temp_df["high"] = pd.to_numeric(temp_df["high"], errors="coerce")
-    temp_df["low"] = pd.to_numeric(temp_df["low"], errors="coerce")
-    temp_df["close"] = pd.to_numeric(temp_df["close"], errors="coerce")
-    return temp_df
+    return _qvix_daily("300index")
 
 
 def index_option_300index_min_qvix() -> pd.DataFrame:
@@ -295,14 +297,7 @@ def index_option_300index_min_qvix() -> pd.DataFrame:
     :return: 中证300股指 期权波动率指数 QVIX-分时
     :rtype: pandas.DataFrame
     """
-    url = "http://1.optbbs.com/d/csv/d/vixindex.csv"
-    temp_df = pd.read_csv(url).iloc[:, :2]
-    temp_df.columns = [
-        "time",
-        "qvix",
-    ]
-    temp_df["qvix"] = pd.to_numeric(temp_df["qvix"], errors="coerce")
-    return temp_df
+    return _qvix_min("300index")
 
 
 def index_option_1000index_qvix() -> pd.DataFrame:
@@ -312,20 +307,7 @@ def index_option_1000index_qvix() -> pd.DataFrame:
     :return: 中证1000股指 期权波动率指数 QVIX
     :rtype: pandas.DataFrame
     """
-    temp_df = __get_optbbs_daily().iloc[:, [0, 25, 26, 27, 28]]
-    temp_df.columns = [
-        "date",
-        "open",
-        "high",
-        "low",
-        "close",
-    ]
-    temp_df["date"] = pd.to_datetime(temp_df["date"], errors="coerce").dt.date
-    temp_df["open"] = pd.to_numeric(temp_df["open"], errors="coerce")
-    temp_df["high"] = pd.to_numeric(temp_df["high"], errors="coerce")
-    temp_df["low"] = pd.to_numeric(temp_df["low"], errors="coerce")
-    temp_df["close"] = pd.to_numeric(temp_df["close"], errors="coerce")
-    return temp_df
+    return _qvix_daily("1000index")
 
 
 def index_option_1000index_min_qvix() -> pd.DataFrame:
@@ -335,14 +317,7 @@ def index_option_1000index_min_qvix() -> pd.DataFrame:
     :return: 中证1000股指 期权波动率指数 QVIX-分时
     :rtype: pandas.DataFrame
     """
-    url = "http://1.optbbs.com/d/csv/d/vixindex1000.csv"
-    temp_df = pd.read_csv(url).iloc[:, :2]
-    temp_df.columns = [
-        "time",
-        "qvix",
-    ]
-    temp_df["qvix"] = pd.to_numeric(temp_df["qvix"], errors="coerce")
-    return temp_df
+    return _qvix_min("1000index")
 
 
 def index_option_50index_qvix() -> pd.DataFrame:
@@ -352,20 +327,7 @@ def index_option_50index_qvix() -> pd.DataFrame:
     :return: 上证50股指 期权波动率指数 QVIX
     :rtype: pandas.DataFrame
     """
-    temp_df = __get_optbbs_daily().iloc[:, [0, 79, 80, 81, 82]]
-    temp_df.columns = [
-        "date",
-        "open",
-        "high",
-        "low",
-        "close",
-    ]
-    temp_df["date"] = pd.to_datetime(temp_df["date"], errors="coerce").dt.date
-    temp_df["open"] = pd.to_numeric(temp_df["open"], errors="coerce")
-    temp_df["high"] = pd.to_numeric(temp_df["high"], errors="coerce")
-    temp_df["low"] = pd.to_numeric(temp_df["low"], errors="coerce")
-    temp_df["close"] = pd.to_numeric(temp_df["close"], errors="coerce")
-    return temp_df
+    return _qvix_daily("50index")
 
 
 def index_option_50index_min_qvix() -> pd.DataFrame:
@@ -375,17 +337,13 @@ def index_option_50index_min_qvix() -> pd.DataFrame:
     :return: 上证50股指 期权波动率指数 QVIX-分时
     :rtype: pandas.DataFrame
     """
-    url = "http://1.optbbs.com/d/csv/d/vix50index.csv"
-    temp_df = pd.read_csv(url).iloc[:, :2]
-    temp_df.columns = [
-        "time",
-        "qvix",
-    ]
-    temp_df["qvix"] = pd.to_numeric(temp_df["qvix"], errors="coerce")
-    return temp_df
+    return _qvix_min("50index")
 
 
 if __name__ == "__main__":
+    index_option_qvix_all_df = index_option_qvix_all()
+    print(index_option_qvix_all_df)
+
     index_option_50etf_qvix_df = index_option_50etf_qvix()
     print(index_option_50etf_qvix_df)
 
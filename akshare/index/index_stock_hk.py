@@ -12,12 +12,11 @@ import re
 
 import pandas as pd
 import requests
-import py_mini_racer
 
 from functools import lru_cache
 
-from akshare.stock.cons import hk_js_decode
 from akshare.utils.func import fetch_paginated_data
+from akshare.utils.sina_decode import sina_js_decode
 
 
 def _replace_comma(x) -> str:
@@ -130,10 +129,8 @@ def stock_hk_index_daily_sina(symbol: str = "CES100") -> pd.DataFrame:
     url = f"https://finance.sina.com.cn/stock/hkstock/{symbol}/klc2_kl.js"
     params = {"d": "2023_5_01"}
     res = requests.get(url, params=params)
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(hk_js_decode)
-    dict_list = js_code.call(
-        "d", res.text.split("=")[1].split(";")[0].replace('"', "")
+    dict_list = sina_js_decode(
+        res.text.split("=")[1].split(";")[0].replace('"', "")
     )  # 执行js解密代码
     temp_df = pd.DataFrame(dict_list)
     temp_df["date"] = pd.to_datetime(temp_df["date"], errors="coerce").dt.date
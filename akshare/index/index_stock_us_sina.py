@@ -8,11 +8,8 @@ https://stock.finance.sina.com.cn/usstock/quotes/.IXIC.html
 
 import pandas as pd
 import requests
-import py_mini_racer
 
-from akshare.stock.cons import (
-    zh_js_decode,
-)
+from akshare.utils.sina_decode import sina_js_decode
 
 
 def index_us_stock_sina(symbol: str = ".INX") -> pd.DataFrame:
@@ -26,9 +23,7 @@ def index_us_stock_sina(symbol: str = ".INX") -> pd.DataFrame:
     """
     url = f"https://finance.sina.com.cn/staticdata/us/{symbol}"
     r = requests.get(url)
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(zh_js_decode)
-    dict_list = js_code.call("d", r.text.split("=")[1].split(";")[0].replace('"', ""))
+    dict_list = sina_js_decode(r.text.split("=")[1].split(";")[0].replace('"', ""))
     temp_df = pd.DataFrame(dict_list)
     temp_df["date"] = pd.to_datetime(temp_df["date"], errors="coerce").dt.date
     temp_df["open"] = pd.to_numeric(temp_df["open"], errors="coerce")
@@ -11,7 +11,6 @@ import datetime
 import re
 
 import pandas as pd
-import py_mini_racer
 import requests
 
 from akshare.index.cons import (
@@ -20,10 +19,10 @@ from akshare.index.cons import (
     zh_sina_index_stock_count_url,
     zh_sina_index_stock_hist_url,
 )
-from akshare.stock.cons import hk_js_decode
-from akshare.utils import demjson
-from akshare.utils.func import fetch_paginated_data
+from akshare.utils.js_literal import loads_js_literal
+from akshare.utils.func import fetch_paginated_data, PageAccumulator
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.sina_decode import sina_js_decode
 
 
 def _replace_comma(x):
@@ -63,15 +62,16 @@ def stock_zh_index_spot_sina() -> pd.DataFrame:
     :return: 所有指数的实时行情数据
     :rtype: pandas.DataFrame
     """
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     page_count = get_zh_index_page_count()
     zh_sina_stock_payload_copy = zh_sina_index_stock_payload.copy()
     tqdm = get_tqdm()
     for page in tqdm(range(1, page_count + 1), leave=False):
         zh_sina_stock_payload_copy.update({"page": page})
         res = requests.get(zh_sina_index_stock_url, params=zh_sina_stock_payload_copy)
-        data_json = demjson.decode(res.text)
-        big_df = pd.concat(objs=[big_df, pd.DataFrame(data_json)], ignore_index=True)
+        data_json = loads_js_literal(res.text)
+        pages.append(pd.DataFrame(data_json))
+    big_df = pages.to_frame(ignore_index=True)
     big_df = big_df.map(_replace_comma)
     big_df["trade"] = pd.to_numeric(big_df["trade"], errors="coerce")
     big_df["pricechange"] = pd.to_numeric(big_df["pricechange"], errors="coerce")
@@ -301,10 +301,8 @@ def stock_zh_index_daily(symbol: str = "sh000922") -> pd.DataFrame:
     """
     params = {"d": "2020_2_4"}
     res = requests.get(zh_sina_index_stock_hist_url.format(symbol), params=params)
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(hk_js_decode)
-    dict_list = js_code.call(
-        "d", res.text.split("=")[1].split(";")[0].replace('"', "")
+    dict_list = sina_js_decode(
+        res.text.split("=")[1].split(";")[0].replace('"', "")
     )  # 执行js解密代码
     temp_df = pd.DataFrame(dict_list)
     temp_df["date"] = pd.to_datetime(temp_df["date"], errors="coerce").dt.date
@@ -334,7 +332,7 @@ def get_tx_start_year(symbol: str = "sh000919") -> str:
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    if not demjson.decode(data_text[data_text.find("={") + 1 :])["data"]:
+    if not loads_js_literal(data_text[data_text.find("={") + 1 :])["data"]:
         url = "https://proxy.finance.qq.com/ifzqgtimg/appstock/app/newfqkline/get"
         params = {
             "_var": "kline_dayqfq",
@@ -343,11 +341,11 @@ def get_tx_start_year(symbol: str = "sh000919") -> str:
         }
         r = requests.get(url, params=params)
         data_text = r.text
-        start_date = demjson.decode(data_text[data_text.find("={") + 1 :])["data"][
+        start_date = loads_js_literal(data_text[data_text.find("={") + 1 :])["data"][
             symbol
         ]["day"][0][0]
         return start_date
-    start_date = demjson.decode(data_text[data_text.find("={") + 1 :])["data"][0][0]
+    start_date = loads_js_literal(data_text[data_text.find("={") + 1 :])["data"][0][0]
     return start_date
 
 
@@ -366,7 +364,7 @@ def stock_zh_index_daily_tx(symbol: str = "sz980017") -> pd.DataFrame:
     url = "https://proxy.finance.qq.com/ifzqgtimg/appstock/app/newfqkline/get"
     range_start = int(start_date.split("-")[0])
     range_end = datetime.date.today().year + 1
-    temp_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for year in tqdm(range(range_start, range_end), leave=False):
         params = {
@@ -378,13 +376,14 @@ def stock_zh_index_daily_tx(symbol: str = "sz980017") -> pd.DataFrame:
         text = res.text
         try:
             inner_temp_df = pd.DataFrame(
-                demjson.decode(text[text.find("={") + 1 :])["data"][symbol]["day"]
+                loads_js_literal(text[text.find("={") + 1 :])["data"][symbol]["day"]
             )
         except:  # noqa: E722
             inner_temp_df = pd.DataFrame(
-                demjson.decode(text[text.find("={") + 1 :])["data"][symbol]["qfqday"]
+                loads_js_literal(text[text.find("={") + 1 :])["data"][symbol]["qfqday"]
             )
-        temp_df = pd.concat(objs=[temp_df, inner_temp_df], ignore_index=True)
+        pages.append(inner_temp_df)
+    temp_df = pages.to_frame(ignore_index=True)
     if temp_df.shape[1] == 6:
         temp_df.columns = ["date", "open", "close", "high", "low", "amount"]
     else:
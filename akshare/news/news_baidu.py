@@ -12,6 +12,8 @@ import re
 import pandas as pd
 from curl_cffi import requests
 
+from akshare.utils.func import PageAccumulator
+
 
 def _get_baidu_cookie(headers: dict) -> str:
     """
@@ -127,7 +129,7 @@ def _baidu_finance_calendar(
     headers["cookie"] = cookie
 
     url = "https://finance.pae.baidu.com/sapi/v1/financecalendar"
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
 
     # 获取指定日期的总记录数
     target_date = formatted_date
@@ -168,7 +170,8 @@ def _baidu_finance_calendar(
             for item in data_json["Result"]["calendarInfo"]:
                 if item.get("date") == target_date and item.get("list"):
                     processed_df = process_func(item["list"])
-                    big_df = pd.concat([big_df, processed_df], ignore_index=True)
+                    pages.append(processed_df)
+    big_df = pages.to_frame(ignore_index=True)
 
     return big_df
 
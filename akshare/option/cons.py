@@ -6,10 +6,11 @@ Desc: 期权配置文件
 """
 
 import datetime
-import json
 import os
 import re
 
+from akshare.utils.trade_calendar import get_trade_calendar
+
 # 中国金融期货交易所
 
 CFFEX_OPTION_URL_300 = "http://www.cffex.com.cn/quote_IO.txt"
@@ -96,11 +97,10 @@ def get_json_path(name, module_file):
 def get_calendar():
     """
     获取交易日历至 2019 年结束, 这里的交易日历需要按年更新
-    :return: json
+    :return: 交易日历
+    :rtype: list
     """
-    setting_file_name = "calendar.json"
-    setting_file_path = get_json_path(setting_file_name, __file__)
-    return json.load(open(setting_file_path, "r"))
+    return list(get_trade_calendar().days)
 
 
 def last_trading_day(day):
@@ -109,23 +109,20 @@ def last_trading_day(day):
     :param day: "%Y%m%d" or  datetime.date()
     :return last_day: "%Y%m%d" or  datetime.date()
     """
-    calendar = get_calendar()
+    calendar = get_trade_calendar()
 
     if isinstance(day, str):
         if day not in calendar:
             print("Today is not trading day：" + day)
             return False
-        pos = calendar.index(day)
-        last_day = calendar[pos - 1]
-        return last_day
+        return calendar.prev(day)
 
     elif isinstance(day, datetime.date):
         d_str = day.strftime("%Y%m%d")
         if d_str not in calendar:
             print("Today is not working day：" + d_str)
             return False
-        pos = calendar.index(d_str)
-        last_day = calendar[pos - 1]
+        last_day = calendar.prev(d_str)
         last_day = datetime.datetime.strptime(last_day, "%Y%m%d").date()
         return last_day
 
@@ -136,16 +133,14 @@ def get_latest_data_date(day):
     :param day: datetime.datetime
     :return string YYYYMMDD
     """
-    calendar = get_calendar()
+    calendar = get_trade_calendar()
     if day.strftime("%Y%m%d") in calendar:
         if day.time() > datetime.time(17, 0, 0):
             return day.strftime("%Y%m%d")
         else:
             return last_trading_day(day.strftime("%Y%m%d"))
     else:
-        while day.strftime("%Y%m%d") not in calendar:
-            day = day - datetime.timedelta(days=1)
-        return day.strftime("%Y%m%d")
+        return calendar.floor(day)
 
 
 if __name__ == "__main__":
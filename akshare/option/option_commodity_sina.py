@@ -10,7 +10,7 @@ import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 
-from akshare.utils import demjson
+from akshare.utils.js_literal import loads_js_literal
 
 
 def option_commodity_contract_sina(symbol: str = "玉米期权") -> pd.DataFrame:
@@ -149,7 +149,7 @@ def option_commodity_hist_sina(symbol: str = "au2012C392") -> pd.DataFrame:
     params = {"symbol": symbol}
     r = requests.get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("[") : -2])
+    data_json = loads_js_literal(data_text[data_text.find("[") : -2])
     temp_df = pd.DataFrame(data_json)
     temp_df.columns = ["open", "high", "low", "close", "volume", "date"]
     temp_df = temp_df[["date", "open", "high", "low", "close", "volume"]]
@@ -29,6 +29,7 @@ from akshare.option.cons import (
     SH_OPTION_URL_KING_50_YFD,
     CFFEX_OPTION_URL_300,
 )
+from akshare.utils.func import PageAccumulator
 
 
 def option_finance_sse_underlying(symbol: str = "华夏科创50ETF期权") -> pd.DataFrame:
@@ -216,7 +217,7 @@ def option_finance_board(
         r = requests.get(url, params=params)
         data_json = r.json()
         page_num = data_json[0]["metadata"]["pagecount"]
-        big_df = pd.DataFrame()
+        pages = PageAccumulator()
         for page in range(1, page_num + 1):
             params = {
                 "SHOWTYPE": "JSON",
@@ -228,7 +229,8 @@ def option_finance_board(
             r = requests.get(url, params=params)
             data_json = r.json()
             temp_df = pd.DataFrame(data_json[0]["data"])
-            big_df = pd.concat([big_df, temp_df], ignore_index=True)
+            pages.append(temp_df)
+        big_df = pages.to_frame(ignore_index=True)
 
         big_df.columns = [
             "合约编码",
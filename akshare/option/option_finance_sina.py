@@ -21,7 +21,7 @@ import requests
 from bs4 import BeautifulSoup
 
 from akshare.option.option_em import option_current_em
-from akshare.utils.func import set_df_columns
+from akshare.utils.func import set_df_columns, PageAccumulator
 
 
 # 期权-中金所-上证50指数
@@ -844,9 +844,10 @@ def option_finance_minute_sina(symbol: str = "10002530") -> pd.DataFrame:
     }
     r = requests.get(url, params=params, headers=headers)
     data_text = r.json()
-    temp_df = pd.DataFrame()
+    pages = PageAccumulator()
     for item in data_text["result"]["data"]:
-        temp_df = pd.concat(objs=[temp_df, pd.DataFrame(item)], ignore_index=True)
+        pages.append(pd.DataFrame(item))
+    temp_df = pages.to_frame(ignore_index=True)
     temp_df.ffill(inplace=True)
     temp_df.columns = ["time", "price", "volume", "_", "average_price", "date"]
     temp_df = temp_df[["date", "time", "price", "average_price", "volume"]]
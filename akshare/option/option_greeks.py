@@ -0,0 +1,400 @@
+#!/usr/bin/env python
+"""
+Date: 2026/10/18 05:30
+Desc: 期权希腊字母和隐含波动率的本地计算
+对整条期权链一次性用 NumPy 向量计算 Black-Scholes / Black-76 的 Greeks, 并用带区间保护的牛顿法求解隐含波动率,
+不再需要像 option_sse_greeks_sina 那样逐个合约请求
+Theta 为每个自然日的变动, Vega 为波动率变动 1 个百分点时的变动, 隐含波动率为小数
+"""
+
+import datetime
+import re
+from typing import Dict, Union
+
+import numpy as np
+import pandas as pd
+
+_MODEL_LIST = ("black_scholes", "black76")
+_CALL_PATTERN = re.compile(r"购|看涨|\d-?[Cc]-?\d")
+_PUT_PATTERN = re.compile(r"沽|看跌|\d-?[Pp]-?\d")
+_CHAIN_COLUMNS = [
+    "代码",
+    "类型",
+    "行权价",
+    "最新价",
+    "剩余年限",
+    "隐含波动率",
+    "Delta",
+    "Gamma",
+    "Theta",
+    "Vega",
+]
+
+
+def _norm_pdf(x: np.ndarray) -> np.ndarray:
+    return np.exp(-0.5 * x * x) / np.sqrt(2 * np.pi)
+
+
+def _norm_cdf(x: np.ndarray) -> np.ndarray:
+    """
+    标准正态分布的累积分布函数; Hart 的有理逼近(West, 2005), 精度接近双精度
+    :param x: 自变量
+    :type x: numpy.ndarray
+    :return: 累积概率
+    :rtype: numpy.ndarray
+    """
+    x = np.asarray(x, dtype=float)
+    x_abs = np.abs(x)
+    exponential = np.exp(-0.5 * x_abs * x_abs)
+    numerator = 3.52624965998911e-02 * x_abs + 0.700383064443688
+    for coef in (
+        6.37396220353165,
+        33.912866078383,
+        112.079291497871,
+        221.213596169931,
+        220.206867912376,
+    ):
+        numerator = numerator * x_abs + coef
+    denominator = 8.83883476483184e-02 * x_abs + 1.75566716318264
+    for coef in (
+        16.064177579207,
+        86.7807322029461,
+        296.564248779674,
+        637.333633378831,
+        793.826512519948,
+        440.413735824752,
+    ):
+        denominator = denominator * x_abs + coef
+    tail = x_abs + 0.65
+    for coef in (4.0, 3.0, 2.0, 1.0):
+        tail = x_abs + coef / tail
+    with np.errstate(divide="ignore", invalid="ignore"):
+        small = np.where(
+            x_abs < 7.07106781186547,
+            exponential * numerator / denominator,
+            exponential / tail / 2.506628274631,
+        )
+    small = np.where(x_abs > 37, 0.0, small)
+    return np.where(x > 0, 1 - small, small)
+
+
+def _is_call(option_type) -> np.ndarray:
+    """
+    期权类型转换为是否看涨
+    :param option_type: 期权类型, 可以是 call/put、C/P、看涨/看跌或购/沽, 支持数组
+    :type option_type: str or list
+    :return: 是否看涨
+    :rtype: numpy.ndarray
+    """
+    type_series = pd.Series(np.atleast_1d(option_type)).astype(str).str.lower()
+    is_call = type_series.isin(["call", "c", "看涨", "购"])
+    is_put = type_series.isin(["put", "p", "看跌", "沽"])
+    if not (is_call | is_put).all():
+        raise ValueError("option_type must be call or put")
+    return is_call.to_numpy()
+
+
+def _carry(rate, dividend, model: str):
+    """
+    持有成本; Black-Scholes 为 rate - dividend, Black-76(标的为期货)为 0
+    """
+    if model not in _MODEL_LIST:
+        raise ValueError('model must be in {"black_scholes", "black76"}')
+    if model == "black76":
+        return np.zeros_like(np.asarray(rate, dtype=float))
+    return np.asarray(rate, dtype=float) - np.asarray(dividend, dtype=float)
+
+
+def _bsm_price(is_call, s, k, t, sigma, r, b) -> np.ndarray:
+    sqrt_t = np.sqrt(t)
+    d1 = (np.log(s / k) + (b + 0.5 * sigma * sigma) * t) / (sigma * sqrt_t)
+    d2 = d1 - sigma * sqrt_t
+    forward = s * np.exp((b - r) * t)
+    discount = k * np.exp(-r * t)
+    call = forward * _norm_cdf(d1) - discount * _norm_cdf(d2)
+    put = discount * _norm_cdf(-d2) - forward * _norm_cdf(-d1)
+    return np.where(is_call, call, put), d1
+
+
+def option_bsm_greeks(
+    option_type,
+    underlying_price,
+    strike,
+    expiry,
+    volatility,
+    rate=0.0,
+    dividend=0.0,
+    model: str = "black_scholes",
+) -> Dict[str, np.ndarray]:
+    """
+    Black-Scholes / Black-76 期权理论价格和希腊字母; 所有参数都支持数组, 按 NumPy 规则广播
+    :param option_type: 期权类型; call/put、C/P、看涨/看跌或购/沽
+    :type option_type: str or list
+    :param underlying_price: 标的价格; model="black76" 时为标的期货价格
+    :type underlying_price: float or numpy.ndarray
+    :param strike: 行权价
+    :type strike: float or numpy.ndarray
+    :param expiry: 剩余期限(年)
+    :type expiry: float or numpy.ndarray
+    :param volatility: 波动率, 小数
+    :type volatility: float or numpy.ndarray
+    :param rate: 无风险利率, 连续复利
+    :type rate: float or numpy.ndarray
+    :param dividend: 连续分红率; model="black76" 时不使用
+    :type dividend: float or numpy.ndarray
+    :param model: choice of {"black_scholes", "black76"}
+    :type model: str
+    :return: 包含 price, delta, gamma, theta, vega 的字典
+    :rtype: dict
+    """
+    b = _carry(rate, dividend, model)
+    is_call = _is_call(option_type)
+    s, k, t, sigma, r = (
+        np.asarray(item, dtype=float)
+        for item in (underlying_price, strike, expiry, volatility, rate)
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        price, d1 = _bsm_price(is_call, s, k, t, sigma, r, b)
+        sqrt_t = np.sqrt(t)
+        d2 = d1 - sigma * sqrt_t
+        carry_discount = np.exp((b - r) * t)
+        pdf_d1 = _norm_pdf(d1)
+        cdf_d1 = _norm_cdf(d1)
+        delta = np.where(
+            is_call, carry_discount * cdf_d1, carry_discount * (cdf_d1 - 1)
+        )
+        gamma = carry_discount * pdf_d1 / (s * sigma * sqrt_t)
+        vega = s * carry_discount * pdf_d1 * sqrt_t
+        decay = -s * carry_discount * pdf_d1 * sigma / (2 * sqrt_t)
+        discount = r * k * np.exp(-r * t)
+        theta_call = (
+            decay - (b - r) * s * carry_discount * cdf_d1 - discount * _norm_cdf(d2)
+        )
+        theta_put = (
+            decay
+            + (b - r) * s * carry_discount * (1 - cdf_d1)
+            + discount * _norm_cdf(-d2)
+        )
+        theta = np.where(is_call, theta_call, theta_put)
+    return {
+        "price": price,
+        "delta": delta,
+        "gamma": gamma,
+        "theta": theta / 365,
+        "vega": vega / 100,
+    }
+
+
+def option_implied_volatility(
+    price,
+    option_type,
+    underlying_price,
+    strike,
+    expiry,
+    rate=0.0,
+    dividend=0.0,
+    model: str = "black_scholes",
+    tol: float = 1e-8,
+    max_iter: int = 100,
+) -> np.ndarray:
+    """
+    隐含波动率; 整条期权链一次求解, 牛顿迭代越出区间或 Vega 过小时改用二分
+    :param price: 期权价格
+    :type price: float or numpy.ndarray
+    :param option_type: 期权类型; call/put、C/P、看涨/看跌或购/沽
+    :type option_type: str or list
+    :param underlying_price: 标的价格; model="black76" 时为标的期货价格
+    :type underlying_price: float or numpy.ndarray
+    :param strike: 行权价
+    :type strike: float or numpy.ndarray
+    :param expiry: 剩余期限(年)
+    :type expiry: float or numpy.ndarray
+    :param rate: 无风险利率, 连续复利
+    :type rate: float or numpy.ndarray
+    :param dividend: 连续分红率; model="black76" 时不使用
+    :type dividend: float or numpy.ndarray
+    :param model: choice of {"black_scholes", "black76"}
+    :type model: str
+    :param tol: 价格相对误差的收敛阈值
+    :type tol: float
+    :param max_iter: 最大迭代次数
+    :type max_iter: int
+    :return: 隐含波动率; 价格超出无套利区间或数据缺失的合约为 NaN
+    :rtype: numpy.ndarray
+    """
+    b = _carry(rate, dividend, model)
+    is_call = _is_call(option_type)
+    target, s, k, t, r = np.broadcast_arrays(
+        *(
+            np.asarray(item, dtype=float)
+            for item in (price, underlying_price, strike, expiry, rate)
+        ),
+        is_call,
+    )[:5]
+    is_call = np.broadcast_to(is_call, target.shape)
+    b = np.broadcast_to(b, target.shape)
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        forward = s * np.exp((b - r) * t)
+        discount = k * np.exp(-r * t)
+        lower = np.where(
+            is_call,
+            np.maximum(forward - discount, 0),
+            np.maximum(discount - forward, 0),
+        )
+        upper = np.where(is_call, forward, discount)
+        valid = (target > lower) & (target < upper) & (t > 0) & (s > 0) & (k > 0)
+        low = np.full(target.shape, 1e-6)
+        high = np.full(target.shape, 5.0)
+        # Brenner-Subrahmanyam 近似作为初值
+        sigma = np.clip(np.sqrt(2 * np.pi / t) * target / s, 0.01, 3.0)
+        sigma = np.where(valid, sigma, 0.2)
+        done = ~valid
+        for _ in range(max_iter):
+            model_price, d1 = _bsm_price(is_call, s, k, t, sigma, r, b)
+            diff = model_price - target
+            done = done | (np.abs(diff) <= tol * target) | (high - low < 1e-12)
+            if done.all():
+                break
+            high = np.where(~done & (diff > 0), sigma, high)
+            low = np.where(~done & (diff < 0), sigma, low)
+            vega = s * np.exp((b - r) * t) * _norm_pdf(d1) * np.sqrt(t)
+            step = sigma - diff / vega
+            bad = ~np.isfinite(step) | (step <= low) | (step >= high)
+            step = np.where(bad, 0.5 * (low + high), step)
+            sigma = np.where(done, sigma, step)
+        # 波动率上限时价格仍低于市价的合约无解
+        valid = valid & (sigma < 5.0 - 1e-6)
+    return np.where(valid & done, sigma, np.nan)
+
+
+def _chain_frame(chain_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    不同来源的期权链整理为 代码, 类型, 行权价, 最新价, 剩余日 的统一格式
+    :param chain_df: option_cffex_*_spot_sina, option_sse_spot_price_sina 或 option_current_em 的返回结果
+    :type chain_df: pandas.DataFrame
+    :return: 统一格式的期权链
+    :rtype: pandas.DataFrame
+    """
+    if "看涨合约-标识" in chain_df.columns:
+        frame_list = []
+        for side in ("看涨", "看跌"):
+            temp_df = pd.DataFrame(
+                {
+                    "代码": chain_df[f"{side}合约-标识"],
+                    "类型": side,
+                    "行权价": chain_df["行权价"],
+                    "最新价": chain_df[f"{side}合约-最新价"],
+                }
+            )
+            frame_list.append(temp_df)
+        temp_df = pd.concat(frame_list, ignore_index=True)
+        temp_df["剩余日"] = np.nan
+        return temp_df
+    if {"字段", "值"}.issubset(chain_df.columns):
+        # 多个合约的结果首尾拼接时, 每个合约都从 买量 开始
+        record_list = []
+        for field, value in zip(chain_df["字段"], chain_df["值"]):
+            if field == "买量" or not record_list:
+                record_list.append({})
+            record_list[-1][field] = value
+        temp_df = pd.DataFrame(record_list)
+        name = temp_df["期权合约简称"]
+        return pd.DataFrame(
+            {
+                "代码": name,
+                "类型": name,
+                "行权价": temp_df["行权价"],
+                "最新价": temp_df["最新价"],
+                "剩余日": np.nan,
+            }
+        )
+    if {"代码", "名称", "最新价", "行权价"}.issubset(chain_df.columns):
+        label = chain_df["代码"].astype(str) + " " + chain_df["名称"].astype(str)
+        return pd.DataFrame(
+            {
+                "代码": chain_df["代码"],
+                "类型": label,
+                "行权价": chain_df["行权价"],
+                "最新价": chain_df["最新价"],
+                "剩余日": chain_df.get("剩余日", np.nan),
+            }
+        ).reset_index(drop=True)
+    raise ValueError(
+        "chain_df must come from option_cffex_*_spot_sina, "
+        "option_sse_spot_price_sina or option_current_em"
+    )
+
+
+def option_chain_greeks(
+    chain_df: pd.DataFrame,
+    underlying_price,
+    rate: float = 0.0,
+    dividend: float = 0.0,
+    expiry: Union[float, str] = None,
+    model: str = "black_scholes",
+) -> pd.DataFrame:
+    """
+    整条期权链的隐含波动率和希腊字母
+    :param chain_df: option_cffex_*_spot_sina, option_sse_spot_price_sina 或 option_current_em 的返回结果
+    :type chain_df: pandas.DataFrame
+    :param underlying_price: 标的价格; 整条链相同时传一个数, 否则传与整理后的期权链逐行对应的数组
+    :type underlying_price: float or numpy.ndarray
+    :param rate: 无风险利率, 连续复利
+    :type rate: float
+    :param dividend: 连续分红率; model="black76" 时不使用
+    :type dividend: float
+    :param expiry: 到期日(如 "20240626")或剩余期限(年); 为空时使用 chain_df 中的 剩余日
+    :type expiry: float or str
+    :param model: choice of {"black_scholes", "black76"}; 股指期权以期货价格为标的时用 black76
+    :type model: str
+    :return: 代码, 类型, 行权价, 最新价, 剩余年限, 隐含波动率, Delta, Gamma, Theta, Vega
+    :rtype: pandas.DataFrame
+    """
+    temp_df = _chain_frame(chain_df)
+    label = temp_df["类型"].astype(str)
+    temp_df["类型"] = np.where(
+        label.str.contains(_CALL_PATTERN),
+        "看涨",
+        np.where(label.str.contains(_PUT_PATTERN), "看跌", None),
+    )
+    temp_df["行权价"] = pd.to_numeric(temp_df["行权价"], errors="coerce")
+    temp_df["最新价"] = pd.to_numeric(temp_df["最新价"], errors="coerce")
+    if isinstance(expiry, str):
+        expiry_date = pd.to_datetime(expiry).date()
+        temp_df["剩余年限"] = (expiry_date - datetime.date.today()).days / 365
+    elif expiry is not None:
+        temp_df["剩余年限"] = float(expiry)
+    else:
+        temp_df["剩余年限"] = pd.to_numeric(temp_df["剩余日"], errors="coerce") / 365
+    temp_df = temp_df[temp_df["类型"].notna()].reset_index(drop=True)
+    arg_dict = dict(
+        option_type=temp_df["类型"].to_numpy(),
+        underlying_price=underlying_price,
+        strike=temp_df["行权价"].to_numpy(),
+        expiry=temp_df["剩余年限"].to_numpy(),
+        rate=rate,
+        dividend=dividend,
+        model=model,
+    )
+    temp_df["隐含波动率"] = option_implied_volatility(
+        price=temp_df["最新价"].to_numpy(), **arg_dict
+    )
+    greeks_dict = option_bsm_greeks(
+        volatility=temp_df["隐含波动率"].to_numpy(), **arg_dict
+    )
+    for key in ("delta", "gamma", "theta", "vega"):
+        temp_df[key.capitalize()] = greeks_dict[key]
+    return temp_df[_CHAIN_COLUMNS]
+
+
+if __name__ == "__main__":
+    from akshare.option.option_finance_sina import option_cffex_hs300_spot_sina
+
+    option_cffex_hs300_spot_sina_df = option_cffex_hs300_spot_sina(symbol="io2412")
+    option_chain_greeks_df = option_chain_greeks(
+        chain_df=option_cffex_hs300_spot_sina_df,
+        underlying_price=3900,
+        rate=0.02,
+        expiry="20241220",
+    )
+    print(option_chain_greeks_df)
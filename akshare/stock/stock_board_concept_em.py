@@ -8,6 +8,7 @@ https://quote.eastmoney.com/center/boardlist.html#concept_board
 
 import re
 from functools import lru_cache
+from typing import Dict, Tuple
 
 import pandas as pd
 import requests
@@ -224,38 +225,52 @@ def stock_board_concept_spot_em(symbol: str = "可燃冰") -> pd.DataFrame:
     return result
 
 
-def stock_board_concept_hist_em(
-    symbol: str = "绿色电力",
+def _stock_board_concept_code(symbol: str) -> str:
+    """
+    东方财富网-沪深板块-概念板块-板块名称转换为板块代码
+    :param symbol: 板块名称或板块代码, 如 "绿色电力" 或 "BK0715"
+    :type symbol: str
+    :return: 板块代码
+    :rtype: str
+    """
+    if re.match(pattern=r"^BK\d+$", string=symbol):
+        return symbol
+    stock_board_concept_em_map = __stock_board_concept_name_em()
+    code_list = stock_board_concept_em_map[
+        stock_board_concept_em_map["板块名称"] == symbol
+    ]["板块代码"].values
+    if len(code_list) == 0:
+        raise ValueError(f"未找到概念板块: {symbol}")
+    return code_list[0]
+
+
+def _stock_board_concept_hist_em_params(
+    stock_board_code: str,
     period: str = "daily",
     start_date: str = "20220101",
     end_date: str = "20221128",
     adjust: str = "",
-) -> pd.DataFrame:
+) -> Tuple[str, Dict]:
     """
-    东方财富网-沪深板块-概念板块-历史行情
-    https://quote.eastmoney.com/bk/90.BK0715.html
-    :param symbol: 板块名称
-    :type symbol: str
-    :type period: 周期; choice of {"daily", "weekly", "monthly"}
-    :param period: 板块名称
+    东方财富网-沪深板块-概念板块-历史行情-请求地址和参数
+    :param stock_board_code: 板块代码
+    :type stock_board_code: str
+    :param period: choice of {"daily", "weekly", "monthly"}
+    :type period: str
     :param start_date: 开始时间
     :type start_date: str
     :param end_date: 结束时间
     :type end_date: str
     :param adjust: choice of {'': 不复权, "qfq": 前复权, "hfq": 后复权}
     :type adjust: str
-    :return: 历史行情
-    :rtype: pandas.DataFrame
+    :return: 请求地址和参数
+    :rtype: tuple
     """
     period_map = {
         "daily": "101",
         "weekly": "102",
         "monthly": "103",
     }
-    stock_board_concept_em_map = __stock_board_concept_name_em()
-    stock_board_code = stock_board_concept_em_map[
-        stock_board_concept_em_map["板块名称"] == symbol
-    ]["板块代码"].values[0]
     adjust_map = {"": "0", "qfq": "1", "hfq": "2"}
     url = "https://91.push2his.eastmoney.com/api/qt/stock/kline/get"
     params = {
@@ -269,8 +284,17 @@ def stock_board_concept_hist_em(
         "smplmt": "10000",
         "lmt": "1000000",
     }
-    r = requests.get(url, params=params)
-    data_json = r.json()
+    return url, params
+
+
+def _stock_board_concept_hist_em_parse(data_json: Dict) -> pd.DataFrame:
+    """
+    东方财富网-沪深板块-概念板块-历史行情-解析返回数据
+    :param data_json: 接口返回的 JSON 数据
+    :type data_json: dict
+    :return: 历史行情
+    :rtype: pandas.DataFrame
+    """
     temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
     temp_df.columns = [
         "日期",
@@ -313,23 +337,52 @@ def stock_board_concept_hist_em(
     return temp_df
 
 
+def stock_board_concept_hist_em(
+    symbol: str = "绿色电力",
+    period: str = "daily",
+    start_date: str = "20220101",
+    end_date: str = "20221128",
+    adjust: str = "",
+) -> pd.DataFrame:
+    """
+    东方财富网-沪深板块-概念板块-历史行情
+    https://quote.eastmoney.com/bk/90.BK0715.html
+    :param symbol: 板块名称或板块代码, 如 "绿色电力" 或 "BK0715"
+    :type symbol: str
+    :param period: choice of {"daily", "weekly", "monthly"}
+    :type period: str
+    :param start_date: 开始时间
+    :type start_date: str
+    :param end_date: 结束时间
+    :type end_date: str
+    :param adjust: choice of {'': 不复权, "qfq": 前复权, "hfq": 后复权}
+    :type adjust: str
+    :return: 历史行情
+    :rtype: pandas.DataFrame
+    """
+    stock_board_code = _stock_board_concept_code(symbol)
+    url, params = _stock_board_concept_hist_em_params(
+        stock_board_code, period, start_date, end_date, adjust
+    )
+    r = requests.get(url, params=params)
+    data_json = r.json()
+    return _stock_board_concept_hist_em_parse(data_json)
+
+
 def stock_board_concept_hist_min_em(
     symbol: str = "长寿药", period: str = "5"
 ) -> pd.DataFrame:
     """
     东方财富网-沪深板块-概念板块-分时历史行情
     https://quote.eastmoney.com/bk/90.BK0715.html
-    :param symbol: 板块名称
+    :param symbol: 板块名称或板块代码, 如 "长寿药" 或 "BK0925"
     :type symbol: str
     :param period: choice of {"1", "5", "15", "30", "60"}
     :type period: str
     :return: 分时历史行情
     :rtype: pandas.DataFrame
     """
-    stock_board_concept_em_map = __stock_board_concept_name_em()
-    stock_board_code = stock_board_concept_em_map[
-        stock_board_concept_em_map["板块名称"] == symbol
-    ]["板块代码"].values[0]
+    stock_board_code = _stock_board_concept_code(symbol)
     if period == "1":
         url = "https://push2his.eastmoney.com/api/qt/stock/trends2/get"
         params = {
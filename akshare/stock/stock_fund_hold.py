@@ -9,6 +9,8 @@ http://data.eastmoney.com/zlsj/2020-06-30-1-2.html
 import pandas as pd
 import requests
 
+from akshare.utils.func import PageAccumulator
+
 
 def stock_report_fund_hold(
     symbol: str = "基金持仓", date: str = "20210331"
@@ -47,7 +49,7 @@ def stock_report_fund_hold(
     r = requests.get(url, params=params)
     data_json = r.json()
     total_page = data_json["pages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     for page in range(1, total_page + 1):
         params = {
             "date": date,
@@ -63,7 +65,8 @@ def stock_report_fund_hold(
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.reset_index(inplace=True)
     big_df["index"] = list(range(1, len(big_df) + 1))
     big_df.columns = [
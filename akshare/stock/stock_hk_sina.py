@@ -7,16 +7,16 @@ https://stock.finance.sina.com.cn/hkstock/quotes/00700.html
 """
 
 import pandas as pd
-from py_mini_racer import MiniRacer
 import requests
 
 from akshare.stock.cons import (
-    hk_js_decode,
     hk_sina_stock_hist_url,
     hk_sina_stock_hist_hfq_url,
     hk_sina_stock_hist_qfq_url,
 )
+from akshare.utils.func import PageAccumulator
 from akshare.utils.tqdm import get_tqdm
+from akshare.utils.sina_decode import sina_js_decode
 
 
 def stock_hk_spot() -> pd.DataFrame:
@@ -35,7 +35,7 @@ def stock_hk_spot() -> pd.DataFrame:
         "node": "qbgg_hk",
         "_s_r_a": "init",
     }
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, 100), leave=False):
         params["page"] = str(page)
@@ -44,7 +44,8 @@ def stock_hk_spot() -> pd.DataFrame:
         if not data_json:
             break
         temp_df = pd.DataFrame(data_json)
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
 
     big_df.columns = [
         "代码",
@@ -118,10 +119,8 @@ def stock_hk_daily(symbol: str = "00981", adjust: str = "") -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     r = requests.get(hk_sina_stock_hist_url.format(symbol))
-    js_code = MiniRacer()
-    js_code.eval(hk_js_decode)
-    dict_list = js_code.call(
-        "d", r.text.split("=")[1].split(";")[0].replace('"', "")
+    dict_list = sina_js_decode(
+        r.text.split("=")[1].split(";")[0].replace('"', "")
     )  # 执行js解密代码
     data_df = pd.DataFrame(dict_list)
     data_df.index = pd.to_datetime(data_df["date"]).dt.date
@@ -12,7 +12,8 @@ import math
 import pandas as pd
 import requests
 
-from akshare.utils import demjson
+from akshare.utils.js_literal import loads_js_literal
+from akshare.utils.func import PageAccumulator
 from tqdm import tqdm
 
 
@@ -88,7 +89,7 @@ def stock_sector_detail(sector: str = "gn_gfgn") -> pd.DataFrame:
     r = requests.get(url, params=params)
     total_num = int(r.json())
     total_page_num = math.ceil(int(total_num) / 80)
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     url = "http://vip.stock.finance.sina.com.cn/quotes_service/api/json_v2.php/Market_Center.getHQNodeData"
     for page in tqdm(range(1, total_page_num + 1), leave=True):
         params = {
@@ -102,9 +103,10 @@ def stock_sector_detail(sector: str = "gn_gfgn") -> pd.DataFrame:
         }
         r = requests.get(url, params=params)
         data_text = r.text
-        data_json = demjson.decode(data_text)
+        data_json = loads_js_literal(data_text)
         temp_df = pd.DataFrame(data_json)
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df["trade"] = pd.to_numeric(big_df["trade"], errors="coerce")
     big_df["pricechange"] = pd.to_numeric(big_df["pricechange"], errors="coerce")
     big_df["changepercent"] = pd.to_numeric(big_df["changepercent"], errors="coerce")
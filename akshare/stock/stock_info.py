@@ -13,6 +13,7 @@ from io import StringIO
 
 import pandas as pd
 import requests
+from akshare.utils.func import PageAccumulator
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -206,7 +207,7 @@ def stock_info_bj_name_code() -> pd.DataFrame:
     data_text = r.text
     data_json = json.loads(data_text[data_text.find("[") : -1])
     total_page = data_json[0]["totalPages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(total_page), leave=False):
         payload.update({"page": page})
@@ -215,7 +216,8 @@ def stock_info_bj_name_code() -> pd.DataFrame:
         data_json = json.loads(data_text[data_text.find("[") : -1])
         temp_df = data_json[0]["content"]
         temp_df = pd.DataFrame(temp_df)
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.columns = [
         "上市日期",
         "-",
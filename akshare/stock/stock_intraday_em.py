@@ -11,6 +11,8 @@ import json
 import pandas as pd
 import requests
 
+from akshare.utils.func import PageAccumulator
+
 
 def __event_stream(url, params):
     # 使用 stream=True 参数来启用流式请求
@@ -48,7 +50,7 @@ def stock_intraday_em(symbol: str = "000001") -> pd.DataFrame:
         "wbp2u": "|0|0|0|web",
     }
 
-    big_df = pd.DataFrame()  # 创建一个空的 DataFrame
+    pages = PageAccumulator()
 
     for event in __event_stream(url, params):
         # 从每个事件的数据行中删除 "data: "，然后解析 JSON
@@ -57,8 +59,9 @@ def stock_intraday_em(symbol: str = "000001") -> pd.DataFrame:
         temp_df = pd.DataFrame(
             [item.split(",") for item in event_json["data"]["details"]]
         )
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
         break
+    big_df = pages.to_frame(ignore_index=True)
 
     big_df.columns = ["时间", "成交价", "手数", "-", "买卖盘性质"]
     big_df["买卖盘性质"] = big_df["买卖盘性质"].map(
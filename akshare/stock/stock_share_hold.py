@@ -17,6 +17,8 @@ import pandas as pd
 import requests
 from tqdm import tqdm
 
+from akshare.utils.func import PageAccumulator
+
 
 def stock_share_hold_change_sse(symbol: str = "600000") -> pd.DataFrame:
     """
@@ -52,7 +54,7 @@ def stock_share_hold_change_sse(symbol: str = "600000") -> pd.DataFrame:
     r = requests.get(url, headers=headers, params=params)
     data_json = r.json()
     total_page = data_json["pageHelp"]["pageCount"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update(
             {
@@ -64,7 +66,8 @@ def stock_share_hold_change_sse(symbol: str = "600000") -> pd.DataFrame:
         r = requests.get(url, headers=headers, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"])
-        big_df = pd.concat(objs=[big_df, temp_df], axis=0, ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(axis=0, ignore_index=True)
     big_df.rename(
         columns={
             "STOCK_TYPE": "股票种类",
@@ -140,7 +143,7 @@ def stock_share_hold_change_szse(symbol: str = "全部") -> pd.DataFrame:
     r = requests.get(url, headers=headers, params=params)
     data_json = r.json()
     total_page = data_json[0]["metadata"]["pagecount"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update(
             {
@@ -150,7 +153,8 @@ def stock_share_hold_change_szse(symbol: str = "全部") -> pd.DataFrame:
         r = requests.get(url, headers=headers, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json[0]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], axis=0, ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(axis=0, ignore_index=True)
     big_df.rename(
         columns={
             "zqdm": "证券代码",
@@ -223,7 +227,7 @@ def stock_share_hold_change_bse(symbol: str = "430489") -> pd.DataFrame:
     data_text = data_text.strip("null(").strip(")")
     data_json = json.loads(data_text)
     total_page = data_json[0]["result"]["totalPages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     for page in tqdm(range(0, total_page), leave=False):
         params.update(
             {
@@ -235,7 +239,8 @@ def stock_share_hold_change_bse(symbol: str = "430489") -> pd.DataFrame:
         data_text = data_text.strip("null(").strip(")")
         data_json = json.loads(data_text)
         temp_df = pd.DataFrame(data_json[0]["result"]["content"])
-        big_df = pd.concat(objs=[big_df, temp_df], axis=0, ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(axis=0, ignore_index=True)
     big_df.rename(
         columns={
             "changeAmount": "变动股数",
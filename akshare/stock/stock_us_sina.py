@@ -11,16 +11,17 @@ from functools import lru_cache
 
 import pandas as pd
 import requests
-import py_mini_racer
 from tqdm import tqdm
 
 from akshare.stock.cons import (
     js_hash_text,
-    zh_js_decode,
     us_sina_stock_list_url,
     us_sina_stock_dict_payload,
     us_sina_stock_hist_qfq_url,
 )
+from akshare.utils.func import PageAccumulator
+from akshare.utils.js_pool import js_call
+from akshare.utils.sina_decode import sina_js_decode
 
 
 @lru_cache()
@@ -35,9 +36,7 @@ def __get_us_page_count() -> int:
     us_js_decode = (
         f"US_CategoryService.getList?page={page}&num=20&sort=&asc=0&market=&id="
     )
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(js_hash_text)
-    dict_list = js_code.call("d", us_js_decode)  # 执行js解密代码
+    dict_list = js_call(js_hash_text, "d", us_js_decode)  # 执行js解密代码
     us_sina_stock_dict_payload.update({"page": "{}".format(page)})
     res = requests.get(
         us_sina_stock_list_url.format(dict_list),
@@ -60,7 +59,7 @@ def get_us_stock_name() -> pd.DataFrame:
     :return: stock's english name, chinese name and symbol
     :rtype: pandas.DataFrame
     """
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     page_count = __get_us_page_count()
     for page in tqdm(range(1, page_count + 1), leave=False):
         us_js_decode = (
@@ -68,18 +67,15 @@ def get_us_stock_name() -> pd.DataFrame:
                 page
             )
         )
-        js_code = py_mini_racer.MiniRacer()
-        js_code.eval(js_hash_text)
-        dict_list = js_code.call("d", us_js_decode)  # 执行js解密代码
+        dict_list = js_call(js_hash_text, "d", us_js_decode)  # 执行js解密代码
         us_sina_stock_dict_payload.update({"page": "{}".format(page)})
         res = requests.get(
             us_sina_stock_list_url.format(dict_list),
             params=us_sina_stock_dict_payload,
         )
         data_json = json.loads(res.text[res.text.find("({") + 1 : res.text.rfind(");")])
-        big_df = pd.concat(
-            objs=[big_df, pd.DataFrame(data_json["data"])], ignore_index=True
-        )
+        pages.append(pd.DataFrame(data_json["data"]))
+    big_df = pages.to_frame(ignore_index=True)
     return big_df[["name", "cname", "symbol"]]
 
 
@@ -90,7 +86,7 @@ def stock_us_spot() -> pd.DataFrame:
     :return: 美股所有股票实时行情
     :rtype: pandas.DataFrame
     """
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     page_count = __get_us_page_count()
     for page in tqdm(range(1, page_count + 1), leave=False):
         # page = "1"
@@ -99,18 +95,15 @@ def stock_us_spot() -> pd.DataFrame:
                 page
             )
         )
-        js_code = py_mini_racer.MiniRacer()
-        js_code.eval(js_hash_text)
-        dict_list = js_code.call("d", us_js_decode)  # 执行js解密代码
+        dict_list = js_call(js_hash_text, "d", us_js_decode)  # 执行js解密代码
         us_sina_stock_dict_payload.update({"page": "{}".format(page)})
         res = requests.get(
             us_sina_stock_list_url.format(dict_list),
             params=us_sina_stock_dict_payload,
         )
         data_json = json.loads(res.text[res.text.find("({") + 1 : res.text.rfind(");")])
-        big_df = pd.concat(
-            objs=[big_df, pd.DataFrame(data_json["data"])], ignore_index=True
-        )
+        pages.append(pd.DataFrame(data_json["data"]))
+    big_df = pages.to_frame(ignore_index=True)
     return big_df
 
 
@@ -130,9 +123,7 @@ def stock_us_daily(symbol: str = "FB", adjust: str = "") -> pd.DataFrame:
     """
     url = f"https://finance.sina.com.cn/staticdata/us/{symbol}"
     res = requests.get(url)
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(zh_js_decode)
-    dict_list = js_code.call("d", res.text.split("=")[1].split(";")[0].replace('"', ""))
+    dict_list = sina_js_decode(res.text.split("=")[1].split(";")[0].replace('"', ""))
     data_df = pd.DataFrame(dict_list)
     data_df["date"] = pd.to_datetime(data_df["date"]).dt.date
     data_df.index = pd.to_datetime(data_df["date"])
@@ -10,7 +10,6 @@ import json
 import re
 
 import pandas as pd
-import py_mini_racer
 import requests
 
 from akshare.stock.cons import (
@@ -18,12 +17,13 @@ from akshare.stock.cons import (
     zh_sina_a_stock_url,
     zh_sina_a_stock_count_url,
     zh_sina_a_stock_hist_url,
-    hk_js_decode,
     zh_sina_a_stock_hfq_url,
     zh_sina_a_stock_qfq_url,
     zh_sina_a_stock_amount_url,
 )
-from akshare.utils import demjson
+from akshare.utils.js_literal import loads_js_literal
+from akshare.utils.func import PageAccumulator
+from akshare.utils.sina_decode import sina_js_decode
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -49,7 +49,7 @@ def stock_zh_a_spot() -> pd.DataFrame:
     :return: 所有股票的实时行情数据
     :rtype: pandas.DataFrame
     """
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     page_count = _get_zh_a_page_count()
     zh_sina_stock_payload_copy = zh_sina_a_stock_payload.copy()
     tqdm = get_tqdm()
@@ -58,8 +58,9 @@ def stock_zh_a_spot() -> pd.DataFrame:
     ):
         zh_sina_stock_payload_copy.update({"page": page})
         r = requests.get(zh_sina_a_stock_url, params=zh_sina_stock_payload_copy)
-        data_json = demjson.decode(r.text)
-        big_df = pd.concat(objs=[big_df, pd.DataFrame(data_json)], ignore_index=True)
+        data_json = loads_js_literal(r.text)
+        pages.append(pd.DataFrame(data_json))
+    big_df = pages.to_frame(ignore_index=True)
 
     big_df = big_df.astype(
         {
@@ -175,10 +176,8 @@ def stock_zh_a_daily(
         return _fq_factor(adjust.split("-")[0])
 
     r = requests.get(zh_sina_a_stock_hist_url.format(symbol))
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(hk_js_decode)
-    dict_list = js_code.call(
-        "d", r.text.split("=")[1].split(";")[0].replace('"', "")
+    dict_list = sina_js_decode(
+        r.text.split("=")[1].split(";")[0].replace('"', "")
     )  # 执行js解密代码
     data_df = pd.DataFrame(dict_list)
     data_df.index = pd.to_datetime(data_df["date"], errors="coerce").dt.date
@@ -194,7 +193,7 @@ def stock_zh_a_daily(
         pass
     data_df = data_df.astype("float")
     r = requests.get(zh_sina_a_stock_amount_url.format(symbol, symbol))
-    amount_data_json = demjson.decode(r.text[r.text.find("[") : r.text.rfind("]") + 1])
+    amount_data_json = loads_js_literal(r.text[r.text.find("[") : r.text.rfind("]") + 1])
     amount_data_df = pd.DataFrame(amount_data_json)
     amount_data_df.columns = ["date", "outstanding_share"]
     amount_data_df.index = pd.to_datetime(amount_data_df.date)
@@ -321,10 +320,8 @@ def stock_zh_a_cdr_daily(
     :rtype: pandas.DataFrame
     """
     res = requests.get(zh_sina_a_stock_hist_url.format(symbol))
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(hk_js_decode)
-    dict_list = js_code.call(
-        "d", res.text.split("=")[1].split(";")[0].replace('"', "")
+    dict_list = sina_js_decode(
+        res.text.split("=")[1].split(";")[0].replace('"', "")
     )  # 执行js解密代码
     data_df = pd.DataFrame(dict_list)
     data_df.index = pd.to_datetime(data_df["date"])
@@ -14,7 +14,7 @@ import math
 import pandas as pd
 import requests
 
-from akshare.utils.func import fetch_paginated_data
+from akshare.utils.func import fetch_paginated_data, PageAccumulator
 
 
 def stock_zh_a_st_em() -> pd.DataFrame:
@@ -299,7 +299,7 @@ def stock_zh_a_new() -> pd.DataFrame:
     r = requests.get(url, params=params)
     total_page = math.ceil(int(r.json()) / 80)
     url = "https://vip.stock.finance.sina.com.cn/quotes_service/api/json_v2.php/Market_Center.getHQNodeData"
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     for page in range(1, total_page + 1):
         params = {
             "page": str(page),
@@ -314,7 +314,8 @@ def stock_zh_a_new() -> pd.DataFrame:
         r.encoding = "gb2312"
         data_json = r.json()
         temp_df = pd.DataFrame(data_json)
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df = big_df[
         [
             "symbol",
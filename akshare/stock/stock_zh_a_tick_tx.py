@@ -12,6 +12,8 @@ import warnings
 import pandas as pd
 import requests
 
+from akshare.utils.func import PageAccumulator
+
 
 def stock_zh_a_tick_tx_js(symbol: str = "sz000001") -> pd.DataFrame:
     """
@@ -22,7 +24,7 @@ def stock_zh_a_tick_tx_js(symbol: str = "sz000001") -> pd.DataFrame:
     :return: 历史分笔数据
     :rtype: pandas.DataFrame
     """
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     page = 0
     warnings.warn("正在下载数据，请稍等")
     while True:
@@ -42,9 +44,10 @@ def stock_zh_a_tick_tx_js(symbol: str = "sz000001") -> pd.DataFrame:
                 .str.split("/", expand=True)
             )
             page += 1
-            big_df = pd.concat([big_df, temp_df], ignore_index=True)
+            pages.append(temp_df)
         except:  # noqa: E722
             break
+    big_df = pages.to_frame(ignore_index=True)
     if not big_df.empty:
         big_df = big_df.iloc[:, 1:].copy()
         big_df.columns = [
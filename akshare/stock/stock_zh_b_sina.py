@@ -12,17 +12,17 @@ from functools import lru_cache
 
 import pandas as pd
 import requests
-import py_mini_racer
 
 from akshare.stock.cons import (
     zh_sina_a_stock_url,
     zh_sina_a_stock_hist_url,
-    hk_js_decode,
     zh_sina_a_stock_hfq_url,
     zh_sina_a_stock_qfq_url,
     zh_sina_a_stock_amount_url,
 )
-from akshare.utils import demjson
+from akshare.utils.js_literal import loads_js_literal
+from akshare.utils.func import PageAccumulator
+from akshare.utils.sina_decode import sina_js_decode
 
 
 @lru_cache()
@@ -62,12 +62,13 @@ def stock_zh_b_spot() -> pd.DataFrame:
         "symbol": "",
         "_s_r_a": "page",
     }
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     for page in range(1, page_count + 1):
         zh_sina_stock_payload_copy.update({"page": page})
         r = requests.get(zh_sina_a_stock_url, params=zh_sina_stock_payload_copy)
-        data_json = demjson.decode(r.text)
-        big_df = pd.concat(objs=[big_df, pd.DataFrame(data_json)], ignore_index=True)
+        data_json = loads_js_literal(r.text)
+        pages.append(pd.DataFrame(data_json))
+    big_df = pages.to_frame(ignore_index=True)
     big_df.columns = [
         "代码",
         "_",
@@ -172,10 +173,8 @@ def stock_zh_b_daily(
         return _fq_factor(adjust.split("-")[0])
 
     r = requests.get(zh_sina_a_stock_hist_url.format(symbol))
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(hk_js_decode)
-    dict_list = js_code.call(
-        "d", r.text.split("=")[1].split(";")[0].replace('"', "")
+    dict_list = sina_js_decode(
+        r.text.split("=")[1].split(";")[0].replace('"', "")
     )  # 执行js解密代码
     data_df = pd.DataFrame(dict_list)
     data_df.index = pd.to_datetime(data_df["date"]).dt.date
@@ -185,7 +184,9 @@ def stock_zh_b_daily(
 
     data_df = data_df.astype("float")
     r = requests.get(zh_sina_a_stock_amount_url.format(symbol, symbol))
-    amount_data_json = demjson.decode(r.text[r.text.find("[") : r.text.rfind("]") + 1])
+    amount_data_json = loads_js_literal(
+        r.text[r.text.find("[") : r.text.rfind("]") + 1]
+    )
     amount_data_df = pd.DataFrame(amount_data_json)
     amount_data_df.index = pd.to_datetime(amount_data_df.date)
     del amount_data_df["date"]
@@ -8,6 +8,7 @@ https://data.eastmoney.com/invest/invest/list.html
 
 import pandas as pd
 import requests
+from akshare.utils.func import PageAccumulator
 from akshare.utils.tqdm import get_tqdm
 from akshare.utils.cons import headers
 
@@ -38,14 +39,15 @@ def stock_analyst_rank_em(year: str = "2024") -> pd.DataFrame:
     r = requests.get(url, params=params, headers=headers)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
         r = requests.get(url, params=params, headers=headers)
         data_json = r.json()
         data_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, data_df], ignore_index=True)
+        pages.append(data_df)
+    big_df = pages.to_frame(ignore_index=True)
 
     big_df.reset_index(inplace=True)
     big_df["index"] = list(range(1, len(big_df) + 1))
@@ -14,27 +14,13 @@ from io import StringIO
 import pandas as pd
 import requests
 from bs4 import BeautifulSoup
-import py_mini_racer
 
-from akshare.datasets import get_ths_js
-from akshare.utils import demjson
+from akshare.utils.func import PageAccumulator
+from akshare.utils.ths_token import get_hexin_v
+from akshare.utils.js_literal import loads_js_literal
 from akshare.utils.tqdm import get_tqdm
 
 
-def _get_file_content_ths(file: str = "ths.js") -> str:
-    """
-    获取 JS 文件的内容
-    :param file:  JS 文件名
-    :type file: str
-    :return: 文件内容
-    :rtype: str
-    """
-    setting_file_path = get_ths_js(file)
-    with open(setting_file_path, encoding="utf-8") as f:
-        file_data = f.read()
-    return file_data
-
-
 @lru_cache()
 def _get_stock_board_concept_name_ths() -> dict:
     """
@@ -42,10 +28,7 @@ def _get_stock_board_concept_name_ths() -> dict:
     :return: 获取同花顺概念板块代码和名称字典
     :rtype: dict
     """
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
-    v_code = js_code.call("v")
+    v_code = get_hexin_v()
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/89.0.4389.90 Safari/537.36",
@@ -138,10 +121,7 @@ def stock_board_concept_index_ths(
     :return: 指数数据
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
-    v_code = js_code.call("v")
+    v_code = get_hexin_v()
 
     code_map = _get_stock_board_concept_name_ths()
     symbol_code = code_map[symbol]
@@ -153,7 +133,7 @@ def stock_board_concept_index_ths(
     r = requests.get(url=url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     inner_code = soup.find(name="input", attrs={"id": "clid"})["value"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     current_year = datetime.now().year
     begin_year = int(start_date[:4])
     tqdm = get_tqdm()
@@ -170,13 +150,14 @@ def stock_board_concept_index_ths(
         data_text = r.text
 
         try:
-            demjson.decode(data_text[data_text.find("{") : -1])
+            loads_js_literal(data_text[data_text.find("{") : -1])
         except:  # noqa: E722
             continue
-        temp_df = demjson.decode(data_text[data_text.find("{") : -1])
+        temp_df = loads_js_literal(data_text[data_text.find("{") : -1])
         temp_df = pd.DataFrame(temp_df["data"].split(";"))
         temp_df = temp_df.iloc[:, 0].str.split(",", expand=True)
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
 
     if len(big_df.columns) == 11:
         big_df.columns = [
@@ -239,10 +220,7 @@ def __stock_board_concept_summary_ths() -> Dict:
     :return: 概念时间表
     :rtype: dict
     """
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
-    v_code = js_code.call("v")
+    v_code = get_hexin_v()
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/89.0.4389.90 Safari/537.36",
@@ -277,10 +255,7 @@ def stock_board_concept_summary_ths() -> pd.DataFrame:
     :return: 概念时间表
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
-    v_code = js_code.call("v")
+    v_code = get_hexin_v()
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/89.0.4389.90 Safari/537.36",
@@ -290,16 +265,17 @@ def stock_board_concept_summary_ths() -> pd.DataFrame:
     r = requests.get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     page_num = soup.find(name="span", attrs={"class": "page_info"}).text.split("/")[1]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(page_num) + 1), leave=False):
         url = f"http://q.10jqka.com.cn/gn/index/field/addtime/order/desc/page/{page}/ajax/1/"
         r = requests.get(url, headers=headers)
         try:
             temp_df = pd.read_html(StringIO(r.text))[0]
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+            pages.append(temp_df)
         except ValueError:
             break
+    big_df = pages.to_frame(ignore_index=True)
     big_df["日期"] = pd.to_datetime(big_df["日期"], errors="coerce").dt.date
     big_df["成分股数量"] = pd.to_numeric(big_df["成分股数量"], errors="coerce")
     return big_df
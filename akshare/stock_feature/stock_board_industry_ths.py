@@ -13,27 +13,13 @@ from io import StringIO
 import pandas as pd
 import requests
 from bs4 import BeautifulSoup
-import py_mini_racer
 
-from akshare.datasets import get_ths_js
-from akshare.utils import demjson
+from akshare.utils.func import PageAccumulator
+from akshare.utils.ths_token import get_hexin_v
+from akshare.utils.js_literal import loads_js_literal
 from akshare.utils.tqdm import get_tqdm
 
 
-def _get_file_content_ths(file: str = "ths.js") -> str:
-    """
-    获取 JS 文件的内容
-    :param file:  JS 文件名
-    :type file: str
-    :return: 文件内容
-    :rtype: str
-    """
-    setting_file_path = get_ths_js(file)
-    with open(setting_file_path, encoding="utf-8") as f:
-        file_data = f.read()
-    return file_data
-
-
 @lru_cache()
 def _get_stock_board_industry_name_ths() -> dict:
     """
@@ -41,10 +27,7 @@ def _get_stock_board_industry_name_ths() -> dict:
     :return: 获取同花顺行业代码和名称字典
     :rtype: dict
     """
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
-    v_code = js_code.call("v")
+    v_code = get_hexin_v()
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/89.0.4389.90 Safari/537.36",
@@ -137,14 +120,11 @@ def stock_board_industry_index_ths(
     """
     code_map = _get_stock_board_industry_name_ths()
     symbol_code = code_map[symbol]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     current_year = datetime.now().year
     begin_year = int(start_date[:4])
     tqdm = get_tqdm()
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
-    v_code = js_code.call("v")
+    v_code = get_hexin_v()
     for year in tqdm(range(begin_year, current_year + 1), leave=False):
         url = f"https://d.10jqka.com.cn/v4/line/bk_{symbol_code}/01/{year}.js"
         headers = {
@@ -158,13 +138,14 @@ def stock_board_industry_index_ths(
         data_text = r.text
 
         try:
-            demjson.decode(data_text[data_text.find("{") : -1])
+            loads_js_literal(data_text[data_text.find("{") : -1])
         except:  # noqa: E722
             continue
-        temp_df = demjson.decode(data_text[data_text.find("{") : -1])
+        temp_df = loads_js_literal(data_text[data_text.find("{") : -1])
         temp_df = pd.DataFrame(temp_df["data"].split(";"))
         temp_df = temp_df.iloc[:, 0].str.split(",", expand=True)
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
 
     if len(big_df.columns) == 11:
         big_df.columns = [
@@ -226,10 +207,7 @@ def stock_xgsr_ths() -> pd.DataFrame:
     :return: 新股上市首日
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
-    v_code = js_code.call("v")
+    v_code = get_hexin_v()
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/89.0.4389.90 Safari/537.36",
@@ -240,11 +218,11 @@ def stock_xgsr_ths() -> pd.DataFrame:
     r = requests.get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     page_num = soup.find(name="span", attrs={"class": "page_info"}).text.split("/")[1]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(page_num) + 1), leave=False):
         url = f"https://data.10jqka.com.cn/ipo/xgsr/field/SSRQ/order/desc/page/{page}/ajax/1/free/1/"
-        v_code = js_code.call("v")
+        v_code = get_hexin_v()
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
             "Chrome/89.0.4389.90 Safari/537.36",
@@ -253,7 +231,8 @@ def stock_xgsr_ths() -> pd.DataFrame:
         }
         r = requests.get(url, headers=headers)
         temp_df = pd.read_html(StringIO(r.text))[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
 
     big_df.rename(columns={"发行价(元)": "发行价"}, inplace=True)
     big_df["序号"] = pd.to_numeric(big_df["序号"], errors="coerce")
@@ -278,10 +257,7 @@ def stock_ipo_benefit_ths() -> pd.DataFrame:
     :return: IPO受益股
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
-    v_code = js_code.call("v")
+    v_code = get_hexin_v()
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/89.0.4389.90 Safari/537.36",
@@ -292,11 +268,11 @@ def stock_ipo_benefit_ths() -> pd.DataFrame:
     r = requests.get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     page_num = soup.find(name="span", attrs={"class": "page_info"}).text.split("/")[1]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(page_num) + 1), leave=False):
         url = f"https://data.10jqka.com.cn/ipo/syg/field/invest/order/desc/page/{page}/ajax/1/free/1/"
-        v_code = js_code.call("v")
+        v_code = get_hexin_v()
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
             "Chrome/89.0.4389.90 Safari/537.36",
@@ -305,7 +281,8 @@ def stock_ipo_benefit_ths() -> pd.DataFrame:
         }
         r = requests.get(url, headers=headers)
         temp_df = pd.read_html(StringIO(r.text))[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
 
     big_df.columns = [
         "序号",
@@ -335,10 +312,7 @@ def stock_board_industry_summary_ths() -> pd.DataFrame:
     :return: 同花顺行业一览表
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
-    v_code = js_code.call("v")
+    v_code = get_hexin_v()
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/89.0.4389.90 Safari/537.36",
@@ -348,13 +322,14 @@ def stock_board_industry_summary_ths() -> pd.DataFrame:
     r = requests.get(url, headers=headers)
     soup = BeautifulSoup(r.text, features="lxml")
     page_num = soup.find(name="span", attrs={"class": "page_info"}).text.split("/")[1]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(page_num) + 1), leave=False):
         url = f"http://q.10jqka.com.cn/thshy/index/field/199112/order/desc/page/{page}/ajax/1/"
         r = requests.get(url, headers=headers)
         temp_df = pd.read_html(StringIO(r.text))[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
 
     big_df.columns = [
         "序号",
@@ -13,6 +13,8 @@ import requests
 from bs4 import BeautifulSoup
 from tqdm import tqdm
 
+from akshare.utils.func import PageAccumulator
+
 
 def stock_classify_board() -> dict:
     """
@@ -55,14 +57,14 @@ def stock_classify_sina(symbol: str = "热门概念") -> pd.DataFrame:
     :rtype: pandas.DataFrame
     """
     stock_classify_board_dict = stock_classify_board()
-    data_df = pd.DataFrame()
+    pages = PageAccumulator()
     for num in tqdm(range(len(stock_classify_board_dict[symbol]["code"])), leave=False):
         url = "http://vip.stock.finance.sina.com.cn/quotes_service/api/json_v2.php/Market_Center.getHQNodeStockCount"
         params = {"node": stock_classify_board_dict[symbol]["code"][num]}
         r = requests.get(url, params=params)
         page_num = math.ceil(int(r.json()) / 80)
         url = "http://vip.stock.finance.sina.com.cn/quotes_service/api/json_v2.php/Market_Center.getHQNodeData"
-        big_df = pd.DataFrame()
+        board_pages = PageAccumulator()
         for page in range(1, page_num + 1):
             params = {
                 "page": page,
@@ -76,9 +78,12 @@ def stock_classify_sina(symbol: str = "热门概念") -> pd.DataFrame:
             r = requests.get(url, params=params)
             data_json = r.json()
             temp_df = pd.DataFrame(data_json)
-            big_df = pd.concat([big_df, temp_df], ignore_index=True)
+            board_pages.append(temp_df)
+        big_df = board_pages.to_frame(ignore_index=True)
+        if not big_df.empty:
             big_df["class"] = stock_classify_board_dict[symbol]["name"][num]
-        data_df = pd.concat([data_df, big_df], ignore_index=True)
+        pages.append(big_df)
+    data_df = pages.to_frame(ignore_index=True)
     return data_df
 
 
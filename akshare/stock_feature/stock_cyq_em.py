@@ -1,223 +1,214 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/11/4 18:00
+Date: 2026/10/17 17:00
 Desc: 东方财富网-概念板-行情中心-日K-筹码分布
 https://quote.eastmoney.com/concept/sz000001.html
 """
 
 from datetime import datetime
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
-import py_mini_racer
 import requests
+from requests.adapters import HTTPAdapter
 
+from akshare.utils.func import run_batch
+from akshare.utils.ratelimit import get_rate_limiter
+from akshare.utils.request import request_with_retry
 
-def stock_cyq_em(symbol: str = "000001", adjust: str = "") -> pd.DataFrame:
+# 价格区间的分档数量, 与网页端 CYQCalculator 的 factor 一致
+_CYQ_FACTOR = 150
+
+
+def _to_precision(values: np.ndarray, digits: int = 12) -> np.ndarray:
     """
-    东方财富网-概念板-行情中心-日K-筹码分布
-    https://quote.eastmoney.com/concept/sz000001.html
-    :param symbol: 股票代码
-    :type symbol: str
-    :param adjust: choice of {"qfq": "前复权", "hfq": "后复权", "": "不复权"}
-    :type adjust: str
-    :return: 筹码分布
-    :rtype: pandas.DataFrame
+    保留有效数字, 对应 JS 的 Number.prototype.toPrecision(digits) / 1
     """
-    html_str = """
-    // @ts-nocheck
+    with np.errstate(divide="ignore", invalid="ignore"):
+        exponent = np.floor(np.log10(np.abs(values)))
+    exponent = np.clip(np.nan_to_num(exponent, posinf=0, neginf=0), -280, 280)
+    shift = digits - 1 - exponent
+    # 10 的整数次幂在 22 以内可精确表示, 按移位方向选择乘或除
+    power = np.power(10.0, np.abs(shift))
+    rounded = np.round(np.where(shift >= 0, values * power, values / power))
+    return np.where(shift >= 0, rounded / power, rounded * power)
 
-    /**
-     * 计算分布及相关指标
-     * @param {number} index 当前选中的K线的索引
-     * @return {{x: Array.<number>, y: Array.<number>}}
-     */
-    /**
-    this.range = 120;
-    */
-    function CYQCalculator(index, klinedata) {
-        var maxprice = 0;
-        var minprice = 0;
-        var factor = 150;
-        var start = this.range ? Math.max(0, index - this.range + 1) : 0;
-        /**
-         * K图数据[time,open,close,high,low,volume,amount,amplitude,turnoverRate]
-         */
-        var kdata = klinedata.slice(start, Math.max(1, index + 1));
-        if (kdata.length === 0) throw 'invaild index';
-        for (var i = 0; i < kdata.length; i++) {
-            var elements = kdata[i];
-            maxprice = !maxprice ? elements.high : Math.max(maxprice, elements.high);
-            minprice = !minprice ? elements.low : Math.min(minprice, elements.low);
-        }
 
-        // 精度不小于0.01 产品逻辑
-        var accuracy = Math.max(0.01, (maxprice - minprice) / (factor - 1));
-        /**
-         * 值域
-         * @type {Array.<number>}
-         */
-        var yrange = [];
-        for (var i = 0; i < factor; i++) {
-            yrange.push((minprice + accuracy * i).toFixed(2) / 1);
-        }
-        /**
-         * 横轴数据
-         */
-        var xdata = createNumberArray(factor);
-
-        for (var i = 0; i < kdata.length; i++) {
-            var eles = kdata[i];
+def _to_fixed(values: np.ndarray, digits: int = 2) -> np.ndarray:
+    """
+    对应 JS 的 Number.prototype.toFixed(digits) / 1, 按二进制精确值舍入, 恰好一半时进位
+    """
+    values = np.asarray(values, dtype=float)
+    scale = 10.0**digits
+    scaled = values * scale
+    result = np.floor(scaled + 0.5)
+    # 乘法有舍入误差, 接近一半的值按精确的十进制值处理
+    quantum = Decimal(1).scaleb(-digits)
+    for pos in np.flatnonzero(np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6):
+        exact = Decimal(float(values[pos])).quantize(quantum, rounding=ROUND_HALF_UP)
+        result[pos] = float(exact.scaleb(digits))
+    return result / scale
 
-            var open = eles.open,
-                close = eles.close,
-                high = eles.high,
-                low = eles.low,
-                avg = (open + close + high + low) / 4,
-                turnoverRate = Math.min(1, eles.hsl / 100 || 0);
 
-            var H = Math.floor((high - minprice) / accuracy),
-                L = Math.ceil((low - minprice) / accuracy),
-                // G点坐标, 一字板时, X为进度因子
-                GPoint = [high == low ? factor - 1 : 2 / (high - low), Math.floor((avg - minprice) / accuracy)];
-            // 衰减
-            for (var n = 0; n < xdata.length; n++) {
-                xdata[n] *= (1 - turnoverRate);
-            }
+def _cyq_price_bounds(
+    high: np.ndarray, low: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    每个交易日的筹码价格区间, 即第一根 K 线到当日的最高价和最低价
+    与网页端一致, 累计值为 0 或缺失时从当日重新开始
+    :return: 最高价和最低价
+    :rtype: tuple
+    """
+    max_array = np.empty(len(high))
+    min_array = np.empty(len(low))
+    max_price = min_price = 0.0
+    for i, (high_price, low_price) in enumerate(zip(high.tolist(), low.tolist())):
+        # JS 中 !NaN 为 true, Math.max 和 Math.min 遇到 NaN 返回 NaN
+        if not max_price or max_price != max_price:
+            max_price = high_price
+        else:
+            max_price = (
+                max(max_price, high_price) if high_price == high_price else np.nan
+            )
+        if not min_price or min_price != min_price:
+            min_price = low_price
+        else:
+            min_price = min(min_price, low_price) if low_price == low_price else np.nan
+        max_array[i] = max_price
+        min_array[i] = min_price
+    return max_array, min_array
 
-            if (high == low) {
-                // 一字板时，画矩形面积是三角形的2倍
-                xdata[GPoint[1]] += GPoint[0] * turnoverRate / 2;
-            } else {
-                for (var j = L; j <= H; j++) {
-                    var curprice = minprice + accuracy * j;
-                    if (curprice <= avg) {
-                        // 上半三角叠加分布分布
-                        if (Math.abs(avg - low) < 1e-8) {
-                            xdata[j] += GPoint[0] * turnoverRate;
-                        } else {
-                            xdata[j] += (curprice - low) / (avg - low) * GPoint[0] * turnoverRate;
-                        }
-                    } else {
-                        // 下半三角叠加分布分布
-                        if (Math.abs(high - avg) < 1e-8) {
-                            xdata[j] += GPoint[0] * turnoverRate;
-                        } else {
-                            xdata[j] += (high - curprice) / (high - avg) * GPoint[0] * turnoverRate;
-                        }
-                    }
-                }
-            }
 
-        }
+def _cyq_chips(
+    bars: Tuple[np.ndarray, ...], min_price: float, accuracy: float
+) -> np.ndarray:
+    """
+    K 线在价格网格上新增的筹码, 每根 K 线的成交按三角形分布在最低价与最高价之间
+    :param bars: 开盘价, 收盘价, 最高价, 最低价, 换手率, 均为一维数组
+    :type bars: tuple
+    :param min_price: 网格的最低价
+    :type min_price: float
+    :param accuracy: 网格的价格间隔
+    :type accuracy: float
+    :return: 形状为 (K 线数量, _CYQ_FACTOR) 的筹码增量
+    :rtype: numpy.ndarray
+    """
+    open_, close, high, low, turnover = (item[:, None] for item in bars)
+    grid_index = np.arange(_CYQ_FACTOR)
+    cur_price = min_price + accuracy * grid_index
+    avg = (open_ + close + high + low) / 4
+    with np.errstate(divide="ignore", invalid="ignore"):
+        upper_index = np.floor((high - min_price) / accuracy)
+        lower_index = np.ceil((low - min_price) / accuracy)
+        flat_index = np.floor((avg - min_price) / accuracy)
+        g_point = 2 / (high - low)
+        rise = np.where(
+            np.abs(avg - low) < 1e-8,
+            g_point * turnover,
+            (cur_price - low) / (avg - low) * g_point * turnover,
+        )
+        fall = np.where(
+            np.abs(high - avg) < 1e-8,
+            g_point * turnover,
+            (high - cur_price) / (high - avg) * g_point * turnover,
+        )
+    flat = high == low
+    in_range = (grid_index >= lower_index) & (grid_index <= upper_index) & ~flat
+    chips = np.where(in_range, np.where(cur_price <= avg, rise, fall), 0.0)
+    # 一字板时, 矩形面积是三角形的 2 倍
+    return np.where(
+        flat & (grid_index == flat_index),
+        (_CYQ_FACTOR - 1) * turnover / 2,
+        chips,
+    )
 
 
-        var currentprice = klinedata[index].close;
-        var totalChips = 0;
-        for (var i = 0; i < factor; i++) {
-            var x = xdata[i].toPrecision(12) / 1;
-            //if (x < 0) xdata[i] = 0;
-            totalChips += x;
-        }
-        var result = new CYQData();
-        result.x = xdata;
-        result.y = yrange;
-        result.benefitPart = result.getBenefitPart(currentprice);
-        result.avgCost = getCostByChip(totalChips * 0.5).toFixed(2);
-        result.percentChips = {
-            '90': result.computePercentChips(0.9),
-            '70': result.computePercentChips(0.7)
-        };
-        return result;
+def _stock_cyq_calc(temp_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    筹码分布指标, 与网页端 CYQCalculator 逐日计算的结果一致
+    价格网格只在出现新的最高价或最低价时变化; 网格不变时在前一日的分布上衰减并叠加当日筹码,
+    网格变化时用各 K 线筹码增量与换手衰减系数的矩阵乘积一次重建
+    :param temp_df: 日 K 线, 需要 date, open, close, high, low, hsl 字段
+    :type temp_df: pandas.DataFrame
+    :return: 每个交易日的筹码分布指标
+    :rtype: pandas.DataFrame
+    """
+    open_, close, high, low, hsl = (
+        temp_df[item].to_numpy(dtype=float)
+        for item in ["open", "close", "high", "low", "hsl"]
+    )
+    turnover = np.minimum(1, np.nan_to_num(hsl / 100, nan=0.0))
+    decay = 1 - turnover
+    bars = (open_, close, high, low, turnover)
+    max_array, min_array = _cyq_price_bounds(high, low)
+    accuracy_array = np.maximum(0.01, (max_array - min_array) / (_CYQ_FACTOR - 1))
+    chips_matrix = np.zeros((len(temp_df), _CYQ_FACTOR))
+    chips = np.zeros(_CYQ_FACTOR)
+    for i in range(len(temp_df)):
+        min_price, accuracy = min_array[i], accuracy_array[i]
+        if i and min_price == min_array[i - 1] and accuracy == accuracy_array[i - 1]:
+            today_bar = tuple(item[i : i + 1] for item in bars)
+            chips = chips * decay[i] + _cyq_chips(today_bar, min_price, accuracy)[0]
+        else:
+            weight = np.ones(i + 1)
+            weight[:-1] = np.cumprod(decay[i:0:-1])[::-1]
+            history_bars = tuple(item[: i + 1] for item in bars)
+            chips = weight @ _cyq_chips(history_bars, min_price, accuracy)
+        chips_matrix[i] = chips
+    chips_matrix = _to_precision(chips_matrix)
+    # 与网页端相同, 按价格从低到高顺序累加
+    cum_chips = np.cumsum(chips_matrix, axis=1)
+    total_chips = cum_chips[:, -1]
+    grid_price = min_array[:, None] + np.arange(_CYQ_FACTOR) * accuracy_array[:, None]
+    below_chips = np.cumsum(
+        np.where(close[:, None] >= grid_price, chips_matrix, 0.0), axis=1
+    )[:, -1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        benefit_part = np.where(total_chips == 0, 0.0, below_chips / total_chips)
 
-        /**
-         * 获取指定筹码处的成本
-         * @param {number} chip 堆叠筹码
-         */
-        function getCostByChip(chip) {
-            var result = 0,
-                sum = 0;
-            for (var i = 0; i < factor; i++) {
-                var x = xdata[i].toPrecision(12) / 1;
-                if (sum + x > chip) {
-                    result = minprice + i * accuracy;
-                    break;
-                }
-                sum += x;
-            }
-            return result;
-        }
+    def _cost_by_chip(chip: np.ndarray) -> np.ndarray:
+        hit = cum_chips > chip[:, None]
+        cost = min_array + hit.argmax(axis=1) * accuracy_array
+        return np.where(hit.any(axis=1), cost, 0.0)
 
-        /**
-         * 筹码分布数据
-         */
-        function CYQData() {
-            /**
-             * 筹码堆叠
-             * @type {Array.<number>}
-             */
-            this.x = arguments[0];
-            /**
-             * 价格分布
-             * @type {Array.<number>}
-             */
-            this.y = arguments[1];
-            /**
-             * 获利比例
-             * @type {number}
-             */
-            this.benefitPart = arguments[2];
-            /**
-             * 平均成本
-             * @type {number}
-             */
-            this.avgCost = arguments[3];
-            /**
-             * 百分比筹码
-             * @type {{Object.<string, {{priceRange: number[], concentration: number}}>}}
-             */
-            this.percentChips = arguments[4];
-            /**
-             * 计算指定百分比的筹码
-             * @param {number} percent 百分比大于0，小于1
-             */
-            this.computePercentChips = function (percent) {
-                if (percent > 1 || percent < 0) throw 'argument "percent" out of range';
-                var ps = [(1 - percent) / 2, (1 + percent) / 2];
-                var pr = [getCostByChip(totalChips * ps[0]), getCostByChip(totalChips * ps[1])];
-                return {
-                    priceRange: [pr[0].toFixed(2), pr[1].toFixed(2)],
-                    concentration: pr[0] + pr[1] === 0 ? 0 : (pr[1] - pr[0]) / (pr[0] + pr[1])
-                };
-            };
-            /**
-             * 获取指定价格的获利比例
-             * @param {number} price 价格
-             */
-            this.getBenefitPart = function (price) {
-                var below = 0;
-                for (var i = 0; i < factor; i++) {
-                    var x = xdata[i].toPrecision(12) / 1;
-                    if (price >= minprice + i * accuracy) {
-                        below += x;
-                    }
-                }
-                return totalChips == 0 ? 0 : below / totalChips;
-            };
-        }
+    result = {
+        "日期": pd.to_datetime(temp_df["date"], errors="coerce").dt.date.to_numpy(),
+        "获利比例": benefit_part,
+        "平均成本": _to_fixed(_cost_by_chip(total_chips * 0.5)),
     }
+    for percent in [0.9, 0.7]:
+        low_cost = _cost_by_chip(total_chips * ((1 - percent) / 2))
+        high_cost = _cost_by_chip(total_chips * ((1 + percent) / 2))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            concentration = np.where(
+                low_cost + high_cost == 0,
+                0.0,
+                (high_cost - low_cost) / (low_cost + high_cost),
+            )
+        label = round(percent * 100)
+        result[f"{label}成本-低"] = _to_fixed(low_cost)
+        result[f"{label}成本-高"] = _to_fixed(high_cost)
+        result[f"{label}集中度"] = concentration
+    return pd.DataFrame(result)
 
 
-    function createNumberArray(count) {
-        var array = [];
-        for (var i = 0; i < count; i++) {
-            array.push(0);
-        }
-        return array;
-    }
+def _stock_cyq_em_params(
+    symbol: str = "000001", adjust: str = "", lmt: int = 210
+) -> Tuple[str, Dict]:
+    """
+    东方财富网-概念板-行情中心-日K-筹码分布-请求地址和参数
+    :param symbol: 股票代码
+    :type symbol: str
+    :param adjust: choice of {"qfq": "前复权", "hfq": "后复权", "": "不复权"}
+    :type adjust: str
+    :param lmt: 参与计算的日 K 线数量
+    :type lmt: int
+    :return: 请求地址和参数
+    :rtype: tuple
     """
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(html_str)
     adjust_dict = {"qfq": "1", "hfq": "2", "": "0"}
     market_code = 1 if symbol.startswith("6") else 0
     url = "https://push2his.eastmoney.com/api/qt/stock/kline/get"
@@ -228,10 +219,23 @@ def stock_cyq_em(symbol: str = "000001", adjust: str = "") -> pd.DataFrame:
         "klt": "101",
         "fqt": adjust_dict[adjust],
         "end": datetime.now().date().strftime("%Y%m%d"),
-        "lmt": "210",
+        "lmt": str(lmt),
     }
-    r = requests.get(url, params=params)
-    data_json = r.json()
+    return url, params
+
+
+def _stock_cyq_em_parse(data_json: Dict, days: int = 90) -> pd.DataFrame:
+    """
+    东方财富网-概念板-行情中心-日K-筹码分布-解析日 K 线并计算筹码分布
+    :param data_json: 接口返回的 JSON 数据
+    :type data_json: dict
+    :param days: 返回最近的交易日数量; None 表示返回全部
+    :type days: int
+    :return: 筹码分布
+    :rtype: pandas.DataFrame
+    """
+    if not (data_json["data"] and data_json["data"]["klines"]):
+        return pd.DataFrame()
     temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
     temp_df.columns = [
         "date",
@@ -247,67 +251,104 @@ def stock_cyq_em(symbol: str = "000001", adjust: str = "") -> pd.DataFrame:
         "hsl",
     ]
     for item in temp_df.columns[1:]:
-        temp_df[item] = pd.to_numeric(temp_df[item])
-    temp_df["index"] = range(0, len(temp_df))
-    records = temp_df.to_dict(orient="records")
-    date_list = []
-    benefit_part = []
-    avg_cost = []
-    pct_70_low = []
-    pct_70_high = []
-    pct_90_low = []
-    pct_90_high = []
-    pct_70_con = []
-    pct_90_con = []
-    for i in range(0, len(records)):
-        mcode = js_code.call("CYQCalculator", i, records)
-        date_list.append(records[i]["date"])
-        benefit_part.append(mcode["benefitPart"])
-        avg_cost.append(mcode["avgCost"])
-        pct_70_low.append(mcode["percentChips"]["70"]["priceRange"][0])
-        pct_70_high.append(mcode["percentChips"]["70"]["priceRange"][1])
-        pct_90_low.append(mcode["percentChips"]["90"]["priceRange"][0])
-        pct_90_high.append(mcode["percentChips"]["90"]["priceRange"][1])
-        pct_70_con.append(mcode["percentChips"]["70"]["concentration"])
-        pct_90_con.append(mcode["percentChips"]["90"]["concentration"])
-    temp_df = pd.DataFrame(
-        [
-            date_list,
-            benefit_part,
-            avg_cost,
-            pct_90_low,
-            pct_90_high,
-            pct_90_con,
-            pct_70_low,
-            pct_70_high,
-            pct_70_con,
-        ]
-    ).T
-    temp_df.columns = [
-        "日期",
-        "获利比例",
-        "平均成本",
-        "90成本-低",
-        "90成本-高",
-        "90集中度",
-        "70成本-低",
-        "70成本-高",
-        "70集中度",
-    ]
-    temp_df["日期"] = pd.to_datetime(temp_df["日期"], errors="coerce").dt.date
-    temp_df["获利比例"] = pd.to_numeric(temp_df["获利比例"], errors="coerce")
-    temp_df["平均成本"] = pd.to_numeric(temp_df["平均成本"], errors="coerce")
-    temp_df["90成本-低"] = pd.to_numeric(temp_df["90成本-低"], errors="coerce")
-    temp_df["90成本-高"] = pd.to_numeric(temp_df["90成本-高"], errors="coerce")
-    temp_df["90集中度"] = pd.to_numeric(temp_df["90集中度"], errors="coerce")
-    temp_df["70成本-低"] = pd.to_numeric(temp_df["70成本-低"], errors="coerce")
-    temp_df["70成本-高"] = pd.to_numeric(temp_df["70成本-高"], errors="coerce")
-    temp_df["70集中度"] = pd.to_numeric(temp_df["70集中度"], errors="coerce")
-    temp_df = temp_df.iloc[-90:, :].copy()
+        temp_df[item] = pd.to_numeric(temp_df[item], errors="coerce")
+    temp_df = _stock_cyq_calc(temp_df)
+    if days is not None:
+        temp_df = temp_df.iloc[-days:, :].copy()
     temp_df.reset_index(inplace=True, drop=True)
     return temp_df
 
 
+def stock_cyq_em(
+    symbol: str = "000001", adjust: str = "", lmt: int = 210, days: int = 90
+) -> pd.DataFrame:
+    """
+    东方财富网-概念板-行情中心-日K-筹码分布
+    https://quote.eastmoney.com/concept/sz000001.html
+    :param symbol: 股票代码
+    :type symbol: str
+    :param adjust: choice of {"qfq": "前复权", "hfq": "后复权", "": "不复权"}
+    :type adjust: str
+    :param lmt: 参与计算的日 K 线数量; 网页端为 210
+    :type lmt: int
+    :param days: 返回最近的交易日数量; None 表示返回全部
+    :type days: int
+    :return: 筹码分布
+    :rtype: pandas.DataFrame
+    """
+    url, params = _stock_cyq_em_params(symbol, adjust, lmt)
+    r = requests.get(url, params=params)
+    data_json = r.json()
+    return _stock_cyq_em_parse(data_json, days)
+
+
+def stock_cyq_em_batch(
+    symbol: List[str],
+    adjust: str = "",
+    lmt: int = 210,
+    days: int = 90,
+    max_workers: int = 8,
+    rate: float = 10,
+    max_retries: int = 3,
+    timeout: float = 15,
+) -> pd.DataFrame:
+    """
+    东方财富网-概念板-行情中心-日K-筹码分布-批量获取
+    https://quote.eastmoney.com/concept/sz000001.html
+    :param symbol: 股票代码列表
+    :type symbol: list
+    :param adjust: choice of {"qfq": "前复权", "hfq": "后复权", "": "不复权"}
+    :type adjust: str
+    :param lmt: 参与计算的日 K 线数量
+    :type lmt: int
+    :param days: 每只股票返回最近的交易日数量; None 表示返回全部
+    :type days: int
+    :param max_workers: 并发线程数
+    :type max_workers: int
+    :param rate: 每秒最多请求数
+    :type rate: float
+    :param max_retries: 单个股票的最大重试次数
+    :type max_retries: int
+    :param timeout: 请求超时时间
+    :type timeout: float
+    :return: 长格式的筹码分布, 各股票按输入顺序排列; 获取失败的股票及原因记录在 attrs["failed"] 中
+    :rtype: pandas.DataFrame
+    """
+    symbol_list = [symbol] if isinstance(symbol, str) else list(symbol)
+    limiter = get_rate_limiter(
+        "https://push2his.eastmoney.com/api/qt/stock/kline/get", rate=rate
+    )
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+    session.mount("https://", adapter)
+
+    def _fetch(item: str) -> pd.DataFrame:
+        url, params = _stock_cyq_em_params(item, adjust, lmt)
+        r = request_with_retry(
+            url,
+            params=params,
+            timeout=timeout,
+            max_retries=max_retries,
+            session=session,
+            limiter=limiter,
+        )
+        temp_df = _stock_cyq_em_parse(r.json(), days)
+        temp_df.insert(0, "代码", item)
+        return temp_df
+
+    with session:
+        result_dict, failed_dict = run_batch(
+            symbol_list, _fetch, max_workers=max_workers
+        )
+    frames = list(result_dict.values())
+    big_df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    big_df.attrs["failed"] = failed_dict
+    return big_df
+
+
 if __name__ == "__main__":
     stock_cyq_em_df = stock_cyq_em(symbol="000001", adjust="")
     print(stock_cyq_em_df)
+
+    stock_cyq_em_batch_df = stock_cyq_em_batch(symbol=["000001", "600000"])
+    print(stock_cyq_em_batch_df)
@@ -12,6 +12,7 @@ from functools import lru_cache
 import pandas as pd
 import requests
 
+from akshare.utils.func import PageAccumulator
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -145,14 +146,15 @@ def stock_zh_a_disclosure_report_cninfo(
     r = requests.post(url, params=payload)
     text_json = r.json()
     page_num = math.ceil(int(text_json["totalAnnouncement"]) / 30)
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, page_num + 1), leave=False):
         payload.update({"pageNum": page})
         r = requests.post(url, data=payload)
         text_json = r.json()
         temp_df = pd.DataFrame(text_json["announcements"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.rename(
         columns={
             "secCode": "代码",
@@ -240,14 +242,15 @@ def stock_zh_a_disclosure_relation_cninfo(
     r = requests.post(url, data=payload)
     text_json = r.json()
     page_num = math.ceil(int(text_json["totalAnnouncement"]) / 30)
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, page_num + 1), leave=False):
         payload.update({"pageNum": page})
         r = requests.post(url, data=payload)
         text_json = r.json()
         temp_df = pd.DataFrame(text_json["announcements"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.rename(
         columns={
             "secCode": "代码",
@@ -12,6 +12,7 @@ https://data.eastmoney.com/xg/xg/default_2.html
 import pandas as pd
 import requests
 
+from akshare.utils.func import PageAccumulator
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -39,14 +40,15 @@ def stock_dxsyl_em() -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"pageNumber": page})
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df.index + 1
     big_df.rename(
@@ -157,14 +159,15 @@ def stock_xgsglb_em(symbol: str = "全部股票") -> pd.DataFrame:
         r = requests.get(url, params=params)
         data_json = r.json()
         total_page = data_json["result"]["pages"]
-        big_df = pd.DataFrame()
+        big_pages = PageAccumulator()
         tqdm = get_tqdm()
         for page in tqdm(range(1, 1 + int(total_page)), leave=False):
             params.update({"pageNumber": page})
             r = requests.get(url, params=params)
             data_json = r.json()
             temp_df = pd.DataFrame(data_json["result"]["data"])
-            big_df = pd.concat([big_df, temp_df], ignore_index=True)
+            big_pages.append(temp_df)
+        big_df = big_pages.to_frame(ignore_index=True)
 
         big_df.rename(
             columns={
@@ -293,14 +296,15 @@ def stock_xgsglb_em(symbol: str = "全部股票") -> pd.DataFrame:
         r = requests.get(url, params=params)
         data_json = r.json()
         total_page = data_json["result"]["pages"]
-        big_df = pd.DataFrame()
+        big_pages = PageAccumulator()
         tqdm = get_tqdm()
         for page in tqdm(range(1, total_page + 1), leave=False):
             params.update({"pageNumber": page})
             r = requests.get(url, params=params)
             data_json = r.json()
             temp_df = pd.DataFrame(data_json["result"]["data"])
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+            big_pages.append(temp_df)
+        big_df = big_pages.to_frame(ignore_index=True)
         big_df.rename(
             columns={
                 "SECURITY_CODE": "股票代码",
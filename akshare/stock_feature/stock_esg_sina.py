@@ -7,6 +7,7 @@ https://finance.sina.com.cn/esg/
 """
 
 import math
+from akshare.utils.func import PageAccumulator
 from akshare.utils.tqdm import get_tqdm
 
 import pandas as pd
@@ -24,7 +25,7 @@ def stock_esg_msci_sina() -> pd.DataFrame:
     r = requests.get(url)
     data_json = r.json()
     page_num = math.ceil(int(data_json["result"]["data"]["total"]) / 100)
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, page_num + 1), leave=False):
         headers = {
@@ -36,7 +37,8 @@ def stock_esg_msci_sina() -> pd.DataFrame:
         r = requests.get(url, headers=headers)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
 
     big_df.rename(
         columns={
@@ -175,7 +177,7 @@ def stock_esg_rate_sina() -> pd.DataFrame:
     r = requests.get(url)
     data_json = r.json()
     page_num = math.ceil(int(data_json["result"]["data"]["info"]["total"]) / 200)
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, page_num + 1), leave=False):
         url = f"https://global.finance.sina.com.cn/api/openapi.php/EsgService.getEsgStocks?page={page}&num=200"
@@ -192,7 +194,8 @@ def stock_esg_rate_sina() -> pd.DataFrame:
             temp_df["market"] = data_json["result"]["data"]["info"]["stocks"][num][
                 "market"
             ]
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+            pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
 
     big_df.rename(
         columns={
@@ -276,14 +279,15 @@ def stock_esg_hz_sina() -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     total_page = math.ceil(int(data_json["result"]["data"]["total"]) / 100)
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params = {"p": str(page), "num": "100"}
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
 
     big_df.rename(
         columns={
@@ -9,6 +9,7 @@ https://data.eastmoney.com/yjfp/
 import pandas as pd
 import requests
 
+from akshare.utils.func import PageAccumulator
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -43,14 +44,15 @@ def stock_fhps_em(date: str = "20231231") -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     total_pages = int(data_json["result"]["pages"])
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_pages + 1), leave=False):
         params.update({"pageNumber": page})
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
 
     big_df.columns = [
         "_",
@@ -165,14 +167,15 @@ def stock_fhps_detail_em(symbol: str = "300073") -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     total_pages = int(data_json["result"]["pages"])
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_pages + 1), leave=False):
         params.update({"pageNumber": page})
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
 
     big_df.columns = [
         "_",
@@ -18,24 +18,10 @@ from io import StringIO
 import pandas as pd
 import requests
 from bs4 import BeautifulSoup
-import py_mini_racer
+from akshare.utils.func import PageAccumulator
 from akshare.utils.tqdm import get_tqdm
 
-from akshare.datasets import get_ths_js
-
-
-def _get_file_content_ths(file: str = "ths.js") -> str:
-    """
-    获取 JS 文件的内容
-    :param file:  JS 文件名
-    :type file: str
-    :return: 文件内容
-    :rtype: str
-    """
-    setting_file_path = get_ths_js(file)
-    with open(setting_file_path, encoding="utf-8") as f:
-        file_data = f.read()
-    return file_data
+from akshare.utils.ths_token import get_hexin_v
 
 
 def stock_fund_flow_individual(symbol: str = "即时") -> pd.DataFrame:
@@ -47,10 +33,7 @@ def stock_fund_flow_individual(symbol: str = "即时") -> pd.DataFrame:
     :return: 个股资金流
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
-    v_code = js_code.call("v")
+    v_code = get_hexin_v()
     headers = {
         "Accept": "text/html, */*; q=0.01",
         "Accept-Encoding": "gzip, deflate",
@@ -80,13 +63,10 @@ def stock_fund_flow_individual(symbol: str = "即时") -> pd.DataFrame:
         url = "http://data.10jqka.com.cn/funds/ggzjl/board/20/field/zdf/order/desc/page/{}/ajax/1/free/1/"
     else:
         url = "http://data.10jqka.com.cn/funds/ggzjl/field/zdf/order/desc/page/{}/ajax/1/free/1/"
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(page_num) + 1), leave=False):
-        js_code = py_mini_racer.MiniRacer()
-        js_content = _get_file_content_ths("ths.js")
-        js_code.eval(js_content)
-        v_code = js_code.call("v")
+        v_code = get_hexin_v()
         headers = {
             "Accept": "text/html, */*; q=0.01",
             "Accept-Encoding": "gzip, deflate",
@@ -103,7 +83,8 @@ def stock_fund_flow_individual(symbol: str = "即时") -> pd.DataFrame:
         }
         r = requests.get(url.format(page), headers=headers)
         temp_df = pd.read_html(StringIO(r.text))[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
 
     del big_df["序号"]
     big_df.reset_index(inplace=True)
@@ -143,10 +124,7 @@ def stock_fund_flow_concept(symbol: str = "即时") -> pd.DataFrame:
     :return: 概念资金流
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
-    v_code = js_code.call("v")
+    v_code = get_hexin_v()
     headers = {
         "Accept": "text/html, */*; q=0.01",
         "Accept-Encoding": "gzip, deflate",
@@ -178,13 +156,10 @@ def stock_fund_flow_concept(symbol: str = "即时") -> pd.DataFrame:
         url = "http://data.10jqka.com.cn/funds/gnzjl/board/20/field/tradezdf/order/desc/page/{}/ajax/1/free/1/"
     else:
         url = "http://data.10jqka.com.cn/funds/gnzjl/field/tradezdf/order/desc/page/{}/ajax/1/free/1/"
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(page_num) + 1), leave=False):
-        js_code = py_mini_racer.MiniRacer()
-        js_content = _get_file_content_ths("ths.js")
-        js_code.eval(js_content)
-        v_code = js_code.call("v")
+        v_code = get_hexin_v()
         headers = {
             "Accept": "text/html, */*; q=0.01",
             "Accept-Encoding": "gzip, deflate",
@@ -201,7 +176,8 @@ def stock_fund_flow_concept(symbol: str = "即时") -> pd.DataFrame:
         }
         r = requests.get(url.format(page), headers=headers)
         temp_df = pd.read_html(StringIO(r.text))[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
 
     del big_df["序号"]
     big_df.reset_index(inplace=True)
@@ -249,10 +225,7 @@ def stock_fund_flow_industry(symbol: str = "即时") -> pd.DataFrame:
     :return: 行业资金流
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
-    v_code = js_code.call("v")
+    v_code = get_hexin_v()
     headers = {
         "Accept": "text/html, */*; q=0.01",
         "Accept-Encoding": "gzip, deflate",
@@ -284,13 +257,10 @@ def stock_fund_flow_industry(symbol: str = "即时") -> pd.DataFrame:
         url = "http://data.10jqka.com.cn/funds/hyzjl/board/20/field/tradezdf/order/desc/page/{}/ajax/1/free/1/"
     else:
         url = "http://data.10jqka.com.cn/funds/hyzjl/field/tradezdf/order/desc/page/{}/ajax/1/free/1/"
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(page_num) + 1), leave=False):
-        js_code = py_mini_racer.MiniRacer()
-        js_content = _get_file_content_ths("ths.js")
-        js_code.eval(js_content)
-        v_code = js_code.call("v")
+        v_code = get_hexin_v()
         headers = {
             "Accept": "text/html, */*; q=0.01",
             "Accept-Encoding": "gzip, deflate",
@@ -307,7 +277,8 @@ def stock_fund_flow_industry(symbol: str = "即时") -> pd.DataFrame:
         }
         r = requests.get(url.format(page), headers=headers)
         temp_df = pd.read_html(StringIO(r.text))[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
 
     del big_df["序号"]
     big_df.reset_index(inplace=True)
@@ -353,10 +324,7 @@ def stock_fund_flow_big_deal() -> pd.DataFrame:
     :return: 大单追踪
     :rtype: pandas.DataFrame
     """
-    js_code = py_mini_racer.MiniRacer()
-    js_content = _get_file_content_ths("ths.js")
-    js_code.eval(js_content)
-    v_code = js_code.call("v")
+    v_code = get_hexin_v()
     headers = {
         "Accept": "text/html, */*; q=0.01",
         "Accept-Encoding": "gzip, deflate",
@@ -377,13 +345,10 @@ def stock_fund_flow_big_deal() -> pd.DataFrame:
     raw_page = soup.find(name="span", attrs={"class": "page_info"}).text
     page_num = raw_page.split("/")[1]
     url = "http://data.10jqka.com.cn/funds/ddzz/order/asc/page/{}/ajax/1/free/1/"
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(page_num) + 1), leave=False):
-        js_code = py_mini_racer.MiniRacer()
-        js_content = _get_file_content_ths("ths.js")
-        js_code.eval(js_content)
-        v_code = js_code.call("v")
+        v_code = get_hexin_v()
         headers = {
             "Accept": "text/html, */*; q=0.01",
             "Accept-Encoding": "gzip, deflate",
@@ -400,7 +365,8 @@ def stock_fund_flow_big_deal() -> pd.DataFrame:
         }
         r = requests.get(url.format(page), headers=headers)
         temp_df = pd.read_html(StringIO(r.text))[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
 
     big_df.columns = [
         "成交时间",
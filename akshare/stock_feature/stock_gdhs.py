@@ -9,6 +9,7 @@ https://data.eastmoney.com/gdhs/
 import pandas as pd
 import requests
 
+from akshare.utils.func import PageAccumulator
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -54,7 +55,7 @@ def stock_zh_a_gdhs(symbol: str = "20230930") -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     total_page_num = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page_num in tqdm(range(1, total_page_num + 1), leave=False):
         params.update(
@@ -65,7 +66,8 @@ def stock_zh_a_gdhs(symbol: str = "20230930") -> pd.DataFrame:
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.columns = [
         "代码",
         "名称",
@@ -154,7 +156,7 @@ def stock_zh_a_gdhs_detail_em(symbol: str = "000001") -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     total_page_num = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page_num in tqdm(range(1, total_page_num + 1), leave=False):
         params.update(
@@ -165,7 +167,8 @@ def stock_zh_a_gdhs_detail_em(symbol: str = "000001") -> pd.DataFrame:
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.columns = [
         "代码",
         "名称",
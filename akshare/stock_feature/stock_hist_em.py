@@ -1,23 +1,28 @@
 #!/usr/bin/env python
 # -*- coding:utf-8 -*-
 """
-Date: 2025/3/10 18:00
+Date: 2026/10/17 13:00
 Desc: 东方财富网-行情首页-沪深京 A 股
 https://quote.eastmoney.com/
 """
 
+import json
+from typing import Dict, List, Tuple, Union
+
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
 
-from akshare.utils.func import fetch_paginated_data
+from akshare.utils.func import fetch_paginated_data, run_batch
+from akshare.utils.ratelimit import get_rate_limiter
+from akshare.utils.request import request_with_retry
 
 
-def stock_zh_a_spot_em() -> pd.DataFrame:
+def _stock_zh_a_spot_em_params() -> Tuple[str, Dict]:
     """
-    东方财富网-沪深京 A 股-实时行情
-    https://quote.eastmoney.com/center/gridlist.html#hs_a_board
-    :return: 实时行情
-    :rtype: pandas.DataFrame
+    东方财富网-沪深京 A 股-实时行情-请求地址和参数
+    :return: 请求地址和参数
+    :rtype: tuple
     """
     url = "https://82.push2.eastmoney.com/api/qt/clist/get"
     params = {
@@ -33,7 +38,17 @@ def stock_zh_a_spot_em() -> pd.DataFrame:
         "fields": "f1,f2,f3,f4,f5,f6,f7,f8,f9,f10,f12,f13,f14,f15,f16,f17,f18,"
         "f20,f21,f23,f24,f25,f22,f11,f62,f128,f136,f115,f152",
     }
-    temp_df = fetch_paginated_data(url, params)
+    return url, params
+
+
+def _stock_zh_a_spot_em_format(temp_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    东方财富网-沪深京 A 股-实时行情-整理分页数据
+    :param temp_df: 分页合并后的原始数据
+    :type temp_df: pandas.DataFrame
+    :return: 整理后的数据
+    :rtype: pandas.DataFrame
+    """
     temp_df.columns = [
         "index",
         "_",
@@ -121,6 +136,18 @@ def stock_zh_a_spot_em() -> pd.DataFrame:
     return temp_df
 
 
+def stock_zh_a_spot_em() -> pd.DataFrame:
+    """
+    东方财富网-沪深京 A 股-实时行情
+    https://quote.eastmoney.com/center/gridlist.html#hs_a_board
+    :return: 实时行情
+    :rtype: pandas.DataFrame
+    """
+    url, params = _stock_zh_a_spot_em_params()
+    temp_df = fetch_paginated_data(url, params)
+    return _stock_zh_a_spot_em_format(temp_df)
+
+
 def stock_sh_a_spot_em() -> pd.DataFrame:
     """
     东方财富网-沪 A 股-实时行情
@@ -949,17 +976,15 @@ def stock_zh_b_spot_em() -> pd.DataFrame:
     return temp_df
 
 
-def stock_zh_a_hist(
-    symbol: str = "000001",
+def _stock_zh_a_hist_params(
+    symbol: str,
     period: str = "daily",
     start_date: str = "19700101",
     end_date: str = "20500101",
     adjust: str = "",
-    timeout: float = None,
-) -> pd.DataFrame:
+) -> Tuple[str, Dict]:
     """
-    东方财富网-行情首页-沪深京 A 股-每日行情
-    https://quote.eastmoney.com/concept/sh603777.html?from=classic
+    东方财富网-行情首页-沪深京 A 股-每日行情-请求地址和参数
     :param symbol: 股票代码
     :type symbol: str
     :param period: choice of {'daily', 'weekly', 'monthly'}
@@ -970,10 +995,8 @@ def stock_zh_a_hist(
     :type end_date: str
     :param adjust: choice of {"qfq": "前复权", "hfq": "后复权", "": "不复权"}
     :type adjust: str
-    :param timeout: choice of None or a positive float number
-    :type timeout: float
-    :return: 每日行情
-    :rtype: pandas.DataFrame
+    :return: 请求地址和参数
+    :rtype: tuple
     """
     market_code = 1 if symbol.startswith("6") else 0
     adjust_dict = {"qfq": "1", "hfq": "2", "": "0"}
@@ -989,8 +1012,19 @@ def stock_zh_a_hist(
         "beg": start_date,
         "end": end_date,
     }
-    r = requests.get(url, params=params, timeout=timeout)
-    data_json = r.json()
+    return url, params
+
+
+def _stock_zh_a_hist_parse(data_json: Dict, symbol: str) -> pd.DataFrame:
+    """
+    东方财富网-行情首页-沪深京 A 股-每日行情-解析返回数据
+    :param data_json: 接口返回的 JSON 数据
+    :type data_json: dict
+    :param symbol: 股票代码
+    :type symbol: str
+    :return: 每日行情
+    :rtype: pandas.DataFrame
+    """
     if not (data_json["data"] and data_json["data"]["klines"]):
         return pd.DataFrame()
     temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
@@ -1039,28 +1073,146 @@ def stock_zh_a_hist(
     return temp_df
 
 
-def stock_zh_a_hist_min_em(
+def stock_zh_a_hist(
     symbol: str = "000001",
-    start_date: str = "1979-09-01 09:32:00",
-    end_date: str = "2222-01-01 09:32:00",
-    period: str = "5",
+    period: str = "daily",
+    start_date: str = "19700101",
+    end_date: str = "20500101",
     adjust: str = "",
+    timeout: float = None,
 ) -> pd.DataFrame:
     """
-    东方财富网-行情首页-沪深京 A 股-每日分时行情
+    东方财富网-行情首页-沪深京 A 股-每日行情
     https://quote.eastmoney.com/concept/sh603777.html?from=classic
     :param symbol: 股票代码
     :type symbol: str
+    :param period: choice of {'daily', 'weekly', 'monthly'}
+    :type period: str
+    :param start_date: 开始日期
+    :type start_date: str
+    :param end_date: 结束日期
+    :type end_date: str
+    :param adjust: choice of {"qfq": "前复权", "hfq": "后复权", "": "不复权"}
+    :type adjust: str
+    :param timeout: choice of None or a positive float number
+    :type timeout: float
+    :return: 每日行情
+    :rtype: pandas.DataFrame
+    """
+    url, params = _stock_zh_a_hist_params(symbol, period, start_date, end_date, adjust)
+    r = requests.get(url, params=params, timeout=timeout)
+    data_json = r.json()
+    return _stock_zh_a_hist_parse(data_json, symbol)
+
+
+def stock_zh_a_hist_batch(
+    symbol: Union[str, List[str]] = "all",
+    period: str = "daily",
+    start_date: str = "19700101",
+    end_date: str = "20500101",
+    adjust: str = "",
+    max_workers: int = 8,
+    rate: float = 10,
+    max_retries: int = 3,
+    timeout: float = 15,
+    output: str = "pandas",
+):
+    """
+    东方财富网-行情首页-沪深京 A 股-每日行情-批量获取
+    https://quote.eastmoney.com/concept/sh603777.html?from=classic
+    :param symbol: 股票代码列表; "all" 表示 stock_zh_a_spot_em 中的所有 A 股
+    :type symbol: str or list
+    :param period: choice of {'daily', 'weekly', 'monthly'}
+    :type period: str
     :param start_date: 开始日期
     :type start_date: str
     :param end_date: 结束日期
     :type end_date: str
+    :param adjust: choice of {"qfq": "前复权", "hfq": "后复权", "": "不复权"}
+    :type adjust: str
+    :param max_workers: 并发线程数
+    :type max_workers: int
+    :param rate: 每秒最多请求数
+    :type rate: float
+    :param max_retries: 单个股票的最大重试次数
+    :type max_retries: int
+    :param timeout: 请求超时时间
+    :type timeout: float
+    :param output: choice of {"pandas", "arrow"}; arrow 需要安装 pyarrow
+    :type output: str
+    :return: 长格式的每日行情, 各股票按输入顺序排列; 获取失败或没有数据的股票及原因记录在 attrs["failed"] 中
+    :rtype: pandas.DataFrame or pyarrow.Table
+    """
+    if output not in {"pandas", "arrow"}:
+        raise ValueError("output must be one of {'pandas', 'arrow'}")
+    if output == "arrow":
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError("output='arrow' 需要安装 pyarrow: pip install pyarrow")
+    if isinstance(symbol, str):
+        if symbol == "all":
+            symbol_list = stock_zh_a_spot_em()["代码"].tolist()
+        else:
+            symbol_list = [symbol]
+    else:
+        symbol_list = list(symbol)
+    limiter = get_rate_limiter(
+        "https://push2his.eastmoney.com/api/qt/stock/kline/get", rate=rate
+    )
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+    session.mount("https://", adapter)
+
+    def _fetch(item: str) -> pd.DataFrame:
+        url, params = _stock_zh_a_hist_params(
+            item, period, start_date, end_date, adjust
+        )
+        r = request_with_retry(
+            url,
+            params=params,
+            timeout=timeout,
+            max_retries=max_retries,
+            session=session,
+            limiter=limiter,
+        )
+        return _stock_zh_a_hist_parse(r.json(), item)
+
+    with session:
+        # 停牌或代码错误时接口返回空数据, 同样记为失败
+        result_dict, failed_dict = run_batch(
+            symbol_list, _fetch, max_workers=max_workers, empty_as_failed=True
+        )
+    frames = list(result_dict.values())
+    if output == "arrow":
+        if frames:
+            table = pa.concat_tables(
+                [pa.Table.from_pandas(frame, preserve_index=False) for frame in frames]
+            )
+        else:
+            table = pa.table({})
+        table = table.replace_schema_metadata(
+            {**(table.schema.metadata or {}), b"failed": json.dumps(failed_dict)}
+        )
+        return table
+    big_df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    big_df.attrs["failed"] = failed_dict
+    return big_df
+
+
+def _stock_zh_a_hist_min_em_params(
+    symbol: str, period: str = "5", adjust: str = ""
+) -> Tuple[str, Dict]:
+    """
+    东方财富网-行情首页-沪深京 A 股-每日分时行情-请求地址和参数
+    :param symbol: 股票代码
+    :type symbol: str
     :param period: choice of {'1', '5', '15', '30', '60'}
     :type period: str
     :param adjust: choice of {'', 'qfq', 'hfq'}
     :type adjust: str
-    :return: 每日分时行情
-    :rtype: pandas.DataFrame
+    :return: 请求地址和参数
+    :rtype: tuple
     """
     market_code = 1 if symbol.startswith("6") else 0
     adjust_map = {
@@ -1078,8 +1230,41 @@ def stock_zh_a_hist_min_em(
             "iscr": "0",
             "secid": f"{market_code}.{symbol}",
         }
-        r = requests.get(url, timeout=15, params=params)
-        data_json = r.json()
+    else:
+        url = "https://push2his.eastmoney.com/api/qt/stock/kline/get"
+        params = {
+            "fields1": "f1,f2,f3,f4,f5,f6",
+            "fields2": "f51,f52,f53,f54,f55,f56,f57,f58,f59,f60,f61",
+            "ut": "7eea3edcaed734bea9cbfc24409ed989",
+            "klt": period,
+            "fqt": adjust_map[adjust],
+            "secid": f"{market_code}.{symbol}",
+            "beg": "0",
+            "end": "20500000",
+        }
+    return url, params
+
+
+def _stock_zh_a_hist_min_em_parse(
+    data_json: Dict,
+    start_date: str = "1979-09-01 09:32:00",
+    end_date: str = "2222-01-01 09:32:00",
+    period: str = "5",
+) -> pd.DataFrame:
+    """
+    东方财富网-行情首页-沪深京 A 股-每日分时行情-解析返回数据
+    :param data_json: 接口返回的 JSON 数据
+    :type data_json: dict
+    :param start_date: 开始日期
+    :type start_date: str
+    :param end_date: 结束日期
+    :type end_date: str
+    :param period: choice of {'1', '5', '15', '30', '60'}
+    :type period: str
+    :return: 每日分时行情
+    :rtype: pandas.DataFrame
+    """
+    if period == "1":
         temp_df = pd.DataFrame(
             [item.split(",") for item in data_json["data"]["trends"]]
         )
@@ -1106,19 +1291,6 @@ def stock_zh_a_hist_min_em(
         temp_df["时间"] = pd.to_datetime(temp_df["时间"]).astype(str)
         return temp_df
     else:
-        url = "https://push2his.eastmoney.com/api/qt/stock/kline/get"
-        params = {
-            "fields1": "f1,f2,f3,f4,f5,f6",
-            "fields2": "f51,f52,f53,f54,f55,f56,f57,f58,f59,f60,f61",
-            "ut": "7eea3edcaed734bea9cbfc24409ed989",
-            "klt": period,
-            "fqt": adjust_map[adjust],
-            "secid": f"{market_code}.{symbol}",
-            "beg": "0",
-            "end": "20500000",
-        }
-        r = requests.get(url, timeout=15, params=params)
-        data_json = r.json()
         temp_df = pd.DataFrame(
             [item.split(",") for item in data_json["data"]["klines"]]
         )
@@ -1167,6 +1339,35 @@ def stock_zh_a_hist_min_em(
         return temp_df
 
 
+def stock_zh_a_hist_min_em(
+    symbol: str = "000001",
+    start_date: str = "1979-09-01 09:32:00",
+    end_date: str = "2222-01-01 09:32:00",
+    period: str = "5",
+    adjust: str = "",
+) -> pd.DataFrame:
+    """
+    东方财富网-行情首页-沪深京 A 股-每日分时行情
+    https://quote.eastmoney.com/concept/sh603777.html?from=classic
+    :param symbol: 股票代码
+    :type symbol: str
+    :param start_date: 开始日期
+    :type start_date: str
+    :param end_date: 结束日期
+    :type end_date: str
+    :param period: choice of {'1', '5', '15', '30', '60'}
+    :type period: str
+    :param adjust: choice of {'', 'qfq', 'hfq'}
+    :type adjust: str
+    :return: 每日分时行情
+    :rtype: pandas.DataFrame
+    """
+    url, params = _stock_zh_a_hist_min_em_params(symbol, period, adjust)
+    r = requests.get(url, timeout=15, params=params)
+    data_json = r.json()
+    return _stock_zh_a_hist_min_em_parse(data_json, start_date, end_date, period)
+
+
 def stock_zh_a_hist_pre_min_em(
     symbol: str = "000001",
     start_time: str = "09:00:00",
@@ -1222,12 +1423,11 @@ def stock_zh_a_hist_pre_min_em(
     return temp_df
 
 
-def stock_hk_spot_em() -> pd.DataFrame:
+def _stock_hk_spot_em_params() -> Tuple[str, Dict]:
     """
-    东方财富网-港股-实时行情
-    https://quote.eastmoney.com/center/gridlist.html#hk_stocks
-    :return: 港股-实时行情
-    :rtype: pandas.DataFrame
+    东方财富网-港股-实时行情-请求地址和参数
+    :return: 请求地址和参数
+    :rtype: tuple
     """
     url = "https://72.push2.eastmoney.com/api/qt/clist/get"
     params = {
@@ -1243,7 +1443,17 @@ def stock_hk_spot_em() -> pd.DataFrame:
         "fields": "f1,f2,f3,f4,f5,f6,f7,f8,f9,f10,f12,f13,f14,f15,f16,f17,f18,f20,"
         "f21,f23,f24,f25,f22,f11,f62,f128,f136,f115,f152",
     }
-    temp_df = fetch_paginated_data(url, params)
+    return url, params
+
+
+def _stock_hk_spot_em_format(temp_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    东方财富网-港股-实时行情-整理分页数据
+    :param temp_df: 分页合并后的原始数据
+    :type temp_df: pandas.DataFrame
+    :return: 整理后的数据
+    :rtype: pandas.DataFrame
+    """
     temp_df.columns = [
         "序号",
         "_",
@@ -1307,6 +1517,18 @@ def stock_hk_spot_em() -> pd.DataFrame:
     return temp_df
 
 
+def stock_hk_spot_em() -> pd.DataFrame:
+    """
+    东方财富网-港股-实时行情
+    https://quote.eastmoney.com/center/gridlist.html#hk_stocks
+    :return: 港股-实时行情
+    :rtype: pandas.DataFrame
+    """
+    url, params = _stock_hk_spot_em_params()
+    temp_df = fetch_paginated_data(url, params)
+    return _stock_hk_spot_em_format(temp_df)
+
+
 def stock_hk_main_board_spot_em() -> pd.DataFrame:
     """
     东方财富网-港股-主板-实时行情
@@ -1392,17 +1614,16 @@ def stock_hk_main_board_spot_em() -> pd.DataFrame:
     return temp_df
 
 
-def stock_hk_hist(
-    symbol: str = "00593",
+def _stock_hk_hist_params(
+    symbol: str,
     period: str = "daily",
     start_date: str = "19700101",
     end_date: str = "22220101",
     adjust: str = "",
-) -> pd.DataFrame:
+) -> Tuple[str, Dict]:
     """
-    东方财富网-行情-港股-每日行情
-    https://quote.eastmoney.com/hk/08367.html
-    :param symbol: 港股-每日行情
+    东方财富网-行情-港股-每日行情-请求地址和参数
+    :param symbol: 股票代码
     :type symbol: str
     :param period: choice of {'daily', 'weekly', 'monthly'}
     :type period: str
@@ -1410,10 +1631,10 @@ def stock_hk_hist(
     :type start_date: str
     :param end_date: 结束日期
     :type end_date: str
-    :param adjust: choice of {"qfq": "1", "hfq": "2", "": "不复权"}
+    :param adjust: choice of {"qfq": "前复权", "hfq": "后复权", "": "不复权"}
     :type adjust: str
-    :return: 每日行情
-    :rtype: pandas.DataFrame
+    :return: 请求地址和参数
+    :rtype: tuple
     """
     adjust_dict = {"qfq": "1", "hfq": "2", "": "0"}
     period_dict = {"daily": "101", "weekly": "102", "monthly": "103"}
@@ -1427,8 +1648,23 @@ def stock_hk_hist(
         "end": "20500000",
         "lmt": "1000000",
     }
-    r = requests.get(url, timeout=15, params=params)
-    data_json = r.json()
+    return url, params
+
+
+def _stock_hk_hist_parse(
+    data_json: Dict, start_date: str = "19700101", end_date: str = "22220101"
+) -> pd.DataFrame:
+    """
+    东方财富网-行情-港股-每日行情-解析返回数据
+    :param data_json: 接口返回的 JSON 数据
+    :type data_json: dict
+    :param start_date: 开始日期
+    :type start_date: str
+    :param end_date: 结束日期
+    :type end_date: str
+    :return: 每日行情
+    :rtype: pandas.DataFrame
+    """
     temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
     if temp_df.empty:
         return pd.DataFrame()
@@ -1464,6 +1700,35 @@ def stock_hk_hist(
     return temp_df
 
 
+def stock_hk_hist(
+    symbol: str = "00593",
+    period: str = "daily",
+    start_date: str = "19700101",
+    end_date: str = "22220101",
+    adjust: str = "",
+) -> pd.DataFrame:
+    """
+    东方财富网-行情-港股-每日行情
+    https://quote.eastmoney.com/hk/08367.html
+    :param symbol: 港股-每日行情
+    :type symbol: str
+    :param period: choice of {'daily', 'weekly', 'monthly'}
+    :type period: str
+    :param start_date: 开始日期
+    :type start_date: str
+    :param end_date: 结束日期
+    :type end_date: str
+    :param adjust: choice of {"qfq": "1", "hfq": "2", "": "不复权"}
+    :type adjust: str
+    :return: 每日行情
+    :rtype: pandas.DataFrame
+    """
+    url, params = _stock_hk_hist_params(symbol, period, start_date, end_date, adjust)
+    r = requests.get(url, timeout=15, params=params)
+    data_json = r.json()
+    return _stock_hk_hist_parse(data_json, start_date, end_date)
+
+
 def stock_hk_hist_min_em(
     symbol: str = "01611",
     period: str = "1",
@@ -1590,12 +1855,11 @@ def stock_hk_hist_min_em(
     return temp_df
 
 
-def stock_us_spot_em() -> pd.DataFrame:
+def _stock_us_spot_em_params() -> Tuple[str, Dict]:
     """
-    东方财富网-美股-实时行情
-    https://quote.eastmoney.com/center/gridlist.html#us_stocks
-    :return: 美股-实时行情; 延迟 15 min
-    :rtype: pandas.DataFrame
+    东方财富网-美股-实时行情-请求地址和参数
+    :return: 请求地址和参数
+    :rtype: tuple
     """
     url = "https://72.push2.eastmoney.com/api/qt/clist/get"
     params = {
@@ -1611,7 +1875,17 @@ def stock_us_spot_em() -> pd.DataFrame:
         "fields": "f1,f2,f3,f4,f5,f6,f7,f8,f9,f10,f12,f13,f14,f15,f16,f17,f18,f20,"
         "f21,f23,f24,f25,f26,f22,f33,f11,f62,f128,f136,f115,f152",
     }
-    temp_df = fetch_paginated_data(url, params)
+    return url, params
+
+
+def _stock_us_spot_em_format(temp_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    东方财富网-美股-实时行情-整理分页数据
+    :param temp_df: 分页合并后的原始数据
+    :type temp_df: pandas.DataFrame
+    :return: 整理后的数据
+    :rtype: pandas.DataFrame
+    """
     temp_df.columns = [
         "序号",
         "_",
@@ -1685,17 +1959,28 @@ def stock_us_spot_em() -> pd.DataFrame:
     return temp_df
 
 
-def stock_us_hist(
-    symbol: str = "105.MSFT",
+def stock_us_spot_em() -> pd.DataFrame:
+    """
+    东方财富网-美股-实时行情
+    https://quote.eastmoney.com/center/gridlist.html#us_stocks
+    :return: 美股-实时行情; 延迟 15 min
+    :rtype: pandas.DataFrame
+    """
+    url, params = _stock_us_spot_em_params()
+    temp_df = fetch_paginated_data(url, params)
+    return _stock_us_spot_em_format(temp_df)
+
+
+def _stock_us_hist_params(
+    symbol: str,
     period: str = "daily",
     start_date: str = "19700101",
     end_date: str = "22220101",
     adjust: str = "",
-) -> pd.DataFrame:
+) -> Tuple[str, Dict]:
     """
-    东方财富网-行情-美股-每日行情
-    https://quote.eastmoney.com/us/ENTX.html#fullScreenChart
-    :param symbol: 股票代码; 此股票代码需要通过调用 ak.stock_us_spot_em() 的 `代码` 字段获取
+    东方财富网-行情-美股-每日行情-请求地址和参数
+    :param symbol: 股票代码
     :type symbol: str
     :param period: choice of {'daily', 'weekly', 'monthly'}
     :type period: str
@@ -1703,10 +1988,10 @@ def stock_us_hist(
     :type start_date: str
     :param end_date: 结束日期
     :type end_date: str
-    :param adjust: choice of {"qfq": "1", "hfq": "2", "": "不复权"}
+    :param adjust: choice of {"qfq": "前复权", "hfq": "后复权", "": "不复权"}
     :type adjust: str
-    :return: 每日行情
-    :rtype: pandas.DataFrame
+    :return: 请求地址和参数
+    :rtype: tuple
     """
     period_dict = {"daily": "101", "weekly": "102", "monthly": "103"}
     adjust_dict = {"qfq": "1", "hfq": "2", "": "0"}
@@ -1720,8 +2005,23 @@ def stock_us_hist(
         "end": "20500000",
         "lmt": "1000000",
     }
-    r = requests.get(url, timeout=15, params=params)
-    data_json = r.json()
+    return url, params
+
+
+def _stock_us_hist_parse(
+    data_json: Dict, start_date: str = "19700101", end_date: str = "22220101"
+) -> pd.DataFrame:
+    """
+    东方财富网-行情-美股-每日行情-解析返回数据
+    :param data_json: 接口返回的 JSON 数据
+    :type data_json: dict
+    :param start_date: 开始日期
+    :type start_date: str
+    :param end_date: 结束日期
+    :type end_date: str
+    :return: 每日行情
+    :rtype: pandas.DataFrame
+    """
     if not data_json["data"]["klines"]:
         return pd.DataFrame()
     temp_df = pd.DataFrame([item.split(",") for item in data_json["data"]["klines"]])
@@ -1755,6 +2055,35 @@ def stock_us_hist(
     return temp_df
 
 
+def stock_us_hist(
+    symbol: str = "105.MSFT",
+    period: str = "daily",
+    start_date: str = "19700101",
+    end_date: str = "22220101",
+    adjust: str = "",
+) -> pd.DataFrame:
+    """
+    东方财富网-行情-美股-每日行情
+    https://quote.eastmoney.com/us/ENTX.html#fullScreenChart
+    :param symbol: 股票代码; 此股票代码需要通过调用 ak.stock_us_spot_em() 的 `代码` 字段获取
+    :type symbol: str
+    :param period: choice of {'daily', 'weekly', 'monthly'}
+    :type period: str
+    :param start_date: 开始日期
+    :type start_date: str
+    :param end_date: 结束日期
+    :type end_date: str
+    :param adjust: choice of {"qfq": "1", "hfq": "2", "": "不复权"}
+    :type adjust: str
+    :return: 每日行情
+    :rtype: pandas.DataFrame
+    """
+    url, params = _stock_us_hist_params(symbol, period, start_date, end_date, adjust)
+    r = requests.get(url, timeout=15, params=params)
+    data_json = r.json()
+    return _stock_us_hist_parse(data_json, start_date, end_date)
+
+
 def stock_us_hist_min_em(
     symbol: str = "105.ATER",
     start_date: str = "1979-09-01 09:32:00",
@@ -12,7 +12,8 @@ import pandas as pd
 import requests
 
 from akshare.index.index_stock_zh import get_tx_start_year
-from akshare.utils import demjson
+from akshare.utils.js_literal import loads_js_literal
+from akshare.utils.func import PageAccumulator
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -48,7 +49,7 @@ def stock_zh_a_hist_tx(
         range_end = datetime.date.today().year + 1
     else:
         range_end = int(end_date.split("-")[0]) + 1
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for year in tqdm(range(range_start, range_end), leave=False):
         params = {
@@ -58,7 +59,7 @@ def stock_zh_a_hist_tx(
         }
         r = requests.get(url, params=params, timeout=timeout)
         data_text = r.text
-        data_json = demjson.decode(data_text[data_text.find("={") + 1 :])["data"][
+        data_json = loads_js_literal(data_text[data_text.find("={") + 1 :])["data"][
             symbol
         ]
         if "day" in data_json.keys():
@@ -67,7 +68,8 @@ def stock_zh_a_hist_tx(
             temp_df = pd.DataFrame(data_json["hfqday"])
         else:
             temp_df = pd.DataFrame(data_json["qfqday"])
-        big_df = pd.concat([big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df = big_df.iloc[:, :6]
     big_df.columns = ["date", "open", "close", "high", "low", "amount"]
     big_df["date"] = pd.to_datetime(big_df["date"], errors="coerce").dt.date
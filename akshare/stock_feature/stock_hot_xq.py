@@ -11,6 +11,7 @@ import math
 import pandas as pd
 import requests
 
+from akshare.utils.func import PageAccumulator
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -59,7 +60,7 @@ def stock_hot_follow_xq(symbol: str = "最热门") -> pd.DataFrame:
     total_num = data_json["data"]["count"]
     total_page = math.ceil(total_num / 200)
     tqdm = get_tqdm()
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"page": page})
         r = requests.get(url, params=params, headers=headers)
@@ -68,7 +69,8 @@ def stock_hot_follow_xq(symbol: str = "最热门") -> pd.DataFrame:
             temp_df = pd.DataFrame(data_json["data"]["list"])
         except TypeError:
             temp_df = pd.DataFrame()
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     if symbol == "本周新增":
         big_df = big_df[
             [
@@ -143,7 +145,7 @@ def stock_hot_tweet_xq(symbol: str = "最热门") -> pd.DataFrame:
     total_num = data_json["data"]["count"]
     total_page = math.ceil(total_num / 200)
     tqdm = get_tqdm()
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"page": page})
         r = requests.get(url, params=params, headers=headers)
@@ -152,7 +154,8 @@ def stock_hot_tweet_xq(symbol: str = "最热门") -> pd.DataFrame:
             temp_df = pd.DataFrame(data_json["data"]["list"])
         except TypeError:
             temp_df = pd.DataFrame()
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     if symbol == "本周新增":
         big_df = big_df[
             [
@@ -227,7 +230,7 @@ def stock_hot_deal_xq(symbol: str = "最热门") -> pd.DataFrame:
     total_num = data_json["data"]["count"]
     total_page = math.ceil(total_num / 200)
     tqdm = get_tqdm()
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update({"page": page})
         r = requests.get(url, params=params, headers=headers)
@@ -236,7 +239,8 @@ def stock_hot_deal_xq(symbol: str = "最热门") -> pd.DataFrame:
             temp_df = pd.DataFrame(data_json["data"]["list"])
         except TypeError:
             temp_df = pd.DataFrame()
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     if symbol == "本周新增":
         big_df = big_df[
             [
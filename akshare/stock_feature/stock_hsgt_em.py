@@ -11,7 +11,7 @@ import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 
-from akshare.utils.func import fetch_paginated_data
+from akshare.utils.func import fetch_paginated_data, PageAccumulator
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -227,14 +227,15 @@ def stock_hsgt_hold_stock_em(
     r = requests.get(url, params=params)
     data_json = r.json()
     page_num = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, page_num + 1), leave=False):
         params.update({"pageNumber": page})
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
 
     big_df.reset_index(inplace=True)
     big_df["index"] = range(1, len(big_df) + 1)
@@ -376,14 +377,15 @@ def stock_hsgt_stock_statistics_em(
         r = requests.get(url, params=params)
         data_json = r.json()
         total_page = data_json["result"]["pages"]
-        big_df = pd.DataFrame()
+        big_pages = PageAccumulator()
         tqdm = get_tqdm()
         for page in tqdm(range(1, int(total_page) + 1), leave=False):
             params.update({"pageNumber": page})
             r = requests.get(url, params=params)
             data_json = r.json()
             temp_df = pd.DataFrame(data_json["result"]["data"])
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+            big_pages.append(temp_df)
+        big_df = big_pages.to_frame(ignore_index=True)
 
         big_df.columns = [
             "-",
@@ -471,14 +473,15 @@ def stock_hsgt_stock_statistics_em(
         r = requests.get(url, params=params)
         data_json = r.json()
         total_page = data_json["result"]["pages"]
-        big_df = pd.DataFrame()
+        big_pages = PageAccumulator()
         tqdm = get_tqdm()
         for page in tqdm(range(1, int(total_page) + 1), leave=False):
             params.update({"pageNumber": page})
             r = requests.get(url, params=params)
             data_json = r.json()
             temp_df = pd.DataFrame(data_json["result"]["data"])
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+            big_pages.append(temp_df)
+        big_df = big_pages.to_frame(ignore_index=True)
 
         big_df.columns = [
             "-",
@@ -579,14 +582,15 @@ def stock_hsgt_stock_statistics_em(
         r = requests.get(url, params=params)
         data_json = r.json()
         total_page = data_json["result"]["pages"]
-        big_df = pd.DataFrame()
+        big_pages = PageAccumulator()
         tqdm = get_tqdm()
         for page in tqdm(range(1, int(total_page) + 1), leave=False):
             params.update({"pageNumber": page})
             r = requests.get(url, params=params)
             data_json = r.json()
             temp_df = pd.DataFrame(data_json["result"]["data"])
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+            big_pages.append(temp_df)
+        big_df = big_pages.to_frame(ignore_index=True)
         big_df.columns = [
             "-",
             "-",
@@ -687,14 +691,15 @@ def stock_hsgt_stock_statistics_em(
         r = requests.get(url, params=params)
         data_json = r.json()
         total_page = data_json["result"]["pages"]
-        big_df = pd.DataFrame()
+        big_pages = PageAccumulator()
         tqdm = get_tqdm()
         for page in tqdm(range(1, int(total_page) + 1), leave=False):
             params.update({"pageNumber": page})
             r = requests.get(url, params=params)
             data_json = r.json()
             temp_df = pd.DataFrame(data_json["result"]["data"])
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+            big_pages.append(temp_df)
+        big_df = big_pages.to_frame(ignore_index=True)
         big_df.columns = [
             "-",
             "-",
@@ -877,14 +882,15 @@ def stock_hsgt_institution_statistics_em(
         r = requests.get(url, params=params, headers=headers)
         data_json = r.json()
         total_page = data_json["result"]["pages"]
-        big_df = pd.DataFrame()
+        big_pages = PageAccumulator()
         tqdm = get_tqdm()
         for page in tqdm(range(1, total_page + 1), leave=False):
             params.update({"pageNumber": page})
             r = requests.get(url, params=params, headers=headers)
             data_json = r.json()
             temp_df = pd.DataFrame(data_json["result"]["data"])
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+            big_pages.append(temp_df)
+        big_df = big_pages.to_frame(ignore_index=True)
         big_df.columns = [
             "持股日期",
             "_",
@@ -945,14 +951,15 @@ def stock_hsgt_institution_statistics_em(
         r = requests.get(url, params=params, headers=headers)
         data_json = r.json()
         total_page = data_json["result"]["pages"]
-        big_df = pd.DataFrame()
+        big_pages = PageAccumulator()
         tqdm = get_tqdm()
         for page in tqdm(range(1, total_page + 1), leave=False):
             params.update({"pageNumber": page})
             r = requests.get(url, params=params, headers=headers)
             data_json = r.json()
             temp_df = pd.DataFrame(data_json["result"]["data"])
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+            big_pages.append(temp_df)
+        big_df = big_pages.to_frame(ignore_index=True)
         big_df.columns = [
             "持股日期",
             "_",
@@ -1013,14 +1020,15 @@ def stock_hsgt_institution_statistics_em(
         r = requests.get(url, params=params, headers=headers)
         data_json = r.json()
         total_page = data_json["result"]["pages"]
-        big_df = pd.DataFrame()
+        big_pages = PageAccumulator()
         tqdm = get_tqdm()
         for page in tqdm(range(1, total_page + 1), leave=False):
             params.update({"pageNumber": page})
             r = requests.get(url, params=params, headers=headers)
             data_json = r.json()
             temp_df = pd.DataFrame(data_json["result"]["data"])
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+            big_pages.append(temp_df)
+        big_df = big_pages.to_frame(ignore_index=True)
         big_df.columns = [
             "持股日期",
             "_",
@@ -1570,14 +1578,15 @@ def stock_hsgt_individual_detail_em(
         r = requests.get(url, params=params)
         data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(total_page) + 1), leave=False):
         params.update({"pageNumber": page})
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.rename(
         columns={
             "SECUCODE": "-",
@@ -9,6 +9,7 @@ https://irm.cninfo.com.cn/
 import pandas as pd
 import requests
 
+from akshare.utils.func import PageAccumulator
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -52,14 +53,15 @@ def stock_irm_cninfo(symbol: str = "002594") -> pd.DataFrame:
     data_json = r.json()
     total_page = int(data_json["totalPage"])
     total_page = 10 if total_page > 10 else total_page
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, 1 + total_page), leave=False):
         params.update({"pageNum": page})
         r = requests.post(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["rows"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.rename(
         columns={
             "indexId": "问题编号",
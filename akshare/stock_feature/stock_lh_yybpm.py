@@ -12,6 +12,7 @@ import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 
+from akshare.utils.func import PageAccumulator
 from akshare.utils.tqdm import get_tqdm
 from akshare.utils.cons import headers
 
@@ -28,13 +29,14 @@ def stock_lh_yyb_most() -> pd.DataFrame:
     soup = BeautifulSoup(r.text, features="lxml")
     page_str = soup.find(name="span", attrs={"class": "page_info"}).text
     total_page = int(page_str.split("/")[1]) + 1
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page), leave=False):
         url = f"https://data.10jqka.com.cn/ifmarket/lhbyyb/type/1/tab/sbcs/field/sbcs/sort/desc/page/{page}/"
         r = requests.get(url, headers=headers)
         temp_df = pd.read_html(StringIO(r.text))[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.reset_index(inplace=True, drop=True)
     return big_df
 
@@ -51,13 +53,14 @@ def stock_lh_yyb_capital() -> pd.DataFrame:
     soup = BeautifulSoup(r.text, features="lxml")
     page_str = soup.find(name="span", attrs={"class": "page_info"}).text
     total_page = int(page_str.split("/")[1]) + 1
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page), leave=False):
         url = f"https://data.10jqka.com.cn/ifmarket/lhbyyb/type/1/tab/zjsl/field/zgczje/sort/desc/page/{page}/"
         r = requests.get(url, headers=headers)
         temp_df = pd.read_html(StringIO(r.text))[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.reset_index(inplace=True, drop=True)
     return big_df
 
@@ -74,13 +77,14 @@ def stock_lh_yyb_control() -> pd.DataFrame:
     soup = BeautifulSoup(r.text, features="lxml")
     page_str = soup.find(name="span", attrs={"class": "page_info"}).text
     total_page = int(page_str.split("/")[1]) + 1
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page), leave=False):
         url = f"https://data.10jqka.com.cn/ifmarket/lhbyyb/type/1/tab/btcz/field/xsjs/sort/desc/page/{page}/"
         r = requests.get(url, headers=headers)
         temp_df = pd.read_html(StringIO(r.text))[0]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     big_df.reset_index(inplace=True, drop=True)
     return big_df
 
@@ -9,6 +9,7 @@ https://www.szse.cn/disclosure/margin/object/index.html
 import pandas as pd
 import requests
 
+from akshare.utils.func import PageAccumulator
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -38,7 +39,7 @@ def stock_margin_account_info() -> pd.DataFrame:
     data_json = r.json()
     total_page = data_json["result"]["pages"]
     tqdm = get_tqdm()
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update(
             {
@@ -51,7 +52,8 @@ def stock_margin_account_info() -> pd.DataFrame:
         r = requests.get(url=url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
 
     big_df.rename(
         columns={
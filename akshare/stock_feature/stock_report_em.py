@@ -14,6 +14,7 @@ https://data.eastmoney.com/bbsj/202003/xjll.html
 import pandas as pd
 import requests
 
+from akshare.utils.func import PageAccumulator
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -43,7 +44,7 @@ def stock_zcfz_em(date: str = "20240331") -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     page_num = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, page_num + 1), leave=False):
         params.update(
@@ -54,7 +55,8 @@ def stock_zcfz_em(date: str = "20240331") -> pd.DataFrame:
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], join="outer", ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(join="outer", ignore_index=True)
 
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df.index + 1
@@ -184,7 +186,7 @@ def stock_zcfz_bj_em(date: str = "20240331") -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     page_num = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, page_num + 1), leave=False):
         params.update(
@@ -195,7 +197,8 @@ def stock_zcfz_bj_em(date: str = "20240331") -> pd.DataFrame:
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], join="outer", ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(join="outer", ignore_index=True)
 
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df.index + 1
@@ -325,7 +328,7 @@ def stock_lrb_em(date: str = "20240331") -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     page_num = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, page_num + 1), leave=False):
         params.update(
@@ -336,7 +339,8 @@ def stock_lrb_em(date: str = "20240331") -> pd.DataFrame:
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
 
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df.index + 1
@@ -461,7 +465,7 @@ def stock_xjll_em(date: str = "20240331") -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     page_num = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, page_num + 1), leave=False):
         params.update(
@@ -472,7 +476,8 @@ def stock_xjll_em(date: str = "20240331") -> pd.DataFrame:
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
 
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df.index + 1
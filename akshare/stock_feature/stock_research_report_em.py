@@ -10,6 +10,7 @@ import datetime
 import pandas as pd
 import requests
 
+from akshare.utils.func import PageAccumulator
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -45,7 +46,7 @@ def stock_research_report_em(symbol: str = "000001") -> pd.DataFrame:
     data_json = r.json()
     total_page = data_json["TotalPage"]
     current_year = data_json["currentYear"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_page + 1), leave=False):
         params.update(
@@ -59,7 +60,8 @@ def stock_research_report_em(symbol: str = "000001") -> pd.DataFrame:
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], axis=0, ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(axis=0, ignore_index=True)
     big_df.reset_index(inplace=True)
     big_df["index"] = big_df["index"] + 1
     predict_this_year_eps_title = f"{current_year}-盈利预测-收益"
@@ -13,6 +13,7 @@ import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 
+from akshare.utils.func import PageAccumulator
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -71,7 +72,7 @@ def stock_sns_sseinfo(symbol: str = "603119") -> pd.DataFrame:
         "uid": code_uid_map[symbol],
         "page": "1",
     }
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     page = 1
     warnings.warn("正在下载中")
     while True:
@@ -142,7 +143,8 @@ def stock_sns_sseinfo(symbol: str = "603119") -> pd.DataFrame:
             "回答来源",
             "用户名",
         ]
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     return big_df
 
 
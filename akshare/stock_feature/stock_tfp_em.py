@@ -9,6 +9,8 @@ https://data.eastmoney.com/tfpxx/
 import pandas as pd
 import requests
 
+from akshare.utils.func import PageAccumulator
+
 
 def stock_tfp_em(date: str = "20240426") -> pd.DataFrame:
     """
@@ -34,13 +36,14 @@ def stock_tfp_em(date: str = "20240426") -> pd.DataFrame:
     r = requests.get(url, params=params)
     data_json = r.json()
     total_page = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     for page in range(1, total_page + 1):
         params.update({"pageNumber": page})
         r = requests.get(url, params=params)
         data_json = r.json()
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
 
     big_df.reset_index(inplace=True)
     big_df.columns = [
@@ -11,6 +11,7 @@ import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 
+from akshare.utils.func import PageAccumulator
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -55,7 +56,7 @@ def stock_balance_sheet_by_report_em(symbol: str = "SH600519") -> pd.DataFrame:
     temp_df["REPORT_DATE"] = temp_df["REPORT_DATE"].astype(str)
     need_date = temp_df["REPORT_DATE"].tolist()
     sep_list = [",".join(need_date[i : i + 5]) for i in range(0, len(need_date), 5)]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for item in tqdm(sep_list, leave=False):
         url = "https://emweb.securities.eastmoney.com/PC_HSF10/NewFinanceAnalysis/zcfzbAjaxNew"
@@ -74,10 +75,8 @@ def stock_balance_sheet_by_report_em(symbol: str = "SH600519") -> pd.DataFrame:
         for col in temp_df.columns:
             if temp_df[col].isnull().all():  # 检查列是否包含 None 或 NaN
                 temp_df[col] = pd.to_numeric(temp_df[col], errors="coerce")
-        if big_df.empty:
-            big_df = temp_df
-        else:
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     return big_df
 
 
@@ -113,7 +112,7 @@ def stock_balance_sheet_by_yearly_em(symbol: str = "SH600036") -> pd.DataFrame:
     temp_df["REPORT_DATE"] = temp_df["REPORT_DATE"].astype(str)
     need_date = temp_df["REPORT_DATE"].tolist()
     sep_list = [",".join(need_date[i : i + 5]) for i in range(0, len(need_date), 5)]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for item in tqdm(sep_list, leave=False):
         url = "https://emweb.securities.eastmoney.com/PC_HSF10/NewFinanceAnalysis/zcfzbAjaxNew"
@@ -132,10 +131,8 @@ def stock_balance_sheet_by_yearly_em(symbol: str = "SH600036") -> pd.DataFrame:
         for col in temp_df.columns:
             if temp_df[col].isnull().all():  # 检查列是否包含 None 或 NaN
                 temp_df[col] = pd.to_numeric(temp_df[col], errors="coerce")
-        if big_df.empty:
-            big_df = temp_df
-        else:
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     return big_df
 
 
@@ -162,7 +159,7 @@ def stock_profit_sheet_by_report_em(symbol: str = "SH600519") -> pd.DataFrame:
     temp_df["REPORT_DATE"] = temp_df["REPORT_DATE"].astype(str)
     need_date = temp_df["REPORT_DATE"].tolist()
     sep_list = [",".join(need_date[i : i + 5]) for i in range(0, len(need_date), 5)]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for item in tqdm(sep_list, leave=False):
         url = "https://emweb.securities.eastmoney.com/PC_HSF10/NewFinanceAnalysis/lrbAjaxNew"
@@ -181,10 +178,8 @@ def stock_profit_sheet_by_report_em(symbol: str = "SH600519") -> pd.DataFrame:
         for col in temp_df.columns:
             if temp_df[col].isnull().all():  # 检查列是否包含 None 或 NaN
                 temp_df[col] = pd.to_numeric(temp_df[col], errors="coerce")
-        if big_df.empty:
-            big_df = temp_df
-        else:
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     return big_df
 
 
@@ -211,7 +206,7 @@ def stock_profit_sheet_by_yearly_em(symbol: str = "SH600519") -> pd.DataFrame:
     temp_df["REPORT_DATE"] = temp_df["REPORT_DATE"].astype(str)
     need_date = temp_df["REPORT_DATE"].tolist()
     sep_list = [",".join(need_date[i : i + 5]) for i in range(0, len(need_date), 5)]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for item in tqdm(sep_list, leave=False):
         url = "https://emweb.securities.eastmoney.com/PC_HSF10/NewFinanceAnalysis/lrbAjaxNew"
@@ -230,10 +225,8 @@ def stock_profit_sheet_by_yearly_em(symbol: str = "SH600519") -> pd.DataFrame:
         for col in temp_df.columns:
             if temp_df[col].isnull().all():  # 检查列是否包含 None 或 NaN
                 temp_df[col] = pd.to_numeric(temp_df[col], errors="coerce")
-        if big_df.empty:
-            big_df = temp_df
-        else:
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     return big_df
 
 
@@ -262,7 +255,7 @@ def stock_profit_sheet_by_quarterly_em(
     temp_df["REPORT_DATE"] = temp_df["REPORT_DATE"].astype(str)
     need_date = temp_df["REPORT_DATE"].tolist()
     sep_list = [",".join(need_date[i : i + 5]) for i in range(0, len(need_date), 5)]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for item in tqdm(sep_list, leave=False):
         url = "https://emweb.securities.eastmoney.com/PC_HSF10/NewFinanceAnalysis/lrbAjaxNew"
@@ -281,10 +274,8 @@ def stock_profit_sheet_by_quarterly_em(
         for col in temp_df.columns:
             if temp_df[col].isnull().all():  # 检查列是否包含 None 或 NaN
                 temp_df[col] = pd.to_numeric(temp_df[col], errors="coerce")
-        if big_df.empty:
-            big_df = temp_df
-        else:
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     return big_df
 
 
@@ -313,7 +304,7 @@ def stock_cash_flow_sheet_by_report_em(
     temp_df["REPORT_DATE"] = temp_df["REPORT_DATE"].astype(str)
     need_date = temp_df["REPORT_DATE"].tolist()
     sep_list = [",".join(need_date[i : i + 5]) for i in range(0, len(need_date), 5)]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for item in tqdm(sep_list, leave=False):
         url = "https://emweb.securities.eastmoney.com/PC_HSF10/NewFinanceAnalysis/xjllbAjaxNew"
@@ -332,10 +323,8 @@ def stock_cash_flow_sheet_by_report_em(
         for col in temp_df.columns:
             if temp_df[col].isnull().all():  # 检查列是否包含 None 或 NaN
                 temp_df[col] = pd.to_numeric(temp_df[col], errors="coerce")
-        if big_df.empty:
-            big_df = temp_df
-        else:
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     return big_df
 
 
@@ -364,7 +353,7 @@ def stock_cash_flow_sheet_by_yearly_em(
     temp_df["REPORT_DATE"] = temp_df["REPORT_DATE"].astype(str)
     need_date = temp_df["REPORT_DATE"].tolist()
     sep_list = [",".join(need_date[i : i + 5]) for i in range(0, len(need_date), 5)]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for item in tqdm(sep_list, leave=False):
         url = "https://emweb.securities.eastmoney.com/PC_HSF10/NewFinanceAnalysis/xjllbAjaxNew"
@@ -383,10 +372,8 @@ def stock_cash_flow_sheet_by_yearly_em(
         for col in temp_df.columns:
             if temp_df[col].isnull().all():  # 检查列是否包含 None 或 NaN
                 temp_df[col] = pd.to_numeric(temp_df[col], errors="coerce")
-        if big_df.empty:
-            big_df = temp_df
-        else:
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     return big_df
 
 
@@ -415,7 +402,7 @@ def stock_cash_flow_sheet_by_quarterly_em(
     temp_df["REPORT_DATE"] = temp_df["REPORT_DATE"].astype(str)
     need_date = temp_df["REPORT_DATE"].tolist()
     sep_list = [",".join(need_date[i : i + 5]) for i in range(0, len(need_date), 5)]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for item in tqdm(sep_list, leave=False):
         url = "https://emweb.securities.eastmoney.com/PC_HSF10/NewFinanceAnalysis/xjllbAjaxNew"
@@ -434,10 +421,8 @@ def stock_cash_flow_sheet_by_quarterly_em(
         for col in temp_df.columns:
             if temp_df[col].isnull().all():  # 检查列是否包含 None 或 NaN
                 temp_df[col] = pd.to_numeric(temp_df[col], errors="coerce")
-        if big_df.empty:
-            big_df = temp_df
-        else:
-            big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
     return big_df
 
 
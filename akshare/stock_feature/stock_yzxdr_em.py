@@ -8,9 +8,10 @@ https://data.eastmoney.com/yzxdr/
 
 import pandas as pd
 import requests
+from akshare.utils.func import PageAccumulator
 from akshare.utils.tqdm import get_tqdm
 
-from akshare.utils import demjson
+from akshare.utils.js_literal import loads_js_literal
 
 
 def stock_yzxdr_em(date: str = "20240930") -> pd.DataFrame:
@@ -41,9 +42,9 @@ def stock_yzxdr_em(date: str = "20240930") -> pd.DataFrame:
     }
     r = requests.get(url, params=params)
     data_text = r.text
-    data_json = demjson.decode(data_text[data_text.find("{") : -1])
+    data_json = loads_js_literal(data_text[data_text.find("{") : -1])
     total_pages = data_json["result"]["pages"]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, total_pages + 1), leave=False):
         params.update(
@@ -54,9 +55,10 @@ def stock_yzxdr_em(date: str = "20240930") -> pd.DataFrame:
         )
         r = requests.get(url, params=params)
         data_text = r.text
-        data_json = demjson.decode(data_text[data_text.find("{") : -1])
+        data_json = loads_js_literal(data_text[data_text.find("{") : -1])
         temp_df = pd.DataFrame(data_json["result"]["data"])
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
 
     big_df.reset_index(inplace=True)
     big_df["index"] = range(1, len(big_df) + 1)
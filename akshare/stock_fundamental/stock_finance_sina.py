@@ -18,6 +18,7 @@ import pandas as pd
 import requests
 from bs4 import BeautifulSoup
 
+from akshare.utils.func import PageAccumulator
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -250,7 +251,7 @@ def stock_financial_analysis_indicator(
         year_list = year_list[: year_list.index(start_year) + 1]
     else:
         return pd.DataFrame()
-    out_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for year_item in tqdm(year_list, leave=False):
         url = (
@@ -292,7 +293,8 @@ def stock_financial_analysis_indicator(
         big_df.columns = big_df.iloc[0, :].tolist()
         big_df = big_df.iloc[1:, :]
         big_df.index = temp_df.columns.tolist()[1:]
-        out_df = pd.concat(objs=[out_df, big_df])
+        pages.append(big_df)
+    out_df = pages.to_frame()
 
     out_df.dropna(inplace=True)
     out_df.reset_index(inplace=True)
@@ -555,7 +557,7 @@ def stock_circulate_stock_holder(symbol: str = "600000") -> pd.DataFrame:
     r = requests.get(url)
     temp_df = pd.read_html(StringIO(r.text))[13].iloc[:, :5]
     temp_df.columns = [*range(5)]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     need_range = temp_df[
         temp_df.iloc[:, 0].str.find("截止日期") == 0
     ].index.tolist() + [len(temp_df)]
@@ -583,7 +585,8 @@ def stock_circulate_stock_holder(symbol: str = "600000") -> pd.DataFrame:
             except Exception as e:
                 print("Error:", e)
 
-        big_df = pd.concat(objs=[big_df, concat_df], axis=0, ignore_index=True)
+        pages.append(concat_df)
+    big_df = pages.to_frame(axis=0, ignore_index=True)
 
     big_df = big_df[
         [
@@ -628,7 +631,7 @@ def stock_fund_stock_holder(symbol: str = "600004") -> pd.DataFrame:
     r = requests.get(url)
     temp_df = pd.read_html(StringIO(r.text))[13].iloc[:, :6]
     temp_df.columns = [*range(6)]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     need_range = temp_df[
         temp_df.iloc[:, 0].str.find("截止日期") == 0
     ].index.tolist() + [len(temp_df)]
@@ -653,7 +656,8 @@ def stock_fund_stock_holder(symbol: str = "600004") -> pd.DataFrame:
             except Exception as e:
                 print("Error:", e)
 
-        big_df = pd.concat(objs=[big_df, concat_df], axis=0, ignore_index=True)
+        pages.append(concat_df)
+    big_df = pages.to_frame(axis=0, ignore_index=True)
     big_df.dropna(inplace=True)
     big_df.reset_index(inplace=True, drop=True)
     big_df.columns = [
@@ -687,7 +691,7 @@ def stock_main_stock_holder(stock: str = "600004") -> pd.DataFrame:
     r = requests.get(url)
     temp_df = pd.read_html(StringIO(r.text))[13].iloc[:, :5]
     temp_df.columns = [*range(5)]
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     need_range = temp_df[
         temp_df.iloc[:, 0].str.find("截至日期") == 0
     ].index.tolist() + [len(temp_df)]
@@ -729,7 +733,8 @@ def stock_main_stock_holder(stock: str = "600004") -> pd.DataFrame:
         concat_df["平均持股数"] = concat_df["平均持股数"].str.strip(
             "(按总股本计算) 查看变化趋势"
         )
-        big_df = pd.concat(objs=[big_df, concat_df], axis=0, ignore_index=True)
+        pages.append(concat_df)
+    big_df = pages.to_frame(axis=0, ignore_index=True)
     big_df.dropna(inplace=True, how="all")
     big_df.reset_index(inplace=True, drop=True)
     big_df.rename(
@@ -11,6 +11,7 @@ import math
 import pandas as pd
 import requests
 
+from akshare.utils.func import PageAccumulator
 from akshare.utils.tqdm import get_tqdm
 
 
@@ -50,7 +51,7 @@ def stock_notice_report(symbol: str = "全部", date: str = "20220511") -> pd.Da
     r = requests.get(url, params=params)
     data_json = r.json()
     total_page = math.ceil(data_json["data"]["total_hits"] / 100)
-    big_df = pd.DataFrame()
+    pages = PageAccumulator()
     tqdm = get_tqdm()
     for page in tqdm(range(1, int(total_page) + 1), leave=False):
         params.update(
@@ -82,7 +83,8 @@ def stock_notice_report(symbol: str = "全部", date: str = "20220511") -> pd.Da
         del temp_df["codes"]
         del temp_df["columns"]
         temp_df = pd.concat(objs=[temp_df, temp_columns_df, temp_codes_df], axis=1)
-        big_df = pd.concat(objs=[big_df, temp_df], ignore_index=True)
+        pages.append(temp_df)
+    big_df = pages.to_frame(ignore_index=True)
 
     big_df.rename(
         columns={
@@ -11,9 +11,8 @@ import datetime
 
 import pandas as pd
 import requests
-import py_mini_racer
 
-from akshare.stock.cons import hk_js_decode
+from akshare.utils.sina_decode import sina_js_decode
 
 
 def tool_trade_date_hist_sina() -> pd.DataFrame:
@@ -25,9 +24,7 @@ def tool_trade_date_hist_sina() -> pd.DataFrame:
     """
     url = "https://finance.sina.com.cn/realstock/company/klc_td_sh.txt"
     r = requests.get(url)
-    js_code = py_mini_racer.MiniRacer()
-    js_code.eval(hk_js_decode)
-    dict_list = js_code.call("d", r.text.split("=")[1].split(";")[0].replace('"', ""))
+    dict_list = sina_js_decode(r.text.split("=")[1].split(";")[0].replace('"', ""))
     temp_df = pd.DataFrame(dict_list)
     temp_df.columns = ["trade_date"]
     temp_df["trade_date"] = pd.to_datetime(temp_df["trade_date"]).dt.date
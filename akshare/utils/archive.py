@@ -0,0 +1,58 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/18 00:30
+Desc: 交易所压缩包的流式读取
+下载内容分块写入临时文件(超过 max_memory 后落盘), 成员文件按需逐个打开, 只解析需要的成员
+"""
+
+import tempfile
+import zipfile
+from typing import IO, Callable, Iterator, Optional, Tuple
+
+import requests
+
+_CHUNK_SIZE = 1 << 20
+
+
+def download_spooled(
+    url: str,
+    method: str = "get",
+    max_memory: int = 16 << 20,
+    **kwargs,
+) -> IO[bytes]:
+    """
+    流式下载到临时文件
+    :param url: 请求地址
+    :type url: str
+    :param method: choice of {"get", "post"}
+    :type method: str
+    :param max_memory: 内存中最多保留的字节数, 超过后写入磁盘
+    :type max_memory: int
+    :param kwargs: 传给 requests 的其他参数, 如 params, json, headers, timeout
+    :return: 已定位到开头的临时文件, 使用后需要关闭
+    :rtype: tempfile.SpooledTemporaryFile
+    """
+    file = tempfile.SpooledTemporaryFile(max_size=max_memory)
+    with requests.request(method, url, stream=True, **kwargs) as r:
+        for chunk in r.iter_content(chunk_size=_CHUNK_SIZE):
+            file.write(chunk)
+    file.seek(0)
+    return file
+
+
+def iter_zip_members(
+    source: IO[bytes], match: Optional[Callable[[str], bool]] = None
+) -> Iterator[Tuple[str, zipfile.ZipFile]]:
+    """
+    逐个列出压缩包中的成员文件
+    :param source: 压缩包文件对象
+    :type source: file-like object
+    :param match: 成员文件名的过滤函数; 为空时返回全部成员
+    :type match: function
+    :return: (成员文件名, 压缩包) 的迭代器, 通过 zip_file.open(name) 按需读取成员
+    :rtype: iterator
+    """
+    with zipfile.ZipFile(source) as zip_file:
+        for name in zip_file.namelist():
+            if match is None or match(name):
+                yield name, zip_file
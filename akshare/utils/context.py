@@ -5,6 +5,8 @@ class AkshareConfig:
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance.proxies = None
+            cls._instance.page_max_workers = 1
+            cls._instance.page_rate = None
         return cls._instance
 
     @classmethod
@@ -15,6 +17,15 @@ class AkshareConfig:
     def get_proxies(cls):
         return cls().proxies
 
+    @classmethod
+    def set_page_concurrency(cls, max_workers=1, rate=None):
+        cls().page_max_workers = max_workers
+        cls().page_rate = rate
+
+    @classmethod
+    def get_page_concurrency(cls):
+        return cls().page_max_workers, cls().page_rate
+
 
 config = AkshareConfig()
 
@@ -28,6 +39,15 @@ def get_proxies():
     return config.get_proxies()
 
 
+# 设置分页接口的并发线程数和每个主机的每秒请求数
+def set_page_concurrency(max_workers=1, rate=None):
+    config.set_page_concurrency(max_workers, rate)
+
+
+def get_page_concurrency():
+    return config.get_page_concurrency()
+
+
 class ProxyContext:
     def __init__(self, proxies):
         self.proxies = proxies
@@ -41,3 +61,19 @@ class ProxyContext:
     def __exit__(self, exc_type, exc_val, exc_tb):
         config.set_proxies(self.old_proxies)
         return False  # 不处理异常
+
+
+class PageConcurrencyContext:
+    def __init__(self, max_workers=8, rate=5):
+        self.max_workers = max_workers
+        self.rate = rate
+        self.old_settings = None
+
+    def __enter__(self):
+        self.old_settings = config.get_page_concurrency()
+        config.set_page_concurrency(self.max_workers, self.rate)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        config.set_page_concurrency(*self.old_settings)
+        return False  # 不处理异常
@@ -0,0 +1,225 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/17 22:00
+Desc: 按交易所和交易日的本地结果缓存
+交易所的历史日数据不会再变化, 开启后按 (函数, 交易所, 日期, 其余参数) 把解析后的结果保存在本地,
+再次请求同一天的数据时直接读取; 今天和昨天的数据可能仍在更新, 只在 recent_ttl 秒内有效
+"""
+
+import datetime
+import functools
+import hashlib
+import inspect
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Optional
+
+import pandas as pd
+
+from akshare.utils.trade_calendar import to_date
+
+
+class DayCache:
+    """
+    本地日数据缓存
+    存储目录默认为 ~/.akshare/day_cache, 文件路径为 函数名/日期/参数摘要.pkl
+    """
+
+    def __init__(self, root: str = None, recent_ttl: float = 3600):
+        """
+        :param root: 存储目录
+        :type root: str
+        :param recent_ttl: 今天和昨天的数据的有效时间（秒）
+        :type recent_ttl: float
+        """
+        self.root = root or os.path.join(
+            os.path.expanduser("~"), ".akshare", "day_cache"
+        )
+        self.recent_ttl = recent_ttl
+
+    def path(self, name: str, exchange: str, day: str, params: dict) -> str:
+        """
+        缓存文件路径
+        :param name: 函数名
+        :type name: str
+        :param exchange: 交易所
+        :type exchange: str
+        :param day: 日期, 格式为 YYYYMMDD
+        :type day: str
+        :param params: 除日期以外的参数
+        :type params: dict
+        :return: 文件路径
+        :rtype: str
+        """
+        key = json.dumps([name, exchange, day, params], sort_keys=True)
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.root, name, day, f"{digest}.pkl")
+
+    def is_fresh(self, path: str, day: str) -> bool:
+        """
+        缓存文件是否仍然有效
+        :param path: 文件路径
+        :type path: str
+        :param day: 日期, 格式为 YYYYMMDD
+        :type day: str
+        :return: 是否有效
+        :rtype: bool
+        """
+        if not os.path.exists(path):
+            return False
+        yesterday = datetime.date.today() - datetime.timedelta(days=1)
+        if day < yesterday.strftime("%Y%m%d"):
+            return True
+        return time.time() - os.path.getmtime(path) < self.recent_ttl
+
+    def load(self, path: str) -> Any:
+        """
+        读取缓存
+        :param path: 文件路径
+        :type path: str
+        :return: 缓存的结果
+        :rtype: pandas.DataFrame or dict
+        """
+        return pd.read_pickle(path)
+
+    def save(self, value: Any, path: str) -> None:
+        """
+        原子写入缓存
+        :param value: 需要缓存的结果
+        :type value: pandas.DataFrame or dict
+        :param path: 文件路径
+        :type path: str
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        pd.to_pickle(value, tmp_path)
+        os.replace(tmp_path, path)
+
+
+_day_cache: Optional[DayCache] = None
+
+
+def enable_day_cache(root: str = None, recent_ttl: float = 3600) -> None:
+    """
+    开启期货日数据的本地缓存
+    :param root: 存储目录; 默认为 ~/.akshare/day_cache
+    :type root: str
+    :param recent_ttl: 今天和昨天的数据的有效时间（秒）
+    :type recent_ttl: float
+    """
+    global _day_cache
+    _day_cache = DayCache(root=root, recent_ttl=recent_ttl)
+
+
+def disable_day_cache() -> None:
+    """
+    关闭期货日数据的本地缓存, 已缓存的文件保留
+    """
+    global _day_cache
+    _day_cache = None
+
+
+def get_day_cache() -> Optional[DayCache]:
+    """
+    当前使用的缓存, 未开启时返回 None
+    :return: 缓存
+    :rtype: DayCache
+    """
+    return _day_cache
+
+
+def _is_empty(value: Any) -> bool:
+    if value is None or value is False:
+        return True
+    if isinstance(value, (pd.DataFrame, dict, list)):
+        return len(value) == 0
+    return False
+
+
+def _is_incomplete(value: Any) -> bool:
+    """
+    结果是否不完整: pandas.DataFrame 的 attrs["failed"] 非空, 或 dict 中有空的子结果
+    :param value: 被装饰函数的返回结果
+    :type value: pandas.DataFrame or dict
+    :return: 是否不完整
+    :rtype: bool
+    """
+    if isinstance(value, pd.DataFrame):
+        return bool(value.attrs.get("failed"))
+    if isinstance(value, dict):
+        return any(_is_empty(item) for item in value.values())
+    return False
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, (list, tuple, set)):
+        return sorted(str(item) for item in value)
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return repr(value)
+
+
+def day_cached(exchange: str) -> Callable:
+    """
+    按交易日缓存的装饰器; 被装饰的函数需要有 date 参数, 返回 pandas.DataFrame 或 dict
+    空结果、请求失败(返回 None 或 False)和不完整的结果(部分子结果为空或 attrs["failed"] 非空)不缓存
+    :param exchange: 交易所
+    :type exchange: str
+    :return: 装饰器
+    :rtype: function
+    """
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        name = f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            cache = _day_cache
+            if cache is None:
+                return func(*args, **kwargs)
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            date = bound.arguments["date"]
+            day = to_date(date) if date is not None else datetime.date.today()
+            if day is None:
+                return func(*args, **kwargs)
+            day = day.strftime("%Y%m%d")
+            params = {
+                key: _normalize(value)
+                for key, value in bound.arguments.items()
+                if key != "date"
+            }
+            path = cache.path(name, exchange, day, params)
+            if cache.is_fresh(path, day):
+                try:
+                    return cache.load(path)
+                except Exception:
+                    pass
+            value = func(*args, **kwargs)
+            if not _is_empty(value) and not _is_incomplete(value):
+                cache.save(value, path)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+class DayCacheContext:
+    def __init__(self, root: str = None, recent_ttl: float = 3600):
+        self.root = root
+        self.recent_ttl = recent_ttl
+        self.old_cache = None
+
+    def __enter__(self):
+        self.old_cache = _day_cache
+        enable_day_cache(root=self.root, recent_ttl=self.recent_ttl)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        global _day_cache
+        _day_cache = self.old_cache
+        return False  # 不处理异常
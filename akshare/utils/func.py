@@ -1,21 +1,70 @@
 # !/usr/bin/env python
 """
-Date: 2025/3/10 18:00
+Date: 2026/10/17 11:00
 Desc: 通用帮助函数
 """
 
 import math
 import random
 import time
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Hashable, Iterable, List, Tuple, Union
 
 import pandas as pd
 
+from akshare.utils.context import config
+from akshare.utils.ratelimit import TokenBucket, get_rate_limiter
 from akshare.utils.request import request_with_retry
 from akshare.utils.tqdm import get_tqdm
 
 
-def fetch_paginated_data(url: str, base_params: Dict, timeout: int = 15):
+def _fetch_page_diff(
+    url: str, params: Dict, timeout: int = 15, limiter: TokenBucket = None
+) -> List[Dict]:
+    """
+    东方财富-获取单页数据
+    :param url: 请求地址
+    :type url: str
+    :param params: 请求参数
+    :type params: dict
+    :param timeout: 请求超时时间
+    :type timeout: int
+    :param limiter: 主机令牌桶, 为 None 时不限速
+    :type limiter: akshare.utils.ratelimit.TokenBucket
+    :return: 该页数据
+    :rtype: list
+    """
+    r = request_with_retry(url, params=params, timeout=timeout, limiter=limiter)
+    data_json = r.json()
+    return data_json["data"]["diff"]
+
+
+def _merge_paginated_data(page_data: Dict[int, List[Dict]]) -> pd.DataFrame:
+    """
+    东方财富-按页码顺序合并分页数据, 并按涨跌幅排序编号
+    :param page_data: 页码到该页数据的映射
+    :type page_data: dict
+    :return: 合并后的数据
+    :rtype: pandas.DataFrame
+    """
+    temp_df = pd.concat(
+        [pd.DataFrame(page_data[page]) for page in sorted(page_data)],
+        ignore_index=True,
+    )
+    temp_df["f3"] = pd.to_numeric(temp_df["f3"], errors="coerce")
+    temp_df.sort_values(by=["f3"], ascending=False, inplace=True, ignore_index=True)
+    temp_df.reset_index(inplace=True)
+    temp_df["index"] = temp_df["index"].astype(int) + 1
+    return temp_df
+
+
+def fetch_paginated_data(
+    url: str,
+    base_params: Dict,
+    timeout: int = 15,
+    max_workers: int = None,
+    rate: float = None,
+):
     """
     东方财富-分页获取数据并合并结果
     https://quote.eastmoney.com/f1.html?newcode=0.000001
@@ -25,9 +74,17 @@ def fetch_paginated_data(url: str, base_params: Dict, timeout: int = 15):
     :type base_params: dict
     :param timeout: 请求超时时间
     :type timeout: str
+    :param max_workers: 并发获取剩余页面的线程数; 默认取 set_page_concurrency 的全局设置(1, 即逐页获取)
+    :type max_workers: int
+    :param rate: 该主机每秒最多请求数; 默认取全局设置, 未设置时逐页获取使用随机延迟, 并发获取限速为 5
+    :type rate: float
     :return: 合并后的数据
     :rtype: pandas.DataFrame
     """
+    if max_workers is None:
+        max_workers = config.page_max_workers
+    if rate is None:
+        rate = config.page_rate
     # 复制参数以避免修改原始参数
     params = base_params.copy()
     # 获取第一页数据，用于确定分页信息
@@ -36,28 +93,99 @@ def fetch_paginated_data(url: str, base_params: Dict, timeout: int = 15):
     # 计算分页信息
     per_page_num = len(data_json["data"]["diff"])
     total_page = math.ceil(data_json["data"]["total"] / per_page_num)
-    # 存储所有页面数据
-    temp_list = []
-    # 添加第一页数据
-    temp_list.append(pd.DataFrame(data_json["data"]["diff"]))
+    # 存储所有页面数据, 第一页数据直接放入
+    page_data = {1: data_json["data"]["diff"]}
     # 获取进度条
     tqdm = get_tqdm()
-    # 获取剩余页面数据
-    for page in tqdm(range(2, total_page + 1), leave=False):
-        params.update({"pn": page})
-        # 添加随机延迟，避免请求过于频繁
-        time.sleep(random.uniform(0.5, 1.5))
-        r = request_with_retry(url, params=params, timeout=timeout)
-        data_json = r.json()
-        inner_temp_df = pd.DataFrame(data_json["data"]["diff"])
-        temp_list.append(inner_temp_df)
-    # 合并所有数据
-    temp_df = pd.concat(temp_list, ignore_index=True)
-    temp_df["f3"] = pd.to_numeric(temp_df["f3"], errors="coerce")
-    temp_df.sort_values(by=["f3"], ascending=False, inplace=True, ignore_index=True)
-    temp_df.reset_index(inplace=True)
-    temp_df["index"] = temp_df["index"].astype(int) + 1
-    return temp_df
+    if max_workers > 1 or rate is not None:
+        # 按主机令牌桶限速, 并发获取剩余页面
+        limiter = get_rate_limiter(url, rate=rate or 5)
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = {
+                executor.submit(
+                    _fetch_page_diff,
+                    url,
+                    {**params, "pn": page},
+                    timeout,
+                    limiter,
+                ): page
+                for page in range(2, total_page + 1)
+            }
+            for future in tqdm(as_completed(futures), total=len(futures), leave=False):
+                page_data[futures[future]] = future.result()
+    else:
+        # 获取剩余页面数据
+        for page in tqdm(range(2, total_page + 1), leave=False):
+            params.update({"pn": page})
+            # 添加随机延迟，避免请求过于频繁
+            time.sleep(random.uniform(0.5, 1.5))
+            page_data[page] = _fetch_page_diff(url, params=params, timeout=timeout)
+    return _merge_paginated_data(page_data)
+
+
+def _is_empty_result(value) -> bool:
+    """
+    判断单个任务的结果是否为空
+    :param value: 任务结果
+    :type value: object
+    :return: 是否为空
+    :rtype: bool
+    """
+    if value is None:
+        return True
+    empty = getattr(value, "empty", None)
+    return isinstance(empty, bool) and empty
+
+
+def run_batch(
+    keys: Iterable[Hashable],
+    fetch: Callable,
+    limiter: Union[TokenBucket, Callable, None] = None,
+    max_workers: int = 8,
+    empty_as_failed: bool = False,
+) -> Tuple[Dict, Dict]:
+    """
+    并发批量获取
+    :param keys: 任务键列表, 每个键作为唯一参数传给 fetch
+    :type keys: list
+    :param fetch: 获取单个任务的函数
+    :type fetch: callable
+    :param limiter: 每个任务开始前获取令牌的限速器, 或根据任务键返回限速器的函数; None 表示不限速;
+    需要在每次重试前限速时应在 fetch 内部获取令牌
+    :type limiter: TokenBucket or callable
+    :param max_workers: 并发线程数
+    :type max_workers: int
+    :param empty_as_failed: 空结果是否记为失败; 否则直接丢弃
+    :type empty_as_failed: bool
+    :return: 按 keys 顺序排列的成功结果, 以及失败的任务键到原因的映射
+    :rtype: tuple
+    """
+    key_list = list(dict.fromkeys(keys))
+
+    def _run(key):
+        if limiter is not None:
+            bucket = limiter if hasattr(limiter, "acquire") else limiter(key)
+            bucket.acquire()
+        return fetch(key)
+
+    result_dict = {}
+    failed_dict = {}
+    tqdm = get_tqdm()
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {executor.submit(_run, key): key for key in key_list}
+        for future in tqdm(as_completed(futures), total=len(futures), leave=False):
+            key = futures[future]
+            try:
+                value = future.result()
+            except Exception as e:
+                failed_dict[key] = repr(e)
+                continue
+            if not _is_empty_result(value):
+                result_dict[key] = value
+            elif empty_as_failed:
+                failed_dict[key] = "empty result"
+    ordered_dict = {key: result_dict[key] for key in key_list if key in result_dict}
+    return ordered_dict, failed_dict
 
 
 def set_df_columns(df: pd.DataFrame, cols: List[str]) -> pd.DataFrame:
@@ -75,3 +203,52 @@ def set_df_columns(df: pd.DataFrame, cols: List[str]) -> pd.DataFrame:
     else:
         df.columns = cols
         return df
+
+
+class PageAccumulator:
+    """
+    分页数据累加器
+    循环中逐页收集数据, 结束后一次性拼接; 避免在循环中反复 pd.concat 导致每页都复制已累计的全部数据
+    """
+
+    def __init__(self):
+        self._chunks = []
+        self._records = []
+
+    def _flush_records(self) -> None:
+        if self._records:
+            self._chunks.append(pd.DataFrame(self._records))
+            self._records = []
+
+    def append(self, df: pd.DataFrame) -> None:
+        """
+        添加一页数据
+        :param df: 该页数据
+        :type df: pandas.DataFrame
+        """
+        self._flush_records()
+        self._chunks.append(df)
+
+    def extend(self, records: List) -> None:
+        """
+        添加原始记录, 连续添加的记录在拼接时才转换为数据框
+        :param records: 记录列表, 每条记录为字典或列表
+        :type records: list
+        """
+        self._records.extend(records)
+
+    def __len__(self) -> int:
+        return sum(len(chunk) for chunk in self._chunks) + len(self._records)
+
+    def to_frame(self, **kwargs) -> pd.DataFrame:
+        """
+        拼接累计的数据
+        :param kwargs: 传给 pandas.concat 的参数, 例如 ignore_index=True
+        :type kwargs: dict
+        :return: 拼接后的数据, 没有数据时返回空的数据框
+        :rtype: pandas.DataFrame
+        """
+        self._flush_records()
+        if not self._chunks:
+            return pd.DataFrame()
+        return pd.concat(self._chunks, **kwargs)
@@ -0,0 +1,349 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/17 14:00
+Desc: 本地增量行情存储
+按 (数据源, 代码, 周期, 复权方式) 在本地保存历史行情, 再次获取时只请求缺失的尾部数据
+"""
+
+import os
+import re
+import threading
+from datetime import datetime
+from typing import Callable, Dict, NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+
+class HistSource(NamedTuple):
+    """
+    增量存储支持的数据源
+    fetch(symbol, period, adjust, start_date, end_date) 返回该区间的行情
+    date_col 为日期字段, price_col 为用于检测复权变化的价格字段
+    """
+
+    fetch: Callable[[str, str, str, str, str], pd.DataFrame]
+    date_col: str
+    price_col: str
+
+
+def _stock_zh_a_hist(
+    symbol: str, period: str, adjust: str, start_date: str, end_date: str
+) -> pd.DataFrame:
+    from akshare.stock_feature.stock_hist_em import stock_zh_a_hist
+
+    return stock_zh_a_hist(
+        symbol=symbol,
+        period=period,
+        start_date=start_date,
+        end_date=end_date,
+        adjust=adjust,
+    )
+
+
+def _stock_zh_a_daily(
+    symbol: str, period: str, adjust: str, start_date: str, end_date: str
+) -> pd.DataFrame:
+    from akshare.stock.stock_zh_a_sina import stock_zh_a_daily
+
+    return stock_zh_a_daily(
+        symbol=symbol, start_date=start_date, end_date=end_date, adjust=adjust
+    )
+
+
+def _futures_zh_daily_sina(
+    symbol: str, period: str, adjust: str, start_date: str, end_date: str
+) -> pd.DataFrame:
+    from akshare.futures.futures_zh_sina import futures_zh_daily_sina
+
+    # 该接口不支持按日期请求, 只能整段获取后截取
+    temp_df = futures_zh_daily_sina(symbol=symbol)
+    date_series = pd.to_datetime(temp_df["date"], errors="coerce")
+    return temp_df[
+        (date_series >= pd.to_datetime(start_date))
+        & (date_series <= pd.to_datetime(end_date))
+    ]
+
+
+def _fund_etf_hist_em(
+    symbol: str, period: str, adjust: str, start_date: str, end_date: str
+) -> pd.DataFrame:
+    from akshare.fund.fund_etf_em import fund_etf_hist_em
+
+    return fund_etf_hist_em(
+        symbol=symbol,
+        period=period,
+        start_date=start_date,
+        end_date=end_date,
+        adjust=adjust,
+    )
+
+
+hist_source_dict: Dict[str, HistSource] = {
+    "stock_zh_a_hist": HistSource(_stock_zh_a_hist, "日期", "收盘"),
+    "stock_zh_a_daily": HistSource(_stock_zh_a_daily, "date", "close"),
+    "futures_zh_daily_sina": HistSource(_futures_zh_daily_sina, "date", "close"),
+    "fund_etf_hist_em": HistSource(_fund_etf_hist_em, "日期", "收盘"),
+}
+
+
+def _has_pyarrow() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def write_frame(df: pd.DataFrame, path: str) -> None:
+    """
+    原子写入数据框; 后缀为 .parquet 时写入 Parquet, 否则写入 pickle
+    :param df: 需要写入的数据
+    :type df: pandas.DataFrame
+    :param path: 文件路径
+    :type path: str
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # 临时文件名包含进程和线程, 同一文件的并发写入互不干扰
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    if path.endswith(".parquet"):
+        df.to_parquet(tmp_path, index=False)
+    else:
+        df.to_pickle(tmp_path)
+    os.replace(tmp_path, path)
+
+
+def read_frame(path: str) -> Optional[pd.DataFrame]:
+    """
+    读取 write_frame 写入的数据框
+    :param path: 文件路径
+    :type path: str
+    :return: 数据框, 文件不存在时返回 None
+    :rtype: pandas.DataFrame
+    """
+    if not os.path.exists(path):
+        return None
+    if path.endswith(".parquet"):
+        return pd.read_parquet(path)
+    return pd.read_pickle(path)
+
+
+class HistStore:
+    """
+    本地增量行情存储
+    存储目录默认为 ~/.akshare/hist; 安装了 pyarrow 时使用 Parquet 格式, 否则使用 pickle
+    """
+
+    def __init__(self, root: str = None, fmt: str = None):
+        """
+        :param root: 存储目录
+        :type root: str
+        :param fmt: choice of {"parquet", "pickle"}; 默认有 pyarrow 时为 parquet
+        :type fmt: str
+        """
+        self.root = root or os.path.join(os.path.expanduser("~"), ".akshare", "hist")
+        if fmt is None:
+            fmt = "parquet" if _has_pyarrow() else "pickle"
+        if fmt not in {"parquet", "pickle"}:
+            raise ValueError("fmt must be one of {'parquet', 'pickle'}")
+        self.fmt = fmt
+
+    def path(self, source: str, symbol: str, period: str, adjust: str) -> str:
+        """
+        数据文件路径
+        :param source: 数据源
+        :type source: str
+        :param symbol: 代码
+        :type symbol: str
+        :param period: 周期
+        :type period: str
+        :param adjust: 复权方式
+        :type adjust: str
+        :return: 文件路径
+        :rtype: str
+        """
+        safe_symbol = re.sub(r"[^\w.\-]", "_", symbol)
+        return os.path.join(
+            self.root,
+            source,
+            period,
+            adjust or "none",
+            f"{safe_symbol}.{self.fmt}",
+        )
+
+    def load(
+        self, source: str, symbol: str, period: str = "daily", adjust: str = ""
+    ) -> Optional[pd.DataFrame]:
+        """
+        读取本地存储的行情
+        :return: 本地行情, 不存在时返回 None
+        :rtype: pandas.DataFrame
+        """
+        return read_frame(self.path(source, symbol, period, adjust))
+
+    def save(
+        self,
+        df: pd.DataFrame,
+        source: str,
+        symbol: str,
+        period: str = "daily",
+        adjust: str = "",
+    ) -> None:
+        """
+        覆盖写入本地行情
+        """
+        write_frame(df, self.path(source, symbol, period, adjust))
+
+    def remove(
+        self, source: str, symbol: str, period: str = "daily", adjust: str = ""
+    ) -> None:
+        """
+        删除本地行情
+        """
+        path = self.path(source, symbol, period, adjust)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def get(
+        self,
+        source: str,
+        symbol: str,
+        period: str = "daily",
+        adjust: str = "",
+        start_date: str = "19700101",
+        end_date: str = None,
+    ) -> pd.DataFrame:
+        """
+        增量获取历史行情
+        本地无数据时获取全部历史; 否则从倒数第二个已存日期开始请求, 用新数据替换最后一个已存交易日
+        (盘中写入的数据可能不完整) 并追加之后的数据; 前复权数据在重叠日的价格发生变化时, 说明
+        出现了除权除息, 会重新获取全部历史并覆盖本地数据
+        :param source: choice of {"stock_zh_a_hist", "stock_zh_a_daily", "futures_zh_daily_sina", "fund_etf_hist_em"}
+        :type source: str
+        :param symbol: 代码, 与对应接口的 symbol 参数一致
+        :type symbol: str
+        :param period: choice of {'daily', 'weekly', 'monthly'}; 新浪数据源只支持 daily
+        :type period: str
+        :param adjust: choice of {"qfq": "前复权", "hfq": "后复权", "": "不复权"}
+        :type adjust: str
+        :param start_date: 返回数据的开始日期
+        :type start_date: str
+        :param end_date: 返回数据的结束日期; 默认为今天
+        :type end_date: str
+        :return: 历史行情
+        :rtype: pandas.DataFrame
+        """
+        if source not in hist_source_dict:
+            raise ValueError(f"source must be one of {set(hist_source_dict)}")
+        hist_source = hist_source_dict[source]
+        date_col = hist_source.date_col
+        end_date = end_date or datetime.now().strftime("%Y%m%d")
+        stored_df = self.load(source, symbol, period, adjust)
+        if stored_df is None or stored_df.empty:
+            big_df = hist_source.fetch(symbol, period, adjust, "19700101", end_date)
+        else:
+            stored_dates = pd.to_datetime(stored_df[date_col])
+            last_date = stored_dates.iloc[-1]
+            anchor_date = stored_dates.iloc[-2] if len(stored_dates) > 1 else last_date
+            today = pd.Timestamp(datetime.now().date())
+            if pd.to_datetime(end_date) <= last_date < today:
+                big_df = stored_df
+            else:
+                new_df = hist_source.fetch(
+                    symbol, period, adjust, anchor_date.strftime("%Y%m%d"), end_date
+                )
+                if adjust == "qfq" and self._adjust_changed(
+                    stored_df, new_df, hist_source, anchor_date
+                ):
+                    big_df = hist_source.fetch(
+                        symbol, period, adjust, "19700101", end_date
+                    )
+                elif new_df.empty:
+                    big_df = stored_df
+                else:
+                    new_dates = pd.to_datetime(new_df[date_col])
+                    big_df = pd.concat(
+                        [
+                            stored_df[stored_dates < last_date],
+                            new_df[new_dates >= last_date],
+                        ],
+                        ignore_index=True,
+                    )
+        if big_df is None or big_df.empty:
+            return pd.DataFrame()
+        if big_df is not stored_df:
+            big_df = big_df.sort_values(
+                by=date_col, key=lambda x: pd.to_datetime(x), ignore_index=True
+            )
+            self.save(big_df, source, symbol, period, adjust)
+        date_series = pd.to_datetime(big_df[date_col])
+        temp_df = big_df[
+            (date_series >= pd.to_datetime(start_date))
+            & (date_series <= pd.to_datetime(end_date))
+        ]
+        temp_df.reset_index(drop=True, inplace=True)
+        return temp_df
+
+    @staticmethod
+    def _adjust_changed(
+        stored_df: pd.DataFrame,
+        new_df: pd.DataFrame,
+        hist_source: HistSource,
+        anchor_date: pd.Timestamp,
+    ) -> bool:
+        """
+        比较重叠日的价格, 判断前复权因子是否发生变化
+        """
+        if new_df.empty:
+            return False
+        stored_price = stored_df.loc[
+            pd.to_datetime(stored_df[hist_source.date_col]) == anchor_date,
+            hist_source.price_col,
+        ]
+        new_price = new_df.loc[
+            pd.to_datetime(new_df[hist_source.date_col]) == anchor_date,
+            hist_source.price_col,
+        ]
+        if stored_price.empty or new_price.empty:
+            return True
+        return not np.isclose(
+            float(stored_price.iloc[-1]), float(new_price.iloc[-1]), rtol=1e-6
+        )
+
+
+def hist_incremental(
+    source: str = "stock_zh_a_hist",
+    symbol: str = "000001",
+    period: str = "daily",
+    adjust: str = "",
+    start_date: str = "19700101",
+    end_date: str = None,
+    root: str = None,
+) -> pd.DataFrame:
+    """
+    增量获取历史行情, 本地已有的数据不再重复下载
+    :param source: choice of {"stock_zh_a_hist", "stock_zh_a_daily", "futures_zh_daily_sina", "fund_etf_hist_em"}
+    :type source: str
+    :param symbol: 代码, 与对应接口的 symbol 参数一致
+    :type symbol: str
+    :param period: choice of {'daily', 'weekly', 'monthly'}
+    :type period: str
+    :param adjust: choice of {"qfq": "前复权", "hfq": "后复权", "": "不复权"}
+    :type adjust: str
+    :param start_date: 开始日期
+    :type start_date: str
+    :param end_date: 结束日期; 默认为今天
+    :type end_date: str
+    :param root: 存储目录; 默认为 ~/.akshare/hist
+    :type root: str
+    :return: 历史行情
+    :rtype: pandas.DataFrame
+    """
+    return HistStore(root=root).get(
+        source=source,
+        symbol=symbol,
+        period=period,
+        adjust=adjust,
+        start_date=start_date,
+        end_date=end_date,
+    )
@@ -0,0 +1,198 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/18 03:30
+Desc: JS 赋值语句中字面量的快速解析
+形如 var name = [...]; 的返回数据先用标准库 json(C 实现)直接解析字面量,
+只有不是严格 JSON 的字面量才交给 demjson 或 V8 处理
+宽松 JSON(无引号的键、单引号字符串、末尾逗号、注释)先用正则预处理成严格 JSON 再用标准库解析,
+预处理后仍无法解析的(如 undefined、十六进制数、数字键)才交给纯 Python 实现的 demjson
+"""
+
+import json
+import re
+from typing import Any, Dict, Iterable, Optional
+
+import py_mini_racer
+
+from akshare.utils import demjson
+
+# 注释整体匹配后跳过, 避免把注释中的 var 当作赋值
+_VAR_PATTERN = re.compile(
+    r"//[^\n]*|/\*.*?\*/|\bvar\s+([A-Za-z_$][\w$]*)\s*=\s*", re.DOTALL
+)
+_END_PATTERN = re.compile(r"[ \t]*(?:;|\r?\n|//|/\*|$)")
+_DECODER = json.JSONDecoder()
+# 字符串整体匹配后再处理, 其中的内容不会被当作键、逗号或注释
+_RELAXED_PATTERN = re.compile(
+    r""""(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'|//[^\n]*|/\*.*?\*/"""
+    r"""|,(?=(?:\s|//[^\n]*|/\*.*?\*/)*[\]}])|(?<![\w$.])(?:[^\W\d]|\$)[\w$]*(?=\s*:)""",
+    re.DOTALL,
+)
+_ESCAPE_PATTERN = re.compile(r'\\(x[0-9A-Fa-f]{2}|.)|"', re.DOTALL)
+_JS_ESCAPES = {"'": "'", "v": "\\u000b", "0": "\\u0000", "\n": "", "\r": ""}
+
+
+def _json_escape(match: re.Match) -> str:
+    """
+    把 JS 字符串中的转义改写为 JSON 的写法
+    :param match: 转义序列或未转义的双引号
+    :type match: re.Match
+    :return: JSON 字符串中的写法
+    :rtype: str
+    """
+    escape = match.group(1)
+    if escape is None:
+        return '\\"'
+    if escape in '"\\/bfnrtu':
+        return match.group(0)
+    if len(escape) == 3:
+        return "\\u00" + escape[1:]
+    return _JS_ESCAPES.get(escape, escape)
+
+
+def _relaxed_token(match: re.Match) -> str:
+    token = match.group(0)
+    first = token[0]
+    if first == '"':
+        if "\\" not in token:
+            return token
+        return '"' + _ESCAPE_PATTERN.sub(_json_escape, token[1:-1]) + '"'
+    if first == "'":
+        return '"' + _ESCAPE_PATTERN.sub(_json_escape, token[1:-1]) + '"'
+    if first == "/":
+        return " "
+    if first == ",":
+        return ""
+    return '"' + token + '"'
+
+
+def normalize_relaxed_json(text: str) -> str:
+    """
+    把宽松 JSON 改写为严格 JSON: 给键加引号, 单引号字符串改为双引号, 去掉末尾逗号和注释
+    :param text: 字面量文本, 如 {symbol:'sh600000',trade:"7.890",}
+    :type text: str
+    :return: 严格 JSON 文本; 其余非标准写法保持原样
+    :rtype: str
+    """
+    return _RELAXED_PATTERN.sub(_relaxed_token, text)
+
+
+def _statement_end(text: str, pos: int) -> int:
+    """
+    从 pos 开始找到当前语句结束的分号位置, 跳过字符串、注释和括号内的内容
+    :param text: JS 文本
+    :type text: str
+    :param pos: 字面量开始的位置
+    :type pos: int
+    :return: 语句结束的位置; 没有分号时为文本末尾
+    :rtype: int
+    """
+    depth = 0
+    quote = None
+    i = pos
+    n = len(text)
+    while i < n:
+        ch = text[i]
+        if quote is not None:
+            if ch == "\\":
+                i += 2
+                continue
+            if ch == quote:
+                quote = None
+        elif ch in "\"'`":
+            quote = ch
+        elif ch == "/" and text.startswith("//", i):
+            end = text.find("\n", i)
+            i = n if end == -1 else end
+            continue
+        elif ch == "/" and text.startswith("/*", i):
+            end = text.find("*/", i + 2)
+            i = n if end == -1 else end + 2
+            continue
+        elif ch in "([{":
+            depth += 1
+        elif ch in ")]}":
+            depth -= 1
+        elif ch == ";" and depth <= 0:
+            return i
+        elif ch == "\n" and depth <= 0 and text[pos:i].strip():
+            return i
+        i += 1
+    return n
+
+
+def loads_js_literal(text: str) -> Any:
+    """
+    解析 JS 字面量; 严格 JSON 和宽松 JSON 用标准库解析, 其余交给 demjson
+    :param text: 字面量文本, 如 [{"x": 1}] 或 {x: 1}
+    :type text: str
+    :return: 解析结果
+    :rtype: object
+    """
+    try:
+        return json.loads(text)
+    except ValueError:
+        pass
+    try:
+        return json.loads(normalize_relaxed_json(text), strict=False)
+    except ValueError:
+        return demjson.decode(text)
+
+
+def extract_js_vars(
+    text: str, names: Optional[Iterable[str]] = None, fallback: str = "demjson"
+) -> Dict[str, Any]:
+    """
+    解析 JS 文本中顶层的 var name = <字面量>; 赋值
+    :param text: JS 文本
+    :type text: str
+    :param names: 需要的变量名; 为空时解析全部变量
+    :type names: list
+    :param fallback: 字面量不是严格 JSON 时的处理方式; choice of {"demjson", "v8", "skip"}
+    :type fallback: str
+    :return: 变量名到值的映射; 同名变量以最后一次赋值为准, 文本中没有的变量不在结果中
+    :rtype: dict
+    """
+    if fallback not in {"demjson", "v8", "skip"}:
+        raise ValueError('fallback must be in {"demjson", "v8", "skip"}')
+    name_set = set(names) if names is not None else None
+    result = {}
+    pending = []
+    pos = 0
+    while True:
+        match = _VAR_PATTERN.search(text, pos)
+        if match is None:
+            break
+        name = match.group(1)
+        start = match.end()
+        if name is None:
+            pos = start
+            continue
+        try:
+            value, end = _DECODER.raw_decode(text, start)
+            # 字面量之后还有表达式时(如 var a = 1 + 2;), 不是单纯的字面量
+            if not _END_PATTERN.match(text, end):
+                raise ValueError(name)
+        except ValueError:
+            end = _statement_end(text, start)
+            if name_set is None or name in name_set:
+                result.pop(name, None)
+                pending.append((name, text[start:end].strip()))
+        else:
+            if name_set is None or name in name_set:
+                result[name] = value
+        pos = end
+    if not pending or fallback == "skip":
+        return result
+    if fallback == "demjson":
+        for name, literal in pending:
+            if name not in result:
+                result[name] = loads_js_literal(literal)
+        return result
+    pending_names = [name for name, _ in pending if name not in result]
+    if pending_names:
+        js_code = py_mini_racer.MiniRacer()
+        js_code.eval(text)
+        fields = ", ".join(f"{json.dumps(name)}: {name}" for name in pending_names)
+        result.update(json.loads(js_code.execute(f"JSON.stringify({{{fields}}})")))
+    return result
@@ -0,0 +1,124 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/17 15:00
+Desc: 预热的 MiniRacer 上下文池
+同一段 JS 脚本只编译一次, 多个调用方共享已加载该脚本的 V8 上下文
+"""
+
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict
+
+from py_mini_racer import MiniRacer
+
+
+class MiniRacerPool:
+    """
+    线程安全的 MiniRacer 上下文池
+    每个上下文都已执行过 script; 同一时刻一个上下文只被一个线程使用
+    """
+
+    def __init__(self, script: str, max_size: int = 4):
+        """
+        :param script: 需要预先执行的 JS 脚本
+        :type script: str
+        :param max_size: 最多创建的上下文数量, 即最大并发数
+        :type max_size: int
+        """
+        self.script = script
+        self.max_size = max_size
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _new_context(self) -> MiniRacer:
+        js_code = MiniRacer()
+        js_code.eval(self.script)
+        return js_code
+
+    @contextmanager
+    def context(self):
+        """
+        借出一个已加载脚本的上下文, 用完自动归还
+        """
+        try:
+            js_code = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_create = self._created < self.max_size
+                if can_create:
+                    self._created += 1
+            if can_create:
+                try:
+                    js_code = self._new_context()
+                except Exception:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+            else:
+                js_code = self._idle.get()
+        try:
+            yield js_code
+        finally:
+            self._idle.put(js_code)
+
+    def call(self, func_name: str, *args) -> Any:
+        """
+        调用脚本中的函数
+        :param func_name: 函数名
+        :type func_name: str
+        :return: 函数返回值
+        :rtype: Any
+        """
+        with self.context() as js_code:
+            return js_code.call(func_name, *args)
+
+    def eval(self, code: str) -> Any:
+        """
+        在已加载脚本的上下文中执行一段 JS 代码
+        :param code: JS 代码
+        :type code: str
+        :return: 执行结果
+        :rtype: Any
+        """
+        with self.context() as js_code:
+            return js_code.eval(code)
+
+
+_pools: Dict[str, MiniRacerPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_js_pool(script: str, max_size: int = 4) -> MiniRacerPool:
+    """
+    获取 script 对应的共享上下文池; 同一段脚本在进程内只有一个池
+    :param script: JS 脚本
+    :type script: str
+    :param max_size: 首次创建该池时的最大上下文数量
+    :type max_size: int
+    :return: 上下文池
+    :rtype: MiniRacerPool
+    """
+    # 以脚本文本为键, 字符串的哈希值会被缓存, 重复查找无需重新计算
+    pool = _pools.get(script)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(script)
+            if pool is None:
+                pool = MiniRacerPool(script, max_size=max_size)
+                _pools[script] = pool
+    return pool
+
+
+def js_call(script: str, func_name: str, *args) -> Any:
+    """
+    在共享的预热上下文中调用 script 中的函数
+    :param script: JS 脚本
+    :type script: str
+    :param func_name: 函数名
+    :type func_name: str
+    :return: 函数返回值
+    :rtype: Any
+    """
+    return get_js_pool(script).call(func_name, *args)
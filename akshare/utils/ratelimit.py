@@ -0,0 +1,95 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/17 11:00
+Desc: 按主机的令牌桶限速工具
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """
+    线程安全的令牌桶
+    每秒补充 rate 个令牌, 最多积累 capacity 个; 每次请求消耗一个令牌
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(capacity) if capacity else max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        预定一个令牌
+        :return: 获得该令牌前需要等待的秒数
+        :rtype: float
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._last) * self.rate
+            )
+            self._last = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def update(self, rate: float, capacity: Optional[float] = None) -> None:
+        """
+        修改速率和容量, 已积累的令牌不超过新的容量
+        :param rate: 每秒请求数
+        :type rate: float
+        :param capacity: 令牌桶容量; 默认与 rate 相同
+        :type capacity: float
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        with self._lock:
+            self.rate = float(rate)
+            self.capacity = float(capacity) if capacity else max(1.0, self.rate)
+            self._tokens = min(self._tokens, self.capacity)
+
+    def acquire(self) -> None:
+        """
+        阻塞直到获得一个令牌
+        """
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    url: str, rate: float, capacity: Optional[float] = None
+) -> TokenBucket:
+    """
+    获取 url 所在主机的共享令牌桶; 同一主机在进程内共享同一个令牌桶, 以最近一次设置的速率为准
+    :param url: 请求地址或主机名
+    :type url: str
+    :param rate: 每秒请求数
+    :type rate: float
+    :param capacity: 令牌桶容量, 即允许的突发请求数; 默认与 rate 相同
+    :type capacity: float
+    :return: 令牌桶
+    :rtype: TokenBucket
+    """
+    host = urlsplit(url).hostname or url
+    with _buckets_lock:
+        bucket = _buckets.get(host)
+        if bucket is None:
+            bucket = TokenBucket(rate=rate, capacity=capacity)
+            _buckets[host] = bucket
+        elif bucket.rate != float(rate):
+            bucket.update(rate=rate, capacity=capacity)
+        return bucket
@@ -1,6 +1,6 @@
 # !/usr/bin/env python
 """
-Date: 2025/12/31
+Date: 2026/10/17 10:00
 Desc: HTTP 请求工具函数
 """
 
@@ -11,6 +11,9 @@ from typing import Dict, Tuple
 import requests
 from requests.adapters import HTTPAdapter
 
+from akshare.utils.ratelimit import TokenBucket
+from akshare.utils.session import get_session
+
 
 def request_with_retry(
     url: str,
@@ -19,9 +22,12 @@ def request_with_retry(
     max_retries: int = 3,
     base_delay: float = 1.0,
     random_delay_range: Tuple[float, float] = (0.5, 1.5),
+    session: requests.Session = None,
+    limiter: TokenBucket = None,
 ) -> requests.Response:
     """
     带重试机制的 HTTP GET 请求
+    通过 akshare.utils.session.enable_session_pool 开启会话池后, 同一主机的请求会复用连接
     :param url: 请求 URL
     :type url: str
     :param params: 请求参数
@@ -34,6 +40,10 @@ def request_with_retry(
     :type base_delay: float
     :param random_delay_range: 随机延迟范围（秒）
     :type random_delay_range: tuple
+    :param session: 指定复用的会话; 默认 None, 使用会话池或每次新建会话
+    :type session: requests.Session
+    :param limiter: 主机令牌桶, 每次请求(包括重试)前获取一个令牌; 默认 None, 不限速
+    :type limiter: akshare.utils.ratelimit.TokenBucket
     :return: Response 对象
     :rtype: requests.Response
     :raises: 最后一次请求的异常
@@ -41,15 +51,23 @@ def request_with_retry(
     last_exception = None
 
     for attempt in range(max_retries):
+        if limiter is not None:
+            limiter.acquire()
         try:
+            # 复用指定会话, 或已开启会话池时复用该主机的保持连接
+            shared_session = session or get_session(url)
+            if shared_session is not None:
+                response = shared_session.get(url, params=params, timeout=timeout)
+                response.raise_for_status()
+                return response
             # 每次请求创建新的 Session，避免复用连接
-            with requests.Session() as session:
+            with requests.Session() as new_session:
                 # 禁用连接池复用
                 adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1)
-                session.mount("http://", adapter)
-                session.mount("https://", adapter)
+                new_session.mount("http://", adapter)
+                new_session.mount("https://", adapter)
 
-                response = session.get(url, params=params, timeout=timeout)
+                response = new_session.get(url, params=params, timeout=timeout)
                 response.raise_for_status()
                 return response
 
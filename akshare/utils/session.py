@@ -0,0 +1,180 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/17 10:00
+Desc: 进程级 HTTP 会话管理, 按主机复用保持连接(keep-alive)的连接池
+"""
+
+import os
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class SessionManager:
+    """
+    进程级 requests.Session 管理器(单例)
+    默认关闭; 开启后按 scheme://host 为每个主机维护一个 Session 及其连接池,
+    同一主机上的请求复用 TCP+TLS 连接, 避免每次请求都重新握手
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance.enabled = False
+                    instance.pool_connections = 10
+                    instance.pool_maxsize = 10
+                    instance.host_pool_maxsize = {}
+                    instance._sessions = {}
+                    instance._lock = threading.Lock()
+                    instance._pid = os.getpid()
+                    cls._instance = instance
+        return cls._instance
+
+    def configure(
+        self,
+        enabled: bool = True,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        host_pool_maxsize: Optional[Dict[str, int]] = None,
+    ) -> None:
+        """
+        设置会话池参数; 已创建的会话会被关闭, 下次请求时按新参数重建
+        :param enabled: 是否启用会话池
+        :type enabled: bool
+        :param pool_connections: 每个会话缓存的连接池数量
+        :type pool_connections: int
+        :param pool_maxsize: 每个主机连接池的最大连接数
+        :type pool_maxsize: int
+        :param host_pool_maxsize: 指定主机的最大连接数, 如 {"push2.eastmoney.com": 32}
+        :type host_pool_maxsize: dict
+        """
+        with self._lock:
+            self.enabled = enabled
+            self.pool_connections = pool_connections
+            self.pool_maxsize = pool_maxsize
+            self.host_pool_maxsize = dict(host_pool_maxsize or {})
+            self._close_sessions()
+
+    def get_session(self, url: str) -> requests.Session:
+        """
+        获取 url 所在主机对应的共享会话
+        :param url: 请求地址
+        :type url: str
+        :return: 该主机的会话
+        :rtype: requests.Session
+        """
+        parts = urlsplit(url)
+        key = f"{parts.scheme}://{parts.netloc}"
+        with self._lock:
+            # fork 出的子进程不能与父进程共享套接字
+            if self._pid != os.getpid():
+                self._sessions = {}
+                self._pid = os.getpid()
+            session = self._sessions.get(key)
+            if session is None:
+                maxsize = self.host_pool_maxsize.get(parts.hostname, self.pool_maxsize)
+                adapter = HTTPAdapter(
+                    pool_connections=self.pool_connections,
+                    pool_maxsize=maxsize,
+                    pool_block=False,
+                )
+                session = requests.Session()
+                session.mount(f"{parts.scheme}://", adapter)
+                self._sessions[key] = session
+            return session
+
+    def close(self) -> None:
+        """
+        关闭所有已创建的会话并释放连接
+        """
+        with self._lock:
+            self._close_sessions()
+
+    def _close_sessions(self) -> None:
+        for session in self._sessions.values():
+            session.close()
+        self._sessions = {}
+
+
+session_manager = SessionManager()
+
+
+def enable_session_pool(
+    pool_connections: int = 10,
+    pool_maxsize: int = 10,
+    host_pool_maxsize: Optional[Dict[str, int]] = None,
+) -> None:
+    """
+    开启进程级会话池
+    :param pool_connections: 每个会话缓存的连接池数量
+    :type pool_connections: int
+    :param pool_maxsize: 每个主机连接池的最大连接数
+    :type pool_maxsize: int
+    :param host_pool_maxsize: 指定主机的最大连接数
+    :type host_pool_maxsize: dict
+    """
+    session_manager.configure(
+        enabled=True,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        host_pool_maxsize=host_pool_maxsize,
+    )
+
+
+def disable_session_pool() -> None:
+    """
+    关闭进程级会话池并释放所有连接
+    """
+    session_manager.configure(enabled=False)
+
+
+def get_session(url: str) -> Optional[requests.Session]:
+    """
+    会话池开启时返回 url 所在主机的共享会话, 否则返回 None
+    :param url: 请求地址
+    :type url: str
+    :return: 共享会话
+    :rtype: requests.Session
+    """
+    if not session_manager.enabled:
+        return None
+    return session_manager.get_session(url)
+
+
+class SessionPoolContext:
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        host_pool_maxsize: Optional[Dict[str, int]] = None,
+    ):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.host_pool_maxsize = host_pool_maxsize
+        self.old_settings = None
+
+    def __enter__(self):
+        self.old_settings = (
+            session_manager.enabled,
+            session_manager.pool_connections,
+            session_manager.pool_maxsize,
+            session_manager.host_pool_maxsize,
+        )
+        enable_session_pool(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            host_pool_maxsize=self.host_pool_maxsize,
+        )
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        session_manager.configure(*self.old_settings)
+        return False  # 不处理异常
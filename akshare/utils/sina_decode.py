@@ -0,0 +1,815 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/17 16:00
+Desc: 新浪财经-行情数据解码
+akshare.stock.cons 中 hk_js_decode 与 zh_js_decode 的 d 函数的 Python 实现, 无需 V8;
+字符到比特流的转换与数值换算使用 NumPy 向量化, 结果按列返回
+"""
+
+import math
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+# 不在字母表中的字符在 JS 中对应 -1, 其低 6 位全为 1
+_CHAR_TABLE = np.full(256, 63, dtype=np.uint8)
+_CHAR_TABLE[np.frombuffer(_ALPHABET.encode(), dtype=np.uint8)] = np.arange(
+    64, dtype=np.uint8
+)
+# 1990-12-19 距 1970-01-01 的天数
+_DAY_BASE = 7657
+_MASK_30 = ~(3 << 30)
+_BIT_30 = 1 << 30
+_LEVELS = [0, 3, 5, 6, 9, 10, 12, 15, 17, 18, 20, 23, 24, 27, 29, 30]
+_NAN = float("nan")
+_MAX_SAFE = 2.0**53
+
+
+def _is_nan(x) -> bool:
+    return isinstance(x, float) and x != x
+
+
+def _to_int32(x) -> int:
+    """
+    JS 位运算前的 ToInt32 转换
+    """
+    if x is None or isinstance(x, float) and not math.isfinite(x):
+        return 0
+    x = int(x) & 0xFFFFFFFF
+    return x - 0x100000000 if x & 0x80000000 else x
+
+
+def _js_mod(a, b):
+    """
+    JS 取余, 结果与被除数同号
+    """
+    if isinstance(a, float):
+        return math.fmod(a, b)
+    return a - b * int(a / b) if a < 0 else a % b
+
+
+def _js_floor(x):
+    if isinstance(x, float) and not math.isfinite(x):
+        return x
+    return math.floor(x)
+
+
+def _js_str(x) -> str:
+    """
+    JS 的 Number.prototype.toString()
+    """
+    if isinstance(x, bool):
+        x = int(x)
+    if isinstance(x, int) and abs(x) < _MAX_SAFE:
+        return str(x)
+    x = float(x)
+    if x != x:
+        return "NaN"
+    if x == 0:
+        return "0"
+    if math.isinf(x):
+        return "Infinity" if x > 0 else "-Infinity"
+    if x < 0:
+        return "-" + _js_str(-x)
+    mantissa, _, exp = repr(x).partition("e")
+    int_part, _, frac_part = mantissa.partition(".")
+    digits = (int_part + frac_part).lstrip("0")
+    point = (
+        len(int_part)
+        + (int(exp) if exp else 0)
+        - (len(int_part + frac_part) - len(digits))
+    )
+    digits = digits.rstrip("0")
+    k = len(digits)
+    if k <= point <= 21:
+        return digits + "0" * (point - k)
+    if 0 < point <= 21:
+        return digits[:point] + "." + digits[point:]
+    if -6 < point <= 0:
+        return "0." + "0" * -point + digits
+    e = point - 1
+    sign = "+" if e >= 0 else "-"
+    mantissa = digits if k == 1 else digits[0] + "." + digits[1:]
+    return f"{mantissa}e{sign}{abs(e)}"
+
+
+def _js_number(s: str) -> float:
+    """
+    JS 中字符串转数字, 即 s - 0
+    """
+    s = s.strip()
+    if not s:
+        return 0
+    if s.lstrip("+-") == "Infinity":
+        return float(s.replace("Infinity", "inf"))
+    if any(ch not in "0123456789+-.eE" for ch in s):
+        return _NAN
+    try:
+        value = float(s)
+    except ValueError:
+        return _NAN
+    return int(value) if value.is_integer() and abs(value) < _MAX_SAFE else value
+
+
+def _split_scale(t) -> List[int]:
+    """
+    JS 中的 T 函数, 把精度拆分为 2 和 5 的指数
+    """
+    if not t or _is_nan(t):
+        return [0, 0]
+    if t < 0:
+        e = _split_scale(-t)
+        return [-e[0], -e[1]]
+    e = t % 3
+    i = (t - e) // 3
+    n = [i, i]
+    if e:
+        n[e - 1] += 1
+    return n
+
+
+@lru_cache(maxsize=None)
+def _scale_params(e, i=None) -> Tuple[int, int]:
+    """
+    P 函数中与数值无关的部分: 返回乘数与最终的十进制小数位移
+    """
+    r = _split_scale(e) if not isinstance(e, tuple) else e
+    a = _split_scale(i)
+    n0, n1 = a[0] - r[0], a[1] - r[1]
+    if n0 < n1:
+        return 5 ** (n1 - n0), n0
+    return 2 ** (n0 - n1), n1
+
+
+def _decnum(t) -> str:
+    """
+    JS 中的 E 函数
+    """
+    if not t or _is_nan(t):
+        t = 0
+    t = _js_str(t)
+    i = t.lower().find("e")
+    if i > 0:
+        e = _js_number(t[i + 1 :])
+        parts = []
+        while e >= 0:
+            parts.append(str(math.floor(e * math.pow(10, -e) + 0.5)))
+            e -= 1
+        return "".join(parts)
+    return t
+
+
+def _rescale(t, e, i=None):
+    """
+    JS 中的 P 函数: 把精度为 e 的整数 t 转换为精度 i 的整数(四舍六入五成双);
+    i 为 None 时返回对应的小数
+    """
+    m, n = _scale_params(tuple(e) if isinstance(e, list) else e, i)
+    if isinstance(t, int) and 0 <= t * m * 10 ** max(n, 0) < _MAX_SAFE:
+        # 非负安全整数直接用整数运算, 结果与字符串运算一致
+        if n >= 0:
+            return t * m * 10**n
+        r, rest = divmod(t * m, 10**-n)
+        if i is None:
+            return t * m / 10**-n
+        a, rest = divmod(rest, 10 ** (-n - 1))
+        if a > 5 or a == 5 and (rest > 0 or r & 1):
+            r += 1
+        return r
+    if m > 1:
+        t = t * m if not isinstance(t, float) else t * float(m)
+        if isinstance(t, int) and abs(t) >= _MAX_SAFE:
+            t = float(t)
+    t = _decnum(t)
+    if n < 0:
+        while len(t) + n <= 0:
+            t = "0" + t
+        n += len(t)
+        r = _js_number(t[:n])
+        if i is None:
+            return _js_number(_js_str(r) + "." + t[n:])
+        a = _js_number(t[n : n + 1])
+        if a > 5:
+            r += 1
+        elif a == 5:
+            if _js_number(t[n + 1 :]) > 0:
+                r += 1
+            else:
+                r += 1 & _to_int32(r)
+        return r
+    return _js_number(t + "0" * n)
+
+
+def _rescale_array(values: List, scales: List) -> np.ndarray:
+    """
+    向量化的 _rescale(t, e): 整数部分用 NumPy 直接相除, 其余回退到逐个转换
+    两个可精确表示的浮点数相除的结果是正确舍入的, 与 JS 中解析十进制字符串的结果一致
+    """
+    raw = np.array([_NAN if v is None else v for v in values], dtype=float)
+    scale_arr = np.array(scales, dtype=float)
+    out = np.full(len(raw), _NAN)
+    for e in np.unique(scale_arr[~np.isnan(scale_arr)]):
+        e = int(e)
+        m, n = _scale_params(e)
+        mask = scale_arr == e
+        t = raw[mask] * m
+        result = np.full(len(t), _NAN)
+        fast = (t >= 0) & (t == np.floor(t)) & (t * 10.0 ** max(n, 0) < _MAX_SAFE)
+        if n < 0:
+            result[fast] = t[fast] / 10.0**-n
+        else:
+            result[fast] = t[fast] * 10.0**n
+        idx = np.flatnonzero(mask)
+        for k in np.flatnonzero(~fast):
+            v = values[idx[k]]
+            result[k] = _NAN if v is None else _rescale(v, e)
+        out[mask] = result
+    return out
+
+
+def _to_dates(days: List) -> np.ndarray:
+    day_arr = np.array(days, dtype=float) + _DAY_BASE
+    out = np.full(len(day_arr), np.datetime64("NaT"), dtype="datetime64[D]")
+    valid = np.isfinite(day_arr)
+    out[valid] = day_arr[valid].astype("int64").astype("datetime64[D]")
+    return out
+
+
+def _at(values: List, k: int):
+    return values[k] if k < len(values) else _NAN
+
+
+class _SinaDecoder:
+    """
+    比特流解码状态; 各方法与 JS 源码中的同名局部函数一一对应
+    """
+
+    def __init__(self, text: str):
+        codes = _CHAR_TABLE[np.frombuffer(text.encode("latin-1", "replace"), np.uint8)]
+        # 每个字符提供 6 个比特, 低位在前; 末尾补零以便越界读取返回 0
+        bits = (codes[:, None] >> np.arange(6, dtype=np.uint8)) & 1
+        self.buf = np.packbits(bits.ravel(), bitorder="little").tobytes() + bytes(8)
+        self.n = len(codes)
+        self.total = 6 * self.n
+        self.pos = 0
+        self.r = {}
+        self._row_pos = -1
+
+    @property
+    def e(self) -> int:
+        return self.pos // 6
+
+    def _read(self, width: int) -> int:
+        pos = self.pos
+        start = pos >> 3
+        chunk = int.from_bytes(self.buf[start : start + 5], "little") >> (pos & 7)
+        self.pos = pos + width
+        return chunk & ((1 << width) - 1)
+
+    def y(self) -> int:
+        if self.pos >= self.total:
+            return 0
+        bit = self.buf[self.pos >> 3] >> (self.pos & 7) & 1
+        self.pos += 1
+        return bit
+
+    def w(self, t: List, r: List = None, a: List = None) -> List:
+        values = []
+        for s, width in enumerate(t):
+            if not width or _is_nan(width):
+                values.append(0)
+                continue
+            if self.pos >= self.total:
+                return values
+            if width <= 0:
+                u = 0
+            elif width <= 30:
+                u = self._read(width)
+                if r and s < len(r) and r[s] and u >= 1 << (width - 1):
+                    u -= 1 << width
+            else:
+                u = self.w([30, width - 30], [0, r[s] if r and s < len(r) else 0])
+                if not (a and s < len(a) and a[s]):
+                    u = _at(u, 0) + _at(u, 1) * float(_BIT_30)
+            values.append(u)
+        return values
+
+    def field(self, width: int, signed: int = 0):
+        """
+        读取单个字段, 等价于 w([width], [signed])[0]
+        """
+        if not width or _is_nan(width):
+            return 0
+        if self.pos >= self.total:
+            return _NAN
+        if width <= 0:
+            return 0
+        if width > 30:
+            return _at(self.w([width], [signed]), 0)
+        u = self._read(width)
+        if signed and u >= 1 << (width - 1):
+            u -= 1 << width
+        return u
+
+    def big_n(self) -> int:
+        t = self.y()
+        e = 1
+        while True:
+            if not self.y():
+                return e * (2 * t - 1)
+            e += 1
+
+    def x(self):
+        t = self.field(3)
+        if t == 1:
+            self.r["d"] = self.field(18, 1)
+            t = 0
+        elif not t or _is_nan(t):
+            t = self.field(6)
+        return t
+
+    def s_day(self, t):
+        r = self.r
+        e = 0
+        while t > e:
+            r["d"] += 1
+            n = _js_mod(r["d"], 7)
+            if n == 3 or n == 4:
+                r["d"] += 5 - n
+            e += 1
+        return r["d"]
+
+    def k_day(self, t):
+        r = self.r
+        n = r.get("wd") or 62
+        e = 0
+        while t > e:
+            while True:
+                r["d"] += 1
+                if n & 1 << (_js_mod(r["d"], 7) + 10) % 7:
+                    break
+            e += 1
+        return r["d"]
+
+    def decode(self) -> Dict[str, np.ndarray]:
+        u = self.w([12, 6])
+        self.s = 63 ^ _to_int32(_at(u, 1))
+        handler = {
+            1479: self._decode_1479,
+            136: self._decode_136,
+            200: self._decode_200,
+            139: self._decode_139,
+            197: self._decode_197,
+            3466: self._decode_3466,
+        }.get(_at(u, 0))
+        if handler is None:
+            return {}
+        return handler()
+
+    def _more_rows(self, mask: int, t: int) -> bool:
+        if self.pos >= self.total:
+            return False
+        if self.e != self.n - 1:
+            # 上一行没有读取任何比特时, JS 会无限循环; 这里直接结束
+            more = self.pos != self._row_pos
+        else:
+            more = bool(mask & (_to_int32(self.r["c"]) ^ t))
+        self._row_pos = self.pos
+        return more
+
+    def _decode_200(self) -> Dict[str, np.ndarray]:
+        """
+        收盘价序列
+        """
+        if self.s >= 1:
+            return {}
+        r = self.r
+        r["d"] = self.field(18, 1) - 1
+        a = self.w([3, 3, 30, 6])
+        r["p"], r["ld"], r["cd"], r["c"] = (_at(a, k) for k in range(4))
+        r["m"] = 10.0 ** r["p"]
+        r["pc"] = r["cd"] / r["m"]
+        dates, closes = [], []
+        t = 0
+        while True:
+            d = 1
+            if self.y():
+                a = self.field(3)
+                if a == 0:
+                    d = self.field(6)
+                elif a == 1:
+                    r["d"] = self.field(18)
+                    d = 0
+                else:
+                    d = a
+            dates.append(self.s_day(d))
+            if self.y():
+                r["ld"] += self.big_n()
+            r["cd"] += self.field(3 * r["ld"], 1)
+            closes.append(r["cd"] / r["m"])
+            if not self._more_rows(63, t + 1):
+                break
+            t += 1
+        prevclose = np.full(len(dates), _NAN)
+        prevclose[0] = r["pc"]
+        return {
+            "date": _to_dates(dates),
+            "close": np.array(closes, dtype=float),
+            "prevclose": prevclose,
+        }
+
+    def _decode_136(self) -> Dict[str, np.ndarray]:
+        """
+        分时数据
+        """
+        s = self.s
+        if s > 2:
+            return {}
+        r = self.r
+        r["d"] = self.field(18, 1) - 1
+        first_date = self.s_day(1)
+        a = self.w([3, 3, 4, 1, 1, 1, 5] if s < 1 else [4, 4, 4, 1, 1, 1, 3])
+        for t, key in enumerate(["la", "lp", "lv", "tv", "rv", "zv", "pp"]):
+            r[key] = _at(a, t)
+        r["m"] = 10.0 ** r["pp"]
+        if s >= 1:
+            a = self.w([3, 3])
+            r["c"] = _at(a, 0)
+            a = _at(a, 1)
+        else:
+            a = 5
+            r["c"] = 2
+        r["pc"] = self.field(6 * a)
+        first_pc = r["pc"] / r["m"]
+        r["cp"] = r["pc"]
+        r["da"] = 0
+        r["sa"] = r["sv"] = 0
+        volumes, prices, avg_prices = [], [], []
+        t = 0
+        while self._more_rows(7, t):
+            o = {}
+            f = self.y() if r["tv"] else 1
+            for i, m in enumerate("vpa"):
+                if f and self.y():
+                    r["l" + m] += self.big_n()
+                u = self.y() if m == "v" and r["rv"] else 1
+                width = 3 * r["l" + m] + (7 * u if m == "v" else 0)
+                value = self.field(width, i > 0) * (1 if u else 100)
+                o[m] = value
+                if m == "v":
+                    volumes.append(value)
+                    if (
+                        (not value or _is_nan(value))
+                        and (s > 1 or 241 > t)
+                        and (not self.y() if r["zv"] else 1)
+                    ):
+                        o["p"] = 0
+                        break
+                elif m == "a":
+                    r["da"] = (0 if s < 1 else r["da"]) + o["a"]
+            r["sv"] += o["v"]
+            r["cp"] += o["p"]
+            price = r["cp"] / r["m"]
+            prices.append(price)
+            r["sa"] += o["v"] * r["cp"]
+            if "a" not in o:
+                avg_prices.append(avg_prices[t - 1] if t else price)
+            elif r["sv"] and not _is_nan(r["sv"]):
+                avg = _js_floor((r["sa"] * (2e3 / r["m"]) + r["sv"]) / r["sv"])
+                avg_prices.append(((_to_int32(avg) >> 1) + r["da"]) / 1e3)
+            else:
+                avg_prices.append(price + r["da"] / 1e3)
+            t += 1
+        if not volumes:
+            raise ValueError("sina payload contains no rows")
+        date = np.full(len(volumes), np.datetime64("NaT"), dtype="datetime64[D]")
+        date[0] = _to_dates([first_date])[0]
+        prevclose = np.full(len(volumes), _NAN)
+        prevclose[0] = first_pc
+        return {
+            "volume": np.array(volumes, dtype=float),
+            "price": np.array(prices, dtype=float),
+            "avg_price": np.array(avg_prices, dtype=float),
+            "date": date,
+            "prevclose": prevclose,
+        }
+
+    def _decode_1479(self) -> Dict[str, np.ndarray]:
+        """
+        日 K 线(旧格式)
+        """
+        if self.s >= 1:
+            return {}
+        r = self.r
+        r["lv"] = r["ld"] = r["cd"] = 0
+        r["cv"] = [0, 0]
+        r["p"] = self.field(6)
+        r["d"] = self.field(18, 1) - 1
+        r["m"] = 10.0 ** r["p"]
+        a = self.w([3, 3])
+        r["md"], r["mv"] = _at(a, 0), _at(a, 1)
+        columns = {k: [] for k in ("date", "open", "high", "low", "close", "volume")}
+        while True:
+            a = self.w([6])
+            if not a:
+                break
+            i = {"c": a[0], "d": 1}
+            if 32 & _to_int32(i["c"]):
+                while True:
+                    a = _to_int32(self.field(6))
+                    if 63 == (16 | a):
+                        key = "x" if 16 & a else "u"
+                        b = self.w([3, 3])
+                        i[key + "_d"] = _at(b, 0) + r["md"]
+                        i[key + "_v"] = _at(b, 1) + r["mv"]
+                        break
+                    if 32 & a:
+                        o = "d" if 8 & a else "v"
+                        key = "x" if 16 & a else "u"
+                        i[key + "_" + o] = (7 & a) + r["m" + o]
+                        break
+                    o = 15 & a
+                    if o == 0:
+                        i["d"] = self.field(6)
+                    elif o == 1:
+                        r["d"] = self.field(18)
+                        i["d"] = 0
+                    else:
+                        i["d"] = o
+                    if not 16 & a:
+                        break
+            columns["date"].append(self.s_day(i["d"]))
+            for o in ("v", "d"):
+                if "x_" + o in i:
+                    r["l" + o] = i["x_" + o]
+                if "u_" + o not in i:
+                    i["u_" + o] = r["l" + o]
+            widths = [i["u_d"]] * 4 + [i["u_v"]]
+            level = _LEVELS[15 & _to_int32(i["c"])]
+            if 1 & _to_int32(i["u_v"]):
+                level = 31 - level
+            if 16 & _to_int32(i["c"]):
+                widths[4] += 2
+            for e in range(5):
+                if level & 1 << 4 - e:
+                    widths[e] += 1
+                widths[e] *= 3
+            d_v = self.w(widths, [1, 0, 0, 1, 1], [0, 0, 0, 0, 1])
+            o = r["cd"] + _at(d_v, 0)
+            columns["open"].append(o / r["m"])
+            columns["high"].append((o + _at(d_v, 1)) / r["m"])
+            columns["low"].append((o - _at(d_v, 2)) / r["m"])
+            columns["close"].append((o + _at(d_v, 3)) / r["m"])
+            vol = _at(d_v, 4)
+            if not isinstance(vol, list):
+                vol = [vol, 0 if vol >= 0 else -1]
+            r["cd"] = o + _at(d_v, 3)
+            low_word = r["cv"][0] + _at(vol, 0)
+            carry = bool(
+                (_to_int32(r["cv"][0]) & _MASK_30) + (_to_int32(_at(vol, 0)) & _MASK_30)
+                & _BIT_30
+            )
+            r["cv"] = [
+                _to_int32(low_word) & _MASK_30,
+                r["cv"][1] + _at(vol, 1) + carry,
+            ]
+            columns["volume"].append((r["cv"][0] & _BIT_30 - 1) + r["cv"][1] * _BIT_30)
+        if not columns["date"]:
+            return {}
+        result = {k: np.array(v, dtype=float) for k, v in columns.items()}
+        result["date"] = _to_dates(columns["date"])
+        return result
+
+    def _decode_139(self) -> Dict[int, np.ndarray]:
+        """
+        交易日历
+        """
+        if self.s > 1:
+            return {}
+        r = self.r
+        r["l"] = 0
+        n = -1
+        r["d"] = self.field(18) - 1
+        i = self.field(18)
+        days = None
+        while r["d"] < i:
+            e = self.s_day(1)
+            if n <= 0:
+                if self.y():
+                    r["l"] += self.big_n()
+                n = self.field(3 * r["l"]) + 1
+                if not days:
+                    days = [e]
+                    n -= 1
+            else:
+                days.append(e)
+            n -= 1
+        if days is None:
+            return {}
+        return {0: _to_dates(days)}
+
+    def _decode_197(self) -> Dict[int, np.ndarray]:
+        """
+        多列整数序列
+        """
+        if self.s >= 1:
+            return {}
+        r = self.r
+        r["f"] = self.field(6)
+        r["c"] = self.field(6)
+        f = int(r["f"]) if not _is_nan(r["f"]) else 0
+        dv = [0] * f
+        dl = [0] * f
+        rows = []
+        t = 0
+        while self._more_rows(7, t):
+            for i in range(f):
+                if self.y():
+                    dl[i] += self.big_n()
+                dv[i] += self.field(3 * dl[i], 1)
+            rows.append(list(dv))
+            t += 1
+        if not rows:
+            return {}
+        matrix = np.array(rows, dtype=float)
+        return {k: matrix[:, k] for k in range(f)}
+
+    def _decode_3466(self) -> Dict[str, np.ndarray]:
+        """
+        日 K 线; 各价格先以整数保存, 最后统一换算为小数
+        """
+        r = self.r
+        r.update(
+            b_avp=1, b_ph=0, b_phx=0, b_sep=0,
+            p_p=6, p_v=0, p_a=0, p_e=0, p_t=0,
+            l_o=3, l_h=3, l_l=3, l_c=3, l_v=5, l_a=5, l_e=3, l_t=0,
+            u_p=0, u_v=0, u_a=0, wd=62, d=0,
+        )  # fmt: skip
+        # 未初始化的 u_o/u_h/u_l/u_c 在 JS 中为 undefined, 参与运算得到 NaN
+        for key in ("u_o", "u_h", "u_l", "u_c", "u_e", "u_t"):
+            r[key] = _NAN
+        if self.s > 0:
+            return {}
+        y, big_n = self.y, self.big_n
+        days = []
+        # 每行保存各列的整数值(缺失为 None)及当时的精度 (p_p, p_v, p_a, p_e)
+        rows = []
+        row_scales = []
+        prev_amount = None
+        while True:
+            if self.pos >= self.total:
+                return {}
+            a = {"d": 1, "c": 0}
+            if y():
+                if y():
+                    if y():
+                        a["c"] += 1
+                        a["a"] = r["b_avp"]
+                        if y():
+                            r["b_avp"] ^= y()
+                            r["b_ph"] ^= y()
+                            r["b_phx"] ^= y()
+                            a["s"] = r["b_sep"]
+                            r["b_sep"] ^= y()
+                            if y():
+                                r["wd"] = self.field(7)
+                            if a["s"] ^ r["b_sep"]:
+                                if a["s"]:
+                                    r["u_p"] = r["u_c"]
+                                else:
+                                    r["u_o"] = r["u_h"] = r["u_l"] = r["u_c"] = r["u_p"]
+                        for u in range(3 + 2 * r["b_ph"]):
+                            if y():
+                                key = "pvaet"[u]
+                                o = r["p_" + key]
+                                r["p_" + key] += big_n()
+                                r["u_" + key] = _rescale(
+                                    r["u_" + key], o, r["p_" + key]
+                                )
+                                if r["b_sep"] and not u:
+                                    for c in "ohlc":
+                                        r["u_" + c] = _rescale(r["u_" + c], o, r["p_p"])
+                        if not r["b_avp"] and a["a"]:
+                            amount = 0
+                            if prev_amount is not None:
+                                amount = _rescale(*prev_amount)
+                                if not amount or _is_nan(amount):
+                                    amount = 0
+                            r["u_a"] = _rescale(amount, 0, r["p_a"])
+                    if y():
+                        a["c"] += 1
+                        for u in range(7 + r["b_ph"] + r["b_phx"]):
+                            if y():
+                                if u == 6:
+                                    a["d"] = self.x()
+                                else:
+                                    r["l_" + "ohlcva*et"[u]] += big_n()
+                    if y():
+                        a["c"] += 1
+                        width = r["l_o"] + (y() and big_n())
+                        o = self.field(3 * width, 1)
+                        if r["b_sep"]:
+                            a["p"] = r["u_c"] + o
+                        else:
+                            r["u_p"] += o
+                            a["p"] = r["u_p"]
+                    if not a["c"]:
+                        break
+                elif y():
+                    if y():
+                        if y():
+                            a["d"] = self.x()
+                        else:
+                            r["l_v"] += big_n()
+                    elif r["b_ph"] and y():
+                        r["l_" + "et"[r["b_phx"] and y()]] += big_n()
+                    else:
+                        r["l_a"] += big_n()
+                else:
+                    r["l_" + "ohlc"[_to_int32(self.field(2))]] += big_n()
+            for u in range(6 + r["b_ph"] + r["b_phx"]):
+                c = "ohlcvaet"[u]
+                o = (191 if r["b_sep"] else 185) >> u & 1
+                a["v_" + c] = self.field(3 * r["l_" + c], o)
+            days.append(self.k_day(a["d"]))
+            prevclose = a["p"] if a.get("p") and not _is_nan(a["p"]) else None
+            if r["b_sep"]:
+                r["u_o"] += a["v_o"]
+                r["u_h"] += a["v_h"]
+                r["u_l"] += a["v_l"]
+                r["u_c"] += a["v_c"]
+                ohlc = (r["u_o"], r["u_h"], r["u_l"], r["u_c"])
+            else:
+                a["o"] = r["u_p"] + a["v_o"]
+                r["u_p"] = a["o"] + a["v_c"]
+                ohlc = (a["o"], a["o"] + a["v_h"], a["o"] - a["v_l"], r["u_p"])
+            r["u_v"] += a["v_v"]
+            if r["b_avp"]:
+                o = _split_scale(r["p_p"])
+                key = _split_scale(r["p_v"])
+                if r["b_sep"]:
+                    mid = (r["u_o"] + r["u_h"] + r["u_l"] + r["u_c"]) / 4
+                else:
+                    mid = a["o"] + (a["v_h"] - a["v_l"] + a["v_c"]) / 4
+                amount = (
+                    _rescale(
+                        _js_floor(mid * r["u_v"] + 0.5),
+                        [o[0] + key[0], o[1] + key[1]],
+                        r["p_a"],
+                    )
+                    + a["v_a"]
+                )
+            else:
+                r["u_a"] += a["v_a"]
+                amount = r["u_a"]
+            prev_amount = (amount, r["p_a"])
+            post_vol = post_amt = None
+            if r["b_ph"]:
+                close = _rescale(ohlc[3], r["p_p"])
+                post_t = _rescale(a["v_t"], r["p_t"]) if r["b_phx"] else 0
+                post_vol = a["v_e"]
+                post_amt = _js_floor(
+                    _rescale(post_vol, r["p_e"]) * close + post_t + 0.5
+                )
+            rows.append((prevclose, *ohlc, r["u_v"], amount, post_vol, post_amt))
+            row_scales.append((r["p_p"], r["p_v"], r["p_a"], r["p_e"]))
+        if not rows:
+            return {}
+        # 列顺序与 JS 对象按行展开后首次出现的顺序一致
+        names = ["prevclose", "open", "high", "low", "close", "volume", "amount", "postVol", "postAmt"]  # fmt: skip
+        scale_index = [0, 0, 0, 0, 0, 1, 2, 3, None]
+        columns = list(zip(*rows))
+        first_row = {}
+        for k, column in enumerate(columns):
+            for row_no, value in enumerate(column):
+                if value is not None:
+                    first_row[k] = row_no
+                    break
+        present = sorted(first_row, key=lambda k: (first_row[k] > 0, first_row[k], k))
+        scale_columns = list(zip(*row_scales))
+        result = {"date": _to_dates(days)}
+        for k in present:
+            if scale_index[k] is None:
+                scales = [0] * len(rows)
+            else:
+                scales = scale_columns[scale_index[k]]
+            result[names[k]] = _rescale_array(
+                columns[k],
+                [None if v is None else p for v, p in zip(columns[k], scales)],
+            )
+        return result
+
+
+def sina_js_decode(text: str) -> Dict:
+    """
+    新浪财经-行情数据解码
+    与 hk_js_decode 或 zh_js_decode 中的 d(text) 返回相同的数据, 但按列返回 NumPy 数组;
+    pandas.DataFrame(sina_js_decode(text)) 与 pandas.DataFrame(d(text)) 一致, 日期列为 datetime64
+    :param text: 接口返回的加密字符串
+    :type text: str
+    :return: 列名到数组的映射; 交易日历等无字段名的数据以列序号为键
+    :rtype: dict
+    """
+    return _SinaDecoder(text).decode()
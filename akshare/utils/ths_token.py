@@ -0,0 +1,105 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/17 18:00
+Desc: 同花顺 hexin-v 令牌
+ths.js 只读取和编译一次, 在预热的 V8 上下文中生成令牌, 有效期内的请求复用同一个令牌
+"""
+
+import threading
+import time
+from functools import lru_cache
+
+from akshare.datasets import get_ths_js
+from akshare.utils.js_pool import get_js_pool
+
+
+@lru_cache()
+def _get_file_content_ths(file: str = "ths.js") -> str:
+    """
+    获取 JS 文件的内容
+    :param file: JS 文件名
+    :type file: str
+    :return: 文件内容
+    :rtype: str
+    """
+    setting_file_path = get_ths_js(file)
+    with open(setting_file_path, encoding="utf-8") as f:
+        file_data = f.read()
+    return file_data
+
+
+class HexinVProvider:
+    """
+    线程安全的 hexin-v 令牌提供者
+    令牌生成后在 ttl 秒内复用, 过期后重新生成
+    """
+
+    def __init__(self, ttl: float = 60, file: str = "ths.js"):
+        """
+        :param ttl: 令牌的复用时间（秒）; 0 表示每次都生成新令牌
+        :type ttl: float
+        :param file: 生成令牌的 JS 文件名
+        :type file: str
+        """
+        self.ttl = ttl
+        self.file = file
+        self._token = None
+        self._expire = 0.0
+        self._lock = threading.Lock()
+
+    def mint(self) -> str:
+        """
+        生成新的令牌并缓存
+        :return: hexin-v 令牌
+        :rtype: str
+        """
+        token = get_js_pool(_get_file_content_ths(self.file)).call("v")
+        with self._lock:
+            self._token = token
+            self._expire = time.monotonic() + self.ttl
+        return token
+
+    def get(self, refresh: bool = False) -> str:
+        """
+        获取令牌, 缓存的令牌未过期时直接返回
+        :param refresh: 是否强制生成新令牌, 例如服务器拒绝了当前令牌时
+        :type refresh: bool
+        :return: hexin-v 令牌
+        :rtype: str
+        """
+        with self._lock:
+            if not refresh and self._token and time.monotonic() < self._expire:
+                return self._token
+        return self.mint()
+
+    def invalidate(self) -> None:
+        """
+        丢弃缓存的令牌
+        """
+        with self._lock:
+            self._token = None
+            self._expire = 0.0
+
+
+_provider = HexinVProvider()
+
+
+def get_hexin_v(refresh: bool = False) -> str:
+    """
+    同花顺 hexin-v 令牌, 用于请求头 hexin-v 和 Cookie v
+    :param refresh: 是否强制生成新令牌
+    :type refresh: bool
+    :return: hexin-v 令牌
+    :rtype: str
+    """
+    return _provider.get(refresh=refresh)
+
+
+def set_hexin_v_ttl(ttl: float = 60) -> None:
+    """
+    设置 hexin-v 令牌的复用时间
+    :param ttl: 复用时间（秒）; 0 表示每次请求都生成新令牌, 与旧版行为一致
+    :type ttl: float
+    """
+    _provider.ttl = ttl
+    _provider.invalidate()
@@ -0,0 +1,205 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/17 20:00
+Desc: 交易日历
+calendar.json 只读取一次, 交易日保存为有序的 int32 数组(YYYYMMDD)并建立集合索引;
+判断交易日为 O(1), 前后交易日与偏移为 O(log n), 区间内的交易日直接切片返回
+"""
+
+import datetime
+import json
+import os
+from functools import lru_cache
+from typing import List, Optional, Union
+
+import numpy as np
+
+DayLike = Union[str, int, datetime.date]
+
+
+def _to_int(day: DayLike) -> Optional[int]:
+    """
+    把日期转为 YYYYMMDD 形式的整数
+    :param day: "YYYYMMDD", "YYYY-MM-DD", "YYYY/MM/DD", 20200101 或 datetime.date
+    :type day: str, int or datetime.date
+    :return: YYYYMMDD 整数, 无法识别时返回 None
+    :rtype: int
+    """
+    if isinstance(day, datetime.date):
+        return day.year * 10000 + day.month * 100 + day.day
+    if isinstance(day, (int, np.integer)) and not isinstance(day, bool):
+        return int(day)
+    if isinstance(day, str):
+        text = day[:10].replace("-", "").replace("/", "")
+        if len(text) == 8 and text.isdigit():
+            return int(text)
+    return None
+
+
+def to_date(day: DayLike) -> Optional[datetime.date]:
+    """
+    把日期转为 datetime.date
+    :param day: "YYYYMMDD", "YYYY-MM-DD", "YYYY/MM/DD", 20200101 或 datetime.date
+    :type day: str, int or datetime.date
+    :return: 日期, 无法识别时返回 None
+    :rtype: datetime.date
+    """
+    if isinstance(day, datetime.datetime):
+        return day.date()
+    if isinstance(day, datetime.date):
+        return day
+    value = _to_int(day)
+    if value is None:
+        return None
+    try:
+        return datetime.date(value // 10000, value // 100 % 100, value % 100)
+    except ValueError:
+        return None
+
+
+class TradeCalendar:
+    """
+    交易日历
+    支持 in 判断; 日期参数可以是 "YYYYMMDD", "YYYY-MM-DD", 20200101 或 datetime.date
+    返回的交易日均为 "YYYYMMDD" 字符串
+    """
+
+    def __init__(self, days: List[str]):
+        """
+        :param days: 升序排列的交易日列表, 格式为 YYYYMMDD
+        :type days: list
+        """
+        self.days = tuple(days)
+        self.array = np.asarray(days, dtype=np.int32)
+        self._index = {int(day): i for i, day in enumerate(self.array)}
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    def __iter__(self):
+        return iter(self.days)
+
+    def __contains__(self, day: DayLike) -> bool:
+        return _to_int(day) in self._index
+
+    def is_trading_day(self, day: DayLike) -> bool:
+        """
+        是否为交易日
+        :param day: 日期
+        :type day: str, int or datetime.date
+        :return: 是否为交易日
+        :rtype: bool
+        """
+        return day in self
+
+    def _position(self, day: DayLike, side: str) -> int:
+        key = _to_int(day)
+        if key is None:
+            raise ValueError(f"无法识别的日期: {day!r}")
+        return int(np.searchsorted(self.array, key, side=side))
+
+    def _day(self, pos: int) -> Optional[str]:
+        if 0 <= pos < len(self.days):
+            return self.days[pos]
+        return None
+
+    def prev(self, day: DayLike, n: int = 1) -> Optional[str]:
+        """
+        day 之前(不含 day)的第 n 个交易日
+        :param day: 日期
+        :type day: str, int or datetime.date
+        :param n: 向前的交易日个数
+        :type n: int
+        :return: 交易日, 超出日历范围时返回 None
+        :rtype: str
+        """
+        return self._day(self._position(day, "left") - n)
+
+    def next(self, day: DayLike, n: int = 1) -> Optional[str]:
+        """
+        day 之后(不含 day)的第 n 个交易日
+        :param day: 日期
+        :type day: str, int or datetime.date
+        :param n: 向后的交易日个数
+        :type n: int
+        :return: 交易日, 超出日历范围时返回 None
+        :rtype: str
+        """
+        return self._day(self._position(day, "right") + n - 1)
+
+    def floor(self, day: DayLike) -> Optional[str]:
+        """
+        不晚于 day 的最近交易日
+        :param day: 日期
+        :type day: str, int or datetime.date
+        :return: 交易日, day 早于日历起点时返回 None
+        :rtype: str
+        """
+        return self._day(self._position(day, "right") - 1)
+
+    def ceil(self, day: DayLike) -> Optional[str]:
+        """
+        不早于 day 的最近交易日
+        :param day: 日期
+        :type day: str, int or datetime.date
+        :return: 交易日, day 晚于日历终点时返回 None
+        :rtype: str
+        """
+        return self._day(self._position(day, "left"))
+
+    def offset(self, day: DayLike, n: int) -> Optional[str]:
+        """
+        从交易日 day 起偏移 n 个交易日
+        :param day: 交易日
+        :type day: str, int or datetime.date
+        :param n: 偏移的交易日个数, 负数表示向前
+        :type n: int
+        :return: 交易日, day 不是交易日或超出日历范围时返回 None
+        :rtype: str
+        """
+        pos = self._index.get(_to_int(day))
+        if pos is None:
+            return None
+        return self._day(pos + n)
+
+    def between(self, start: DayLike, end: DayLike) -> List[str]:
+        """
+        [start, end] 区间内的全部交易日
+        :param start: 开始日期
+        :type start: str, int or datetime.date
+        :param end: 结束日期
+        :type end: str, int or datetime.date
+        :return: 升序排列的交易日
+        :rtype: list
+        """
+        left = self._position(start, "left")
+        right = self._position(end, "right")
+        return list(self.days[left:right])
+
+    def mask(self, days) -> np.ndarray:
+        """
+        批量判断交易日
+        :param days: YYYYMMDD 整数或字符串的序列
+        :type days: array-like
+        :return: 布尔数组
+        :rtype: numpy.ndarray
+        """
+        values = np.asarray(days).astype(np.int64)
+        return np.isin(values, self.array)
+
+
+@lru_cache()
+def get_trade_calendar() -> TradeCalendar:
+    """
+    交易日历单例, 读取 akshare/file_fold/calendar.json
+    :return: 交易日历
+    :rtype: TradeCalendar
+    """
+    setting_file_path = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        "file_fold",
+        "calendar.json",
+    )
+    with open(setting_file_path, encoding="utf-8") as f:
+        data_json = json.load(f)
+    return TradeCalendar(sorted(set(data_json)))
@@ -0,0 +1,6 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 13:00
+Desc: 耗时基准脚本, 在仓库根目录下运行, 如 python -m benchmarks.bench_page_accumulator
+"""
@@ -0,0 +1,66 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/18 10:30
+Desc: JS 字面量解析耗时基准, 对比 json 快速路径、宽松 JSON 预处理、V8 执行和 demjson
+python -m benchmarks.bench_js_literal
+"""
+
+import py_mini_racer
+
+from akshare.utils import demjson
+from akshare.utils.js_literal import extract_js_vars, loads_js_literal
+from benchmarks.bench_utils import best_of
+from tests.fake_payloads import pingzhong_text
+
+
+def bench_extract_js_vars(n: int = 2000) -> dict:
+    """
+    天天基金 pingzhongdata 形式的数据, 统计三种解析方式的耗时
+    :param n: 每个走势数组的长度
+    :type n: int
+    :return: 解析方式到最短耗时(秒)的映射
+    :rtype: dict
+    """
+    text = pingzhong_text(n)
+    names = ["Data_netWorthTrend", "Data_ACWorthTrend"]
+    literal = text.split("var Data_netWorthTrend = ")[1].split(";\n")[0]
+
+    def _v8():
+        js_code = py_mini_racer.MiniRacer()
+        js_code.eval(text)
+        return {name: js_code.execute(name) for name in names}
+
+    return {
+        "extract_js_vars": best_of(lambda: extract_js_vars(text, names=names)),
+        "v8": best_of(_v8),
+        "demjson": best_of(lambda: demjson.decode(literal), repeat=1),
+    }
+
+
+def bench_loads_js_literal(n: int = 40) -> dict:
+    """
+    新浪行情中心形式的无引号键数据, 统计宽松 JSON 预处理和 demjson 的耗时
+    :param n: 行数
+    :type n: int
+    :return: 解析方式到最短耗时(秒)的映射
+    :rtype: dict
+    """
+    row = (
+        '{{symbol:"sh60{0:04d}",code:"60{0:04d}",name:"股票{0}",trade:"7.890",'
+        'pricechange:-0.05,changepercent:-0.629,buy:"7.890",sell:"7.900",'
+        'settlement:"7.940",open:"7.930",high:"7.950",low:"7.860",'
+        'volume:26395137,amount:208361035,ticktime:"15:00:00",per:5.08,pb:0.397,'
+        "mktcap:23158650.1,nmc:23158650.1,turnoverratio:0.0899}}"
+    )
+    text = "[" + ",".join(row.format(i) for i in range(n)) + "]"
+    return {
+        "loads_js_literal": best_of(lambda: loads_js_literal(text)),
+        "demjson": best_of(lambda: demjson.decode(text), repeat=1),
+    }
+
+
+if __name__ == "__main__":
+    for name, seconds in bench_extract_js_vars().items():
+        print(f"pingzhongdata {name}: {seconds:.4f}s")
+    for name, seconds in bench_loads_js_literal().items():
+        print(f"sina spot {name}: {seconds:.4f}s")
@@ -0,0 +1,39 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/18 11:00
+Desc: 整条期权链隐含波动率的耗时基准
+python -m benchmarks.bench_option_greeks
+"""
+
+import numpy as np
+
+from akshare.option.option_greeks import option_bsm_greeks, option_implied_volatility
+from benchmarks.bench_utils import best_of
+
+
+def bench_option_implied_volatility(n: int = 2000) -> float:
+    """
+    随机生成期权链, 统计一次性求解全部隐含波动率的耗时
+    :param n: 合约数量
+    :type n: int
+    :return: 最短耗时(秒)
+    :rtype: float
+    """
+    rng = np.random.default_rng(0)
+    option_type = np.where(rng.random(n) < 0.5, "C", "P")
+    strike = rng.uniform(2.0, 4.0, n)
+    expiry = rng.uniform(5, 400, n) / 365
+    sigma = rng.uniform(0.08, 1.2, n)
+    price = option_bsm_greeks(option_type, 3.0, strike, expiry, sigma, rate=0.02)[
+        "price"
+    ]
+    return best_of(
+        lambda: option_implied_volatility(
+            price, option_type, 3.0, strike, expiry, rate=0.02
+        )
+    )
+
+
+if __name__ == "__main__":
+    for num in [2000, 20000]:
+        print(f"{num} contracts: {bench_option_implied_volatility(num):.4f}s")
@@ -0,0 +1,34 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/18 10:00
+Desc: 大量分页时的耗时基准; 页数翻倍时耗时应接近翻倍, 循环中反复 pd.concat 时增长远超线性
+python -m benchmarks.bench_page_accumulator
+"""
+
+from unittest import mock
+
+from akshare.fund import fund_amac
+from benchmarks.bench_utils import best_of
+from tests.fake_payloads import FakeAmacResponse
+
+
+def bench_amac_fund_info(page_num: int) -> float:
+    """
+    本地模拟接口, 统计 amac_fund_info 获取指定页数的耗时
+    :param page_num: 页数
+    :type page_num: int
+    :return: 最短耗时(秒)
+    :rtype: float
+    """
+    with mock.patch.object(
+        fund_amac.requests, "post", lambda *args, **kwargs: FakeAmacResponse()
+    ):
+        return best_of(
+            lambda: fund_amac.amac_fund_info(start_page="1", end_page=str(page_num)),
+            repeat=1,
+        )
+
+
+if __name__ == "__main__":
+    for num in [250, 500, 1000, 2000, 4000]:
+        print(f"{num} pages: {bench_amac_fund_info(num):.3f}s")
@@ -0,0 +1,26 @@
+# !/usr/bin/env python
+"""
+Date: 2026/10/18 10:00
+Desc: 基准脚本共用的计时函数
+"""
+
+import time
+from typing import Callable
+
+
+def best_of(func: Callable, repeat: int = 3) -> float:
+    """
+    多次运行取最短耗时
+    :param func: 无参数的被测函数
+    :type func: callable
+    :param repeat: 运行次数
+    :type repeat: int
+    :return: 最短耗时(秒)
+    :rtype: float
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
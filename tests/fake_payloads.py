@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 13:00
+Desc: 测试和 benchmarks 共用的本地模拟数据
+"""
+
+import json
+
+AMAC_FUND_ROWS = [
+    {
+        "fundName": f"基金{i}",
+        "managerName": "管理人",
+        "managerType": "私募证券投资基金管理人",
+        "workingState": "正在运作",
+        "putOnRecordDate": 1500000000000,
+        "establishDate": 1500000000000,
+        "mandatorName": "托管人",
+    }
+    for i in range(100)
+]
+
+
+class FakeAmacResponse:
+    """
+    中国证券投资基金业协会私募基金公示接口的分页响应, 每页返回 AMAC_FUND_ROWS
+    """
+
+    def json(self):
+        return {"totalPages": 100000, "content": AMAC_FUND_ROWS}
+
+
+def pingzhong_text(n: int = 2000) -> str:
+    """
+    天天基金网 pingzhongdata 形式的 JS 文本, 包含严格 JSON 的走势数组和需要回退解析的变量
+    :param n: 每个走势数组的长度
+    :type n: int
+    :return: JS 文本
+    :rtype: str
+    """
+    net_worth = [
+        {"x": 1104508800000 + i * 86400000, "y": 1 + i / 1000, "equityReturn": 0.1}
+        for i in range(n)
+    ]
+    ac_worth = [[1104508800000 + i * 86400000, 2 + i / 1000] for i in range(n)]
+    return (
+        '/*基金名称*/var fS_name = "华夏大盘";var fS_code = "000011";\n'
+        f"/*单位净值走势*/var Data_netWorthTrend = {json.dumps(net_worth)};\n"
+        f"/*累计净值走势*/var Data_ACWorthTrend = {json.dumps(ac_worth)};\n"
+        "var Data_grandTotal = [{name: '华夏大盘', data: [[1, 2]]}];\n"
+        "var total = 1 + 2; // var ignored = 5;\n"
+    )
@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 11:30
+Desc: 异步接口测试, 使用本地伪造的会话
+"""
+
+import asyncio
+
+import pandas as pd
+import pytest
+from curl_cffi.requests.exceptions import RequestException
+
+import akshare.aio as aka
+from akshare.aio import client as aio_client
+from akshare.stock import stock_board_concept_em
+from akshare.stock_feature import stock_hist_em
+
+_KLINES = [
+    "2024-01-02,10.0,10.5,10.8,9.9,1000,10500.0,9.0,5.0,0.5,0.1",
+    "2024-01-03,10.5,10.2,10.6,10.1,800,8200.0,4.8,-2.9,-0.3,0.08",
+]
+
+
+class _FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+
+class _FakeAsyncSession:
+    """
+    按 handler 返回结果; handler 抛出的异常原样抛出
+    """
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.calls = []
+        self.closed = False
+
+    async def get(self, url, params=None, timeout=None):
+        self.calls.append((url, dict(params or {})))
+        await asyncio.sleep(0)
+        return _FakeResponse(self.handler(url, params or {}))
+
+    async def close(self):
+        self.closed = True
+
+
+def _fake_client(handler, **kwargs) -> aka.AsyncClient:
+    client = aka.AsyncClient(base_delay=0, random_delay_range=(0, 0), **kwargs)
+    client._session = _FakeAsyncSession(handler)
+    return client
+
+
+def test_async_client_retry():
+    """
+    test failed attempts are retried and the session is closed on exit
+    """
+    attempts = []
+
+    def _handler(url, params):
+        attempts.append(url)
+        if len(attempts) < 3:
+            raise RequestException("reset")
+        return {"ok": True}
+
+    async def _main():
+        async with _fake_client(_handler) as client:
+            session = client.session
+            assert await client.get_json("https://push2.eastmoney.com/api") == {
+                "ok": True
+            }
+        return session
+
+    session = asyncio.run(_main())
+    assert len(attempts) == 3
+    assert session.closed
+
+    def _always_fail(url, params):
+        raise RequestException("reset")
+
+    client = _fake_client(_always_fail, max_retries=2)
+    with pytest.raises(RequestException):
+        asyncio.run(client.get("https://push2.eastmoney.com/api"))
+    assert len(client.session.calls) == 2
+
+
+def test_async_fetch_paginated_data():
+    """
+    test remaining pages are fetched concurrently and merged in page order
+    """
+
+    def _handler(url, params):
+        page = int(params.get("pn", 1))
+        diff = [{"f3": 100 - page * 10 - i, "f12": f"{page}-{i}"} for i in range(2)]
+        return {"data": {"diff": diff, "total": 7}}
+
+    client = _fake_client(_handler)
+    temp_df = asyncio.run(
+        aka.fetch_paginated_data(
+            "https://push2.eastmoney.com/api/qt/clist/get",
+            {"pn": 1},
+            client=client,
+            rate=1000,
+        )
+    )
+    assert sorted(params["pn"] for _, params in client.session.calls) == [1, 2, 3, 4]
+    expected = [f"{page}-{i}" for page in range(1, 5) for i in range(2)]
+    assert temp_df["f12"].tolist() == expected
+    assert temp_df["index"].tolist() == list(range(1, 9))
+
+
+def test_async_stock_zh_a_hist(monkeypatch):
+    """
+    test the async frame is identical to the sync one
+    """
+
+    def _handler(url, params):
+        return {"data": {"klines": _KLINES}}
+
+    monkeypatch.setattr(
+        stock_hist_em.requests,
+        "get",
+        lambda url, params=None, timeout=None: _FakeResponse(_handler(url, params)),
+    )
+    sync_df = stock_hist_em.stock_zh_a_hist(symbol="600000")
+    client = _fake_client(_handler)
+    async_df = asyncio.run(aka.stock_zh_a_hist(symbol="600000", client=client))
+    pd.testing.assert_frame_equal(async_df, sync_df)
+    assert client.session.calls[0][1]["secid"] == "1.600000"
+
+
+def test_stock_board_concept_code(monkeypatch):
+    """
+    test board names and BK codes resolve the same way in the sync and async APIs
+    """
+    name_map = pd.DataFrame({"板块名称": ["绿色电力"], "板块代码": ["BK0715"]})
+    calls = []
+
+    def _name_em():
+        calls.append(1)
+        return name_map
+
+    monkeypatch.setattr(
+        stock_board_concept_em, "__stock_board_concept_name_em", _name_em
+    )
+    assert stock_board_concept_em._stock_board_concept_code("BK0715") == "BK0715"
+    assert calls == []
+    assert stock_board_concept_em._stock_board_concept_code("绿色电力") == "BK0715"
+    with pytest.raises(ValueError):
+        stock_board_concept_em._stock_board_concept_code("不存在")
+
+    secid_list = []
+
+    def _handler(url, params):
+        secid_list.append(params["secid"])
+        return {"data": {"klines": _KLINES}}
+
+    monkeypatch.setattr(
+        stock_board_concept_em.requests,
+        "get",
+        lambda url, params=None: _FakeResponse(_handler(url, params)),
+    )
+    sync_df = stock_board_concept_em.stock_board_concept_hist_em(symbol="BK0715")
+    client = _fake_client(_handler)
+    for symbol in ["BK0715", "绿色电力"]:
+        async_df = asyncio.run(
+            aka.stock_board_concept_hist_em(symbol=symbol, client=client)
+        )
+        pd.testing.assert_frame_equal(async_df, sync_df)
+    assert secid_list == ["90.BK0715"] * 3
+
+
+def test_get_client():
+    """
+    test each event loop gets its own default client
+    """
+
+    async def _main():
+        first = aio_client.get_client()
+        assert aio_client.get_client() is first
+        await aio_client.close_client()
+        return first
+
+    assert asyncio.run(_main()) is not asyncio.run(_main())
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
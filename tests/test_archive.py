@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 00:30
+Desc: 交易所压缩包流式读取测试
+"""
+
+import io
+import zipfile
+
+from akshare.futures import cot, futures_daily_bar
+from akshare.utils.archive import iter_zip_members
+
+
+def _zip_bytes(members: dict) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, mode="w") as zip_file:
+        for name, content in members.items():
+            zip_file.writestr(name, content)
+    return buffer.getvalue()
+
+
+def test_iter_zip_members():
+    """
+    test members are filtered by name before being opened
+    """
+    data = _zip_bytes({"a.txt": "1", "b.csv": "2", "c.txt": "3"})
+    names = [
+        name
+        for name, _ in iter_zip_members(
+            io.BytesIO(data), match=lambda x: x.endswith("txt")
+        )
+    ]
+    assert names == ["a.txt", "c.txt"]
+
+
+def test_futures_dce_position_rank_iter(monkeypatch):
+    """
+    test only members of the requested varieties and date are parsed
+    """
+    data = _zip_bytes(
+        {
+            "20240105_a2405_成交量_买持仓_卖持仓排名.txt": "",
+            "20240105_m2405_成交量_买持仓_卖持仓排名.txt": "",
+            "20240105_y2405_成交量_买持仓_卖持仓排名.txt": "",
+            "20240104_a2405_成交量_买持仓_卖持仓排名.txt": "",
+        }
+    )
+
+    def _fake_download(url, method="get", **kwargs):
+        return io.BytesIO(data)
+
+    parsed = []
+
+    def _fake_member(z, file_name):
+        parsed.append(file_name)
+        return file_name
+
+    monkeypatch.setattr(cot, "download_spooled", _fake_download)
+    monkeypatch.setattr(cot, "_dce_position_rank_member", _fake_member)
+    result = list(cot.futures_dce_position_rank_iter("20240105", vars_list=["A", "Y"]))
+    assert [symbol for symbol, _ in result] == ["a2405", "y2405"]
+    assert parsed == [
+        "20240105_a2405_成交量_买持仓_卖持仓排名.txt",
+        "20240105_y2405_成交量_买持仓_卖持仓排名.txt",
+    ]
+
+
+def test_czce_history_rows():
+    """
+    test only the header and rows of the requested day are kept
+    """
+    lines = io.StringIO(
+        "郑州商品交易所期货历史交易数据\n"
+        "交易日期  |合约代码 |昨结算 |\n"
+        "2010-08-24|CF101 |1.0 |\n"
+        "2010-08-25|CF101 |2.0 |\n"
+        "2010-08-24|SR101 |3.0 |\n"
+    )
+    data = futures_daily_bar._czce_history_rows(lines, "20100824")
+    assert data.splitlines() == [
+        "交易日期  |合约代码 |昨结算 |",
+        "2010-08-24|CF101 |1.0 |",
+        "2010-08-24|SR101 |3.0 |",
+    ]
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__])
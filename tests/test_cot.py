@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 23:00
+Desc: 期货持仓排名汇总测试
+"""
+
+import datetime
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from akshare.exceptions import NetworkError
+from akshare.futures import cot
+from akshare.utils.day_cache import DayCacheContext
+
+
+def test_get_rank_sum_daily_checkpoint(monkeypatch, tmp_path):
+    """
+    test trading-day fan-out, failed days and resuming from checkpoints
+    """
+    calls = []
+    lock = threading.Lock()
+    fail_days = {"20240104"}
+
+    def _fake_rank_sum(date, vars_list):
+        day = date.strftime("%Y%m%d")
+        with lock:
+            calls.append(day)
+        if day in fail_days:
+            return False
+        return pd.DataFrame({"symbol": ["RB2405"], "variety": ["RB"], "date": [day]})
+
+    monkeypatch.setattr(cot, "get_rank_sum", _fake_rank_sum)
+    temp_df = cot.get_rank_sum_daily(
+        start_day="20240101", end_day="20240107", checkpoint_dir=str(tmp_path)
+    )
+    assert sorted(calls) == ["20240102", "20240103", "20240104", "20240105"]
+    assert temp_df["date"].tolist() == ["20240102", "20240103", "20240105"]
+    assert list(temp_df.attrs["failed"]) == ["20240104"]
+
+    calls.clear()
+    fail_days.clear()
+    temp_df = cot.get_rank_sum_daily(
+        start_day="20240101", end_day="20240107", checkpoint_dir=str(tmp_path)
+    )
+    assert calls == ["20240104"]
+    assert temp_df["date"].tolist() == ["20240102", "20240103", "20240104", "20240105"]
+    assert temp_df.attrs["failed"] == {}
+
+
+def test_get_dce_rank_table_incomplete(monkeypatch, tmp_path):
+    """
+    test a failed contract list raises instead of returning and caching a partial table
+    """
+    monkeypatch.setattr(cot.time, "sleep", lambda seconds: None)
+
+    def _fail_post(*args, **kwargs):
+        raise ConnectionError("blocked")
+
+    monkeypatch.setattr(cot.requests, "post", _fail_post)
+    with pytest.raises(NetworkError):
+        cot._get_dce_contract_list(datetime.date(2024, 1, 5), "M")
+
+    def _fake_contract_list(date, var):
+        if var == "M":
+            raise NetworkError("20240105 M 合约列表获取失败")
+        return [var.lower() + "2405"]
+
+    def _fake_rank_contract(date, date_string, var, symbol):
+        return pd.DataFrame({"symbol": [symbol.upper()], "var": [var]})
+
+    monkeypatch.setattr(cot, "_get_dce_contract_list", _fake_contract_list)
+    monkeypatch.setattr(cot, "_dce_rank_contract", _fake_rank_contract)
+    with DayCacheContext(root=str(tmp_path)):
+        with pytest.raises(NetworkError):
+            cot.get_dce_rank_table(date="20240105", vars_list=["A", "M"])
+        assert list(tmp_path.rglob("*.pkl")) == []
+        data = cot.get_dce_rank_table(date="20240105", vars_list=["A"])
+        assert list(data) == ["a2405"]
+        assert len(list(tmp_path.rglob("*.pkl"))) == 1
+
+
+def test_rank_exchange_limit(monkeypatch):
+    """
+    test the per-exchange cap holds for every HTTP request inside the DCE contract pool
+    """
+    state = {"active": 0, "peak": 0, "calls": 0}
+    lock = threading.Lock()
+
+    def _enter():
+        with lock:
+            state["active"] += 1
+            state["calls"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.02)
+        with lock:
+            state["active"] -= 1
+
+    class _Response:
+        text = "".join(
+            f'<input name="contract" onclick="javascript:setContract_id(\'{month}\');">'
+            for month in ("2405", "2409")
+        )
+
+    def _fake_post(*args, **kwargs):
+        _enter()
+        return _Response()
+
+    def _fake_read_excel(*args, **kwargs):
+        _enter()
+        columns = ["名次", "会员简称", "成交量", "增减", "名次.1", "会员简称.1"]
+        columns += ["持买单量", "增减.1", "名次.2", "会员简称.2", "持卖单量", "增减.2"]
+        row = ["1", "甲", "10", "1", "1", "甲", "5", "1", "1", "乙", "5", "1"]
+        return pd.DataFrame([row], columns=columns)
+
+    monkeypatch.setattr(cot.requests, "post", _fake_post)
+    monkeypatch.setattr(cot.pd, "read_excel", _fake_read_excel)
+    cot.set_rank_exchange_limit(1)
+    try:
+        data = cot.get_dce_rank_table(date="20240105", vars_list=["A", "M", "Y", "P"])
+    finally:
+        cot.set_rank_exchange_limit()
+    assert len(data) == 8
+    assert state["calls"] == 12
+    assert state["peak"] == 1
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__])
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 22:00
+Desc: 按交易日的本地结果缓存测试
+"""
+
+import datetime
+import os
+import time
+
+import pandas as pd
+
+from akshare.utils.day_cache import DayCacheContext, day_cached
+
+calls = []
+
+
+@day_cached("DCE")
+def _fake_daily(date: str = None, vars_list: list = None) -> pd.DataFrame:
+    calls.append(date)
+    if date == "20240106":
+        return pd.DataFrame()
+    return pd.DataFrame({"date": [date], "vars": [",".join(vars_list or [])]})
+
+
+def test_day_cached(tmp_path):
+    """
+    test cache hits, keys, empty results and freshness of recent days
+    """
+    calls.clear()
+    _fake_daily("20240105")
+    _fake_daily("20240105")
+    assert len(calls) == 2
+    with DayCacheContext(root=str(tmp_path), recent_ttl=60) as context:
+        first = _fake_daily("20240105", vars_list=["A", "M"])
+        second = _fake_daily(date="2024-01-05", vars_list=["M", "A"])
+        pd.testing.assert_frame_equal(first, second)
+        assert len(calls) == 3
+        _fake_daily("20240105", vars_list=["A"])
+        assert len(calls) == 4
+        _fake_daily("20240106")
+        _fake_daily("20240106")
+        assert len(calls) == 6
+        today = datetime.date.today().strftime("%Y%m%d")
+        _fake_daily(today)
+        _fake_daily(today)
+        assert len(calls) == 7
+        for root, _, files in os.walk(
+            os.path.join(str(tmp_path), "test_day_cache._fake_daily", today)
+        ):
+            for file in files:
+                path = os.path.join(root, file)
+                os.utime(path, (time.time() - 120, time.time() - 120))
+        _fake_daily(today)
+        assert len(calls) == 8
+        assert context.old_cache is None
+    _fake_daily("20240105", vars_list=["A", "M"])
+    assert len(calls) == 9
+
+
+@day_cached("SHFE")
+def _fake_rank(date: str = None, fail: bool = False):
+    calls.append(date)
+    if fail:
+        temp_df = pd.DataFrame({"date": [date]})
+        temp_df.attrs["failed"] = {"RB2405": "timeout"}
+        return {"RB2405": pd.DataFrame(), "RB2410": temp_df}
+    return {"RB2405": pd.DataFrame({"date": [date]})}
+
+
+def test_day_cached_incomplete(tmp_path):
+    """
+    test results with empty parts or recorded failures are not cached
+    """
+    calls.clear()
+    with DayCacheContext(root=str(tmp_path)):
+        _fake_rank("20240105", fail=True)
+        _fake_rank("20240105", fail=True)
+        assert len(calls) == 2
+        assert not list(tmp_path.rglob("*.pkl"))
+        _fake_rank("20240105")
+        _fake_rank("20240105")
+        assert len(calls) == 3
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__])
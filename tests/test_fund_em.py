@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 03:00
+Desc: 开放式基金净值多指标获取测试
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from akshare.fund import fund_em
+
+_JS_TEXT = """
+var fS_code = "710001";
+var Data_netWorthTrend = [{"x":1704153600000,"y":1.01,"equityReturn":0.5,"unitMoney":""},
+{"x":1704240000000,"y":1.02,"equityReturn":0.99,"unitMoney":""}];
+var Data_ACWorthTrend = [[1704153600000,2.01],[1704240000000,2.02]];
+var Data_rateInSimilarType = [{"x":1704153600000,"y":12,"sc":"300"}];
+var Data_rateInSimilarPersent = [[1704153600000,85.5]];
+"""
+
+
+class _FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+def test_fund_open_fund_info_bundle(monkeypatch):
+    """
+    test every pingzhongdata indicator comes from one download per fund
+    """
+    calls = []
+    lock = threading.Lock()
+
+    def _fake_get(url, headers=None, **kwargs):
+        with lock:
+            calls.append(url)
+        return _FakeResponse(_JS_TEXT)
+
+    monkeypatch.setattr(fund_em.requests, "get", _fake_get)
+    fund_em.set_fund_open_fund_info_ttl(60)
+    try:
+        indicator_list = list(fund_em._PINGZHONG_INDICATOR_VAR)
+        bundle = fund_em.fund_open_fund_info_bundle_em(
+            symbol="710001", indicator_list=indicator_list
+        )
+        assert bundle["单位净值走势"]["单位净值"].tolist() == [1.01, 1.02]
+        assert bundle["累计净值走势"]["累计净值"].tolist() == [2.01, 2.02]
+        assert bundle["每万份收益"].empty
+        assert bundle["同类排名走势"]["同类型排名-每日近三月排名"].tolist() == [12]
+        temp_df = fund_em.fund_open_fund_info_em(
+            symbol="710001", indicator="累计净值走势"
+        )
+        assert temp_df["累计净值"].tolist() == [2.01, 2.02]
+        assert len(calls) == 1
+
+        fund_em.set_fund_open_fund_info_ttl(0)
+        big_dict = fund_em.fund_open_fund_info_em_batch(
+            symbol=["710001", "000001", "710001"],
+            indicator_list=["单位净值走势", "同类排名百分比"],
+            rate=1000,
+        )
+        # 重复的基金代码只请求一次
+        assert len(calls) == 3
+        assert big_dict["单位净值走势"]["基金代码"].tolist() == [
+            "710001",
+            "710001",
+            "000001",
+            "000001",
+            "710001",
+            "710001",
+        ]
+        assert big_dict["同类排名百分比"].attrs["failed"] == {}
+    finally:
+        fund_em.set_fund_open_fund_info_ttl(60)
+
+
+def test_fund_open_fund_info_cache_bounded(monkeypatch):
+    """
+    test the cache keeps at most maxsize entries, drops expired ones and is skipped by batches
+    """
+    monkeypatch.setattr(
+        fund_em.requests,
+        "get",
+        lambda url, headers=None, **kwargs: _FakeResponse(_JS_TEXT),
+    )
+    indicator_list = ["单位净值走势"]
+    fund_em.set_fund_open_fund_info_ttl(60)
+    fund_em.set_fund_open_fund_info_cache_size(5)
+    try:
+        for i in range(20):
+            fund_em.fund_open_fund_info_bundle_em(
+                symbol=f"{i:06d}", indicator_list=indicator_list
+            )
+            assert len(fund_em._fund_info_cache) <= 5
+        # 最近使用的数据保留, 最久未使用的数据被淘汰
+        assert list(fund_em._fund_info_cache) == [
+            ("pingzhongdata", f"{i:06d}") for i in range(15, 20)
+        ]
+        monotonic = fund_em.time.monotonic
+        clock = {"now": 0.0}
+        monkeypatch.setattr(fund_em.time, "monotonic", lambda: clock["now"])
+        fund_em.set_fund_open_fund_info_ttl(10)
+        fund_em.fund_open_fund_info_bundle_em(
+            symbol="000001", indicator_list=indicator_list
+        )
+        clock["now"] = 20.0
+        fund_em.fund_open_fund_info_bundle_em(
+            symbol="000002", indicator_list=indicator_list
+        )
+        assert list(fund_em._fund_info_cache) == [("pingzhongdata", "000002")]
+        # 限速器同样使用 time.monotonic, 批量获取前恢复
+        monkeypatch.setattr(fund_em.time, "monotonic", monotonic)
+        fund_em.fund_open_fund_info_em_batch(
+            symbol=[f"{i:06d}" for i in range(30)],
+            indicator_list=indicator_list,
+            rate=1000,
+        )
+        assert list(fund_em._fund_info_cache) == [("pingzhongdata", "000002")]
+    finally:
+        fund_em.set_fund_open_fund_info_cache_size(64)
+        fund_em.set_fund_open_fund_info_ttl(60)
+
+
+def test_fund_open_fund_info_shared_download(monkeypatch):
+    """
+    test concurrent requests for the same fund share one download
+    """
+    calls = []
+    lock = threading.Lock()
+
+    def _slow_get(url, headers=None, **kwargs):
+        with lock:
+            calls.append(url)
+        time.sleep(0.05)
+        return _FakeResponse(_JS_TEXT)
+
+    monkeypatch.setattr(fund_em.requests, "get", _slow_get)
+    fund_em.set_fund_open_fund_info_ttl(60)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            result = list(
+                executor.map(
+                    lambda _: fund_em.fund_open_fund_info_em(
+                        symbol="710001", indicator="单位净值走势"
+                    ),
+                    range(8),
+                )
+            )
+        assert len(calls) == 1
+        assert all(item["单位净值"].tolist() == [1.01, 1.02] for item in result)
+        assert fund_em._fund_info_locks == {}
+    finally:
+        fund_em.set_fund_open_fund_info_ttl(60)
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__])
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 00:00
+Desc: 基差面板测试
+"""
+
+import pandas as pd
+
+from akshare.futures import futures_basis
+
+
+def _fake_spot_day(date):
+    day = date.strftime("%Y%m%d")
+    return pd.DataFrame(
+        {
+            "date": [day, day],
+            "symbol": ["RB", "SR"],
+            "spot_price": [4000.0, 6000.0],
+            "near_contract": ["rb2401", "SR401"],
+            "near_contract_price": [3900.0, 5900.0],
+            "dominant_contract": ["rb2405", "SR405"],
+            "dominant_contract_price": [3950.0, 5950.0],
+            "near_month": ["2401", "401"],
+            "dominant_month": ["2405", "405"],
+        }
+    )
+
+
+def _fake_bars(start_date, end_date, market, max_workers):
+    assert market == ["CZCE", "SHFE"]
+    return pd.DataFrame(
+        {
+            "date": ["20240102", "20240102", "20240103"],
+            "symbol": ["RB2401", "SR401", "RB2405"],
+            "settle": [3800.0, 6100.0, 4400.0],
+        }
+    )
+
+
+def test_futures_basis_panel(monkeypatch):
+    """
+    test exchange settle prices replace 100ppi prices where available
+    """
+    monkeypatch.setattr(futures_basis, "_futures_spot_price_day", _fake_spot_day)
+    monkeypatch.setattr(futures_basis, "get_futures_daily_batch", _fake_bars)
+    temp_df = futures_basis.futures_basis_panel(
+        start_day="20240101", end_day="20240107", vars_list=["RB", "SR"]
+    )
+    assert temp_df["date"].unique().tolist() == [
+        "20240102",
+        "20240103",
+        "20240104",
+        "20240105",
+    ]
+    first = temp_df.iloc[:2]
+    assert first["near_contract_price"].tolist() == [3800.0, 6100.0]
+    assert first["near_basis"].tolist() == [-200.0, 100.0]
+    assert first["dominant_contract_price"].tolist() == [3950.0, 5950.0]
+    assert temp_df.iloc[2]["dominant_contract_price"] == 4400.0
+    assert abs(temp_df.iloc[2]["dom_basis_rate"] - 0.1) < 1e-12
+    raw_df = futures_basis.futures_spot_price_daily(
+        start_day="20240101", end_day="20240107", vars_list=["RB"]
+    )
+    assert raw_df["near_contract_price"].tolist() == [3900.0] * 4
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__])
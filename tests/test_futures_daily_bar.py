@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 21:00
+Desc: 期货日线行情批量获取测试
+"""
+
+import threading
+
+import pandas as pd
+
+from akshare.futures import futures_daily_bar
+
+
+def test_get_futures_daily_batch(monkeypatch):
+    """
+    test only trading days are requested and frames are ordered by exchange and date
+    """
+    calls = []
+    lock = threading.Lock()
+
+    def _fake(market):
+        def _daily(date):
+            with lock:
+                calls.append((market, date))
+            if market == "DCE" and date == "20240104":
+                raise ValueError("boom")
+            return pd.DataFrame(
+                {"symbol": [f"{market}2401", f"{market}efp"], "date": [date, date]}
+            )
+
+        return _daily
+
+    market_dict = {
+        key: (_fake(key), host)
+        for key, (_, host) in futures_daily_bar._FUTURES_DAILY_MARKET.items()
+    }
+    monkeypatch.setattr(futures_daily_bar, "_FUTURES_DAILY_MARKET", market_dict)
+    monkeypatch.setattr(futures_daily_bar.time, "sleep", lambda _: None)
+    temp_df = futures_daily_bar.get_futures_daily_batch(
+        start_date="20240101", end_date="20240107", market=["shfe", "DCE"], rate=1000
+    )
+    # 20240101 元旦和周末不请求
+    days = ["20240102", "20240103", "20240104", "20240105"]
+    assert sorted({date for _, date in calls}) == days
+    assert calls.count(("DCE", "20240104")) == 3
+    assert temp_df["exchange"].tolist() == ["SHFE"] * 4 + ["DCE"] * 3
+    assert temp_df["date"].tolist() == days + ["20240102", "20240103", "20240105"]
+    assert not temp_df["symbol"].str.contains("efp").any()
+    assert list(temp_df.attrs["failed"]) == ["DCE 20240104"]
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__])
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 23:30
+Desc: 展期收益率面板测试
+"""
+
+import random
+
+import numpy as np
+import pandas as pd
+
+from akshare.futures.futures_roll_yield import get_roll_yield, get_roll_yield_panel
+
+
+def _fake_bars() -> pd.DataFrame:
+    random.seed(1)
+    rows = []
+    days = ["20240102", "20240103", "20240104", "20240105"]
+    varieties = {"RB": "RB24", "CU": "CU24", "SR": "SR4", "M": "M24"}
+    for day in days:
+        for var, prefix in varieties.items():
+            for month in random.sample(range(1, 13), random.randint(1, 6)):
+                rows.append(
+                    {
+                        "symbol": f"{prefix}{month:02d}",
+                        "date": day,
+                        "close": 0
+                        if random.random() < 0.1
+                        else 3000 + random.random() * 500,
+                        "open_interest": random.randint(1, 100000),
+                        "variety": var,
+                    }
+                )
+            rows.append(
+                {
+                    "symbol": f"{var}efp",
+                    "date": day,
+                    "close": 1.0,
+                    "open_interest": 10**9,
+                    "variety": var,
+                }
+            )
+    return pd.DataFrame(rows)
+
+
+def test_roll_yield_panel():
+    """
+    test panel matches get_roll_yield for every (date, variety)
+    """
+    df = _fake_bars()
+    panel_df = get_roll_yield_panel(df).set_index(["date", "variety"])
+    checked = 0
+    for (day, var), _ in df.groupby(["date", "variety"]):
+        day_df = df[df["date"] == day]
+        ry = get_roll_yield(day, var, df=day_df)
+        if not ry:
+            assert (day, var) not in panel_df.index
+            continue
+        row = panel_df.loc[(day, var)]
+        assert np.isclose(row["roll_yield"], ry[0], rtol=1e-12)
+        assert (row["near_by"], row["deferred"]) == (ry[1], ry[2])
+        assert row["spread"] == row["deferred_close"] - row["near_close"]
+        checked += 1
+    assert checked > 5
+    assert len(panel_df) == checked
+
+
+if __name__ == "__main__":
+    test_roll_yield_panel()
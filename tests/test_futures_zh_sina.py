@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 01:00
+Desc: 新浪财经-期货实时行情轮询测试
+"""
+
+from akshare.futures import futures_zh_sina
+
+
+def _line(contract: str, price: str) -> str:
+    fields = [contract, "145959", "6000", "6100", "5900", "6010", "6019", "6020"]
+    fields += [price, "6005", "6000", "10", "20", "1000", "2000"]
+    fields += ["0"] * 13
+    return f'var hq_str_nf_{contract}="{",".join(fields)}";\n'
+
+
+class _FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+class _FakeSession:
+    def __init__(self, price_list):
+        self.price_list = price_list
+        self.url_list = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.url_list.append(url)
+        prices = self.price_list[len(self.url_list) - 1]
+        return _FakeResponse(
+            "".join(
+                _line(k, v) if v else f'var hq_str_nf_{k}="";\n'
+                for k, v in prices.items()
+            )
+        )
+
+    def close(self):
+        pass
+
+
+def test_futures_zh_spot_poller(monkeypatch):
+    """
+    test metadata is looked up once per contract and only changed rows are emitted
+    """
+    meta_calls = []
+
+    def _fake_meta(contract):
+        meta_calls.append(contract)
+        return "大连商品交易所", "5元/吨"
+
+    monkeypatch.setattr(futures_zh_sina, "_futures_contract_meta", _fake_meta)
+    session = _FakeSession(
+        [
+            {"V2405": "6018", "V2409": "6100"},
+            {"V2405": "6018", "V2409": "6101"},
+            {"V2405": "6018", "V2409": "6101"},
+            {"V2405": "6020", "V2409": "6101", "P2405": "7000"},
+        ]
+    )
+    poller = futures_zh_sina.FuturesZhSpotPoller(
+        symbol="V2405,V2409", adjust="1", session=session
+    )
+    first = poller.poll()
+    assert first["contract"].tolist() == ["V2405", "V2409"]
+    assert first["exchange"].tolist() == ["大连商品交易所"] * 2
+    assert "receive_time" in first.columns
+    second = poller.poll()
+    assert second["contract"].tolist() == ["V2409"]
+    assert second["current_price"].tolist() == [6101]
+    assert poller.poll().empty
+    poller.subscribe(["P2405", "V2405"])
+    fourth = poller.poll()
+    assert fourth["contract"].tolist() == ["V2405", "P2405"]
+    assert meta_calls == ["V2405", "V2409", "P2405"]
+    assert session.url_list[-1].endswith("list=nf_V2405,nf_V2409,nf_P2405")
+    assert poller.snapshot["contract"].tolist() == ["V2405", "V2409", "P2405"]
+    assert poller.snapshot["current_price"].tolist() == [6020, 6101, 7000]
+    poller.unsubscribe("V2409")
+    assert poller.snapshot["contract"].tolist() == ["V2405", "P2405"]
+
+
+def test_futures_zh_spot_poller_expired(monkeypatch):
+    """
+    test an expired contract that returns an empty string is dropped instead of failing the poll
+    """
+    monkeypatch.setattr(
+        futures_zh_sina, "_futures_contract_meta", lambda contract: ("", "")
+    )
+    session = _FakeSession(
+        [
+            {"V2405": "6018", "V2409": "6100"},
+            {"V2405": "", "V2409": "6100"},
+            {"V2405": "", "V2409": "6101"},
+        ]
+    )
+    poller = futures_zh_sina.FuturesZhSpotPoller(symbol="V2405,V2409", session=session)
+    assert poller.poll()["contract"].tolist() == ["V2405", "V2409"]
+    assert poller.poll().empty
+    assert poller.poll()["contract"].tolist() == ["V2409"]
+    contract_list, row_list = futures_zh_sina._futures_zh_spot_rows(
+        'var hq_str_nf_V2405="";\nvar hq_str_nf_IF2406="";', market="FF"
+    )
+    assert contract_list == [] and row_list == []
+
+
+def test_futures_zh_spot_frame():
+    """
+    test both the 28 and 44 field layouts of commodity futures are parsed
+    """
+    _, row_list = futures_zh_sina._futures_zh_spot_rows(_line("V2405", "6018"))
+    data_df = futures_zh_sina._futures_zh_spot_frame(
+        row_list + [row_list[0] + ["0"] * 16]
+    )
+    assert data_df["symbol"].tolist() == ["V2405", "V2405"]
+    assert data_df["current_price"].tolist() == [6018, 6018]
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__])
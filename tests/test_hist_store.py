@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 14:00
+Desc: 本地增量行情存储测试
+"""
+
+import os
+import threading
+
+import pandas as pd
+
+import akshare as ak
+from akshare.utils import hist_store
+from akshare.utils.hist_store import HistSource, HistStore
+
+
+def test_hist_store_incremental(tmp_path, monkeypatch):
+    """
+    test only the missing tail is fetched and qfq changes rewrite history
+    """
+    dates = pd.bdate_range("2024-01-01", "2024-02-29")
+    state = {"factor": 1.0, "calls": []}
+
+    def fake_fetch(symbol, period, adjust, start_date, end_date):
+        state["calls"].append(start_date)
+        mask = (dates >= pd.to_datetime(start_date)) & (
+            dates <= pd.to_datetime(end_date)
+        )
+        return pd.DataFrame(
+            {
+                "date": dates[mask].strftime("%Y-%m-%d"),
+                "close": [10.0 * state["factor"]] * int(mask.sum()),
+            }
+        )
+
+    monkeypatch.setitem(
+        hist_store.hist_source_dict, "fake", HistSource(fake_fetch, "date", "close")
+    )
+    store = HistStore(root=str(tmp_path), fmt="pickle")
+    first_df = store.get("fake", "X", adjust="qfq", end_date="20240115")
+    assert first_df["date"].iloc[-1] == "2024-01-15"
+    second_df = store.get("fake", "X", adjust="qfq", end_date="20240131")
+    assert state["calls"][-1] == "20240112"
+    assert len(second_df) == 23
+    store.get("fake", "X", adjust="qfq", end_date="20240131")
+    assert len(state["calls"]) == 2
+    state["factor"] = 0.5
+    third_df = store.get("fake", "X", adjust="qfq", end_date="20240229")
+    assert state["calls"][-1] == "19700101"
+    assert len(third_df) == len(dates)
+    assert (third_df["close"] == 5.0).all()
+
+
+def test_hist_incremental(tmp_path, monkeypatch):
+    """
+    test the top-level helper reads back what it stored without refetching
+    """
+    calls = []
+
+    def fake_fetch(symbol, period, adjust, start_date, end_date):
+        calls.append((symbol, start_date, end_date))
+        dates = pd.bdate_range(start_date, end_date)
+        return pd.DataFrame(
+            {"date": dates.strftime("%Y-%m-%d"), "close": [1.0] * len(dates)}
+        )
+
+    monkeypatch.setitem(
+        hist_store.hist_source_dict, "fake", HistSource(fake_fetch, "date", "close")
+    )
+    assert ak.HistStore is HistStore
+    kwargs = dict(
+        source="fake",
+        symbol="Y",
+        start_date="20240101",
+        end_date="20240110",
+        root=str(tmp_path),
+    )
+    first_df = ak.hist_incremental(**kwargs)
+    second_df = ak.hist_incremental(**kwargs)
+    assert len(first_df) == 8
+    pd.testing.assert_frame_equal(first_df, second_df)
+    assert calls == [("Y", "19700101", "20240110")]
+
+
+def test_write_frame_threads(tmp_path, monkeypatch):
+    """
+    test concurrent writers to one path use separate temp files
+    """
+    path = str(tmp_path / "X.pkl")
+    tmp_list = []
+    barrier = threading.Barrier(4)
+    replace = os.replace
+
+    def _replace(src, dst):
+        tmp_list.append(src)
+        # 所有线程都写完临时文件后再替换, 模拟同时写入
+        barrier.wait(timeout=5)
+        replace(src, dst)
+
+    monkeypatch.setattr(hist_store.os, "replace", _replace)
+    frames = [pd.DataFrame({"close": [float(i)] * 1000}) for i in range(4)]
+    threads = [
+        threading.Thread(target=hist_store.write_frame, args=(frame, path))
+        for frame in frames
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(set(tmp_list)) == 4
+    temp_df = hist_store.read_frame(path)
+    assert any(temp_df.equals(frame) for frame in frames)
+    assert os.listdir(tmp_path) == ["X.pkl"]
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__])
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 02:30
+Desc: 期权波动率指数 QVIX 缓存测试
+"""
+
+import pandas as pd
+
+from akshare.index import index_option_qvix
+
+
+def test_qvix_shared_download(monkeypatch):
+    """
+    test all daily QVIX series come from one download within the ttl
+    """
+    calls = []
+    raw_df = pd.DataFrame(
+        [["2024-01-02"] + [float(i) for i in range(1, 90)]],
+        columns=range(90),
+    )
+
+    def _fake_read_csv(url, **kwargs):
+        calls.append(url)
+        if url.endswith("k.csv"):
+            return raw_df.copy()
+        return pd.DataFrame({"time": ["9:30"], "qvix": ["20.1"]})
+
+    monkeypatch.setattr(index_option_qvix.pd, "read_csv", _fake_read_csv)
+    index_option_qvix.set_qvix_cache_ttl(60)
+    try:
+        panel_df = index_option_qvix.index_option_qvix_all()
+        temp_df = index_option_qvix.index_option_300etf_qvix()
+        index_option_qvix.index_option_50etf_qvix()
+        index_option_qvix.index_option_50etf_min_qvix()
+        index_option_qvix.index_option_50etf_min_qvix()
+        assert len(calls) == 2
+        assert temp_df["open"].tolist() == [9.0]
+        assert panel_df["symbol"].tolist() == list(
+            index_option_qvix._QVIX_DAILY_COLUMNS
+        )
+        assert panel_df[panel_df["symbol"] == "300etf"]["close"].tolist() == [12.0]
+        index_option_qvix.set_qvix_cache_ttl(0)
+        index_option_qvix.index_option_50etf_qvix()
+        index_option_qvix.index_option_50etf_qvix()
+        assert len(calls) == 4
+    finally:
+        index_option_qvix.set_qvix_cache_ttl(60)
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__])
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 03:30
+Desc: JS 赋值语句字面量解析测试
+"""
+
+import py_mini_racer
+
+from akshare.utils import demjson
+from akshare.utils.js_literal import extract_js_vars, loads_js_literal
+from tests.fake_payloads import pingzhong_text
+
+
+def test_extract_js_vars():
+    """
+    test strict literals, fallbacks, comments and name filtering
+    """
+    text = pingzhong_text(3)
+    result = extract_js_vars(text, fallback="v8")
+    assert result["fS_code"] == "000011"
+    assert result["Data_ACWorthTrend"][2][1] == 2.002
+    assert result["Data_grandTotal"] == [{"name": "华夏大盘", "data": [[1, 2]]}]
+    assert result["total"] == 3
+    assert "ignored" not in result
+    result = extract_js_vars(
+        text, names=["Data_grandTotal", "Data_netWorthTrend"], fallback="demjson"
+    )
+    assert sorted(result) == ["Data_grandTotal", "Data_netWorthTrend"]
+    assert result["Data_grandTotal"][0]["name"] == "华夏大盘"
+    assert extract_js_vars(text, names=["Data_grandTotal"], fallback="skip") == {}
+    assert loads_js_literal('{a: 1, "b": [2]}') == {"a": 1, "b": [2]}
+
+
+def test_extract_js_vars_large():
+    """
+    test the json fast path agrees with V8 and demjson on a full pingzhongdata payload
+    """
+    text = pingzhong_text()
+    names = ["Data_netWorthTrend", "Data_ACWorthTrend"]
+    js_code = py_mini_racer.MiniRacer()
+    js_code.eval(text)
+    fast = extract_js_vars(text, names=names)
+    assert fast == {name: js_code.execute(name) for name in names}
+    literal = text.split("var Data_netWorthTrend = ")[1].split(";\n")[0]
+    assert len(fast["Data_netWorthTrend"]) == len(demjson.decode(literal))
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__])
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 12:00
+Desc: MiniRacer 上下文池测试
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from akshare.utils.js_pool import MiniRacerPool, get_js_pool, js_call
+
+SCRIPT = """
+var calls = 0;
+function add(a, b) {
+    calls += 1;
+    return a + b;
+}
+"""
+
+
+def test_js_pool_reuse():
+    """
+    test the script is loaded once per context and contexts are reused
+    """
+    pool = MiniRacerPool(SCRIPT, max_size=2)
+    assert [pool.call("add", i, 1) for i in range(5)] == [1, 2, 3, 4, 5]
+    assert pool._created == 1
+    # 同一上下文中的全局状态保留, 说明脚本没有重复执行
+    assert pool.eval("calls") == 5
+    assert get_js_pool(SCRIPT) is get_js_pool(SCRIPT)
+    assert js_call(SCRIPT, "add", 2, 3) == 5
+
+
+def test_js_pool_threads():
+    """
+    test concurrent callers never share a context and never exceed max_size
+    """
+    pool = MiniRacerPool(SCRIPT, max_size=3)
+    lock = threading.Lock()
+    in_use = set()
+    overlaps = []
+
+    def _work(i: int) -> int:
+        with pool.context() as js_code:
+            with lock:
+                if id(js_code) in in_use:
+                    overlaps.append(i)
+                in_use.add(id(js_code))
+            result = js_code.call("add", i, i)
+            with lock:
+                in_use.discard(id(js_code))
+        return result
+
+    with ThreadPoolExecutor(max_workers=12) as executor:
+        result = list(executor.map(_work, range(200)))
+    assert result == [i * 2 for i in range(200)]
+    assert overlaps == []
+    assert 1 <= pool._created <= 3
+    assert pool._idle.qsize() == pool._created
+
+
+def test_js_pool_bad_script():
+    """
+    test a context that fails to load does not use up the pool
+    """
+    pool = MiniRacerPool("function (", max_size=1)
+    for _ in range(2):
+        with pytest.raises(Exception):
+            pool.call("add", 1, 2)
+    assert pool._created == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 05:30
+Desc: 期权希腊字母和隐含波动率计算测试
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+
+from akshare.option.option_greeks import (
+    _norm_cdf,
+    option_bsm_greeks,
+    option_chain_greeks,
+    option_implied_volatility,
+)
+
+
+def _scalar_call(s, k, t, sigma, r):
+    d1 = (math.log(s / k) + (r + 0.5 * sigma**2) * t) / (sigma * math.sqrt(t))
+    d2 = d1 - sigma * math.sqrt(t)
+    cdf = lambda x: 0.5 * math.erfc(-x / math.sqrt(2))  # noqa: E731
+    return s * cdf(d1) - k * math.exp(-r * t) * cdf(d2)
+
+
+def test_option_bsm_greeks():
+    """
+    test the normal cdf, prices, put-call parity and greeks against finite differences
+    """
+    x = np.linspace(-40, 40, 2001)
+    expected = np.array([0.5 * math.erfc(-item / math.sqrt(2)) for item in x])
+    assert np.max(np.abs(_norm_cdf(x) - expected)) < 1e-14
+    strike = np.array([2.5, 2.8, 3.0, 3.2, 3.5])
+    call = option_bsm_greeks("call", 3.0, strike, 0.25, 0.2, rate=0.02)
+    put = option_bsm_greeks("put", 3.0, strike, 0.25, 0.2, rate=0.02)
+    for i, k in enumerate(strike):
+        assert abs(call["price"][i] - _scalar_call(3.0, k, 0.25, 0.2, 0.02)) < 1e-12
+    parity = call["price"] - put["price"] - (3.0 - strike * math.exp(-0.02 * 0.25))
+    assert np.max(np.abs(parity)) < 1e-12
+    h = 1e-4
+    up = option_bsm_greeks("call", 3.0 + h, strike, 0.25, 0.2, rate=0.02)
+    down = option_bsm_greeks("call", 3.0 - h, strike, 0.25, 0.2, rate=0.02)
+    delta = (up["price"] - down["price"]) / (2 * h)
+    gamma = (up["price"] - 2 * call["price"] + down["price"]) / h**2
+    vol_up = option_bsm_greeks("call", 3.0, strike, 0.25, 0.2 + h, rate=0.02)
+    day = option_bsm_greeks("call", 3.0, strike, 0.25 - 1 / 365, 0.2, rate=0.02)
+    np.testing.assert_allclose(call["delta"], delta, atol=1e-6)
+    np.testing.assert_allclose(call["gamma"], gamma, atol=1e-3)
+    np.testing.assert_allclose(
+        call["vega"], (vol_up["price"] - call["price"]) / h / 100, atol=1e-5
+    )
+    np.testing.assert_allclose(call["theta"], day["price"] - call["price"], atol=1e-5)
+    black = option_bsm_greeks("put", 3500, 3600, 0.5, 0.25, rate=0.03, model="black76")
+    scholes = option_bsm_greeks("put", 3500, 3600, 0.5, 0.25, rate=0.03, dividend=0.03)
+    np.testing.assert_allclose(black["price"], scholes["price"])
+
+
+def test_option_implied_volatility():
+    """
+    test the solver recovers volatility across a whole chain and rejects arbitrage prices
+    """
+    rng = np.random.default_rng(0)
+    n = 2000
+    option_type = np.where(rng.random(n) < 0.5, "C", "P")
+    strike = rng.uniform(2.0, 4.0, n)
+    expiry = rng.uniform(5, 400, n) / 365
+    sigma = rng.uniform(0.08, 1.2, n)
+    greeks_dict = option_bsm_greeks(option_type, 3.0, strike, expiry, sigma, rate=0.02)
+    price = greeks_dict["price"]
+    implied = option_implied_volatility(
+        price, option_type, 3.0, strike, expiry, rate=0.02
+    )
+    # 深度实值、剩余期限短的合约时间价值接近浮点精度, 波动率无法从价格中确定
+    solvable = greeks_dict["vega"] > 1e-5
+    assert solvable.sum() > 0.95 * n
+    assert np.all(np.isfinite(implied[solvable]))
+    np.testing.assert_allclose(implied[solvable], sigma[solvable], atol=1e-6)
+    bad = option_implied_volatility(
+        [0.0001, 3.5, np.nan], ["call", "call", "put"], 3.0, 2.5, 0.25
+    )
+    assert np.isnan(bad).all()
+
+
+def test_option_chain_greeks():
+    """
+    test the three chain formats are normalised and priced
+    """
+    price = option_bsm_greeks(["C", "P"], 3900, 4000, 0.1, 0.2, rate=0.02)["price"]
+    cffex_df = pd.DataFrame(
+        {
+            "看涨合约-最新价": [price[0]],
+            "看跌合约-最新价": [price[1]],
+            "行权价": [4000],
+            "看涨合约-标识": ["io2412C4000"],
+            "看跌合约-标识": ["io2412P4000"],
+        }
+    )
+    temp_df = option_chain_greeks(cffex_df, 3900, rate=0.02, expiry=0.1)
+    assert temp_df["代码"].tolist() == ["io2412C4000", "io2412P4000"]
+    assert temp_df["类型"].tolist() == ["看涨", "看跌"]
+    np.testing.assert_allclose(temp_df["隐含波动率"], 0.2, atol=1e-6)
+    assert abs(temp_df["Delta"].iloc[0] - temp_df["Delta"].iloc[1] - 1) < 1e-9
+
+    em_df = pd.DataFrame(
+        {
+            "代码": ["10007000", "10007001", "ZZ"],
+            "名称": ["300ETF购12月4000", "300ETF沽12月4000", "其他"],
+            "最新价": [0.05, 0.15, 1.0],
+            "行权价": [4.0, 4.0, 1.0],
+            "剩余日": [36.5, 36.5, 10],
+        }
+    )
+    temp_df = option_chain_greeks(em_df, 3.9, rate=0.02)
+    assert temp_df["类型"].tolist() == ["看涨", "看跌"]
+    assert temp_df["剩余年限"].tolist() == [0.1, 0.1]
+
+    sse_df = pd.DataFrame(
+        {
+            "字段": ["买量", "最新价", "行权价", "期权合约简称"] * 2,
+            "值": ["1", "0.05", "4.0", "300ETF购12月4000"]
+            + ["1", "0.15", "4.0", "300ETF沽12月4000"],
+        }
+    )
+    temp_df = option_chain_greeks(sse_df, 3.9, rate=0.02, expiry=0.1)
+    assert temp_df["类型"].tolist() == ["看涨", "看跌"]
+    assert temp_df["隐含波动率"].notna().all()
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__])
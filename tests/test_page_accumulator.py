@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 19:00
+Desc: 分页数据累加器测试; 耗时基准见 benchmarks/bench_page_accumulator.py
+"""
+
+import pandas as pd
+
+from akshare.fund import fund_amac
+from akshare.utils.func import PageAccumulator
+from tests.fake_payloads import AMAC_FUND_ROWS, FakeAmacResponse
+
+
+def test_page_accumulator():
+    """
+    test same result as repeated pd.concat
+    """
+    chunks = [pd.DataFrame({"a": [i, i + 1], "b": ["x", "y"]}) for i in range(5)]
+    big_df = pd.DataFrame()
+    pages = PageAccumulator()
+    for chunk in chunks:
+        big_df = pd.concat([big_df, chunk], ignore_index=True)
+        pages.append(chunk)
+    assert len(pages) == 10
+    pd.testing.assert_frame_equal(pages.to_frame(ignore_index=True), big_df)
+    pages.extend([{"a": 100, "b": "z"}, {"a": 101, "b": "w"}])
+    temp_df = pages.to_frame(ignore_index=True)
+    assert temp_df["a"].tolist()[-2:] == [100, 101]
+    assert PageAccumulator().to_frame().empty
+
+
+def test_amac_fund_info_pages(monkeypatch):
+    """
+    test every page is collected in order
+    """
+    monkeypatch.setattr(
+        fund_amac.requests, "post", lambda *args, **kwargs: FakeAmacResponse()
+    )
+    temp_df = fund_amac.amac_fund_info(start_page="1", end_page="30")
+    assert len(temp_df) == 30 * len(AMAC_FUND_ROWS)
+    assert temp_df["基金名称"].tolist()[:2] == ["基金0", "基金1"]
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__])
@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 07:00
+Desc: 令牌桶限速和并发分页测试
+"""
+
+import threading
+
+import pytest
+import requests
+
+from akshare.utils import func, ratelimit, request
+from akshare.utils.context import PageConcurrencyContext
+from akshare.utils.ratelimit import TokenBucket, get_rate_limiter
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def test_token_bucket(monkeypatch):
+    """
+    test burst capacity, refill, waiting and rate updates
+    """
+    clock = _FakeClock()
+    monkeypatch.setattr(ratelimit.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(ratelimit.time, "sleep", clock.sleep)
+    bucket = TokenBucket(rate=2)
+    assert [bucket.reserve() for _ in range(2)] == [0.0, 0.0]
+    assert bucket.reserve() == pytest.approx(0.5)
+    clock.now = 1.5
+    assert bucket.reserve() == 0.0
+    for _ in range(5):
+        bucket.acquire()
+    # 剩余 1 个令牌, 之后每个令牌等待 0.5 秒
+    assert clock.now == pytest.approx(3.5)
+    bucket.update(rate=10, capacity=3)
+    assert (bucket.rate, bucket.capacity) == (10.0, 3.0)
+    with pytest.raises(ValueError):
+        bucket.update(rate=0)
+
+
+def test_get_rate_limiter():
+    """
+    test buckets are shared per host and the latest rate wins
+    """
+    first = get_rate_limiter("https://test-ratelimit.example.com/a?x=1", rate=3)
+    second = get_rate_limiter("https://test-ratelimit.example.com/b", rate=3)
+    other = get_rate_limiter("https://other-ratelimit.example.com/a", rate=3)
+    assert first is second
+    assert first is not other
+    assert get_rate_limiter("test-ratelimit.example.com", rate=6) is first
+    assert first.rate == 6.0
+
+
+class _CountingLimiter:
+    def __init__(self):
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            self.count += 1
+
+
+def test_request_with_retry_limiter(monkeypatch):
+    """
+    test every attempt, including retries, takes a token
+    """
+    monkeypatch.setattr(request.time, "sleep", lambda seconds: None)
+
+    class _Session:
+        calls = 0
+
+        def get(self, url, params=None, timeout=None):
+            self.calls += 1
+            if self.calls < 3:
+                raise requests.ConnectionError("reset")
+            response = requests.Response()
+            response.status_code = 200
+            return response
+
+    limiter = _CountingLimiter()
+    session = _Session()
+    request.request_with_retry(
+        "https://push2.eastmoney.com/api", session=session, limiter=limiter
+    )
+    assert session.calls == 3
+    assert limiter.count == 3
+
+
+class _JsonResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def json(self):
+        return self.data
+
+
+def test_fetch_paginated_data_concurrent(monkeypatch):
+    """
+    test pages are fetched concurrently through the host limiter and merged in page order
+    """
+    limiter = _CountingLimiter()
+    calls = []
+
+    def _fake_request(url, params=None, timeout=15, limiter=None, **kwargs):
+        page = int(params.get("pn", 1))
+        calls.append((page, limiter))
+        if limiter is not None:
+            limiter.acquire()
+        diff = [{"f3": 100 - page * 10 - i, "f12": f"{page}-{i}"} for i in range(2)]
+        return _JsonResponse({"data": {"diff": diff, "total": 7}})
+
+    monkeypatch.setattr(func, "request_with_retry", _fake_request)
+    monkeypatch.setattr(func, "get_rate_limiter", lambda url, rate: limiter)
+    with PageConcurrencyContext(max_workers=3, rate=50):
+        temp_df = func.fetch_paginated_data("https://push2.eastmoney.com", {"pn": 1})
+    assert sorted(page for page, _ in calls) == [1, 2, 3, 4]
+    assert all(item is limiter for page, item in calls if page > 1)
+    assert limiter.count == 3
+    expected = [f"{page}-{i}" for page in range(1, 5) for i in range(2)]
+    assert temp_df["f12"].tolist() == expected
+    assert temp_df["index"].tolist() == list(range(1, 9))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 02:00
+Desc: 注册仓单区间面板测试
+"""
+
+import datetime
+import threading
+
+import pandas as pd
+
+from akshare.futures import receipt
+
+
+def test_get_receipt_panel(monkeypatch):
+    """
+    test only trading days are requested and rows are ordered by date and exchange
+    """
+    calls = []
+    lock = threading.Lock()
+
+    def _fake(market):
+        def _receipt(date, vars_list):
+            with lock:
+                calls.append((market, date))
+            if market == "czce" and date == "20240104":
+                raise ValueError("boom")
+            return pd.DataFrame(
+                {
+                    "var": vars_list,
+                    "receipt": [100] * len(vars_list),
+                    "receipt_chg": [1] * len(vars_list),
+                    "date": [date] * len(vars_list),
+                }
+            )
+
+        return _receipt
+
+    fake_dict = {market: _fake(market) for market in ["dce", "shfe", "czce"]}
+
+    def _fake_receipt_func(market, day):
+        assert isinstance(day, datetime.date)
+        return fake_dict.get(market), None
+
+    monkeypatch.setattr(receipt, "_receipt_func", _fake_receipt_func)
+    temp_df = receipt.get_receipt_panel(
+        start_date="20240101",
+        end_date="20240105",
+        vars_list=["RB", "M", "SR", "IF"],
+        rate=1000,
+    )
+    assert len(calls) == 12
+    assert sorted({date for _, date in calls}) == [
+        "20240102",
+        "20240103",
+        "20240104",
+        "20240105",
+    ]
+    assert temp_df.columns.tolist() == [
+        "date",
+        "exchange",
+        "variety",
+        "receipt",
+        "receipt_chg",
+    ]
+    assert temp_df[temp_df["date"] == "20240102"]["variety"].tolist() == [
+        "M",
+        "SR",
+        "RB",
+    ]
+    assert temp_df[temp_df["date"] == "20240104"]["exchange"].tolist() == [
+        "DCE",
+        "SHFE",
+    ]
+    assert list(temp_df.attrs["failed"]) == ["CZCE 20240104"]
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__])
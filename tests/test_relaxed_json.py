@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 04:30
+Desc: 宽松 JSON 解析测试
+"""
+
+import decimal
+import json
+
+from akshare.utils import demjson
+from akshare.utils.js_literal import loads_js_literal, normalize_relaxed_json
+
+# 各数据源返回的非标准写法
+CORPUS = [
+    '{"a": 1, "b": [1.5, -2e3, true, false, null]}',
+    '[{symbol:"sh600000",code:"600000",name:"浦发银行",trade:"7.890",ticktime:"15:00:00"}]',
+    "{pages:2,data:{diff:[{f12:'000001',f14:'平安银行'}]}}",
+    "{a:1,b:[1,2,],c:{d:2,},}",
+    "{'name':'O\\'Neil', quote: 'say \"hi\"'}",
+    '{"text": "it\\\'s", "hex": "\\x41\\x42", "tab": "a\\tb"}',
+    "{url: 'http://a.com/b?c=d:e', s: \"{x:1,}\"}",
+    "{a: 1, // comment: 2\n b: /* c: 3, */ 4}",
+    "{$key: 1, _key2: 2, 中文: 3}",
+    "{exp: 1e5, nan: NaN, neg: -0.25}",
+    "{nested: [[1,2],[3,4],], empty: {}, list: []}",
+    "{a: undefined}",
+    "{1: 2}",
+    "[0x10, 010]",
+]
+
+
+def _plain(value):
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    if value is demjson.undefined:
+        return None
+    return value
+
+
+def test_loads_js_literal_corpus():
+    """
+    test the relaxed decoder agrees with demjson on every corpus entry
+    """
+    for text in CORPUS:
+        result = _plain(loads_js_literal(text))
+        expected = _plain(demjson.decode(text))
+        if "nan" in expected:
+            assert result["nan"] != result["nan"]
+            result.pop("nan")
+            expected.pop("nan")
+        assert result == expected, text
+
+
+def test_normalize_relaxed_json():
+    """
+    test the pre-pass produces strict JSON and leaves string contents alone
+    """
+    text = "{a:'x:1,]',b:[1,],// c:2\n}"
+    assert json.loads(normalize_relaxed_json(text)) == {"a": "x:1,]", "b": [1]}
+    assert normalize_relaxed_json("{1: 2}") == "{1: 2}"
+
+
+def test_loads_js_literal_rows():
+    """
+    test a Sina spot page with unquoted keys decodes the same as demjson
+    """
+    row = (
+        '{{symbol:"sh60{0:04d}",code:"60{0:04d}",name:"股票{0}",trade:"7.890",'
+        'pricechange:-0.05,changepercent:-0.629,buy:"7.890",sell:"7.900",'
+        'volume:26395137,amount:208361035,ticktime:"15:00:00",per:5.08,pb:0.397}}'
+    )
+    text = "[" + ",".join(row.format(i) for i in range(10)) + "]"
+    assert _plain(loads_js_literal(text)) == _plain(demjson.decode(text))
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__])
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 09:00
+Desc: 并发批量获取测试
+"""
+
+import random
+import threading
+import time
+
+import pandas as pd
+
+from akshare.utils.func import run_batch
+
+
+class _CountingLimiter:
+    def __init__(self):
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            self.count += 1
+
+
+def _fetch(key):
+    time.sleep(random.uniform(0, 0.01))
+    if key % 5 == 0:
+        raise ValueError(f"bad {key}")
+    if key % 7 == 0:
+        return pd.DataFrame()
+    return pd.DataFrame({"key": [key]})
+
+
+def test_run_batch():
+    """
+    test results keep the input order and failures are recorded by key
+    """
+    key_list = list(range(20, 0, -1))
+    limiter = _CountingLimiter()
+    result_dict, failed_dict = run_batch(key_list, _fetch, limiter, max_workers=4)
+    expected = [key for key in key_list if key % 5 and key % 7]
+    assert list(result_dict) == expected
+    assert [value["key"].iloc[0] for value in result_dict.values()] == expected
+    assert sorted(failed_dict) == [5, 10, 15, 20]
+    assert failed_dict[5] == "ValueError('bad 5')"
+    assert limiter.count == 20
+
+
+def test_run_batch_empty_as_failed():
+    """
+    test empty results are recorded when requested and limiters are chosen per key
+    """
+    limiter_dict = {"a": _CountingLimiter(), "b": _CountingLimiter()}
+    key_list = [("a", 7), ("b", 1), ("a", 2), ("b", 14)]
+    result_dict, failed_dict = run_batch(
+        key_list,
+        lambda key: _fetch(key[1]),
+        limiter=lambda key: limiter_dict[key[0]],
+        empty_as_failed=True,
+    )
+    assert list(result_dict) == [("b", 1), ("a", 2)]
+    assert failed_dict == {("a", 7): "empty result", ("b", 14): "empty result"}
+    assert limiter_dict["a"].count == 2
+    assert limiter_dict["b"].count == 2
+    result_dict, failed_dict = run_batch([1, 1, 7], lambda key: {"key": key})
+    assert result_dict == {1: {"key": 1}, 7: {"key": 7}}
+    assert failed_dict == {}
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__])
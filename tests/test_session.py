@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 10:00
+Desc: 会话池测试
+"""
+
+from akshare.utils.session import (
+    SessionPoolContext,
+    disable_session_pool,
+    get_session,
+)
+
+
+def test_session_pool_reuse():
+    """
+    test session pool reuse per host
+    """
+    assert get_session("https://push2.eastmoney.com/api/qt/clist/get") is None
+    with SessionPoolContext(pool_maxsize=4):
+        first = get_session("https://push2.eastmoney.com/api/qt/clist/get")
+        second = get_session("https://push2.eastmoney.com/api/qt/stock/get")
+        other = get_session("https://datacenter-web.eastmoney.com/api/data/v1/get")
+        assert first is second
+        assert first is not other
+    assert get_session("https://push2.eastmoney.com/api/qt/clist/get") is None
+    disable_session_pool()
+
+
+if __name__ == "__main__":
+    test_session_pool_reuse()
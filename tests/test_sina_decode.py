@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 16:00
+Desc: 新浪财经行情解码测试, 与 JS 解码结果逐项比对
+"""
+
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+from py_mini_racer import MiniRacer
+from py_mini_racer.py_mini_racer import JSEvalException
+
+from akshare.stock.cons import hk_js_decode, zh_js_decode
+from akshare.utils.sina_decode import _ALPHABET, sina_js_decode
+
+
+def _encode(bits: list) -> str:
+    bits = bits + [0] * (-len(bits) % 6)
+    return "".join(
+        _ALPHABET[sum(bit << k for k, bit in enumerate(bits[i : i + 6]))]
+        for i in range(0, len(bits), 6)
+    )
+
+
+def _emit(bits: list, value: int, width: int) -> None:
+    value &= (1 << width) - 1
+    bits.extend((value >> k) & 1 for k in range(width))
+
+
+def _random_payload(seed: int) -> str:
+    """
+    指定格式头的随机比特流, 覆盖各类记录格式与控制分支
+    """
+    rng = random.Random(seed)
+    bits = []
+    _emit(bits, rng.choice([3466, 3466, 139, 200, 1479, 136, 197]), 12)
+    _emit(bits, 63 ^ rng.choice([0, 0, 1, 2]), 6)
+    bias = rng.choice([0.5, 0.3, 0.2])
+    bits.extend(int(rng.random() < bias) for _ in range(6 * rng.randint(1, 300)))
+    return _encode(bits)
+
+
+def _kline_payload(rows: int, seed: int = 0) -> str:
+    """
+    日 K 线格式: 先设置昨收价, 之后每行为价格与成交量的增量
+    """
+    rng = random.Random(seed)
+    bits = []
+    _emit(bits, 3466, 12)
+    _emit(bits, 63, 6)
+    bits.extend([1, 1, 0, 0, 1, 1, 1, 1, 1, 1, 1, 0])
+    _emit(bits, 1_000_000, 24)
+    volume = 0
+    for row in range(rows):
+        if row:
+            bits.append(0)
+        delta = rng.randint(-min(volume, 16000), 16000)
+        volume += delta
+        for value, width in (
+            (rng.randint(-200, 200), 9),
+            (rng.randint(0, 255), 9),
+            (rng.randint(0, 255), 9),
+            (rng.randint(-200, 200), 9),
+            (delta, 15),
+            (rng.randint(-16000, 16000), 15),
+        ):
+            _emit(bits, value, width)
+    bits.extend([1, 1, 0, 0, 0])
+    return _encode(bits)
+
+
+def _normalize(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    日期转换为天数, 其余列转换为浮点数; JS 通过 JSON 返回, 日期为 ISO 字符串, NaN 为 None
+    """
+    df = df.copy()
+    df.columns = [str(col) for col in df.columns]
+    for col in df.columns:
+        values = df[col].to_numpy()
+        if np.issubdtype(values.dtype, np.datetime64):
+            days = values.astype("datetime64[D]").astype("int64").astype(float)
+            df[col] = np.where(np.isnat(values), np.nan, days)
+        elif any(isinstance(value, str) for value in values):
+            df[col] = [
+                np.datetime64(value.split("T")[0].lstrip("+"), "D").astype("int64")
+                if isinstance(value, str)
+                else np.nan
+                for value in values
+            ]
+        df[col] = df[col].astype(float).replace([np.inf, -np.inf], np.nan)
+    return df
+
+
+@pytest.fixture(scope="module", params=["hk", "zh"])
+def js_context(request):
+    js_code = MiniRacer()
+    js_code.eval(hk_js_decode if request.param == "hk" else zh_js_decode)
+    return js_code
+
+
+def test_sina_js_decode_random(js_context):
+    compared = 0
+    for seed in range(150):
+        text = _random_payload(seed)
+        try:
+            js_code_result = js_context.call("d", text, timeout=200)
+        except JSEvalException:
+            # 随机数据可能让 JS 读取 undefined 的属性而报错, 这类输入不参与比对
+            continue
+        except ValueError:
+            # JS 返回 undefined(数据在记录中途结束)
+            assert sina_js_decode(text) == {}
+            continue
+        expected = _normalize(pd.DataFrame(js_code_result))
+        result = _normalize(pd.DataFrame(sina_js_decode(text)))
+        # V8 的 Math.pow(10, p) 在 p >= 23 时有 1 ulp 误差, 正常数据不会出现这么大的精度
+        pd.testing.assert_frame_equal(result, expected, check_exact=False, rtol=1e-14)
+        compared += 1
+    assert compared > 100
+
+
+def test_sina_js_decode_kline(js_context):
+    text = _kline_payload(2000)
+    expected = pd.DataFrame(js_context.call("d", text))
+    temp_df = pd.DataFrame(sina_js_decode(text))
+    pd.testing.assert_frame_equal(
+        _normalize(temp_df), _normalize(expected), check_exact=True
+    )
+    assert temp_df.columns.tolist() == [
+        "date",
+        "prevclose",
+        "open",
+        "high",
+        "low",
+        "close",
+        "volume",
+        "amount",
+    ]
+    assert temp_df["date"].is_monotonic_increasing
+    assert temp_df["prevclose"].iloc[0] == 10000.0
+
+
+def test_sina_js_decode_empty():
+    assert sina_js_decode("") == {}
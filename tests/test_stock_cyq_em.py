@@ -0,0 +1,294 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 17:00
+Desc: 筹码分布测试, 与网页端 CYQCalculator 的计算结果逐日比对
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from py_mini_racer import MiniRacer
+
+from akshare.stock_feature.stock_cyq_em import _stock_cyq_calc, _stock_cyq_em_parse
+
+# 东方财富网页端的筹码分布算法
+CYQ_JS = """
+    // @ts-nocheck
+
+    /**
+     * 计算分布及相关指标
+     * @param {number} index 当前选中的K线的索引
+     * @return {{x: Array.<number>, y: Array.<number>}}
+     */
+    /**
+    this.range = 120;
+    */
+    function CYQCalculator(index, klinedata) {
+        var maxprice = 0;
+        var minprice = 0;
+        var factor = 150;
+        var start = this.range ? Math.max(0, index - this.range + 1) : 0;
+        /**
+         * K图数据[time,open,close,high,low,volume,amount,amplitude,turnoverRate]
+         */
+        var kdata = klinedata.slice(start, Math.max(1, index + 1));
+        if (kdata.length === 0) throw 'invaild index';
+        for (var i = 0; i < kdata.length; i++) {
+            var elements = kdata[i];
+            maxprice = !maxprice ? elements.high : Math.max(maxprice, elements.high);
+            minprice = !minprice ? elements.low : Math.min(minprice, elements.low);
+        }
+
+        // 精度不小于0.01 产品逻辑
+        var accuracy = Math.max(0.01, (maxprice - minprice) / (factor - 1));
+        /**
+         * 值域
+         * @type {Array.<number>}
+         */
+        var yrange = [];
+        for (var i = 0; i < factor; i++) {
+            yrange.push((minprice + accuracy * i).toFixed(2) / 1);
+        }
+        /**
+         * 横轴数据
+         */
+        var xdata = createNumberArray(factor);
+
+        for (var i = 0; i < kdata.length; i++) {
+            var eles = kdata[i];
+
+            var open = eles.open,
+                close = eles.close,
+                high = eles.high,
+                low = eles.low,
+                avg = (open + close + high + low) / 4,
+                turnoverRate = Math.min(1, eles.hsl / 100 || 0);
+
+            var H = Math.floor((high - minprice) / accuracy),
+                L = Math.ceil((low - minprice) / accuracy),
+                // G点坐标, 一字板时, X为进度因子
+                GPoint = [high == low ? factor - 1 : 2 / (high - low), Math.floor((avg - minprice) / accuracy)];
+            // 衰减
+            for (var n = 0; n < xdata.length; n++) {
+                xdata[n] *= (1 - turnoverRate);
+            }
+
+            if (high == low) {
+                // 一字板时，画矩形面积是三角形的2倍
+                xdata[GPoint[1]] += GPoint[0] * turnoverRate / 2;
+            } else {
+                for (var j = L; j <= H; j++) {
+                    var curprice = minprice + accuracy * j;
+                    if (curprice <= avg) {
+                        // 上半三角叠加分布分布
+                        if (Math.abs(avg - low) < 1e-8) {
+                            xdata[j] += GPoint[0] * turnoverRate;
+                        } else {
+                            xdata[j] += (curprice - low) / (avg - low) * GPoint[0] * turnoverRate;
+                        }
+                    } else {
+                        // 下半三角叠加分布分布
+                        if (Math.abs(high - avg) < 1e-8) {
+                            xdata[j] += GPoint[0] * turnoverRate;
+                        } else {
+                            xdata[j] += (high - curprice) / (high - avg) * GPoint[0] * turnoverRate;
+                        }
+                    }
+                }
+            }
+
+        }
+
+
+        var currentprice = klinedata[index].close;
+        var totalChips = 0;
+        for (var i = 0; i < factor; i++) {
+            var x = xdata[i].toPrecision(12) / 1;
+            //if (x < 0) xdata[i] = 0;
+            totalChips += x;
+        }
+        var result = new CYQData();
+        result.x = xdata;
+        result.y = yrange;
+        result.benefitPart = result.getBenefitPart(currentprice);
+        result.avgCost = getCostByChip(totalChips * 0.5).toFixed(2);
+        result.percentChips = {
+            '90': result.computePercentChips(0.9),
+            '70': result.computePercentChips(0.7)
+        };
+        return result;
+
+        /**
+         * 获取指定筹码处的成本
+         * @param {number} chip 堆叠筹码
+         */
+        function getCostByChip(chip) {
+            var result = 0,
+                sum = 0;
+            for (var i = 0; i < factor; i++) {
+                var x = xdata[i].toPrecision(12) / 1;
+                if (sum + x > chip) {
+                    result = minprice + i * accuracy;
+                    break;
+                }
+                sum += x;
+            }
+            return result;
+        }
+
+        /**
+         * 筹码分布数据
+         */
+        function CYQData() {
+            /**
+             * 筹码堆叠
+             * @type {Array.<number>}
+             */
+            this.x = arguments[0];
+            /**
+             * 价格分布
+             * @type {Array.<number>}
+             */
+            this.y = arguments[1];
+            /**
+             * 获利比例
+             * @type {number}
+             */
+            this.benefitPart = arguments[2];
+            /**
+             * 平均成本
+             * @type {number}
+             */
+            this.avgCost = arguments[3];
+            /**
+             * 百分比筹码
+             * @type {{Object.<string, {{priceRange: number[], concentration: number}}>}}
+             */
+            this.percentChips = arguments[4];
+            /**
+             * 计算指定百分比的筹码
+             * @param {number} percent 百分比大于0，小于1
+             */
+            this.computePercentChips = function (percent) {
+                if (percent > 1 || percent < 0) throw 'argument "percent" out of range';
+                var ps = [(1 - percent) / 2, (1 + percent) / 2];
+                var pr = [getCostByChip(totalChips * ps[0]), getCostByChip(totalChips * ps[1])];
+                return {
+                    priceRange: [pr[0].toFixed(2), pr[1].toFixed(2)],
+                    concentration: pr[0] + pr[1] === 0 ? 0 : (pr[1] - pr[0]) / (pr[0] + pr[1])
+                };
+            };
+            /**
+             * 获取指定价格的获利比例
+             * @param {number} price 价格
+             */
+            this.getBenefitPart = function (price) {
+                var below = 0;
+                for (var i = 0; i < factor; i++) {
+                    var x = xdata[i].toPrecision(12) / 1;
+                    if (price >= minprice + i * accuracy) {
+                        below += x;
+                    }
+                }
+                return totalChips == 0 ? 0 : below / totalChips;
+            };
+        }
+    }
+
+
+    function createNumberArray(count) {
+        var array = [];
+        for (var i = 0; i < count; i++) {
+            array.push(0);
+        }
+        return array;
+    }
+"""
+
+
+def _kline(rows: int, seed: int) -> pd.DataFrame:
+    """
+    随机日 K 线, 含一字板和换手率缺失的交易日
+    """
+    rng = np.random.default_rng(seed)
+    close = np.round(10 * np.exp(np.cumsum(rng.normal(0, 0.02, rows))), 2)
+    open_ = np.round(close * (1 + rng.normal(0, 0.01, rows)), 2)
+    high = np.round(
+        np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.01, rows))), 2
+    )
+    low = np.round(
+        np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.01, rows))), 2
+    )
+    flat = rng.random(rows) < 0.05
+    open_[flat] = high[flat] = low[flat] = close[flat]
+    hsl = np.round(np.abs(rng.normal(2, 1.5, rows)), 2)
+    hsl[rng.random(rows) < 0.02] = np.nan
+    return pd.DataFrame(
+        {
+            "date": pd.date_range("2020-01-01", periods=rows).strftime("%Y-%m-%d"),
+            "open": open_,
+            "close": close,
+            "high": high,
+            "low": low,
+            "hsl": hsl,
+        }
+    )
+
+
+def _js_calc(js_code: MiniRacer, temp_df: pd.DataFrame) -> pd.DataFrame:
+    records = temp_df.to_dict(orient="records")
+    rows = []
+    for i in range(len(records)):
+        result = js_code.call("CYQCalculator", i, records)
+        rows.append(
+            [
+                result["benefitPart"],
+                result["avgCost"],
+                *result["percentChips"]["90"]["priceRange"],
+                result["percentChips"]["90"]["concentration"],
+                *result["percentChips"]["70"]["priceRange"],
+                result["percentChips"]["70"]["concentration"],
+            ]
+        )
+    return pd.DataFrame(rows).astype(float)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_stock_cyq_calc(seed):
+    js_code = MiniRacer()
+    js_code.eval(CYQ_JS)
+    temp_df = _kline(200, seed)
+    expected = _js_calc(js_code, temp_df)
+    result = _stock_cyq_calc(temp_df)
+    assert result.columns.tolist() == [
+        "日期",
+        "获利比例",
+        "平均成本",
+        "90成本-低",
+        "90成本-高",
+        "90集中度",
+        "70成本-低",
+        "70成本-高",
+        "70集中度",
+    ]
+    values = result.iloc[:, 1:].to_numpy(dtype=float)
+    cost_columns = [1, 2, 3, 5, 6]
+    np.testing.assert_array_equal(
+        values[:, cost_columns], expected.to_numpy()[:, cost_columns]
+    )
+    np.testing.assert_allclose(
+        values[:, [0, 4, 7]], expected.to_numpy()[:, [0, 4, 7]], rtol=1e-12
+    )
+
+
+def test_stock_cyq_em_parse():
+    temp_df = _kline(300, 0)
+    klines = [
+        f"{row.date},{row.open},{row.close},{row.high},{row.low},1,1,0,0,0,{row.hsl}"
+        for row in temp_df.itertuples()
+    ]
+    result = _stock_cyq_em_parse({"data": {"klines": klines}}, days=90)
+    assert len(result) == 90
+    assert str(result["日期"].iloc[-1]) == temp_df["date"].iloc[-1]
+    assert _stock_cyq_em_parse({"data": None}).empty
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 09:30
+Desc: 沪深京 A 股每日行情批量获取测试
+"""
+
+import threading
+
+import requests
+
+from akshare.stock_feature import stock_hist_em
+from akshare.utils import request
+
+
+class _CountingLimiter:
+    def __init__(self):
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            self.count += 1
+
+
+class _FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+
+class _FakeSession:
+    """
+    600000 首次请求连接重置, 600001 停牌无数据, 600002 始终失败
+    """
+
+    def __init__(self):
+        self.calls = {}
+        self.lock = threading.Lock()
+
+    def mount(self, prefix, adapter):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def get(self, url, params=None, timeout=None):
+        code = params["secid"].split(".")[1]
+        with self.lock:
+            self.calls[code] = self.calls.get(code, 0) + 1
+            count = self.calls[code]
+        if code == "600002" or (code == "600000" and count == 1):
+            raise requests.ConnectionError("reset")
+        if code == "600001":
+            return _FakeResponse({"data": {"klines": []}})
+        klines = [
+            f"2024-01-0{day},10.0,10.5,10.8,9.9,1000,10500.0,9.0,5.0,0.5,0.1"
+            for day in (2, 3)
+        ]
+        return _FakeResponse({"data": {"klines": klines}})
+
+
+def test_stock_zh_a_hist_batch(monkeypatch):
+    """
+    test order, empty results recorded as failed and a token per attempt
+    """
+    session = _FakeSession()
+    limiter = _CountingLimiter()
+    monkeypatch.setattr(stock_hist_em.requests, "Session", lambda: session)
+    monkeypatch.setattr(stock_hist_em, "get_rate_limiter", lambda url, rate: limiter)
+    monkeypatch.setattr(request.time, "sleep", lambda seconds: None)
+    temp_df = stock_hist_em.stock_zh_a_hist_batch(
+        symbol=["600003", "600002", "600001", "600000"], max_workers=2
+    )
+    assert temp_df["股票代码"].tolist() == ["600003"] * 2 + ["600000"] * 2
+    assert temp_df["收盘"].tolist() == [10.5] * 4
+    assert sorted(temp_df.attrs["failed"]) == ["600001", "600002"]
+    assert temp_df.attrs["failed"]["600001"] == "empty result"
+    assert "ConnectionError" in temp_df.attrs["failed"]["600002"]
+    assert session.calls == {"600000": 2, "600001": 1, "600002": 3, "600003": 1}
+    assert limiter.count == 7
+
+
+if __name__ == "__main__":
+    import pytest
+
+    pytest.main([__file__])
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/18 01:30
+Desc: 期货品种映射表测试
+"""
+
+import pandas as pd
+import pytest
+
+from akshare.futures.symbol_var import (
+    CHINESE_ENGLISH_MAP,
+    chinese_to_english,
+    chinese_to_english_series,
+    symbol_market,
+    symbol_market_series,
+    symbol_varieties,
+    symbol_varieties_series,
+)
+
+
+def test_symbol_lookup():
+    """
+    test scalar and whole-column lookups agree
+    """
+    codes = pd.Series(["ru1801", "PTA801", "IF2401", "bb2501", "xx2401", None])
+    assert symbol_varieties_series(codes).tolist()[:5] == [
+        symbol_varieties(item) for item in codes[:5]
+    ]
+    assert symbol_varieties("PTA801") == "TA"
+    assert symbol_market("SP") == "shfe"
+    assert symbol_market_series(codes).tolist()[:4] == ["shfe", "czce", "cffex", "dce"]
+    assert symbol_market_series(codes).isna().tolist()[4:] == [True, True]
+
+
+def test_chinese_to_english():
+    """
+    test the first mapping wins for duplicated names and unknown names raise
+    """
+    assert chinese_to_english("沥青厂库") == "BU2"
+    assert chinese_to_english("石油沥青厂库") == "BU"
+    assert chinese_to_english_series(pd.Series(["苹果", "未知"])).tolist()[0] == "AP"
+    with pytest.raises(ValueError):
+        chinese_to_english("未知")
+    with pytest.raises(TypeError):
+        CHINESE_ENGLISH_MAP["未知"] = "XX"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
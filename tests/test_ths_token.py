@@ -0,0 +1,27 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 18:00
+Desc: 同花顺 hexin-v 令牌测试
+"""
+
+from akshare.utils.ths_token import HexinVProvider
+
+
+def test_hexin_v_provider_ttl():
+    """
+    test token reuse within ttl and refresh
+    """
+    provider = HexinVProvider(ttl=60)
+    token = provider.get()
+    assert isinstance(token, str) and token
+    assert provider.get() == token
+    provider.mint()
+    assert provider.get() != token
+    provider.ttl = 0
+    provider.invalidate()
+    assert provider.get() != provider.get()
+
+
+if __name__ == "__main__":
+    test_hexin_v_provider_ttl()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding:utf-8 -*-
+"""
+Date: 2026/10/17 20:00
+Desc: 交易日历测试
+"""
+
+import datetime
+import json
+import os
+import random
+
+from akshare.futures import cons
+from akshare.utils.trade_calendar import get_trade_calendar, to_date
+
+
+def _calendar_list() -> list:
+    path = os.path.join(
+        os.path.dirname(os.path.dirname(__file__)),
+        "akshare",
+        "file_fold",
+        "calendar.json",
+    )
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_trade_calendar_lookup():
+    """
+    test lookups against linear scans of calendar.json
+    """
+    days = _calendar_list()
+    calendar = get_trade_calendar()
+    assert calendar is get_trade_calendar()
+    assert cons.get_calendar() == days
+    random.seed(0)
+    first = datetime.date(1990, 12, 1)
+    for _ in range(150):
+        day = first + datetime.timedelta(days=random.randint(0, 13200))
+        key = day.strftime("%Y%m%d")
+        assert (key in calendar) == (key in days)
+        assert (day in calendar) == (key in days)
+        earlier = [d for d in days if d < key]
+        later = [d for d in days if d > key]
+        assert calendar.prev(key) == (earlier[-1] if earlier else None)
+        assert calendar.next(day) == (later[0] if later else None)
+        floor = [d for d in days if d <= key]
+        assert calendar.floor(key) == (floor[-1] if floor else None)
+        end = day + datetime.timedelta(days=random.randint(0, 60))
+        assert calendar.between(day, end) == [
+            d for d in days if key <= d <= end.strftime("%Y%m%d")
+        ]
+    assert calendar.offset("20240102", 5) == days[days.index("20240102") + 5]
+    assert calendar.offset("20240102", -3) == days[days.index("20240102") - 3]
+    assert calendar.offset("20240106", 1) is None
+    assert calendar.mask(["20240105", "20240106"]).tolist() == [True, False]
+
+
+def test_to_date():
+    """
+    test date normalisation agrees with futures.cons.convert_date
+    """
+    for day in ["20240105", "2024-01-05", "2024/01/05", datetime.date(2024, 1, 5)]:
+        assert to_date(day) == cons.convert_date(day) == datetime.date(2024, 1, 5)
+    assert to_date(datetime.datetime(2024, 1, 5, 15, 30)) == datetime.date(2024, 1, 5)
+    assert to_date(20240105) == datetime.date(2024, 1, 5)
+    assert to_date("20241305") is None
+    assert to_date("latest") is None
+
+
+def test_latest_data_date():
+    """
+    test latest data date on trading and non-trading days
+    """
+    assert (
+        cons.get_latest_data_date(datetime.datetime(2018, 10, 5, 17, 1)) == "20180928"
+    )
+    assert (
+        cons.get_latest_data_date(datetime.datetime(2018, 10, 8, 18, 0)) == "20181008"
+    )
+    assert cons.get_latest_data_date(datetime.datetime(2018, 10, 8, 9, 0)) == "20180928"
+    assert cons.last_trading_day(datetime.date(2018, 10, 8)) == datetime.date(
+        2018, 9, 28
+    )
+
+
+if __name__ == "__main__":
+    test_trade_calendar_lookup()
+    test_latest_data_date()